@@ -0,0 +1,59 @@
+import resource
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from math import cos
+from math import pi
+from math import sin
+
+from compas.geometry import Box
+from compas.geometry import Sphere
+
+from compas_cgal.booleans import boolean_chain
+
+# =============================================================================
+# Benchmark: time and peak memory of a long EPECK boolean chain,
+# with and without rounding of the intermediate result.
+#
+# A cube is carved by n overlapping spheres placed on a helix, so that every
+# cut crosses the boundary created by the previous ones. Without rounding,
+# the lazy-exact coordinates of the new vertices keep the history of their
+# construction through the whole chain; snap_every=k rounds them to doubles
+# after every k steps.
+#
+# Every run happens in a fresh process, so the peak resident set size of a
+# run is not hidden by the peak of an earlier, larger one.
+# =============================================================================
+
+LENGTHS = [8, 16, 32, 64]
+SNAP_EVERY = [0, 1, 4, 16]
+
+
+def carving(n):
+    meshes = [Box(2).to_vertices_and_faces(triangulated=True)]
+    for i in range(n):
+        angle = 4 * pi * i / n
+        point = [0.8 * cos(angle), 0.8 * sin(angle), -1.0 + 2.0 * i / n]
+        meshes.append(Sphere(0.35, point=point).to_vertices_and_faces(u=16, v=16, triangulated=True))
+    return meshes
+
+
+def run(n, snap_every):
+    meshes = carving(n)
+    start = time.perf_counter()
+    V, F = boolean_chain(meshes, ["difference"] * n, snap_every=snap_every)
+    seconds = time.perf_counter() - start
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and in kilobytes on Linux
+    megabytes = peak / 2**20 if sys.platform == "darwin" else peak / 2**10
+    return seconds, megabytes, len(F)
+
+
+if __name__ == "__main__":
+    print(f"{'steps':>6} {'snap_every':>10} {'time [s]':>9} {'peak RSS [MB]':>14} {'faces':>7}")
+    for n in LENGTHS:
+        for k in SNAP_EVERY:
+            with ProcessPoolExecutor(max_workers=1) as executor:
+                seconds, megabytes, faces = executor.submit(run, n, k).result()
+            print(f"{n:>6} {k:>10} {seconds:>9.2f} {megabytes:>14.1f} {faces:>7}")
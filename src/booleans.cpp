@@ -1,7 +1,10 @@
 #include "booleans.h"
 
 #include <array>
+#include <limits>
 #include <map>
+#include <mutex>
+#include <optional>
 
 // Local-only: enables std::vector<int> auto-conversion from Python lists for
 // the boolean_chain binding. Kept out of compas.h because types_std binds
@@ -11,55 +14,207 @@
 #include <CGAL/boost/graph/properties.h>
 #include <CGAL/Cartesian_converter.h>
 #include <CGAL/Exact_predicates_exact_constructions_kernel.h>
+#include <CGAL/Side_of_triangle_mesh.h>
+#include <CGAL/Polygon_mesh_processing/bbox.h>
+#include <CGAL/Polygon_mesh_processing/connected_components.h>
+#include <CGAL/Polygon_mesh_processing/intersection.h>
+#include <CGAL/Polygon_mesh_processing/orientation.h>
+#include <CGAL/Polygon_mesh_processing/self_intersections.h>
 
 namespace PMP = CGAL::Polygon_mesh_processing;
 
-std::tuple<compas::RowMatrixXd, compas::RowMatrixXi>
+// =============================================================================
+// Broad phase: skip the corefinement when the operands do not touch.
+// =============================================================================
+
+namespace broad_phase {
+
+bool contains(const CGAL::Bbox_3& outer, const CGAL::Bbox_3& inner)
+{
+    return outer.xmin() <= inner.xmin() && inner.xmax() <= outer.xmax() &&
+           outer.ymin() <= inner.ymin() && inner.ymax() <= outer.ymax() &&
+           outer.zmin() <= inner.zmin() && inner.zmax() <= outer.zmax();
+}
+
+// True if `inner` lies in the volume bounded by `outer`. Only valid if the
+// two surfaces do not intersect, so testing one vertex is enough.
+bool is_inside(const compas::Mesh& inner, const compas::Mesh& outer)
+{
+    CGAL::Side_of_triangle_mesh<compas::Mesh, compas::Kernel> side(outer);
+    return side(inner.point(*inner.vertices().begin())) != CGAL::ON_UNBOUNDED_SIDE;
+}
+
+// Assemble the result of a union (0), difference (1), or intersection (2) of
+// two meshes whose surfaces do not intersect. Returns false for other
+// operations.
+bool assemble(const compas::Mesh& a, const compas::Mesh& b, int operation,
+              bool a_in_b, bool b_in_a, compas::Mesh& out)
+{
+    switch (operation)
+    {
+    case 0:
+        if (a_in_b) out = b;
+        else if (b_in_a) out = a;
+        else { out = a; out += b; }
+        return true;
+    case 1:
+        if (a_in_b) out.clear();
+        else if (b_in_a)
+        {
+            // B becomes a cavity of A.
+            compas::Mesh cavity = b;
+            PMP::reverse_face_orientations(cavity);
+            out = a;
+            out += cavity;
+        }
+        else out = a;
+        return true;
+    case 2:
+        if (a_in_b) out = a;
+        else if (b_in_a) out = b;
+        else out.clear();
+        return true;
+    default:
+        return false;
+    }
+}
+
+/**
+ * Compute the result of a union (0), difference (1), or intersection (2)
+ * without corefinement if the surfaces of A and B do not intersect.
+ *
+ * The bounding boxes are compared first ("bbox"). If they overlap, the
+ * surfaces are tested with an AABB tree and, if they are disjoint, nesting
+ * is decided with a point-in-mesh test ("aabb"). The second test requires
+ * closed meshes; open meshes with overlapping boxes always go to the
+ * corefinement.
+ *
+ * @return The path taken, or an empty string if the corefinement is needed.
+ */
+std::string shortcut(const compas::Mesh& a, const compas::Mesh& b, int operation, compas::Mesh& out)
+{
+    if (a.is_empty() || b.is_empty())
+        return "";
+
+    CGAL::Bbox_3 box_a = PMP::bbox(a);
+    CGAL::Bbox_3 box_b = PMP::bbox(b);
+
+    if (!CGAL::do_overlap(box_a, box_b))
+        return assemble(a, b, operation, false, false, out) ? "bbox" : "";
+
+    if (!CGAL::is_closed(a) || !CGAL::is_closed(b))
+        return "";
+
+    if (PMP::do_intersect(a, b, CGAL::parameters::do_overlap_test_of_bounded_sides(false),
+                          CGAL::parameters::do_overlap_test_of_bounded_sides(false)))
+        return "";
+
+    bool a_in_b = contains(box_b, box_a) && is_inside(a, b);
+    bool b_in_a = !a_in_b && contains(box_a, box_b) && is_inside(b, a);
+
+    return assemble(a, b, operation, a_in_b, b_in_a, out) ? "aabb" : "";
+}
+
+} // namespace broad_phase
+
+std::tuple<compas::RowMatrixXd, compas::RowMatrixXi, std::string>
+pmp_boolean_union(
+    compas::Mesh mesh_a,
+    compas::Mesh mesh_b)
+{
+    compas::Mesh mesh_out;
+
+    std::string path = broad_phase::shortcut(mesh_a, mesh_b, 0, mesh_out);
+    if (path.empty())
+    {
+        PMP::corefine_and_compute_union(mesh_a, mesh_b, mesh_out);
+        path = "corefinement";
+    }
+
+    auto [V, F] = compas::mesh_to_vertices_and_faces(mesh_out);
+    return std::make_tuple(std::move(V), std::move(F), std::move(path));
+};
+
+std::tuple<compas::RowMatrixXd, compas::RowMatrixXi, std::string>
 pmp_boolean_union(
     Eigen::Ref<const compas::RowMatrixXd> vertices_a,
     Eigen::Ref<const compas::RowMatrixXi> faces_a,
     Eigen::Ref<const compas::RowMatrixXd> vertices_b,
     Eigen::Ref<const compas::RowMatrixXi> faces_b)
 {
-    compas::Mesh mesh_a = compas::mesh_from_vertices_and_faces(vertices_a, faces_a);
-    compas::Mesh mesh_b = compas::mesh_from_vertices_and_faces(vertices_b, faces_b);
+    return pmp_boolean_union(
+        compas::mesh_from_vertices_and_faces(vertices_a, faces_a),
+        compas::mesh_from_vertices_and_faces(vertices_b, faces_b));
+};
+
+std::tuple<compas::RowMatrixXd, compas::RowMatrixXi, std::string>
+pmp_boolean_difference(
+    compas::Mesh mesh_a,
+    compas::Mesh mesh_b)
+{
     compas::Mesh mesh_out;
 
-    PMP::corefine_and_compute_union(mesh_a, mesh_b, mesh_out);
+    std::string path = broad_phase::shortcut(mesh_a, mesh_b, 1, mesh_out);
+    if (path.empty())
+    {
+        PMP::corefine_and_compute_difference(mesh_a, mesh_b, mesh_out);
+        path = "corefinement";
+    }
 
-    return compas::mesh_to_vertices_and_faces(mesh_out);
+    auto [V, F] = compas::mesh_to_vertices_and_faces(mesh_out);
+    return std::make_tuple(std::move(V), std::move(F), std::move(path));
 };
 
-std::tuple<compas::RowMatrixXd, compas::RowMatrixXi>
+std::tuple<compas::RowMatrixXd, compas::RowMatrixXi, std::string>
 pmp_boolean_difference(
     Eigen::Ref<const compas::RowMatrixXd> vertices_a,
     Eigen::Ref<const compas::RowMatrixXi> faces_a,
     Eigen::Ref<const compas::RowMatrixXd> vertices_b,
     Eigen::Ref<const compas::RowMatrixXi> faces_b)
 {
-    compas::Mesh mesh_a = compas::mesh_from_vertices_and_faces(vertices_a, faces_a);
-    compas::Mesh mesh_b = compas::mesh_from_vertices_and_faces(vertices_b, faces_b);
+    return pmp_boolean_difference(
+        compas::mesh_from_vertices_and_faces(vertices_a, faces_a),
+        compas::mesh_from_vertices_and_faces(vertices_b, faces_b));
+};
+
+std::tuple<compas::RowMatrixXd, compas::RowMatrixXi, std::string>
+pmp_boolean_intersection(
+    compas::Mesh mesh_a,
+    compas::Mesh mesh_b)
+{
     compas::Mesh mesh_out;
 
-    PMP::corefine_and_compute_difference(mesh_a, mesh_b, mesh_out);
+    std::string path = broad_phase::shortcut(mesh_a, mesh_b, 2, mesh_out);
+    if (path.empty())
+    {
+        PMP::corefine_and_compute_intersection(mesh_a, mesh_b, mesh_out);
+        path = "corefinement";
+    }
 
-    return compas::mesh_to_vertices_and_faces(mesh_out);
+    auto [V, F] = compas::mesh_to_vertices_and_faces(mesh_out);
+    return std::make_tuple(std::move(V), std::move(F), std::move(path));
 };
 
-std::tuple<compas::RowMatrixXd, compas::RowMatrixXi>
+std::tuple<compas::RowMatrixXd, compas::RowMatrixXi, std::string>
 pmp_boolean_intersection(
     Eigen::Ref<const compas::RowMatrixXd> vertices_a,
     Eigen::Ref<const compas::RowMatrixXi> faces_a,
     Eigen::Ref<const compas::RowMatrixXd> vertices_b,
     Eigen::Ref<const compas::RowMatrixXi> faces_b)
 {
-    compas::Mesh mesh_a = compas::mesh_from_vertices_and_faces(vertices_a, faces_a);
-    compas::Mesh mesh_b = compas::mesh_from_vertices_and_faces(vertices_b, faces_b);
-    compas::Mesh mesh_out;
+    return pmp_boolean_intersection(
+        compas::mesh_from_vertices_and_faces(vertices_a, faces_a),
+        compas::mesh_from_vertices_and_faces(vertices_b, faces_b));
+};
 
-    PMP::corefine_and_compute_intersection(mesh_a, mesh_b, mesh_out);
+std::tuple<compas::RowMatrixXd, compas::RowMatrixXi>
+pmp_split(
+    compas::Mesh mesh_a,
+    compas::Mesh mesh_b)
+{
+    PMP::split(mesh_a, mesh_b);
 
-    return compas::mesh_to_vertices_and_faces(mesh_out);
+    return compas::mesh_to_vertices_and_faces(mesh_a);
 };
 
 std::tuple<compas::RowMatrixXd, compas::RowMatrixXi>
@@ -69,11 +224,9 @@ pmp_split(
     Eigen::Ref<const compas::RowMatrixXd> vertices_b,
     Eigen::Ref<const compas::RowMatrixXi> faces_b)
 {
-    compas::Mesh mesh_a = compas::mesh_from_vertices_and_faces(vertices_a, faces_a);
-    compas::Mesh mesh_b = compas::mesh_from_vertices_and_faces(vertices_b, faces_b);
-    PMP::split(mesh_a, mesh_b);
-
-    return compas::mesh_to_vertices_and_faces(mesh_a);
+    return pmp_split(
+        compas::mesh_from_vertices_and_faces(vertices_a, faces_a),
+        compas::mesh_from_vertices_and_faces(vertices_b, faces_b));
 };
 
 namespace {
@@ -84,14 +237,10 @@ namespace {
 template <typename BoolOp>
 std::tuple<compas::RowMatrixXd, compas::RowMatrixXi, compas::RowMatrixXi>
 boolean_with_edges_impl(
-    Eigen::Ref<const compas::RowMatrixXd> VA,
-    Eigen::Ref<const compas::RowMatrixXi> FA,
-    Eigen::Ref<const compas::RowMatrixXd> VB,
-    Eigen::Ref<const compas::RowMatrixXi> FB,
+    compas::Mesh A,
+    compas::Mesh B,
     BoolOp op)
 {
-    compas::Mesh A = compas::mesh_from_vertices_and_faces(VA, FA);
-    compas::Mesh B = compas::mesh_from_vertices_and_faces(VB, FB);
     compas::Mesh out;
 
     auto ecm = get(CGAL::dynamic_edge_property_t<bool>(), out);
@@ -129,13 +278,11 @@ boolean_with_edges_impl(
 
 std::tuple<compas::RowMatrixXd, compas::RowMatrixXi, compas::RowMatrixXi>
 pmp_boolean_union_with_edges(
-    Eigen::Ref<const compas::RowMatrixXd> vertices_a,
-    Eigen::Ref<const compas::RowMatrixXi> faces_a,
-    Eigen::Ref<const compas::RowMatrixXd> vertices_b,
-    Eigen::Ref<const compas::RowMatrixXi> faces_b)
+    compas::Mesh mesh_a,
+    compas::Mesh mesh_b)
 {
     return boolean_with_edges_impl(
-        vertices_a, faces_a, vertices_b, faces_b,
+        std::move(mesh_a), std::move(mesh_b),
         [](compas::Mesh& a, compas::Mesh& b, compas::Mesh& out,
            auto np1, auto np2, auto npout) {
             PMP::corefine_and_compute_union(a, b, out, np1, np2, npout);
@@ -143,14 +290,24 @@ pmp_boolean_union_with_edges(
 }
 
 std::tuple<compas::RowMatrixXd, compas::RowMatrixXi, compas::RowMatrixXi>
-pmp_boolean_difference_with_edges(
+pmp_boolean_union_with_edges(
     Eigen::Ref<const compas::RowMatrixXd> vertices_a,
     Eigen::Ref<const compas::RowMatrixXi> faces_a,
     Eigen::Ref<const compas::RowMatrixXd> vertices_b,
     Eigen::Ref<const compas::RowMatrixXi> faces_b)
+{
+    return pmp_boolean_union_with_edges(
+        compas::mesh_from_vertices_and_faces(vertices_a, faces_a),
+        compas::mesh_from_vertices_and_faces(vertices_b, faces_b));
+}
+
+std::tuple<compas::RowMatrixXd, compas::RowMatrixXi, compas::RowMatrixXi>
+pmp_boolean_difference_with_edges(
+    compas::Mesh mesh_a,
+    compas::Mesh mesh_b)
 {
     return boolean_with_edges_impl(
-        vertices_a, faces_a, vertices_b, faces_b,
+        std::move(mesh_a), std::move(mesh_b),
         [](compas::Mesh& a, compas::Mesh& b, compas::Mesh& out,
            auto np1, auto np2, auto npout) {
             PMP::corefine_and_compute_difference(a, b, out, np1, np2, npout);
@@ -158,20 +315,42 @@ pmp_boolean_difference_with_edges(
 }
 
 std::tuple<compas::RowMatrixXd, compas::RowMatrixXi, compas::RowMatrixXi>
-pmp_boolean_intersection_with_edges(
+pmp_boolean_difference_with_edges(
     Eigen::Ref<const compas::RowMatrixXd> vertices_a,
     Eigen::Ref<const compas::RowMatrixXi> faces_a,
     Eigen::Ref<const compas::RowMatrixXd> vertices_b,
     Eigen::Ref<const compas::RowMatrixXi> faces_b)
+{
+    return pmp_boolean_difference_with_edges(
+        compas::mesh_from_vertices_and_faces(vertices_a, faces_a),
+        compas::mesh_from_vertices_and_faces(vertices_b, faces_b));
+}
+
+std::tuple<compas::RowMatrixXd, compas::RowMatrixXi, compas::RowMatrixXi>
+pmp_boolean_intersection_with_edges(
+    compas::Mesh mesh_a,
+    compas::Mesh mesh_b)
 {
     return boolean_with_edges_impl(
-        vertices_a, faces_a, vertices_b, faces_b,
+        std::move(mesh_a), std::move(mesh_b),
         [](compas::Mesh& a, compas::Mesh& b, compas::Mesh& out,
            auto np1, auto np2, auto npout) {
             PMP::corefine_and_compute_intersection(a, b, out, np1, np2, npout);
         });
 }
 
+std::tuple<compas::RowMatrixXd, compas::RowMatrixXi, compas::RowMatrixXi>
+pmp_boolean_intersection_with_edges(
+    Eigen::Ref<const compas::RowMatrixXd> vertices_a,
+    Eigen::Ref<const compas::RowMatrixXi> faces_a,
+    Eigen::Ref<const compas::RowMatrixXd> vertices_b,
+    Eigen::Ref<const compas::RowMatrixXi> faces_b)
+{
+    return pmp_boolean_intersection_with_edges(
+        compas::mesh_from_vertices_and_faces(vertices_a, faces_a),
+        compas::mesh_from_vertices_and_faces(vertices_b, faces_b));
+}
+
 namespace {
 
 // Per-face tag carried through the corefinement: which input mesh the face
@@ -214,14 +393,10 @@ struct FaceSourceVisitor
 template <typename BoolOp>
 std::tuple<compas::RowMatrixXd, compas::RowMatrixXi, compas::RowMatrixXi>
 boolean_with_face_source_impl(
-    Eigen::Ref<const compas::RowMatrixXd> VA,
-    Eigen::Ref<const compas::RowMatrixXi> FA,
-    Eigen::Ref<const compas::RowMatrixXd> VB,
-    Eigen::Ref<const compas::RowMatrixXi> FB,
+    compas::Mesh A,
+    compas::Mesh B,
     BoolOp op)
 {
-    compas::Mesh A = compas::mesh_from_vertices_and_faces(VA, FA);
-    compas::Mesh B = compas::mesh_from_vertices_and_faces(VB, FB);
     compas::Mesh out;
 
     auto tag_a = A.add_property_map<compas::Mesh::Face_index, FaceTag>("f:src", FaceTag{}).first;
@@ -262,13 +437,11 @@ boolean_with_face_source_impl(
 
 std::tuple<compas::RowMatrixXd, compas::RowMatrixXi, compas::RowMatrixXi>
 pmp_boolean_union_with_face_source(
-    Eigen::Ref<const compas::RowMatrixXd> vertices_a,
-    Eigen::Ref<const compas::RowMatrixXi> faces_a,
-    Eigen::Ref<const compas::RowMatrixXd> vertices_b,
-    Eigen::Ref<const compas::RowMatrixXi> faces_b)
+    compas::Mesh mesh_a,
+    compas::Mesh mesh_b)
 {
     return boolean_with_face_source_impl(
-        vertices_a, faces_a, vertices_b, faces_b,
+        std::move(mesh_a), std::move(mesh_b),
         [](compas::Mesh& a, compas::Mesh& b, compas::Mesh& out,
            auto np1, auto np2, auto npout) {
             PMP::corefine_and_compute_union(a, b, out, np1, np2, npout);
@@ -276,14 +449,24 @@ pmp_boolean_union_with_face_source(
 }
 
 std::tuple<compas::RowMatrixXd, compas::RowMatrixXi, compas::RowMatrixXi>
-pmp_boolean_difference_with_face_source(
+pmp_boolean_union_with_face_source(
     Eigen::Ref<const compas::RowMatrixXd> vertices_a,
     Eigen::Ref<const compas::RowMatrixXi> faces_a,
     Eigen::Ref<const compas::RowMatrixXd> vertices_b,
     Eigen::Ref<const compas::RowMatrixXi> faces_b)
+{
+    return pmp_boolean_union_with_face_source(
+        compas::mesh_from_vertices_and_faces(vertices_a, faces_a),
+        compas::mesh_from_vertices_and_faces(vertices_b, faces_b));
+}
+
+std::tuple<compas::RowMatrixXd, compas::RowMatrixXi, compas::RowMatrixXi>
+pmp_boolean_difference_with_face_source(
+    compas::Mesh mesh_a,
+    compas::Mesh mesh_b)
 {
     return boolean_with_face_source_impl(
-        vertices_a, faces_a, vertices_b, faces_b,
+        std::move(mesh_a), std::move(mesh_b),
         [](compas::Mesh& a, compas::Mesh& b, compas::Mesh& out,
            auto np1, auto np2, auto npout) {
             PMP::corefine_and_compute_difference(a, b, out, np1, np2, npout);
@@ -291,20 +474,180 @@ pmp_boolean_difference_with_face_source(
 }
 
 std::tuple<compas::RowMatrixXd, compas::RowMatrixXi, compas::RowMatrixXi>
-pmp_boolean_intersection_with_face_source(
+pmp_boolean_difference_with_face_source(
     Eigen::Ref<const compas::RowMatrixXd> vertices_a,
     Eigen::Ref<const compas::RowMatrixXi> faces_a,
     Eigen::Ref<const compas::RowMatrixXd> vertices_b,
     Eigen::Ref<const compas::RowMatrixXi> faces_b)
+{
+    return pmp_boolean_difference_with_face_source(
+        compas::mesh_from_vertices_and_faces(vertices_a, faces_a),
+        compas::mesh_from_vertices_and_faces(vertices_b, faces_b));
+}
+
+std::tuple<compas::RowMatrixXd, compas::RowMatrixXi, compas::RowMatrixXi>
+pmp_boolean_intersection_with_face_source(
+    compas::Mesh mesh_a,
+    compas::Mesh mesh_b)
 {
     return boolean_with_face_source_impl(
-        vertices_a, faces_a, vertices_b, faces_b,
+        std::move(mesh_a), std::move(mesh_b),
         [](compas::Mesh& a, compas::Mesh& b, compas::Mesh& out,
            auto np1, auto np2, auto npout) {
             PMP::corefine_and_compute_intersection(a, b, out, np1, np2, npout);
         });
 }
 
+std::tuple<compas::RowMatrixXd, compas::RowMatrixXi, compas::RowMatrixXi>
+pmp_boolean_intersection_with_face_source(
+    Eigen::Ref<const compas::RowMatrixXd> vertices_a,
+    Eigen::Ref<const compas::RowMatrixXi> faces_a,
+    Eigen::Ref<const compas::RowMatrixXd> vertices_b,
+    Eigen::Ref<const compas::RowMatrixXi> faces_b)
+{
+    return pmp_boolean_intersection_with_face_source(
+        compas::mesh_from_vertices_and_faces(vertices_a, faces_a),
+        compas::mesh_from_vertices_and_faces(vertices_b, faces_b));
+}
+
+// =============================================================================
+// Single corefinement with edges, face sources, and vertex sources.
+// =============================================================================
+
+namespace {
+
+// Per-vertex tag: which input mesh the vertex comes from (0 = A, 1 = B) and
+// its index there. Vertices created on the intersection curves keep -1.
+struct VertexTag
+{
+    int mesh_id = -1;
+    int vertex_id = -1;
+};
+
+// FaceSourceVisitor that also propagates VertexTag values to the output.
+struct SourceVisitor : public FaceSourceVisitor
+{
+    using vertex_descriptor = compas::Mesh::Vertex_index;
+    using VertexTagMap = compas::Mesh::Property_map<vertex_descriptor, VertexTag>;
+
+    std::map<const compas::Mesh*, VertexTagMap> vertex_tags;
+
+    void after_vertex_copy(vertex_descriptor v_src, const compas::Mesh& tm_src,
+                           vertex_descriptor v_tgt, const compas::Mesh& tm_tgt)
+    {
+        vertex_tags[&tm_tgt][v_tgt] = vertex_tags[&tm_src][v_src];
+    }
+};
+
+} // namespace
+
+std::tuple<compas::RowMatrixXd, compas::RowMatrixXi, compas::RowMatrixXi, compas::RowMatrixXi, compas::RowMatrixXi>
+pmp_boolean_mesh_mesh(
+    compas::Mesh mesh_a,
+    compas::Mesh mesh_b,
+    int operation,
+    bool return_edges,
+    bool return_face_source,
+    bool return_vertex_source)
+{
+    using face_descriptor = compas::Mesh::Face_index;
+    using vertex_descriptor = compas::Mesh::Vertex_index;
+
+    if (operation < 0 || operation > 2)
+        throw std::invalid_argument("operation must be 0 (union), 1 (difference), or 2 (intersection)");
+
+    compas::Mesh out;
+    SourceVisitor visitor;
+    compas::Mesh* meshes[3] = {&mesh_a, &mesh_b, &out};
+    for (int m = 0; m < 3; ++m)
+    {
+        auto ftags = meshes[m]->add_property_map<face_descriptor, FaceTag>("f:src", FaceTag{}).first;
+        auto vtags = meshes[m]->add_property_map<vertex_descriptor, VertexTag>("v:src", VertexTag{}).first;
+        if (m < 2)
+        {
+            int idx = 0;
+            for (auto f : meshes[m]->faces()) ftags[f] = {m, idx++};
+            idx = 0;
+            for (auto v : meshes[m]->vertices()) vtags[v] = {m, idx++};
+        }
+        visitor.tags[meshes[m]] = ftags;
+        visitor.vertex_tags[meshes[m]] = vtags;
+    }
+
+    auto ecm = get(CGAL::dynamic_edge_property_t<bool>(), out);
+
+    // The visitor is read from the parameters of the first input mesh.
+    auto np_a = PMP::parameters::visitor(visitor);
+    auto np_b = PMP::parameters::default_values();
+    auto np_out = PMP::parameters::edge_is_constrained_map(ecm);
+    switch (operation)
+    {
+    case 0: PMP::corefine_and_compute_union(mesh_a, mesh_b, out, np_a, np_b, np_out); break;
+    case 1: PMP::corefine_and_compute_difference(mesh_a, mesh_b, out, np_a, np_b, np_out); break;
+    default: PMP::corefine_and_compute_intersection(mesh_a, mesh_b, out, np_a, np_b, np_out); break;
+    }
+
+    auto [V, F] = compas::mesh_to_vertices_and_faces(out);
+
+    compas::RowMatrixXi E(0, 2), S(0, 2), VS(0, 2);
+    if (return_edges)
+    {
+        std::vector<std::pair<int, int>> edges;
+        for (auto e : out.edges())
+        {
+            if (!get(ecm, e))
+                continue;
+            auto h = out.halfedge(e);
+            edges.emplace_back(static_cast<int>(out.source(h).idx()), static_cast<int>(out.target(h).idx()));
+        }
+        E.resize(static_cast<Eigen::Index>(edges.size()), 2);
+        for (std::size_t i = 0; i < edges.size(); ++i)
+        {
+            E(static_cast<Eigen::Index>(i), 0) = edges[i].first;
+            E(static_cast<Eigen::Index>(i), 1) = edges[i].second;
+        }
+    }
+    if (return_face_source)
+    {
+        auto ftags = visitor.tags[&out];
+        S.resize(static_cast<Eigen::Index>(out.number_of_faces()), 2);
+        for (auto f : out.faces())
+        {
+            S(static_cast<Eigen::Index>(f.idx()), 0) = ftags[f].mesh_id;
+            S(static_cast<Eigen::Index>(f.idx()), 1) = ftags[f].face_id;
+        }
+    }
+    if (return_vertex_source)
+    {
+        auto vtags = visitor.vertex_tags[&out];
+        VS.resize(static_cast<Eigen::Index>(out.number_of_vertices()), 2);
+        for (auto v : out.vertices())
+        {
+            VS(static_cast<Eigen::Index>(v.idx()), 0) = vtags[v].mesh_id;
+            VS(static_cast<Eigen::Index>(v.idx()), 1) = vtags[v].vertex_id;
+        }
+    }
+
+    return std::make_tuple(std::move(V), std::move(F), std::move(E), std::move(S), std::move(VS));
+}
+
+std::tuple<compas::RowMatrixXd, compas::RowMatrixXi, compas::RowMatrixXi, compas::RowMatrixXi, compas::RowMatrixXi>
+pmp_boolean_mesh_mesh(
+    Eigen::Ref<const compas::RowMatrixXd> vertices_a,
+    Eigen::Ref<const compas::RowMatrixXi> faces_a,
+    Eigen::Ref<const compas::RowMatrixXd> vertices_b,
+    Eigen::Ref<const compas::RowMatrixXi> faces_b,
+    int operation,
+    bool return_edges,
+    bool return_face_source,
+    bool return_vertex_source)
+{
+    return pmp_boolean_mesh_mesh(
+        compas::mesh_from_vertices_and_faces(vertices_a, faces_a),
+        compas::mesh_from_vertices_and_faces(vertices_b, faces_b),
+        operation, return_edges, return_face_source, return_vertex_source);
+}
+
 // =============================================================================
 // EPECK chain: exact-constructions kernel from start to finish.
 // =============================================================================
@@ -553,422 +896,1883 @@ struct HFaceSourceVisitor
 
 } // namespace hybrid_chain
 
-std::tuple<compas::RowMatrixXd, compas::RowMatrixXi>
-pmp_boolean_chain_hybrid(
-    Eigen::Ref<const compas::RowMatrixXd> vertices,
-    Eigen::Ref<const compas::RowMatrixXi> faces,
-    const std::vector<int>& mesh_v_counts,
-    const std::vector<int>& mesh_f_counts,
-    const std::vector<int>& operations)
+// =============================================================================
+// Chain steps shared by the chain functions and BooleanAccumulator.
+// =============================================================================
+
+namespace chain {
+
+// Add the "f:src" face tags (mesh_id, face index) to a mesh entering a chain.
+template <typename Tag, typename MeshT>
+void tag_faces(MeshT& mesh, int mesh_id)
 {
-    using HMesh = hybrid_chain::HMesh;
-    using Exact_vertex_point_map = hybrid_chain::Exact_vertex_point_map;
+    auto tags = mesh.template add_property_map<typename MeshT::Face_index, Tag>("f:src", Tag{}).first;
+    int j = 0;
+    for (auto f : mesh.faces()) tags[f] = Tag{mesh_id, j++};
+}
 
-    compas::RowMatrixXd V_all = vertices;
-    compas::RowMatrixXi F_all = faces;
-    hybrid_chain::check_inputs(V_all, F_all, mesh_v_counts, mesh_f_counts, operations);
+// The "f:src" face tags of a mesh as an Fx2 matrix, in face order.
+template <typename Tag, typename MeshT>
+compas::RowMatrixXi face_sources(const MeshT& mesh)
+{
+    auto tags = *mesh.template property_map<typename MeshT::Face_index, Tag>("f:src");
+    compas::RowMatrixXi S(static_cast<Eigen::Index>(mesh.number_of_faces()), 2);
+    for (auto fd : mesh.faces())
+    {
+        const Tag& t = tags[fd];
+        const Eigen::Index row = static_cast<Eigen::Index>(fd.idx());
+        S(row, 0) = t.mesh_id;
+        S(row, 1) = t.face_id;
+    }
+    return S;
+}
 
-    int v_off = 0, f_off = 0;
-    HMesh m = hybrid_chain::slice_to_mesh(V_all, F_all, v_off, mesh_v_counts[0], f_off, mesh_f_counts[0]);
-    v_off += mesh_v_counts[0];
-    f_off += mesh_f_counts[0];
+void check_operation(int operation)
+{
+    if (operation < 0 || operation > 3)
+        throw std::invalid_argument("operation must be 0 (union), 1 (difference), 2 (intersection), or 3 (xor)");
+}
 
+// Check the operation codes of a chain. The two shells of a symmetric
+// difference touch along the intersection curves (see symmetric_difference),
+// so the result is not a valid operand for a later corefinement and xor can
+// only be the last operation.
+void check_operations(const std::vector<int>& operations)
+{
     for (std::size_t i = 0; i < operations.size(); ++i)
     {
-        HMesh B = hybrid_chain::slice_to_mesh(V_all, F_all,
-                                v_off, mesh_v_counts[i + 1],
-                                f_off, mesh_f_counts[i + 1]);
-        v_off += mesh_v_counts[i + 1];
-        f_off += mesh_f_counts[i + 1];
+        check_operation(operations[i]);
+        if (operations[i] == 3 && i + 1 < operations.size())
+            throw std::invalid_argument("xor can only be the last operation of a chain");
+    }
+}
+
+// Symmetric difference of m and b from a single corefinement: A - B and
+// B - A are computed together and concatenated into `out`. The two volumes
+// only touch along the intersection curves, whose vertices stay duplicated,
+// so the result is closed and combinatorially manifold, but its two shells
+// still meet geometrically there and does_self_intersect would reject it
+// as the operand of another corefinement. Face tags of the visitor in
+// `np_m` reach `out` through the per-mesh property maps, which join() copies
+// from `b_minus_a`. Returns false if CGAL could not compute either part.
+template <typename Mesh, typename NP1, typename NP2, typename NPOut>
+bool symmetric_difference(
+    Mesh& m, Mesh& b, Mesh& out, Mesh& b_minus_a,
+    const NP1& np_m, const NP2& np_b, const NPOut& np_out, const NPOut& np_b_minus_a)
+{
+    std::array<std::optional<Mesh*>, 4> output;
+    output[PMP::Corefinement::TM1_MINUS_TM2] = &out;
+    output[PMP::Corefinement::TM2_MINUS_TM1] = &b_minus_a;
+    // Union and intersection are not requested; their parameters are unused.
+    auto ok = PMP::corefine_and_compute_boolean_operations(
+        m, b, output, np_m, np_b, std::make_tuple(np_out, np_out, np_out, np_b_minus_a));
+    out.join(b_minus_a);
+    return ok[PMP::Corefinement::TM1_MINUS_TM2] && ok[PMP::Corefinement::TM2_MINUS_TM1];
+}
+
+// Outcome of rounding an intermediate result (see exact_chain::snap).
+enum class SnapResult { valid, rolled_back, self_intersecting };
+
+// Whether the result of step `i` (0-based) of a chain of `num_steps` is
+// rounded. The last result is converted to doubles anyway.
+inline bool snap_due(std::size_t i, int snap_every, std::size_t num_steps)
+{
+    return snap_every > 0 && (i + 1) % static_cast<std::size_t>(snap_every) == 0 && i + 1 < num_steps;
+}
+
+} // namespace chain
 
-        HMesh tmp;
-        hybrid_chain::get_or_add_epm(tmp);
+namespace exact_chain {
 
-        Exact_vertex_point_map vpm_m{hybrid_chain::get_or_add_epm(m), &m};
-        Exact_vertex_point_map vpm_B{hybrid_chain::get_or_add_epm(B), &B};
-        Exact_vertex_point_map vpm_tmp{hybrid_chain::get_or_add_epm(tmp), &tmp};
+// One step of a chain: m = m OP b. With `track`, m and b must carry "f:src"
+// face tags (see chain::tag_faces), which are propagated to the result.
+void step(EMesh& m, EMesh& b, int operation, bool track)
+{
+    chain::check_operation(operation);
 
-        switch (operations[i])
+    EMesh tmp, b_minus_a;
+    const auto np_out = PMP::parameters::default_values();
+    if (track)
+    {
+        EFaceSourceVisitor visitor;
+        visitor.tags[&m] = *m.property_map<EMesh::Face_index, EFaceTag>("f:src");
+        visitor.tags[&b] = *b.property_map<EMesh::Face_index, EFaceTag>("f:src");
+        visitor.tags[&tmp] = tmp.add_property_map<EMesh::Face_index, EFaceTag>("f:src", EFaceTag{}).first;
+        visitor.tags[&b_minus_a] = b_minus_a.add_property_map<EMesh::Face_index, EFaceTag>("f:src", EFaceTag{}).first;
+
+        auto np_m = PMP::parameters::visitor(visitor);
+        switch (operation)
         {
-        case 0:
-            PMP::corefine_and_compute_union(m, B, tmp,
-                PMP::parameters::vertex_point_map(vpm_m),
-                PMP::parameters::vertex_point_map(vpm_B),
-                PMP::parameters::vertex_point_map(vpm_tmp));
-            break;
-        case 1:
-            PMP::corefine_and_compute_difference(m, B, tmp,
-                PMP::parameters::vertex_point_map(vpm_m),
-                PMP::parameters::vertex_point_map(vpm_B),
-                PMP::parameters::vertex_point_map(vpm_tmp));
-            break;
-        case 2:
-            PMP::corefine_and_compute_intersection(m, B, tmp,
-                PMP::parameters::vertex_point_map(vpm_m),
-                PMP::parameters::vertex_point_map(vpm_B),
-                PMP::parameters::vertex_point_map(vpm_tmp));
-            break;
-        case 3: // xor: (A - B) union (B - A)
-        {
-            HMesh m_copy = m, B_copy = B;
-            HMesh a_minus_b, b_minus_a;
-            hybrid_chain::get_or_add_epm(a_minus_b);
-            hybrid_chain::get_or_add_epm(b_minus_a);
-
-            Exact_vertex_point_map vpm_mc{hybrid_chain::get_or_add_epm(m_copy), &m_copy};
-            Exact_vertex_point_map vpm_Bc{hybrid_chain::get_or_add_epm(B_copy), &B_copy};
-            Exact_vertex_point_map vpm_amb{hybrid_chain::get_or_add_epm(a_minus_b), &a_minus_b};
-            Exact_vertex_point_map vpm_bma{hybrid_chain::get_or_add_epm(b_minus_a), &b_minus_a};
-
-            PMP::corefine_and_compute_difference(m, B, a_minus_b,
-                PMP::parameters::vertex_point_map(vpm_m),
-                PMP::parameters::vertex_point_map(vpm_B),
-                PMP::parameters::vertex_point_map(vpm_amb));
-            PMP::corefine_and_compute_difference(B_copy, m_copy, b_minus_a,
-                PMP::parameters::vertex_point_map(vpm_Bc),
-                PMP::parameters::vertex_point_map(vpm_mc),
-                PMP::parameters::vertex_point_map(vpm_bma));
-
-            Exact_vertex_point_map vpm_amb2{hybrid_chain::get_or_add_epm(a_minus_b), &a_minus_b};
-            Exact_vertex_point_map vpm_bma2{hybrid_chain::get_or_add_epm(b_minus_a), &b_minus_a};
-            PMP::corefine_and_compute_union(a_minus_b, b_minus_a, tmp,
-                PMP::parameters::vertex_point_map(vpm_amb2),
-                PMP::parameters::vertex_point_map(vpm_bma2),
-                PMP::parameters::vertex_point_map(vpm_tmp));
+        case 0: PMP::corefine_and_compute_union(m, b, tmp, np_m); break;
+        case 1: PMP::corefine_and_compute_difference(m, b, tmp, np_m); break;
+        case 2: PMP::corefine_and_compute_intersection(m, b, tmp, np_m); break;
+        default:
+            if (!chain::symmetric_difference(m, b, tmp, b_minus_a, np_m, np_out, np_out, np_out))
+                throw std::runtime_error("xor failed: CGAL could not compute both parts of the symmetric difference");
             break;
         }
+    }
+    else
+    {
+        switch (operation)
+        {
+        case 0: PMP::corefine_and_compute_union(m, b, tmp); break;
+        case 1: PMP::corefine_and_compute_difference(m, b, tmp); break;
+        case 2: PMP::corefine_and_compute_intersection(m, b, tmp); break;
         default:
-            throw std::invalid_argument(
-                "operation must be 0 (union), 1 (difference), 2 (intersection), or 3 (xor)");
+            if (!chain::symmetric_difference(m, b, tmp, b_minus_a, np_out, np_out, np_out, np_out))
+                throw std::runtime_error("xor failed: CGAL could not compute both parts of the symmetric difference");
+            break;
         }
-        m = std::move(tmp);
     }
-
-    return hybrid_chain::mesh_to_VF(m);
+    m = std::move(tmp);
 }
 
-std::tuple<compas::RowMatrixXd, compas::RowMatrixXi, compas::RowMatrixXi>
-pmp_boolean_chain_with_face_source_hybrid(
-    Eigen::Ref<const compas::RowMatrixXd> vertices,
-    Eigen::Ref<const compas::RowMatrixXi> faces,
-    const std::vector<int>& mesh_v_counts,
-    const std::vector<int>& mesh_f_counts,
-    const std::vector<int>& operations)
+// Round the coordinates of m to doubles. Lazy-exact points carry the history
+// of their construction through every corefinement of a chain; rounding
+// replaces each point by a plain leaf, which bounds memory and keeps later
+// predicates cheap. The rounded mesh is always checked for self-intersections.
+// With `rollback`, a rounding that makes the mesh self-intersect is undone;
+// exact() has then still collapsed the history of every point. Without it,
+// the self-intersecting mesh is kept and reported.
+chain::SnapResult snap(EMesh& m, bool rollback)
 {
-    using HMesh = hybrid_chain::HMesh;
-    using HFaceTag = hybrid_chain::HFaceTag;
-    using HFaceSourceVisitor = hybrid_chain::HFaceSourceVisitor;
-    using Exact_vertex_point_map = hybrid_chain::Exact_vertex_point_map;
-
-    compas::RowMatrixXd V_all = vertices;
-    compas::RowMatrixXi F_all = faces;
-    hybrid_chain::check_inputs(V_all, F_all, mesh_v_counts, mesh_f_counts, operations);
-
-    int v_off = 0, f_off = 0;
-    HMesh m = hybrid_chain::slice_to_mesh(V_all, F_all, v_off, mesh_v_counts[0], f_off, mesh_f_counts[0]);
-    v_off += mesh_v_counts[0];
-    f_off += mesh_f_counts[0];
+    std::vector<EPoint> exact_points;
+    if (rollback) exact_points.reserve(m.number_of_vertices());
 
-    auto m_tag = m.add_property_map<HMesh::Face_index, HFaceTag>("f:src", HFaceTag{}).first;
+    for (auto v : m.vertices())
     {
-        int j = 0;
-        for (auto f : m.faces()) m_tag[f] = HFaceTag{0, j++};
+        EPoint& p = m.point(v);
+        CGAL::exact(p);
+        if (rollback) exact_points.push_back(p);
+        p = EPoint(CGAL::to_double(p.x()), CGAL::to_double(p.y()), CGAL::to_double(p.z()));
     }
 
-    for (std::size_t i = 0; i < operations.size(); ++i)
-    {
-        HMesh B = hybrid_chain::slice_to_mesh(V_all, F_all,
-                                v_off, mesh_v_counts[i + 1],
-                                f_off, mesh_f_counts[i + 1]);
+    if (!PMP::does_self_intersect(m))
+        return chain::SnapResult::valid;
+    if (!rollback)
+        return chain::SnapResult::self_intersecting;
+
+    std::size_t i = 0;
+    for (auto v : m.vertices()) m.point(v) = exact_points[i++];
+    return chain::SnapResult::rolled_back;
+}
+
+} // namespace exact_chain
+
+namespace hybrid_chain {
+
+// One step of a chain with exact vertex point maps: m = m OP b. See
+// exact_chain::step for `track`.
+void step(HMesh& m, HMesh& b, int operation, bool track)
+{
+    chain::check_operation(operation);
+
+    HMesh tmp, b_minus_a;
+    Exact_vertex_point_map vpm_m{get_or_add_epm(m), &m};
+    Exact_vertex_point_map vpm_b{get_or_add_epm(b), &b};
+    Exact_vertex_point_map vpm_tmp{get_or_add_epm(tmp), &tmp};
+    Exact_vertex_point_map vpm_bma{get_or_add_epm(b_minus_a), &b_minus_a};
+
+    auto np_b = PMP::parameters::vertex_point_map(vpm_b);
+    auto np_tmp = PMP::parameters::vertex_point_map(vpm_tmp);
+    auto np_bma = PMP::parameters::vertex_point_map(vpm_bma);
+
+    if (track)
+    {
+        HFaceSourceVisitor visitor;
+        visitor.tags[&m] = *m.property_map<HMesh::Face_index, HFaceTag>("f:src");
+        visitor.tags[&b] = *b.property_map<HMesh::Face_index, HFaceTag>("f:src");
+        visitor.tags[&tmp] = tmp.add_property_map<HMesh::Face_index, HFaceTag>("f:src", HFaceTag{}).first;
+        visitor.tags[&b_minus_a] = b_minus_a.add_property_map<HMesh::Face_index, HFaceTag>("f:src", HFaceTag{}).first;
+
+        auto np_m = PMP::parameters::vertex_point_map(vpm_m).visitor(visitor);
+        switch (operation)
+        {
+        case 0: PMP::corefine_and_compute_union(m, b, tmp, np_m, np_b, np_tmp); break;
+        case 1: PMP::corefine_and_compute_difference(m, b, tmp, np_m, np_b, np_tmp); break;
+        case 2: PMP::corefine_and_compute_intersection(m, b, tmp, np_m, np_b, np_tmp); break;
+        default:
+            if (!chain::symmetric_difference(m, b, tmp, b_minus_a, np_m, np_b, np_tmp, np_bma))
+                throw std::runtime_error("xor failed: CGAL could not compute both parts of the symmetric difference");
+            break;
+        }
+    }
+    else
+    {
+        auto np_m = PMP::parameters::vertex_point_map(vpm_m);
+        switch (operation)
+        {
+        case 0: PMP::corefine_and_compute_union(m, b, tmp, np_m, np_b, np_tmp); break;
+        case 1: PMP::corefine_and_compute_difference(m, b, tmp, np_m, np_b, np_tmp); break;
+        case 2: PMP::corefine_and_compute_intersection(m, b, tmp, np_m, np_b, np_tmp); break;
+        default:
+            if (!chain::symmetric_difference(m, b, tmp, b_minus_a, np_m, np_b, np_tmp, np_bma))
+                throw std::runtime_error("xor failed: CGAL could not compute both parts of the symmetric difference");
+            break;
+        }
+    }
+    m = std::move(tmp);
+}
+
+// Round the exact point map of m to the double coordinates of the mesh.
+// See exact_chain::snap.
+chain::SnapResult snap(HMesh& m, bool rollback)
+{
+    auto epm = get_or_add_epm(m);
+    ToExact to_exact;
+    std::vector<std::pair<HPoint, EPoint>> exact_points;
+    if (rollback) exact_points.reserve(m.number_of_vertices());
+
+    for (auto v : m.vertices())
+    {
+        const EPoint& e = epm[v];
+        CGAL::exact(e);
+        if (rollback) exact_points.emplace_back(m.point(v), e);
+        m.point(v) = HPoint(CGAL::to_double(e.x()), CGAL::to_double(e.y()), CGAL::to_double(e.z()));
+        epm[v] = to_exact(m.point(v));
+    }
+
+    if (!PMP::does_self_intersect(m))
+        return chain::SnapResult::valid;
+    if (!rollback)
+        return chain::SnapResult::self_intersecting;
+
+    std::size_t i = 0;
+    for (auto v : m.vertices())
+    {
+        m.point(v) = exact_points[i].first;
+        epm[v] = exact_points[i].second;
+        ++i;
+    }
+    return chain::SnapResult::rolled_back;
+}
+
+} // namespace hybrid_chain
+
+std::tuple<compas::RowMatrixXd, compas::RowMatrixXi, int>
+pmp_boolean_chain_hybrid(
+    Eigen::Ref<const compas::RowMatrixXd> vertices,
+    Eigen::Ref<const compas::RowMatrixXi> faces,
+    const std::vector<int>& mesh_v_counts,
+    const std::vector<int>& mesh_f_counts,
+    const std::vector<int>& operations,
+    int snap_every,
+    bool snap_rollback)
+{
+    using HMesh = hybrid_chain::HMesh;
+
+    compas::RowMatrixXd V_all = vertices;
+    compas::RowMatrixXi F_all = faces;
+    hybrid_chain::check_inputs(V_all, F_all, mesh_v_counts, mesh_f_counts, operations);
+    chain::check_operations(operations);
+
+    int v_off = 0, f_off = 0, failed_snaps = 0;
+    HMesh m = hybrid_chain::slice_to_mesh(V_all, F_all, v_off, mesh_v_counts[0], f_off, mesh_f_counts[0]);
+    v_off += mesh_v_counts[0];
+    f_off += mesh_f_counts[0];
+
+    for (std::size_t i = 0; i < operations.size(); ++i)
+    {
+        HMesh B = hybrid_chain::slice_to_mesh(V_all, F_all,
+                                v_off, mesh_v_counts[i + 1],
+                                f_off, mesh_f_counts[i + 1]);
+        v_off += mesh_v_counts[i + 1];
+        f_off += mesh_f_counts[i + 1];
+
+        hybrid_chain::step(m, B, operations[i], false);
+        if (chain::snap_due(i, snap_every, operations.size()) &&
+            hybrid_chain::snap(m, snap_rollback) != chain::SnapResult::valid)
+            ++failed_snaps;
+    }
+
+    auto [V_out, F_out] = hybrid_chain::mesh_to_VF(m);
+    return {std::move(V_out), std::move(F_out), failed_snaps};
+}
+
+std::tuple<compas::RowMatrixXd, compas::RowMatrixXi, compas::RowMatrixXi, int>
+pmp_boolean_chain_with_face_source_hybrid(
+    Eigen::Ref<const compas::RowMatrixXd> vertices,
+    Eigen::Ref<const compas::RowMatrixXi> faces,
+    const std::vector<int>& mesh_v_counts,
+    const std::vector<int>& mesh_f_counts,
+    const std::vector<int>& operations,
+    int snap_every,
+    bool snap_rollback)
+{
+    using HMesh = hybrid_chain::HMesh;
+    using HFaceTag = hybrid_chain::HFaceTag;
+
+    compas::RowMatrixXd V_all = vertices;
+    compas::RowMatrixXi F_all = faces;
+    hybrid_chain::check_inputs(V_all, F_all, mesh_v_counts, mesh_f_counts, operations);
+    chain::check_operations(operations);
+
+    int v_off = 0, f_off = 0, failed_snaps = 0;
+    HMesh m = hybrid_chain::slice_to_mesh(V_all, F_all, v_off, mesh_v_counts[0], f_off, mesh_f_counts[0]);
+    v_off += mesh_v_counts[0];
+    f_off += mesh_f_counts[0];
+    chain::tag_faces<HFaceTag>(m, 0);
+
+    for (std::size_t i = 0; i < operations.size(); ++i)
+    {
+        HMesh B = hybrid_chain::slice_to_mesh(V_all, F_all,
+                                v_off, mesh_v_counts[i + 1],
+                                f_off, mesh_f_counts[i + 1]);
+        v_off += mesh_v_counts[i + 1];
+        f_off += mesh_f_counts[i + 1];
+        chain::tag_faces<HFaceTag>(B, static_cast<int>(i + 1));
+
+        hybrid_chain::step(m, B, operations[i], true);
+        if (chain::snap_due(i, snap_every, operations.size()) &&
+            hybrid_chain::snap(m, snap_rollback) != chain::SnapResult::valid)
+            ++failed_snaps;
+    }
+
+    auto [V_out, F_out] = hybrid_chain::mesh_to_VF(m);
+    return {std::move(V_out), std::move(F_out), chain::face_sources<HFaceTag>(m), failed_snaps};
+}
+
+std::tuple<compas::RowMatrixXd, compas::RowMatrixXi, int>
+pmp_boolean_chain(
+    Eigen::Ref<const compas::RowMatrixXd> vertices,
+    Eigen::Ref<const compas::RowMatrixXi> faces,
+    const std::vector<int>& mesh_v_counts,
+    const std::vector<int>& mesh_f_counts,
+    const std::vector<int>& operations,
+    int snap_every,
+    bool snap_rollback)
+{
+    compas::RowMatrixXd V_all = vertices;
+    compas::RowMatrixXi F_all = faces;
+    exact_chain::check_inputs(V_all, F_all, mesh_v_counts, mesh_f_counts, operations);
+    chain::check_operations(operations);
+
+    int v_off = 0, f_off = 0, failed_snaps = 0;
+    exact_chain::EMesh m = exact_chain::slice_to_mesh(V_all, F_all, v_off, mesh_v_counts[0], f_off, mesh_f_counts[0]);
+    v_off += mesh_v_counts[0];
+    f_off += mesh_f_counts[0];
+
+    for (std::size_t i = 0; i < operations.size(); ++i)
+    {
+        exact_chain::EMesh B = exact_chain::slice_to_mesh(V_all, F_all,
+                                v_off, mesh_v_counts[i + 1],
+                                f_off, mesh_f_counts[i + 1]);
         v_off += mesh_v_counts[i + 1];
         f_off += mesh_f_counts[i + 1];
 
-        auto b_tag = B.add_property_map<HMesh::Face_index, HFaceTag>("f:src", HFaceTag{}).first;
-        {
-            int j = 0;
-            const int mesh_id = static_cast<int>(i + 1);
-            for (auto f : B.faces()) b_tag[f] = HFaceTag{mesh_id, j++};
-        }
+        exact_chain::step(m, B, operations[i], false);
+        if (chain::snap_due(i, snap_every, operations.size()) &&
+            exact_chain::snap(m, snap_rollback) != chain::SnapResult::valid)
+            ++failed_snaps;
+    }
+
+    auto [V_out, F_out] = exact_chain::mesh_to_VF(m);
+    return {std::move(V_out), std::move(F_out), failed_snaps};
+}
+
+std::tuple<compas::RowMatrixXd, compas::RowMatrixXi, compas::RowMatrixXi, int>
+pmp_boolean_chain_with_face_source(
+    Eigen::Ref<const compas::RowMatrixXd> vertices,
+    Eigen::Ref<const compas::RowMatrixXi> faces,
+    const std::vector<int>& mesh_v_counts,
+    const std::vector<int>& mesh_f_counts,
+    const std::vector<int>& operations,
+    int snap_every,
+    bool snap_rollback)
+{
+    using EFaceTag = exact_chain::EFaceTag;
+
+    compas::RowMatrixXd V_all = vertices;
+    compas::RowMatrixXi F_all = faces;
+    exact_chain::check_inputs(V_all, F_all, mesh_v_counts, mesh_f_counts, operations);
+    chain::check_operations(operations);
+
+    int v_off = 0, f_off = 0, failed_snaps = 0;
+    exact_chain::EMesh m = exact_chain::slice_to_mesh(V_all, F_all, v_off, mesh_v_counts[0], f_off, mesh_f_counts[0]);
+    v_off += mesh_v_counts[0];
+    f_off += mesh_f_counts[0];
+    chain::tag_faces<EFaceTag>(m, 0);
+
+    for (std::size_t i = 0; i < operations.size(); ++i)
+    {
+        exact_chain::EMesh B = exact_chain::slice_to_mesh(V_all, F_all,
+                                v_off, mesh_v_counts[i + 1],
+                                f_off, mesh_f_counts[i + 1]);
+        v_off += mesh_v_counts[i + 1];
+        f_off += mesh_f_counts[i + 1];
+        chain::tag_faces<EFaceTag>(B, static_cast<int>(i + 1));
+
+        exact_chain::step(m, B, operations[i], true);
+        if (chain::snap_due(i, snap_every, operations.size()) &&
+            exact_chain::snap(m, snap_rollback) != chain::SnapResult::valid)
+            ++failed_snaps;
+    }
+
+    auto [V_out, F_out] = exact_chain::mesh_to_VF(m);
+    return {std::move(V_out), std::move(F_out), chain::face_sources<EFaceTag>(m), failed_snaps};
+}
+
+// =============================================================================
+// Batched booleans: one mesh A against many meshes B_i on native threads.
+// =============================================================================
+
+namespace batch {
+
+// Row offsets of every mesh in the flat (V, F) arrays.
+std::pair<std::vector<int>, std::vector<int>> offsets(
+    Eigen::Index n_vertices, Eigen::Index n_faces,
+    const std::vector<int>& vc, const std::vector<int>& fc)
+{
+    if (vc.size() != fc.size())
+        throw std::invalid_argument("mesh_v_counts and mesh_f_counts must have the same length");
+
+    std::vector<int> v_off(vc.size() + 1, 0), f_off(fc.size() + 1, 0);
+    for (std::size_t i = 0; i < vc.size(); ++i)
+    {
+        v_off[i + 1] = v_off[i] + vc[i];
+        f_off[i + 1] = f_off[i] + fc[i];
+    }
+    if (v_off.back() != n_vertices)
+        throw std::invalid_argument("sum(mesh_v_counts) must equal vertices.rows()");
+    if (f_off.back() != n_faces)
+        throw std::invalid_argument("sum(mesh_f_counts) must equal faces.rows()");
+    return {std::move(v_off), std::move(f_off)};
+}
+
+// Run one boolean on two EPICK meshes (both are modified by the corefinement).
+// Returns false if CGAL reports that the output could not be computed.
+bool compute(compas::Mesh& a, compas::Mesh& b, int operation, compas::Mesh& out)
+{
+    if (operation < 3 && !broad_phase::shortcut(a, b, operation, out).empty())
+        return true;
+
+    auto np = PMP::parameters::throw_on_self_intersection(true);
+    switch (operation)
+    {
+    case 0: return PMP::corefine_and_compute_union(a, b, out, np);
+    case 1: return PMP::corefine_and_compute_difference(a, b, out, np);
+    case 2: return PMP::corefine_and_compute_intersection(a, b, out, np);
+    case 3:
+    {
+        compas::Mesh b_minus_a;
+        const auto np_out = PMP::parameters::default_values();
+        return chain::symmetric_difference(a, b, out, b_minus_a, np, np, np_out, np_out);
+    }
+    default:
+        throw std::invalid_argument(
+            "operation must be 0 (union), 1 (difference), 2 (intersection), or 3 (xor)");
+    }
+}
+
+} // namespace batch
+
+std::tuple<std::vector<compas::RowMatrixXd>, std::vector<compas::RowMatrixXi>, std::vector<std::string>>
+pmp_boolean_many(
+    const compas::Mesh& mesh_a,
+    Eigen::Ref<const compas::RowMatrixXd> vertices,
+    Eigen::Ref<const compas::RowMatrixXi> faces,
+    const std::vector<int>& mesh_v_counts,
+    const std::vector<int>& mesh_f_counts,
+    int operation,
+    int num_threads)
+{
+    if (operation < 0 || operation > 3)
+        throw std::invalid_argument(
+            "operation must be 0 (union), 1 (difference), 2 (intersection), or 3 (xor)");
+
+    auto [v_off, f_off] = batch::offsets(vertices.rows(), faces.rows(), mesh_v_counts, mesh_f_counts);
+    const std::size_t n = mesh_v_counts.size();
+
+    std::vector<compas::RowMatrixXd> V_out(n, compas::RowMatrixXd(0, 3));
+    std::vector<compas::RowMatrixXi> F_out(n, compas::RowMatrixXi(0, 3));
+    std::vector<std::string> errors(n);
+
+    compas::parallel_for(n, [&](std::size_t i) {
+        try
+        {
+            compas::Mesh A = mesh_a;
+            compas::Mesh B = compas::mesh_from_vertices_and_faces(
+                vertices.middleRows(v_off[i], mesh_v_counts[i]),
+                faces.middleRows(f_off[i], mesh_f_counts[i]));
+            compas::Mesh out;
+
+            if (!batch::compute(A, B, operation, out))
+            {
+                errors[i] = "the boolean operation could not be computed for this mesh";
+                return;
+            }
+            std::tie(V_out[i], F_out[i]) = compas::mesh_to_vertices_and_faces(out);
+        }
+        catch (const std::exception& e)
+        {
+            errors[i] = e.what();
+        }
+        catch (...)
+        {
+            errors[i] = "unknown error";
+        }
+    }, static_cast<std::size_t>(std::max(num_threads, 0)));
+
+    return {std::move(V_out), std::move(F_out), std::move(errors)};
+}
+
+std::tuple<std::vector<compas::RowMatrixXd>, std::vector<compas::RowMatrixXi>, std::vector<std::string>>
+pmp_boolean_many(
+    Eigen::Ref<const compas::RowMatrixXd> vertices_a,
+    Eigen::Ref<const compas::RowMatrixXi> faces_a,
+    Eigen::Ref<const compas::RowMatrixXd> vertices,
+    Eigen::Ref<const compas::RowMatrixXi> faces,
+    const std::vector<int>& mesh_v_counts,
+    const std::vector<int>& mesh_f_counts,
+    int operation,
+    int num_threads)
+{
+    // A is converted once and copied for every item.
+    compas::Mesh mesh_a = compas::mesh_from_vertices_and_faces(vertices_a, faces_a);
+    return pmp_boolean_many(mesh_a, vertices, faces, mesh_v_counts, mesh_f_counts, operation, num_threads);
+}
+
+// =============================================================================
+// Balanced-tree union of many meshes.
+// Meshes are grouped by (transitive) bounding-box overlap; every group is
+// reduced pairwise in a balanced binary tree, with all pairs of a tree level
+// unioned concurrently. The groups are bbox-disjoint, so their results are
+// simply concatenated.
+// =============================================================================
+
+namespace union_tree {
+
+struct Box
+{
+    double min[3];
+    double max[3];
+};
+
+std::vector<Box> mesh_boxes(
+    const compas::RowMatrixXd& V_all,
+    const std::vector<int>& v_off,
+    const std::vector<int>& vc)
+{
+    std::vector<Box> boxes(vc.size());
+    for (std::size_t i = 0; i < vc.size(); ++i)
+    {
+        Box& b = boxes[i];
+        for (int k = 0; k < 3; ++k)
+        {
+            b.min[k] = std::numeric_limits<double>::infinity();
+            b.max[k] = -std::numeric_limits<double>::infinity();
+        }
+        for (int r = v_off[i]; r < v_off[i] + vc[i]; ++r)
+        {
+            for (int k = 0; k < 3; ++k)
+            {
+                b.min[k] = std::min(b.min[k], V_all(r, k));
+                b.max[k] = std::max(b.max[k], V_all(r, k));
+            }
+        }
+    }
+    return boxes;
+}
+
+int find(std::vector<int>& parent, int i)
+{
+    while (parent[i] != i)
+    {
+        parent[i] = parent[parent[i]];
+        i = parent[i];
+    }
+    return i;
+}
+
+// Pairs of boxes that overlap, by a sweep along x. `order` receives the
+// indices sorted by the lower x of their box.
+std::vector<std::pair<int, int>> overlap_pairs(const std::vector<Box>& boxes, std::vector<int>& order)
+{
+    const int n = static_cast<int>(boxes.size());
+    order.resize(n);
+    for (int i = 0; i < n; ++i) order[i] = i;
+    std::sort(order.begin(), order.end(), [&](int a, int b) { return boxes[a].min[0] < boxes[b].min[0]; });
+
+    std::vector<std::pair<int, int>> pairs;
+    std::vector<int> active;
+    for (int i : order)
+    {
+        const Box& bi = boxes[i];
+        active.erase(
+            std::remove_if(active.begin(), active.end(), [&](int j) { return boxes[j].max[0] < bi.min[0]; }),
+            active.end());
+        for (int j : active)
+        {
+            const Box& bj = boxes[j];
+            if (bi.min[1] <= bj.max[1] && bj.min[1] <= bi.max[1] &&
+                bi.min[2] <= bj.max[2] && bj.min[2] <= bi.max[2])
+            {
+                pairs.push_back({j, i});
+            }
+        }
+        active.push_back(i);
+    }
+    return pairs;
+}
+
+// Connected components of the graph with the given edges. Members of a
+// component keep the given order, so that neighbouring meshes end up in the
+// same subtree.
+std::vector<std::vector<int>> components(const std::vector<int>& order, const std::vector<std::pair<int, int>>& pairs)
+{
+    std::vector<int> parent(order.size());
+    for (std::size_t i = 0; i < parent.size(); ++i) parent[i] = static_cast<int>(i);
+    for (auto [i, j] : pairs) parent[find(parent, i)] = find(parent, j);
+
+    std::map<int, std::vector<int>> members;
+    for (int i : order) members[find(parent, i)].push_back(i);
+
+    std::vector<std::vector<int>> groups;
+    groups.reserve(members.size());
+    for (auto& [root, group] : members) groups.push_back(std::move(group));
+    return groups;
+}
+
+// Connected components of the bbox-overlap graph.
+std::vector<std::vector<int>> overlap_groups(const std::vector<Box>& boxes)
+{
+    std::vector<int> order;
+    auto pairs = overlap_pairs(boxes, order);
+    return components(order, pairs);
+}
+
+// Reduce every group to a single mesh. `union_pair(a, b, out)` must return
+// false if the union could not be computed.
+template <typename MeshT, typename UnionPair>
+std::vector<MeshT> reduce(std::vector<std::vector<MeshT>> groups, UnionPair union_pair, std::size_t num_threads)
+{
+    while (true)
+    {
+        std::vector<std::pair<std::size_t, std::size_t>> tasks;
+        for (std::size_t g = 0; g < groups.size(); ++g)
+            for (std::size_t k = 0; k < groups[g].size() / 2; ++k)
+                tasks.push_back({g, k});
+        if (tasks.empty()) break;
+
+        std::vector<std::vector<MeshT>> next(groups.size());
+        for (std::size_t g = 0; g < groups.size(); ++g)
+        {
+            next[g].resize((groups[g].size() + 1) / 2);
+            if (groups[g].size() % 2 == 1) next[g].back() = std::move(groups[g].back());
+        }
+
+        compas::parallel_for(tasks.size(), [&](std::size_t t) {
+            auto [g, k] = tasks[t];
+            if (!union_pair(groups[g][2 * k], groups[g][2 * k + 1], next[g][k]))
+                throw std::runtime_error("the union of two meshes could not be computed");
+        }, num_threads);
+
+        groups = std::move(next);
+    }
+
+    std::vector<MeshT> result;
+    result.reserve(groups.size());
+    for (auto& group : groups) result.push_back(std::move(group.front()));
+    return result;
+}
+
+// Union of two hybrid meshes with their exact vertex point maps.
+bool hybrid_union(hybrid_chain::HMesh& a, hybrid_chain::HMesh& b, hybrid_chain::HMesh& out)
+{
+    using Exact_vertex_point_map = hybrid_chain::Exact_vertex_point_map;
+    Exact_vertex_point_map vpm_a{hybrid_chain::get_or_add_epm(a), &a};
+    Exact_vertex_point_map vpm_b{hybrid_chain::get_or_add_epm(b), &b};
+    Exact_vertex_point_map vpm_out{hybrid_chain::get_or_add_epm(out), &out};
+    return PMP::corefine_and_compute_union(a, b, out,
+        PMP::parameters::vertex_point_map(vpm_a),
+        PMP::parameters::vertex_point_map(vpm_b),
+        PMP::parameters::vertex_point_map(vpm_out));
+}
+
+template <typename MeshT, typename SliceToMesh, typename ToVF, typename UnionPair>
+std::tuple<compas::RowMatrixXd, compas::RowMatrixXi> union_many(
+    const compas::RowMatrixXd& V_all,
+    const compas::RowMatrixXi& F_all,
+    const std::vector<int>& vc,
+    const std::vector<int>& fc,
+    SliceToMesh slice_to_mesh,
+    ToVF to_vf,
+    UnionPair union_pair,
+    std::size_t num_threads)
+{
+    auto [v_off, f_off] = batch::offsets(V_all.rows(), F_all.rows(), vc, fc);
+    const auto groups = overlap_groups(mesh_boxes(V_all, v_off, vc));
+
+    std::vector<std::vector<MeshT>> meshes(groups.size());
+    std::vector<std::pair<std::size_t, std::size_t>> slots;
+    for (std::size_t g = 0; g < groups.size(); ++g)
+    {
+        meshes[g].resize(groups[g].size());
+        for (std::size_t k = 0; k < groups[g].size(); ++k) slots.push_back({g, k});
+    }
+    compas::parallel_for(slots.size(), [&](std::size_t s) {
+        auto [g, k] = slots[s];
+        const int i = groups[g][k];
+        meshes[g][k] = slice_to_mesh(V_all, F_all, v_off[i], vc[i], f_off[i], fc[i]);
+    }, num_threads);
+
+    std::vector<MeshT> results = reduce<MeshT>(std::move(meshes), union_pair, num_threads);
+
+    // The groups are bbox-disjoint: their union is their concatenation.
+    std::vector<compas::RowMatrixXd> Vs;
+    std::vector<compas::RowMatrixXi> Fs;
+    Eigen::Index nv = 0, nf = 0;
+    for (const MeshT& mesh : results)
+    {
+        auto [V, F] = to_vf(mesh);
+        nv += V.rows();
+        nf += F.rows();
+        Vs.push_back(std::move(V));
+        Fs.push_back(std::move(F));
+    }
+
+    compas::RowMatrixXd V_out(nv, 3);
+    compas::RowMatrixXi F_out(nf, 3);
+    Eigen::Index v = 0, f = 0;
+    for (std::size_t i = 0; i < Vs.size(); ++i)
+    {
+        V_out.middleRows(v, Vs[i].rows()) = Vs[i];
+        F_out.middleRows(f, Fs[i].rows()) = Fs[i].array() + static_cast<int>(v);
+        v += Vs[i].rows();
+        f += Fs[i].rows();
+    }
+    return {std::move(V_out), std::move(F_out)};
+}
+
+} // namespace union_tree
+
+std::tuple<compas::RowMatrixXd, compas::RowMatrixXi>
+pmp_boolean_union_many(
+    Eigen::Ref<const compas::RowMatrixXd> vertices,
+    Eigen::Ref<const compas::RowMatrixXi> faces,
+    const std::vector<int>& mesh_v_counts,
+    const std::vector<int>& mesh_f_counts,
+    bool exact,
+    int num_threads)
+{
+    compas::RowMatrixXd V_all = vertices;
+    compas::RowMatrixXi F_all = faces;
+    const std::size_t threads = static_cast<std::size_t>(std::max(num_threads, 0));
+
+    if (exact)
+    {
+        using EMesh = exact_chain::EMesh;
+        return union_tree::union_many<EMesh>(
+            V_all, F_all, mesh_v_counts, mesh_f_counts,
+            exact_chain::slice_to_mesh,
+            exact_chain::mesh_to_VF,
+            [](EMesh& a, EMesh& b, EMesh& out) {
+                return PMP::corefine_and_compute_union(a, b, out);
+            },
+            threads);
+    }
+
+    return union_tree::union_many<hybrid_chain::HMesh>(
+        V_all, F_all, mesh_v_counts, mesh_f_counts,
+        hybrid_chain::slice_to_mesh,
+        hybrid_chain::mesh_to_VF,
+        union_tree::hybrid_union,
+        threads);
+}
+
+// =============================================================================
+// Many cutters: overlapping clusters are unioned, then one difference.
+// =============================================================================
+
+namespace cutters {
+
+/**
+ * Merge many closed cutters into one operand whose components do not overlap.
+ *
+ * Candidate pairs come from the bounding-box sweep; for those, the volumes are
+ * tested with PMP::do_intersect on native threads, including the bounded
+ * sides so that a cutter nested inside another is grouped with it. Clusters
+ * of overlapping (or nested) cutters are unioned in a balanced tree with the
+ * hybrid kernel, and the clusters are concatenated.
+ */
+compas::Mesh merge(
+    const compas::RowMatrixXd& V_all,
+    const compas::RowMatrixXi& F_all,
+    const std::vector<int>& vc,
+    const std::vector<int>& fc,
+    std::size_t num_threads)
+{
+    using HMesh = hybrid_chain::HMesh;
+
+    auto [v_off, f_off] = batch::offsets(V_all.rows(), F_all.rows(), vc, fc);
+    const std::size_t n = vc.size();
+
+    std::vector<HMesh> meshes(n);
+    compas::parallel_for(n, [&](std::size_t i) {
+        meshes[i] = hybrid_chain::slice_to_mesh(V_all, F_all, v_off[i], vc[i], f_off[i], fc[i]);
+    }, num_threads);
+
+    std::vector<int> order;
+    auto candidates = union_tree::overlap_pairs(union_tree::mesh_boxes(V_all, v_off, vc), order);
+    std::vector<char> overlap(candidates.size(), 0);
+    compas::parallel_for(candidates.size(), [&](std::size_t k) {
+        auto [i, j] = candidates[k];
+        overlap[k] = PMP::do_intersect(meshes[i], meshes[j],
+                                       CGAL::parameters::do_overlap_test_of_bounded_sides(true),
+                                       CGAL::parameters::do_overlap_test_of_bounded_sides(true));
+    }, num_threads);
+
+    std::vector<std::pair<int, int>> pairs;
+    for (std::size_t k = 0; k < candidates.size(); ++k)
+        if (overlap[k]) pairs.push_back(candidates[k]);
+    const auto groups = union_tree::components(order, pairs);
+
+    std::vector<std::vector<HMesh>> grouped(groups.size());
+    for (std::size_t g = 0; g < groups.size(); ++g)
+        for (int i : groups[g])
+            grouped[g].push_back(std::move(meshes[i]));
+
+    compas::Mesh merged;
+    for (const HMesh& mesh : union_tree::reduce<HMesh>(std::move(grouped), union_tree::hybrid_union, num_threads))
+        merged += mesh;
+    return merged;
+}
+
+} // namespace cutters
+
+std::tuple<compas::RowMatrixXd, compas::RowMatrixXi, std::string>
+pmp_boolean_difference_mesh_meshes(
+    compas::Mesh mesh_a,
+    Eigen::Ref<const compas::RowMatrixXd> vertices,
+    Eigen::Ref<const compas::RowMatrixXi> faces,
+    const std::vector<int>& mesh_v_counts,
+    const std::vector<int>& mesh_f_counts,
+    int num_threads)
+{
+    compas::RowMatrixXd V_all = vertices;
+    compas::RowMatrixXi F_all = faces;
+    compas::Mesh merged = cutters::merge(
+        V_all, F_all, mesh_v_counts, mesh_f_counts, static_cast<std::size_t>(std::max(num_threads, 0)));
+
+    if (merged.is_empty())
+    {
+        auto [V, F] = compas::mesh_to_vertices_and_faces(mesh_a);
+        return std::make_tuple(std::move(V), std::move(F), std::string("bbox"));
+    }
+    return pmp_boolean_difference(std::move(mesh_a), std::move(merged));
+}
+
+std::tuple<compas::RowMatrixXd, compas::RowMatrixXi, std::string>
+pmp_boolean_difference_mesh_meshes(
+    Eigen::Ref<const compas::RowMatrixXd> vertices_a,
+    Eigen::Ref<const compas::RowMatrixXi> faces_a,
+    Eigen::Ref<const compas::RowMatrixXd> vertices,
+    Eigen::Ref<const compas::RowMatrixXi> faces,
+    const std::vector<int>& mesh_v_counts,
+    const std::vector<int>& mesh_f_counts,
+    int num_threads)
+{
+    return pmp_boolean_difference_mesh_meshes(
+        compas::mesh_from_vertices_and_faces(vertices_a, faces_a),
+        vertices, faces, mesh_v_counts, mesh_f_counts, num_threads);
+}
+
+// =============================================================================
+// Localized booleans: corefine only the faces of A near B.
+// =============================================================================
+
+namespace roi {
+
+using Vertex = compas::Mesh::Vertex_index;
+using Face = compas::Mesh::Face_index;
+using Halfedge = compas::Mesh::Halfedge_index;
+using Edge = compas::Mesh::Edge_index;
+
+// Side of the surface near the point w, where w is the third vertex of a face
+// of B incident to the intersection edge h of the corefined patch.
+// NEGATIVE is inside A, POSITIVE outside, COPLANAR undecided.
+CGAL::Orientation side_at_edge(const compas::Mesh& patch, Halfedge h, const compas::Point& w)
+{
+    if (patch.is_border(h) || patch.is_border(patch.opposite(h)))
+        return CGAL::COPLANAR;
+
+    const compas::Point& s = patch.point(patch.source(h));
+    const compas::Point& t = patch.point(patch.target(h));
+    const compas::Point& a = patch.point(patch.target(patch.next(h)));
+    const compas::Point& b = patch.point(patch.target(patch.next(patch.opposite(h))));
+
+    CGAL::Orientation o1 = CGAL::orientation(s, t, a, w);
+    CGAL::Orientation o2 = CGAL::orientation(t, s, b, w);
+    if (o1 == CGAL::COPLANAR || o2 == CGAL::COPLANAR)
+        return CGAL::COPLANAR;
+
+    switch (CGAL::orientation(s, t, a, b))
+    {
+    case CGAL::NEGATIVE: // convex edge: inside both half-spaces
+        return (o1 == CGAL::NEGATIVE && o2 == CGAL::NEGATIVE) ? CGAL::NEGATIVE : CGAL::POSITIVE;
+    case CGAL::POSITIVE: // concave edge: inside either half-space
+        return (o1 == CGAL::NEGATIVE || o2 == CGAL::NEGATIVE) ? CGAL::NEGATIVE : CGAL::POSITIVE;
+    default:             // flat edge
+        return o1;
+    }
+}
+
+/**
+ * Compute a boolean of A and B by corefining only the faces of A whose
+ * bounding box overlaps the (slightly expanded) bounding box of B.
+ *
+ * The patch is corefined with B and split into components along the
+ * intersection curves. Patch components are classified with a point-in-mesh
+ * test against B; components of B are classified from the local side of the
+ * patch at one of their intersection edges. The kept faces are spliced back
+ * into the untouched faces of A through the original vertex indices. For the
+ * intersection, the faces of A outside the patch lie outside B and are
+ * dropped instead.
+ *
+ * @return false if the local classification is not conclusive (no
+ *         intersection, components of B that do not cross A, coplanar
+ *         contacts, ...); the caller then runs the full operation.
+ */
+bool compute(
+    const compas::Mesh& a,
+    compas::Mesh b,
+    int operation,
+    compas::RowMatrixXd& V,
+    compas::RowMatrixXi& F)
+{
+    if (a.is_empty() || b.is_empty())
+        return false;
+
+    CGAL::Bbox_3 box = PMP::bbox(b);
+    double margin = 1e-3 * std::sqrt(
+        CGAL::square(box.xmax() - box.xmin()) +
+        CGAL::square(box.ymax() - box.ymin()) +
+        CGAL::square(box.zmax() - box.zmin()));
+    box = CGAL::Bbox_3(
+        box.xmin() - margin, box.ymin() - margin, box.zmin() - margin,
+        box.xmax() + margin, box.ymax() + margin, box.zmax() + margin);
+
+    // Region of interest. Faces outside it do not touch B, so the boundary
+    // of the patch is not changed by the corefinement.
+    std::vector<char> in_patch(a.num_faces(), 0);
+    std::size_t n_patch = 0;
+    for (Face f : a.faces())
+    {
+        CGAL::Bbox_3 face_box;
+        for (Vertex v : CGAL::vertices_around_face(a.halfedge(f), a))
+            face_box += a.point(v).bbox();
+        if (CGAL::do_overlap(face_box, box))
+        {
+            in_patch[f] = 1;
+            ++n_patch;
+        }
+    }
+    if (n_patch == 0)
+        return false;
+
+    compas::Mesh patch;
+    auto source = patch.add_property_map<Vertex, int>("v:source", -1).first;
+    std::vector<Vertex> a_to_patch(a.num_vertices(), Vertex());
+    for (Face f : a.faces())
+    {
+        if (!in_patch[f])
+            continue;
+        std::array<Vertex, 3> vs;
+        int i = 0;
+        for (Vertex v : CGAL::vertices_around_face(a.halfedge(f), a))
+        {
+            if (a_to_patch[v] == Vertex())
+            {
+                a_to_patch[v] = patch.add_vertex(a.point(v));
+                source[a_to_patch[v]] = static_cast<int>(v);
+            }
+            vs[i++] = a_to_patch[v];
+        }
+        if (patch.add_face(vs[0], vs[1], vs[2]) == Face())
+            return false;
+    }
+
+    auto patch_constrained = patch.add_property_map<Edge, bool>("e:constrained", false).first;
+    auto b_constrained = b.add_property_map<Edge, bool>("e:constrained", false).first;
+    PMP::corefine(
+        patch, b,
+        CGAL::parameters::edge_is_constrained_map(patch_constrained),
+        CGAL::parameters::edge_is_constrained_map(b_constrained));
+
+    // Intersection vertices of the patch, to match those of B by position.
+    std::map<compas::Point, Vertex> curve_vertices;
+    for (Edge e : patch.edges())
+    {
+        if (!patch_constrained[e])
+            continue;
+        curve_vertices.emplace(patch.point(patch.vertex(e, 0)), patch.vertex(e, 0));
+        curve_vertices.emplace(patch.point(patch.vertex(e, 1)), patch.vertex(e, 1));
+    }
+    if (curve_vertices.empty())
+        return false;
+
+    auto patch_component = patch.add_property_map<Face, std::size_t>("f:component", 0).first;
+    auto b_component = b.add_property_map<Face, std::size_t>("f:component", 0).first;
+    std::size_t n_patch_components = PMP::connected_components(
+        patch, patch_component, CGAL::parameters::edge_is_constrained_map(patch_constrained));
+    std::size_t n_b_components = PMP::connected_components(
+        b, b_component, CGAL::parameters::edge_is_constrained_map(b_constrained));
+
+    // Patch components: inside or outside of B.
+    std::vector<int> keep_patch(n_patch_components, -1);
+    CGAL::Side_of_triangle_mesh<compas::Mesh, compas::Kernel> side_of_b(b);
+    for (Face f : patch.faces())
+    {
+        std::size_t c = patch_component[f];
+        if (keep_patch[c] != -1)
+            continue;
+        Halfedge h = patch.halfedge(f);
+        compas::Point centroid = CGAL::centroid(
+            patch.point(patch.source(h)),
+            patch.point(patch.target(h)),
+            patch.point(patch.target(patch.next(h))));
+        CGAL::Bounded_side side = side_of_b(centroid);
+        if (side == CGAL::ON_BOUNDARY)
+            continue;
+        bool inside = side == CGAL::ON_BOUNDED_SIDE;
+        keep_patch[c] = (operation == 2) ? inside : !inside;
+    }
+
+    // Components of B: inside or outside of A, from the side of the patch
+    // at an intersection edge.
+    std::vector<int> keep_b(n_b_components, -1);
+    for (Halfedge h : b.halfedges())
+    {
+        if (!b_constrained[b.edge(h)] || b.is_border(h))
+            continue;
+        std::size_t c = b_component[b.face(h)];
+        if (keep_b[c] != -1)
+            continue;
+        auto source_it = curve_vertices.find(b.point(b.source(h)));
+        auto target_it = curve_vertices.find(b.point(b.target(h)));
+        if (source_it == curve_vertices.end() || target_it == curve_vertices.end())
+            continue;
+        auto [hp, found] = CGAL::halfedge(source_it->second, target_it->second, patch);
+        if (!found)
+            continue;
+        CGAL::Orientation side = side_at_edge(patch, hp, b.point(b.target(b.next(h))));
+        if (side == CGAL::COPLANAR)
+            continue;
+        bool inside = side == CGAL::NEGATIVE;
+        keep_b[c] = (operation == 0) ? !inside : inside;
+    }
+
+    if (std::find(keep_patch.begin(), keep_patch.end(), -1) != keep_patch.end() ||
+        std::find(keep_b.begin(), keep_b.end(), -1) != keep_b.end())
+        return false;
+
+    // Splice the kept faces into the faces of A outside the patch.
+    std::vector<compas::Point> points;
+    std::vector<std::array<int, 3>> triangles;
+
+    std::vector<int> a_index(a.num_vertices(), -1);
+    auto index_a = [&](Vertex v) {
+        if (a_index[v] < 0)
+        {
+            a_index[v] = static_cast<int>(points.size());
+            points.push_back(a.point(v));
+        }
+        return a_index[v];
+    };
+    std::vector<int> patch_index(patch.num_vertices(), -1);
+    auto index_patch = [&](Vertex v) {
+        if (source[v] >= 0)
+            return index_a(Vertex(source[v]));
+        if (patch_index[v] < 0)
+        {
+            patch_index[v] = static_cast<int>(points.size());
+            points.push_back(patch.point(v));
+        }
+        return patch_index[v];
+    };
+    std::vector<int> b_index(b.num_vertices(), -1);
+    auto index_b = [&](Vertex v) {
+        if (b_index[v] < 0)
+        {
+            auto it = curve_vertices.find(b.point(v));
+            if (it != curve_vertices.end())
+                b_index[v] = index_patch(it->second);
+            else
+            {
+                b_index[v] = static_cast<int>(points.size());
+                points.push_back(b.point(v));
+            }
+        }
+        return b_index[v];
+    };
+
+    const bool keep_rest = operation != 2;
+    triangles.reserve((keep_rest ? a.number_of_faces() - n_patch : 0) + patch.number_of_faces());
+    for (Face f : a.faces())
+    {
+        if (!keep_rest || in_patch[f])
+            continue;
+        Halfedge h = a.halfedge(f);
+        triangles.push_back({index_a(a.source(h)), index_a(a.target(h)), index_a(a.target(a.next(h)))});
+    }
+    for (Face f : patch.faces())
+    {
+        if (!keep_patch[patch_component[f]])
+            continue;
+        Halfedge h = patch.halfedge(f);
+        triangles.push_back({
+            index_patch(patch.source(h)),
+            index_patch(patch.target(h)),
+            index_patch(patch.target(patch.next(h)))});
+    }
+    for (Face f : b.faces())
+    {
+        if (!keep_b[b_component[f]])
+            continue;
+        Halfedge h = b.halfedge(f);
+        int i = index_b(b.source(h)), j = index_b(b.target(h)), k = index_b(b.target(b.next(h)));
+        if (operation == 1)
+            triangles.push_back({i, k, j});
+        else
+            triangles.push_back({i, j, k});
+    }
+
+    V.resize(static_cast<Eigen::Index>(points.size()), 3);
+    for (std::size_t i = 0; i < points.size(); ++i)
+    {
+        V(i, 0) = points[i].x();
+        V(i, 1) = points[i].y();
+        V(i, 2) = points[i].z();
+    }
+    F.resize(static_cast<Eigen::Index>(triangles.size()), 3);
+    for (std::size_t i = 0; i < triangles.size(); ++i)
+    {
+        F(i, 0) = triangles[i][0];
+        F(i, 1) = triangles[i][1];
+        F(i, 2) = triangles[i][2];
+    }
+    return true;
+}
+
+} // namespace roi
+
+std::tuple<compas::RowMatrixXd, compas::RowMatrixXi, std::string>
+pmp_boolean_localized(
+    const compas::Mesh& mesh_a,
+    compas::Mesh mesh_b,
+    int operation)
+{
+    if (operation < 0 || operation > 2)
+        throw std::invalid_argument("operation must be 0 (union), 1 (difference), or 2 (intersection)");
+
+    compas::RowMatrixXd V;
+    compas::RowMatrixXi F;
+    if (roi::compute(mesh_a, mesh_b, operation, V, F))
+        return std::make_tuple(std::move(V), std::move(F), std::string("localized"));
+
+    switch (operation)
+    {
+    case 0: return pmp_boolean_union(mesh_a, std::move(mesh_b));
+    case 1: return pmp_boolean_difference(mesh_a, std::move(mesh_b));
+    default: return pmp_boolean_intersection(mesh_a, std::move(mesh_b));
+    }
+}
+
+std::tuple<compas::RowMatrixXd, compas::RowMatrixXi, std::string>
+pmp_boolean_localized(
+    Eigen::Ref<const compas::RowMatrixXd> vertices_a,
+    Eigen::Ref<const compas::RowMatrixXi> faces_a,
+    Eigen::Ref<const compas::RowMatrixXd> vertices_b,
+    Eigen::Ref<const compas::RowMatrixXi> faces_b,
+    int operation)
+{
+    return pmp_boolean_localized(
+        compas::mesh_from_vertices_and_faces(vertices_a, faces_a),
+        compas::mesh_from_vertices_and_faces(vertices_b, faces_b),
+        operation);
+}
+
+// =============================================================================
+// Clipping with a mesh, a plane, or axis-aligned boxes.
+// =============================================================================
 
-        HMesh tmp;
-        hybrid_chain::get_or_add_epm(tmp);
-        auto tmp_tag = tmp.add_property_map<HMesh::Face_index, HFaceTag>("f:src", HFaceTag{}).first;
+namespace clipping {
 
-        HFaceSourceVisitor visitor;
-        visitor.tags[&m] = m_tag;
-        visitor.tags[&B] = b_tag;
-        visitor.tags[&tmp] = tmp_tag;
+compas::Kernel::Iso_cuboid_3 cuboid(const double* box)
+{
+    if (box[0] > box[3] || box[1] > box[4] || box[2] > box[5])
+        throw std::invalid_argument("box must be given as xmin, ymin, zmin, xmax, ymax, zmax");
+    return compas::Kernel::Iso_cuboid_3(box[0], box[1], box[2], box[3], box[4], box[5]);
+}
 
-        Exact_vertex_point_map vpm_m{hybrid_chain::get_or_add_epm(m), &m};
-        Exact_vertex_point_map vpm_B{hybrid_chain::get_or_add_epm(B), &B};
-        Exact_vertex_point_map vpm_tmp{hybrid_chain::get_or_add_epm(tmp), &tmp};
+// The faces of the mesh whose bounding boxes overlap the box. Clipping the
+// surface (not the volume) of this submesh gives the same result as clipping
+// the whole mesh, without copying the faces that would be discarded anyway.
+compas::Mesh extract(const compas::Mesh& mesh, const compas::Kernel::Iso_cuboid_3& cuboid)
+{
+    using Vertex = compas::Mesh::Vertex_index;
 
-        switch (operations[i])
+    CGAL::Bbox_3 box = cuboid.bbox();
+    compas::Mesh submesh;
+    std::vector<Vertex> vmap(mesh.num_vertices(), Vertex());
+    for (auto f : mesh.faces())
+    {
+        CGAL::Bbox_3 face_box;
+        for (Vertex v : CGAL::vertices_around_face(mesh.halfedge(f), mesh))
+            face_box += mesh.point(v).bbox();
+        if (!CGAL::do_overlap(face_box, box))
+            continue;
+
+        std::vector<Vertex> vs;
+        for (Vertex v : CGAL::vertices_around_face(mesh.halfedge(f), mesh))
         {
-        case 0:
-            PMP::corefine_and_compute_union(m, B, tmp,
-                PMP::parameters::vertex_point_map(vpm_m).visitor(visitor),
-                PMP::parameters::vertex_point_map(vpm_B),
-                PMP::parameters::vertex_point_map(vpm_tmp));
-            break;
-        case 1:
-            PMP::corefine_and_compute_difference(m, B, tmp,
-                PMP::parameters::vertex_point_map(vpm_m).visitor(visitor),
-                PMP::parameters::vertex_point_map(vpm_B),
-                PMP::parameters::vertex_point_map(vpm_tmp));
-            break;
-        case 2:
-            PMP::corefine_and_compute_intersection(m, B, tmp,
-                PMP::parameters::vertex_point_map(vpm_m).visitor(visitor),
-                PMP::parameters::vertex_point_map(vpm_B),
-                PMP::parameters::vertex_point_map(vpm_tmp));
-            break;
-        case 3:
-            throw std::invalid_argument("xor (op code 3) is not supported by boolean_chain_with_face_source");
-        default:
-            throw std::invalid_argument("operation must be 0 (union), 1 (difference), or 2 (intersection)");
+            if (vmap[v] == Vertex())
+                vmap[v] = submesh.add_vertex(mesh.point(v));
+            vs.push_back(vmap[v]);
         }
-
-        m = std::move(tmp);
-        m_tag = *m.property_map<HMesh::Face_index, HFaceTag>("f:src");
+        submesh.add_face(vs);
     }
+    return submesh;
+}
 
-    auto [V_out, F_out] = hybrid_chain::mesh_to_VF(m);
+compas::Mesh clip_box(const compas::Mesh& mesh, const compas::Kernel::Iso_cuboid_3& cuboid, bool close)
+{
+    compas::Mesh result = close ? mesh : extract(mesh, cuboid);
+    if (!PMP::clip(result, cuboid, CGAL::parameters::clip_volume(close)))
+        throw std::runtime_error("clipping with the box failed");
+    result.collect_garbage();
+    return result;
+}
 
-    compas::RowMatrixXi S(static_cast<Eigen::Index>(m.number_of_faces()), 2);
-    for (auto fd : m.faces())
-    {
-        const HFaceTag& t = m_tag[fd];
-        const Eigen::Index row = static_cast<Eigen::Index>(fd.idx());
-        S(row, 0) = t.mesh_id;
-        S(row, 1) = t.face_id;
-    }
+} // namespace clipping
+
+std::tuple<compas::RowMatrixXd, compas::RowMatrixXi>
+pmp_clip(
+    compas::Mesh mesh_a,
+    compas::Mesh mesh_b)
+{
+    if (!PMP::clip(mesh_a, mesh_b))
+        throw std::runtime_error("clipping with the mesh failed");
 
-    return {std::move(V_out), std::move(F_out), std::move(S)};
+    mesh_a.collect_garbage();
+    return compas::mesh_to_vertices_and_faces(mesh_a);
 }
 
 std::tuple<compas::RowMatrixXd, compas::RowMatrixXi>
-pmp_boolean_chain(
+pmp_clip(
+    Eigen::Ref<const compas::RowMatrixXd> vertices_a,
+    Eigen::Ref<const compas::RowMatrixXi> faces_a,
+    Eigen::Ref<const compas::RowMatrixXd> vertices_b,
+    Eigen::Ref<const compas::RowMatrixXi> faces_b)
+{
+    return pmp_clip(
+        compas::mesh_from_vertices_and_faces(vertices_a, faces_a),
+        compas::mesh_from_vertices_and_faces(vertices_b, faces_b));
+}
+
+std::tuple<compas::RowMatrixXd, compas::RowMatrixXi>
+pmp_clip_plane(
+    compas::Mesh mesh,
+    const std::vector<double>& point,
+    const std::vector<double>& normal,
+    bool close)
+{
+    if (point.size() != 3 || normal.size() != 3)
+        throw std::invalid_argument("point and normal must have 3 coordinates");
+
+    compas::Kernel::Plane_3 plane(
+        compas::Point(point[0], point[1], point[2]),
+        compas::Vector(normal[0], normal[1], normal[2]));
+
+    if (!PMP::clip(mesh, plane, CGAL::parameters::clip_volume(close)))
+        throw std::runtime_error("clipping with the plane failed");
+
+    mesh.collect_garbage();
+    return compas::mesh_to_vertices_and_faces(mesh);
+}
+
+std::tuple<compas::RowMatrixXd, compas::RowMatrixXi>
+pmp_clip_plane(
     Eigen::Ref<const compas::RowMatrixXd> vertices,
     Eigen::Ref<const compas::RowMatrixXi> faces,
-    const std::vector<int>& mesh_v_counts,
-    const std::vector<int>& mesh_f_counts,
-    const std::vector<int>& operations)
+    const std::vector<double>& point,
+    const std::vector<double>& normal,
+    bool close)
 {
-    compas::RowMatrixXd V_all = vertices;
-    compas::RowMatrixXi F_all = faces;
-    exact_chain::check_inputs(V_all, F_all, mesh_v_counts, mesh_f_counts, operations);
+    return pmp_clip_plane(compas::mesh_from_vertices_and_faces(vertices, faces), point, normal, close);
+}
 
-    int v_off = 0, f_off = 0;
-    exact_chain::EMesh m = exact_chain::slice_to_mesh(V_all, F_all, v_off, mesh_v_counts[0], f_off, mesh_f_counts[0]);
-    v_off += mesh_v_counts[0];
-    f_off += mesh_f_counts[0];
+std::tuple<compas::RowMatrixXd, compas::RowMatrixXi>
+pmp_clip_box(
+    const compas::Mesh& mesh,
+    const std::vector<double>& box,
+    bool close)
+{
+    if (box.size() != 6)
+        throw std::invalid_argument("box must be given as xmin, ymin, zmin, xmax, ymax, zmax");
 
-    for (std::size_t i = 0; i < operations.size(); ++i)
+    return compas::mesh_to_vertices_and_faces(clipping::clip_box(mesh, clipping::cuboid(box.data()), close));
+}
+
+std::tuple<compas::RowMatrixXd, compas::RowMatrixXi>
+pmp_clip_box(
+    Eigen::Ref<const compas::RowMatrixXd> vertices,
+    Eigen::Ref<const compas::RowMatrixXi> faces,
+    const std::vector<double>& box,
+    bool close)
+{
+    return pmp_clip_box(compas::mesh_from_vertices_and_faces(vertices, faces), box, close);
+}
+
+std::tuple<std::vector<compas::RowMatrixXd>, std::vector<compas::RowMatrixXi>>
+pmp_clip_boxes(
+    const compas::Mesh& mesh,
+    Eigen::Ref<const compas::RowMatrixXd> boxes,
+    bool close,
+    int num_threads)
+{
+    if (boxes.rows() > 0 && boxes.cols() != 6)
+        throw std::invalid_argument("boxes must be a Nx6 array of xmin, ymin, zmin, xmax, ymax, zmax");
+
+    const std::size_t n = static_cast<std::size_t>(boxes.rows());
+    std::vector<compas::Kernel::Iso_cuboid_3> cuboids;
+    cuboids.reserve(n);
+    for (std::size_t i = 0; i < n; ++i)
+        cuboids.push_back(clipping::cuboid(boxes.row(i).data()));
+
+    std::vector<compas::RowMatrixXd> Vs(n);
+    std::vector<compas::RowMatrixXi> Fs(n);
+    compas::parallel_for(n, [&](std::size_t i) {
+        std::tie(Vs[i], Fs[i]) = compas::mesh_to_vertices_and_faces(clipping::clip_box(mesh, cuboids[i], close));
+    }, static_cast<std::size_t>(std::max(num_threads, 0)));
+
+    return std::make_tuple(std::move(Vs), std::move(Fs));
+}
+
+std::tuple<std::vector<compas::RowMatrixXd>, std::vector<compas::RowMatrixXi>>
+pmp_clip_boxes(
+    Eigen::Ref<const compas::RowMatrixXd> vertices,
+    Eigen::Ref<const compas::RowMatrixXi> faces,
+    Eigen::Ref<const compas::RowMatrixXd> boxes,
+    bool close,
+    int num_threads)
+{
+    return pmp_clip_boxes(compas::mesh_from_vertices_and_faces(vertices, faces), boxes, close, num_threads);
+}
+
+// =============================================================================
+// BooleanSolver: one operand prepared once, many booleans against it.
+// =============================================================================
+
+class BooleanSolver {
+public:
+    BooleanSolver(
+        Eigen::Ref<const compas::RowMatrixXd> vertices,
+        Eigen::Ref<const compas::RowMatrixXi> faces)
+        : BooleanSolver(compas::mesh_from_vertices_and_faces(vertices, faces))
+    {}
+
+    BooleanSolver(compas::Mesh mesh)
+        : mesh_(std::move(mesh)),
+          bbox_(mesh_.is_empty() ? CGAL::Bbox_3() : PMP::bbox(mesh_)),
+          closed_(CGAL::is_closed(mesh_)),
+          tree_(faces(mesh_).first, faces(mesh_).second, mesh_)
     {
-        exact_chain::EMesh B = exact_chain::slice_to_mesh(V_all, F_all,
-                                v_off, mesh_v_counts[i + 1],
-                                f_off, mesh_f_counts[i + 1]);
-        v_off += mesh_v_counts[i + 1];
-        f_off += mesh_f_counts[i + 1];
+        // The exact point map of the hybrid kernel travels with every copy of
+        // the mesh, so the corefinements never convert A's points again.
+        auto epm = hybrid_chain::get_or_add_epm(mesh_);
+        hybrid_chain::ToExact to_exact;
+        for (auto v : mesh_.vertices())
+            epm[v] = to_exact(mesh_.point(v));
+        tree_.build();
+    }
+
+    BooleanSolver(const BooleanSolver&) = delete;
+    BooleanSolver& operator=(const BooleanSolver&) = delete;
+
+    /**
+     * Union (0), difference A - B (1), or intersection (2) with B.
+     *
+     * The cached bounding box and AABB tree decide whether B touches A at
+     * all; only then is a copy of the prepared mesh corefined with B.
+     * The solver is not modified, so it can be used from several threads.
+     */
+    std::tuple<compas::RowMatrixXd, compas::RowMatrixXi, std::string>
+    compute(compas::Mesh b, int operation) const
+    {
+        if (operation < 0 || operation > 2)
+            throw std::invalid_argument("operation must be 0 (union), 1 (difference), or 2 (intersection)");
 
-        exact_chain::EMesh tmp;
-        switch (operations[i])
+        compas::Mesh out;
+        std::string path = shortcut(b, operation, out);
+        if (path.empty())
         {
-        case 0: PMP::corefine_and_compute_union(m, B, tmp); break;
-        case 1: PMP::corefine_and_compute_difference(m, B, tmp); break;
-        case 2: PMP::corefine_and_compute_intersection(m, B, tmp); break;
-        case 3: // xor: (A - B) union (B - A) — works robustly under EPECK
+            using Exact_vertex_point_map = hybrid_chain::Exact_vertex_point_map;
+
+            compas::Mesh a = mesh_;
+            auto epm_b = hybrid_chain::get_or_add_epm(b);
+            hybrid_chain::ToExact to_exact;
+            for (auto v : b.vertices())
+                epm_b[v] = to_exact(b.point(v));
+            hybrid_chain::get_or_add_epm(out);
+
+            Exact_vertex_point_map vpm_a{hybrid_chain::get_or_add_epm(a), &a};
+            Exact_vertex_point_map vpm_b{epm_b, &b};
+            Exact_vertex_point_map vpm_out{hybrid_chain::get_or_add_epm(out), &out};
+            auto np_a = PMP::parameters::vertex_point_map(vpm_a);
+            auto np_b = PMP::parameters::vertex_point_map(vpm_b);
+            auto np_out = PMP::parameters::vertex_point_map(vpm_out);
+
+            switch (operation)
+            {
+            case 0: PMP::corefine_and_compute_union(a, b, out, np_a, np_b, np_out); break;
+            case 1: PMP::corefine_and_compute_difference(a, b, out, np_a, np_b, np_out); break;
+            default: PMP::corefine_and_compute_intersection(a, b, out, np_a, np_b, np_out); break;
+            }
+            path = "corefinement";
+        }
+
+        auto [V, F] = compas::mesh_to_vertices_and_faces(out);
+        return std::make_tuple(std::move(V), std::move(F), std::move(path));
+    }
+
+    std::tuple<compas::RowMatrixXd, compas::RowMatrixXi, std::string>
+    compute(
+        Eigen::Ref<const compas::RowMatrixXd> vertices,
+        Eigen::Ref<const compas::RowMatrixXi> faces,
+        int operation) const
+    {
+        return compute(compas::mesh_from_vertices_and_faces(vertices, faces), operation);
+    }
+
+    int num_vertices() const { return static_cast<int>(mesh_.number_of_vertices()); }
+    int num_faces() const { return static_cast<int>(mesh_.number_of_faces()); }
+
+private:
+    // broad_phase::shortcut, with the bounding box and the AABB tree of A
+    // taken from the cache.
+    std::string shortcut(const compas::Mesh& b, int operation, compas::Mesh& out) const
+    {
+        if (mesh_.is_empty() || b.is_empty())
+            return "";
+
+        CGAL::Bbox_3 box_b = PMP::bbox(b);
+        if (!CGAL::do_overlap(bbox_, box_b))
+            return broad_phase::assemble(mesh_, b, operation, false, false, out) ? "bbox" : "";
+
+        if (!closed_ || !CGAL::is_closed(b))
+            return "";
+
+        for (auto f : b.faces())
         {
-            exact_chain::EMesh m_copy = m, B_copy = B;
-            exact_chain::EMesh a_minus_b, b_minus_a;
-            PMP::corefine_and_compute_difference(m, B, a_minus_b);
-            PMP::corefine_and_compute_difference(B_copy, m_copy, b_minus_a);
-            PMP::corefine_and_compute_union(a_minus_b, b_minus_a, tmp);
-            break;
+            auto h = b.halfedge(f);
+            compas::Kernel::Triangle_3 triangle(
+                b.point(b.source(h)), b.point(b.target(h)), b.point(b.target(b.next(h))));
+            if (tree_.do_intersect(triangle))
+                return "";
         }
-        default:
-            throw std::invalid_argument(
-                "operation must be 0 (union), 1 (difference), 2 (intersection), or 3 (xor)");
+
+        bool a_in_b = broad_phase::contains(box_b, bbox_) && broad_phase::is_inside(mesh_, b);
+        bool b_in_a = false;
+        if (!a_in_b && broad_phase::contains(bbox_, box_b))
+        {
+            CGAL::Side_of_triangle_mesh<compas::Mesh, compas::Kernel, CGAL::Default, compas::FaceTree> side_of_a(tree_);
+            b_in_a = side_of_a(b.point(*b.vertices().begin())) != CGAL::ON_UNBOUNDED_SIDE;
         }
-        m = std::move(tmp);
+
+        return broad_phase::assemble(mesh_, b, operation, a_in_b, b_in_a, out) ? "aabb" : "";
     }
 
-    return exact_chain::mesh_to_VF(m);
-}
+    compas::Mesh mesh_;
+    CGAL::Bbox_3 bbox_;
+    bool closed_;
+    compas::FaceTree tree_;
+};
 
-std::tuple<compas::RowMatrixXd, compas::RowMatrixXi, compas::RowMatrixXi>
-pmp_boolean_chain_with_face_source(
-    Eigen::Ref<const compas::RowMatrixXd> vertices,
-    Eigen::Ref<const compas::RowMatrixXi> faces,
-    const std::vector<int>& mesh_v_counts,
-    const std::vector<int>& mesh_f_counts,
-    const std::vector<int>& operations)
-{
-    compas::RowMatrixXd V_all = vertices;
-    compas::RowMatrixXi F_all = faces;
-    exact_chain::check_inputs(V_all, F_all, mesh_v_counts, mesh_f_counts, operations);
+// =============================================================================
+// BooleanAccumulator: a chain fed one mesh at a time.
+// =============================================================================
 
-    int v_off = 0, f_off = 0;
-    exact_chain::EMesh m = exact_chain::slice_to_mesh(V_all, F_all, v_off, mesh_v_counts[0], f_off, mesh_f_counts[0]);
-    v_off += mesh_v_counts[0];
-    f_off += mesh_f_counts[0];
+class BooleanAccumulator {
+public:
+    BooleanAccumulator(
+        Eigen::Ref<const compas::RowMatrixXd> vertices,
+        Eigen::Ref<const compas::RowMatrixXi> faces,
+        bool hybrid,
+        bool track_sources,
+        int snap_every,
+        bool snap_rollback)
+        : hybrid_(hybrid), track_(track_sources), snap_every_(snap_every), snap_rollback_(snap_rollback)
+    {
+        load(vertices, faces, exact_, hybrid_mesh_);
+        num_meshes_ = 1;
+    }
 
-    auto m_tag = m.add_property_map<exact_chain::EMesh::Face_index, exact_chain::EFaceTag>("f:src", exact_chain::EFaceTag{}).first;
+    BooleanAccumulator(compas::Mesh mesh, bool hybrid, bool track_sources, int snap_every, bool snap_rollback)
+        : hybrid_(hybrid), track_(track_sources), snap_every_(snap_every), snap_rollback_(snap_rollback)
     {
-        int j = 0;
-        for (auto f : m.faces()) m_tag[f] = exact_chain::EFaceTag{0, j++};
+        load(std::move(mesh), exact_, hybrid_mesh_);
+        num_meshes_ = 1;
     }
 
-    for (std::size_t i = 0; i < operations.size(); ++i)
+    BooleanAccumulator(const BooleanAccumulator&) = delete;
+    BooleanAccumulator& operator=(const BooleanAccumulator&) = delete;
+
+    /**
+     * Replace the intermediate result R by R OP B.
+     *
+     * The intermediate result stays in its exact (or hybrid) representation,
+     * so a stream of n meshes is equivalent to boolean_chain on all of them,
+     * without the meshes ever having to be in memory at the same time.
+     * With snap_every = k > 0, the result is rounded after every k-th step.
+     * No operation can follow xor (see chain::check_operations).
+     */
+    void apply(int operation, compas::Mesh mesh)
     {
-        exact_chain::EMesh B = exact_chain::slice_to_mesh(V_all, F_all,
-                                v_off, mesh_v_counts[i + 1],
-                                f_off, mesh_f_counts[i + 1]);
-        v_off += mesh_v_counts[i + 1];
-        f_off += mesh_f_counts[i + 1];
+        std::lock_guard<std::mutex> lock(mutex_);
+        chain::check_operation(operation);
+        if (ended_by_xor_)
+            throw std::invalid_argument("xor can only be the last operation of a chain");
+        exact_chain::EMesh e;
+        hybrid_chain::HMesh h;
+        load(std::move(mesh), e, h);
+        advance(operation, e, h);
+    }
 
-        auto b_tag = B.add_property_map<exact_chain::EMesh::Face_index, exact_chain::EFaceTag>("f:src", exact_chain::EFaceTag{}).first;
+    void apply(
+        int operation,
+        Eigen::Ref<const compas::RowMatrixXd> vertices,
+        Eigen::Ref<const compas::RowMatrixXi> faces)
+    {
+        std::lock_guard<std::mutex> lock(mutex_);
+        chain::check_operation(operation);
+        if (ended_by_xor_)
+            throw std::invalid_argument("xor can only be the last operation of a chain");
+        exact_chain::EMesh e;
+        hybrid_chain::HMesh h;
+        load(vertices, faces, e, h);
+        advance(operation, e, h);
+    }
+
+    /**
+     * The current result as (V, F, S). S holds the (mesh index, face index)
+     * source of every face if sources are tracked, and is empty (0x2) otherwise.
+     */
+    std::tuple<compas::RowMatrixXd, compas::RowMatrixXi, compas::RowMatrixXi>
+    result()
+    {
+        std::lock_guard<std::mutex> lock(mutex_);
+        compas::RowMatrixXd V;
+        compas::RowMatrixXi F;
+        compas::RowMatrixXi S(0, 2);
+        if (hybrid_)
         {
-            int j = 0;
-            const int mesh_id = static_cast<int>(i + 1);
-            for (auto f : B.faces()) b_tag[f] = exact_chain::EFaceTag{mesh_id, j++};
+            std::tie(V, F) = hybrid_chain::mesh_to_VF(hybrid_mesh_);
+            if (track_) S = chain::face_sources<hybrid_chain::HFaceTag>(hybrid_mesh_);
         }
+        else
+        {
+            std::tie(V, F) = exact_chain::mesh_to_VF(exact_);
+            if (track_) S = chain::face_sources<exact_chain::EFaceTag>(exact_);
+        }
+        return std::make_tuple(std::move(V), std::move(F), std::move(S));
+    }
 
-        exact_chain::EMesh tmp;
-        auto tmp_tag = tmp.add_property_map<exact_chain::EMesh::Face_index, exact_chain::EFaceTag>("f:src", exact_chain::EFaceTag{}).first;
+    int num_meshes() const { return num_meshes_; }
 
-        exact_chain::EFaceSourceVisitor visitor;
-        visitor.tags[&m] = m_tag;
-        visitor.tags[&B] = b_tag;
-        visitor.tags[&tmp] = tmp_tag;
+    // Roundings so far that made the result self-intersect (see exact_chain::snap).
+    int num_failed_snaps() const { return num_failed_snaps_; }
 
-        switch (operations[i])
+private:
+    // Convert the next input into the representation of the chain and tag
+    // its faces with the index of the mesh in the stream.
+    void load(
+        Eigen::Ref<const compas::RowMatrixXd> vertices,
+        Eigen::Ref<const compas::RowMatrixXi> faces,
+        exact_chain::EMesh& e,
+        hybrid_chain::HMesh& h) const
+    {
+        compas::RowMatrixXd V = vertices;
+        compas::RowMatrixXi F = faces;
+        if (V.cols() != 3 || F.cols() != 3)
+            throw std::invalid_argument("vertices and faces must have 3 columns");
+        const int nv = static_cast<int>(V.rows());
+        const int nf = static_cast<int>(F.rows());
+        if (nf > 0 && (F.minCoeff() < 0 || F.maxCoeff() >= nv))
+            throw std::invalid_argument("face index out of range");
+
+        if (hybrid_)
         {
-        case 0:
-            PMP::corefine_and_compute_union(m, B, tmp, PMP::parameters::visitor(visitor));
-            break;
-        case 1:
-            PMP::corefine_and_compute_difference(m, B, tmp, PMP::parameters::visitor(visitor));
-            break;
-        case 2:
-            PMP::corefine_and_compute_intersection(m, B, tmp, PMP::parameters::visitor(visitor));
-            break;
-        case 3:
-            throw std::invalid_argument("xor (op code 3) is not supported by boolean_chain_with_face_source");
-        default:
-            throw std::invalid_argument("operation must be 0 (union), 1 (difference), or 2 (intersection)");
+            h = hybrid_chain::slice_to_mesh(V, F, 0, nv, 0, nf);
+            if (track_) chain::tag_faces<hybrid_chain::HFaceTag>(h, num_meshes_);
+        }
+        else
+        {
+            e = exact_chain::slice_to_mesh(V, F, 0, nv, 0, nf);
+            if (track_) chain::tag_faces<exact_chain::EFaceTag>(e, num_meshes_);
         }
-
-        m = std::move(tmp);
-        m_tag = *m.property_map<exact_chain::EMesh::Face_index, exact_chain::EFaceTag>("f:src");
     }
 
-    auto [V_out, F_out] = exact_chain::mesh_to_VF(m);
+    void load(compas::Mesh mesh, exact_chain::EMesh& e, hybrid_chain::HMesh& h) const
+    {
+        auto [V, F] = compas::mesh_to_vertices_and_faces(mesh);
+        load(V, F, e, h);
+    }
 
-    compas::RowMatrixXi S(static_cast<Eigen::Index>(m.number_of_faces()), 2);
-    for (auto fd : m.faces())
+    void advance(int operation, exact_chain::EMesh& e, hybrid_chain::HMesh& h)
     {
-        const exact_chain::EFaceTag& t = m_tag[fd];
-        const Eigen::Index row = static_cast<Eigen::Index>(fd.idx());
-        S(row, 0) = t.mesh_id;
-        S(row, 1) = t.face_id;
+        if (hybrid_)
+            hybrid_chain::step(hybrid_mesh_, h, operation, track_);
+        else
+            exact_chain::step(exact_, e, operation, track_);
+        ++num_meshes_;
+        ended_by_xor_ = operation == 3;
+
+        const int steps = num_meshes_ - 1;
+        if (snap_every_ > 0 && steps % snap_every_ == 0)
+        {
+            const chain::SnapResult snapped = hybrid_
+                ? hybrid_chain::snap(hybrid_mesh_, snap_rollback_)
+                : exact_chain::snap(exact_, snap_rollback_);
+            if (snapped != chain::SnapResult::valid)
+                ++num_failed_snaps_;
+        }
     }
 
-    return {std::move(V_out), std::move(F_out), std::move(S)};
-}
+    bool hybrid_;
+    bool track_;
+    int snap_every_;
+    bool snap_rollback_;
+    int num_meshes_ = 0;
+    int num_failed_snaps_ = 0;
+    bool ended_by_xor_ = false;
+    exact_chain::EMesh exact_;
+    hybrid_chain::HMesh hybrid_mesh_;
+    std::mutex mutex_;
+};
 
 NB_MODULE(_booleans, m) {
 
     m.def(
         "boolean_union",
-        &pmp_boolean_union,
-        "Boolean Union from triangular mesh vertices and faces.",
+        nb::overload_cast<
+            Eigen::Ref<const compas::RowMatrixXd>,
+            Eigen::Ref<const compas::RowMatrixXi>,
+            Eigen::Ref<const compas::RowMatrixXd>,
+            Eigen::Ref<const compas::RowMatrixXi>>(&pmp_boolean_union),
+        "Boolean Union from triangular mesh vertices and faces. Also returns the path taken: \"bbox\", \"aabb\", or \"corefinement\".",
         "VA"_a,
         "FA"_a,
         "VB"_a,
-        "FB"_a);
+        "FB"_a,
+        nb::call_guard<nb::gil_scoped_release>());
+
+    m.def(
+        "boolean_union",
+        nb::overload_cast<compas::Mesh, compas::Mesh>(&pmp_boolean_union),
+        "Boolean Union of two native triangle meshes. Also returns the path taken.",
+        "A"_a,
+        "B"_a,
+        nb::call_guard<nb::gil_scoped_release>());
 
     m.def(
         "boolean_difference",
-        &pmp_boolean_difference,
-        "Boolean Difference from triangular mesh vertices and faces.",
+        nb::overload_cast<
+            Eigen::Ref<const compas::RowMatrixXd>,
+            Eigen::Ref<const compas::RowMatrixXi>,
+            Eigen::Ref<const compas::RowMatrixXd>,
+            Eigen::Ref<const compas::RowMatrixXi>>(&pmp_boolean_difference),
+        "Boolean Difference from triangular mesh vertices and faces. Also returns the path taken: \"bbox\", \"aabb\", or \"corefinement\".",
         "VA"_a,
         "FA"_a,
         "VB"_a,
-        "FB"_a);
+        "FB"_a,
+        nb::call_guard<nb::gil_scoped_release>());
+
+    m.def(
+        "boolean_difference",
+        nb::overload_cast<compas::Mesh, compas::Mesh>(&pmp_boolean_difference),
+        "Boolean Difference of two native triangle meshes. Also returns the path taken.",
+        "A"_a,
+        "B"_a,
+        nb::call_guard<nb::gil_scoped_release>());
 
     m.def(
         "boolean_intersection",
-        &pmp_boolean_intersection,
-        "Boolean Intersection from triangular mesh vertices and faces.",
+        nb::overload_cast<
+            Eigen::Ref<const compas::RowMatrixXd>,
+            Eigen::Ref<const compas::RowMatrixXi>,
+            Eigen::Ref<const compas::RowMatrixXd>,
+            Eigen::Ref<const compas::RowMatrixXi>>(&pmp_boolean_intersection),
+        "Boolean Intersection from triangular mesh vertices and faces. Also returns the path taken: \"bbox\", \"aabb\", or \"corefinement\".",
         "VA"_a,
         "FA"_a,
         "VB"_a,
-        "FB"_a);
+        "FB"_a,
+        nb::call_guard<nb::gil_scoped_release>());
+
+    m.def(
+        "boolean_intersection",
+        nb::overload_cast<compas::Mesh, compas::Mesh>(&pmp_boolean_intersection),
+        "Boolean Intersection of two native triangle meshes. Also returns the path taken.",
+        "A"_a,
+        "B"_a,
+        nb::call_guard<nb::gil_scoped_release>());
 
     m.def(
         "split",
-        &pmp_split,
+        nb::overload_cast<
+            Eigen::Ref<const compas::RowMatrixXd>,
+            Eigen::Ref<const compas::RowMatrixXi>,
+            Eigen::Ref<const compas::RowMatrixXd>,
+            Eigen::Ref<const compas::RowMatrixXi>>(&pmp_split),
         "Boolean Split from triangular mesh vertices and faces.",
         "VA"_a,
         "FA"_a,
         "VB"_a,
-        "FB"_a);
+        "FB"_a,
+        nb::call_guard<nb::gil_scoped_release>());
+
+    m.def(
+        "split",
+        nb::overload_cast<compas::Mesh, compas::Mesh>(&pmp_split),
+        "Boolean Split of two native triangle meshes.",
+        "A"_a,
+        "B"_a,
+        nb::call_guard<nb::gil_scoped_release>());
 
     m.def(
         "boolean_union_with_edges",
-        &pmp_boolean_union_with_edges,
+        nb::overload_cast<
+            Eigen::Ref<const compas::RowMatrixXd>,
+            Eigen::Ref<const compas::RowMatrixXi>,
+            Eigen::Ref<const compas::RowMatrixXd>,
+            Eigen::Ref<const compas::RowMatrixXi>>(&pmp_boolean_union_with_edges),
         "Boolean Union returning (V, F, E) where E lists vertex-index pairs of intersection-curve edges.",
         "VA"_a,
         "FA"_a,
         "VB"_a,
-        "FB"_a);
+        "FB"_a,
+        nb::call_guard<nb::gil_scoped_release>());
+
+    m.def(
+        "boolean_union_with_edges",
+        nb::overload_cast<compas::Mesh, compas::Mesh>(&pmp_boolean_union_with_edges),
+        "Boolean Union of two native triangle meshes returning (V, F, E).",
+        "A"_a,
+        "B"_a,
+        nb::call_guard<nb::gil_scoped_release>());
 
     m.def(
         "boolean_difference_with_edges",
-        &pmp_boolean_difference_with_edges,
+        nb::overload_cast<
+            Eigen::Ref<const compas::RowMatrixXd>,
+            Eigen::Ref<const compas::RowMatrixXi>,
+            Eigen::Ref<const compas::RowMatrixXd>,
+            Eigen::Ref<const compas::RowMatrixXi>>(&pmp_boolean_difference_with_edges),
         "Boolean Difference returning (V, F, E) where E lists vertex-index pairs of intersection-curve edges.",
         "VA"_a,
         "FA"_a,
         "VB"_a,
-        "FB"_a);
+        "FB"_a,
+        nb::call_guard<nb::gil_scoped_release>());
+
+    m.def(
+        "boolean_difference_with_edges",
+        nb::overload_cast<compas::Mesh, compas::Mesh>(&pmp_boolean_difference_with_edges),
+        "Boolean Difference of two native triangle meshes returning (V, F, E).",
+        "A"_a,
+        "B"_a,
+        nb::call_guard<nb::gil_scoped_release>());
 
     m.def(
         "boolean_intersection_with_edges",
-        &pmp_boolean_intersection_with_edges,
+        nb::overload_cast<
+            Eigen::Ref<const compas::RowMatrixXd>,
+            Eigen::Ref<const compas::RowMatrixXi>,
+            Eigen::Ref<const compas::RowMatrixXd>,
+            Eigen::Ref<const compas::RowMatrixXi>>(&pmp_boolean_intersection_with_edges),
         "Boolean Intersection returning (V, F, E) where E lists vertex-index pairs of intersection-curve edges.",
         "VA"_a,
         "FA"_a,
         "VB"_a,
-        "FB"_a);
+        "FB"_a,
+        nb::call_guard<nb::gil_scoped_release>());
+
+    m.def(
+        "boolean_intersection_with_edges",
+        nb::overload_cast<compas::Mesh, compas::Mesh>(&pmp_boolean_intersection_with_edges),
+        "Boolean Intersection of two native triangle meshes returning (V, F, E).",
+        "A"_a,
+        "B"_a,
+        nb::call_guard<nb::gil_scoped_release>());
 
     m.def(
         "boolean_union_with_face_source",
-        &pmp_boolean_union_with_face_source,
+        nb::overload_cast<
+            Eigen::Ref<const compas::RowMatrixXd>,
+            Eigen::Ref<const compas::RowMatrixXi>,
+            Eigen::Ref<const compas::RowMatrixXd>,
+            Eigen::Ref<const compas::RowMatrixXi>>(&pmp_boolean_union_with_face_source),
         "Boolean Union returning (V, F, S) where S[i] = [mesh_id, face_id] of the input face that produced output face i.",
         "VA"_a,
         "FA"_a,
         "VB"_a,
-        "FB"_a);
+        "FB"_a,
+        nb::call_guard<nb::gil_scoped_release>());
+
+    m.def(
+        "boolean_union_with_face_source",
+        nb::overload_cast<compas::Mesh, compas::Mesh>(&pmp_boolean_union_with_face_source),
+        "Boolean Union of two native triangle meshes returning (V, F, S).",
+        "A"_a,
+        "B"_a,
+        nb::call_guard<nb::gil_scoped_release>());
 
     m.def(
         "boolean_difference_with_face_source",
-        &pmp_boolean_difference_with_face_source,
+        nb::overload_cast<
+            Eigen::Ref<const compas::RowMatrixXd>,
+            Eigen::Ref<const compas::RowMatrixXi>,
+            Eigen::Ref<const compas::RowMatrixXd>,
+            Eigen::Ref<const compas::RowMatrixXi>>(&pmp_boolean_difference_with_face_source),
         "Boolean Difference returning (V, F, S) where S[i] = [mesh_id, face_id] of the input face that produced output face i.",
         "VA"_a,
         "FA"_a,
         "VB"_a,
-        "FB"_a);
+        "FB"_a,
+        nb::call_guard<nb::gil_scoped_release>());
+
+    m.def(
+        "boolean_difference_with_face_source",
+        nb::overload_cast<compas::Mesh, compas::Mesh>(&pmp_boolean_difference_with_face_source),
+        "Boolean Difference of two native triangle meshes returning (V, F, S).",
+        "A"_a,
+        "B"_a,
+        nb::call_guard<nb::gil_scoped_release>());
 
     m.def(
         "boolean_intersection_with_face_source",
-        &pmp_boolean_intersection_with_face_source,
+        nb::overload_cast<
+            Eigen::Ref<const compas::RowMatrixXd>,
+            Eigen::Ref<const compas::RowMatrixXi>,
+            Eigen::Ref<const compas::RowMatrixXd>,
+            Eigen::Ref<const compas::RowMatrixXi>>(&pmp_boolean_intersection_with_face_source),
         "Boolean Intersection returning (V, F, S) where S[i] = [mesh_id, face_id] of the input face that produced output face i.",
         "VA"_a,
         "FA"_a,
         "VB"_a,
-        "FB"_a);
+        "FB"_a,
+        nb::call_guard<nb::gil_scoped_release>());
+
+    m.def(
+        "boolean_intersection_with_face_source",
+        nb::overload_cast<compas::Mesh, compas::Mesh>(&pmp_boolean_intersection_with_face_source),
+        "Boolean Intersection of two native triangle meshes returning (V, F, S).",
+        "A"_a,
+        "B"_a,
+        nb::call_guard<nb::gil_scoped_release>());
 
     m.def(
         "boolean_chain",
@@ -977,24 +2781,31 @@ NB_MODULE(_booleans, m) {
         "constructions). The full collection of input meshes is sent in a single "
         "call as flat (V, F) arrays plus per-mesh row counts. operations is a list "
         "of int codes (0=union, 1=difference, 2=intersection, 3=xor) of length "
-        "number_of_meshes - 1.",
+        "number_of_meshes - 1. Returns (V, F, failed_snaps), where failed_snaps "
+        "counts the roundings that made the intermediate result self-intersect.",
         "vertices"_a,
         "faces"_a,
         "mesh_v_counts"_a,
         "mesh_f_counts"_a,
-        "operations"_a);
+        "operations"_a,
+        "snap_every"_a = 0,
+        "snap_rollback"_a = true,
+        nb::call_guard<nb::gil_scoped_release>());
 
     m.def(
         "boolean_chain_with_face_source",
         &pmp_boolean_chain_with_face_source,
         "Like boolean_chain but additionally returns S (Mx2 int): for each output face, "
         "[mesh_id, face_id] of the input face that produced it. Tracking is via a "
-        "corefinement visitor; xor (op 3) is not supported here.",
+        "corefinement visitor. Returns (V, F, S, failed_snaps).",
         "vertices"_a,
         "faces"_a,
         "mesh_v_counts"_a,
         "mesh_f_counts"_a,
-        "operations"_a);
+        "operations"_a,
+        "snap_every"_a = 0,
+        "snap_rollback"_a = true,
+        nb::call_guard<nb::gil_scoped_release>());
 
     m.def(
         "boolean_chain_hybrid",
@@ -1007,7 +2818,10 @@ NB_MODULE(_booleans, m) {
         "faces"_a,
         "mesh_v_counts"_a,
         "mesh_f_counts"_a,
-        "operations"_a);
+        "operations"_a,
+        "snap_every"_a = 0,
+        "snap_rollback"_a = true,
+        nb::call_guard<nb::gil_scoped_release>());
 
     m.def(
         "boolean_chain_with_face_source_hybrid",
@@ -1018,5 +2832,315 @@ NB_MODULE(_booleans, m) {
         "faces"_a,
         "mesh_v_counts"_a,
         "mesh_f_counts"_a,
-        "operations"_a);
+        "operations"_a,
+        "snap_every"_a = 0,
+        "snap_rollback"_a = true,
+        nb::call_guard<nb::gil_scoped_release>());
+
+    m.def(
+        "boolean_many",
+        nb::overload_cast<
+            Eigen::Ref<const compas::RowMatrixXd>,
+            Eigen::Ref<const compas::RowMatrixXi>,
+            Eigen::Ref<const compas::RowMatrixXd>,
+            Eigen::Ref<const compas::RowMatrixXi>,
+            const std::vector<int>&,
+            const std::vector<int>&,
+            int,
+            int>(&pmp_boolean_many),
+        "Apply one boolean operation between mesh A and each of many meshes B_i "
+        "on a pool of native threads. A is converted once; the B_i are sent as "
+        "flat (V, F) arrays plus per-mesh row counts. Returns per-item lists of "
+        "vertices, faces, and error messages (empty string on success).",
+        "vertices_a"_a,
+        "faces_a"_a,
+        "vertices"_a,
+        "faces"_a,
+        "mesh_v_counts"_a,
+        "mesh_f_counts"_a,
+        "operation"_a,
+        "num_threads"_a = 0,
+        nb::call_guard<nb::gil_scoped_release>());
+
+    m.def(
+        "boolean_many",
+        nb::overload_cast<
+            const compas::Mesh&,
+            Eigen::Ref<const compas::RowMatrixXd>,
+            Eigen::Ref<const compas::RowMatrixXi>,
+            const std::vector<int>&,
+            const std::vector<int>&,
+            int,
+            int>(&pmp_boolean_many),
+        "Apply one boolean operation between a native mesh A and each of many meshes B_i.",
+        "A"_a,
+        "vertices"_a,
+        "faces"_a,
+        "mesh_v_counts"_a,
+        "mesh_f_counts"_a,
+        "operation"_a,
+        "num_threads"_a = 0,
+        nb::call_guard<nb::gil_scoped_release>());
+
+    m.def(
+        "boolean_union_many",
+        &pmp_boolean_union_many,
+        "Union of many meshes. Meshes are grouped by bounding-box overlap; each "
+        "group is reduced in a balanced binary tree with the pairs of every tree "
+        "level unioned on native threads, and the disjoint group results are "
+        "concatenated. exact=True uses EPECK, exact=False the hybrid EPICK mesh "
+        "with an EPECK vertex point map.",
+        "vertices"_a,
+        "faces"_a,
+        "mesh_v_counts"_a,
+        "mesh_f_counts"_a,
+        "exact"_a = true,
+        "num_threads"_a = 0,
+        nb::call_guard<nb::gil_scoped_release>());
+
+    m.def(
+        "boolean_localized",
+        nb::overload_cast<
+            Eigen::Ref<const compas::RowMatrixXd>,
+            Eigen::Ref<const compas::RowMatrixXi>,
+            Eigen::Ref<const compas::RowMatrixXd>,
+            Eigen::Ref<const compas::RowMatrixXi>,
+            int>(&pmp_boolean_localized),
+        "Boolean operation that corefines only the faces of A near B. Returns (V, F, path).",
+        "VA"_a,
+        "FA"_a,
+        "VB"_a,
+        "FB"_a,
+        "operation"_a,
+        nb::call_guard<nb::gil_scoped_release>());
+
+    m.def(
+        "boolean_localized",
+        nb::overload_cast<const compas::Mesh&, compas::Mesh, int>(&pmp_boolean_localized),
+        "Boolean operation on native meshes that corefines only the faces of A near B.",
+        "A"_a,
+        "B"_a,
+        "operation"_a,
+        nb::call_guard<nb::gil_scoped_release>());
+
+    m.def(
+        "clip",
+        nb::overload_cast<
+            Eigen::Ref<const compas::RowMatrixXd>,
+            Eigen::Ref<const compas::RowMatrixXi>,
+            Eigen::Ref<const compas::RowMatrixXd>,
+            Eigen::Ref<const compas::RowMatrixXi>>(&pmp_clip),
+        "Keep the part of mesh A inside the closed mesh B.",
+        "VA"_a,
+        "FA"_a,
+        "VB"_a,
+        "FB"_a,
+        nb::call_guard<nb::gil_scoped_release>());
+
+    m.def(
+        "clip",
+        nb::overload_cast<compas::Mesh, compas::Mesh>(&pmp_clip),
+        "Keep the part of native mesh A inside the closed native mesh B.",
+        "A"_a,
+        "B"_a,
+        nb::call_guard<nb::gil_scoped_release>());
+
+    m.def(
+        "clip_plane",
+        nb::overload_cast<
+            Eigen::Ref<const compas::RowMatrixXd>,
+            Eigen::Ref<const compas::RowMatrixXi>,
+            const std::vector<double>&,
+            const std::vector<double>&,
+            bool>(&pmp_clip_plane),
+        "Keep the part of a mesh on the negative side of a plane.",
+        "vertices"_a,
+        "faces"_a,
+        "point"_a,
+        "normal"_a,
+        "close"_a = false,
+        nb::call_guard<nb::gil_scoped_release>());
+
+    m.def(
+        "clip_plane",
+        nb::overload_cast<compas::Mesh, const std::vector<double>&, const std::vector<double>&, bool>(&pmp_clip_plane),
+        "Keep the part of a native mesh on the negative side of a plane.",
+        "mesh"_a,
+        "point"_a,
+        "normal"_a,
+        "close"_a = false,
+        nb::call_guard<nb::gil_scoped_release>());
+
+    m.def(
+        "clip_box",
+        nb::overload_cast<
+            Eigen::Ref<const compas::RowMatrixXd>,
+            Eigen::Ref<const compas::RowMatrixXi>,
+            const std::vector<double>&,
+            bool>(&pmp_clip_box),
+        "Keep the part of a mesh inside an axis-aligned box (xmin, ymin, zmin, xmax, ymax, zmax).",
+        "vertices"_a,
+        "faces"_a,
+        "box"_a,
+        "close"_a = false,
+        nb::call_guard<nb::gil_scoped_release>());
+
+    m.def(
+        "clip_box",
+        nb::overload_cast<const compas::Mesh&, const std::vector<double>&, bool>(&pmp_clip_box),
+        "Keep the part of a native mesh inside an axis-aligned box.",
+        "mesh"_a,
+        "box"_a,
+        "close"_a = false,
+        nb::call_guard<nb::gil_scoped_release>());
+
+    m.def(
+        "clip_boxes",
+        nb::overload_cast<
+            Eigen::Ref<const compas::RowMatrixXd>,
+            Eigen::Ref<const compas::RowMatrixXi>,
+            Eigen::Ref<const compas::RowMatrixXd>,
+            bool,
+            int>(&pmp_clip_boxes),
+        "Clip one mesh with many axis-aligned boxes (Nx6) on native threads.",
+        "vertices"_a,
+        "faces"_a,
+        "boxes"_a,
+        "close"_a = false,
+        "num_threads"_a = 0,
+        nb::call_guard<nb::gil_scoped_release>());
+
+    m.def(
+        "clip_boxes",
+        nb::overload_cast<const compas::Mesh&, Eigen::Ref<const compas::RowMatrixXd>, bool, int>(&pmp_clip_boxes),
+        "Clip one native mesh with many axis-aligned boxes (Nx6) on native threads.",
+        "mesh"_a,
+        "boxes"_a,
+        "close"_a = false,
+        "num_threads"_a = 0,
+        nb::call_guard<nb::gil_scoped_release>());
+
+    nb::class_<BooleanSolver>(m, "BooleanSolver",
+        "Mesh prepared once for repeated booleans with other meshes.")
+        .def(nb::init<Eigen::Ref<const compas::RowMatrixXd>, Eigen::Ref<const compas::RowMatrixXi>>(),
+             "vertices"_a, "faces"_a,
+             nb::call_guard<nb::gil_scoped_release>())
+        .def(nb::init<compas::Mesh>(),
+             "mesh"_a,
+             nb::call_guard<nb::gil_scoped_release>())
+        .def("compute",
+             nb::overload_cast<
+                 Eigen::Ref<const compas::RowMatrixXd>,
+                 Eigen::Ref<const compas::RowMatrixXi>,
+                 int>(&BooleanSolver::compute, nb::const_),
+             "Boolean operation with mesh B. Returns (V, F, path).",
+             "vertices"_a, "faces"_a, "operation"_a,
+             nb::call_guard<nb::gil_scoped_release>())
+        .def("compute",
+             nb::overload_cast<compas::Mesh, int>(&BooleanSolver::compute, nb::const_),
+             "Boolean operation with native mesh B. Returns (V, F, path).",
+             "mesh"_a, "operation"_a,
+             nb::call_guard<nb::gil_scoped_release>())
+        .def_prop_ro("num_vertices", &BooleanSolver::num_vertices)
+        .def_prop_ro("num_faces", &BooleanSolver::num_faces);
+
+    m.def(
+        "boolean_mesh_mesh",
+        nb::overload_cast<
+            Eigen::Ref<const compas::RowMatrixXd>,
+            Eigen::Ref<const compas::RowMatrixXi>,
+            Eigen::Ref<const compas::RowMatrixXd>,
+            Eigen::Ref<const compas::RowMatrixXi>,
+            int, bool, bool, bool>(&pmp_boolean_mesh_mesh),
+        "Boolean operation with one corefinement. Returns (V, F, E, S, VS); arrays that are not requested are empty.",
+        "VA"_a,
+        "FA"_a,
+        "VB"_a,
+        "FB"_a,
+        "operation"_a,
+        "return_edges"_a = true,
+        "return_face_source"_a = true,
+        "return_vertex_source"_a = true,
+        nb::call_guard<nb::gil_scoped_release>());
+
+    m.def(
+        "boolean_mesh_mesh",
+        nb::overload_cast<compas::Mesh, compas::Mesh, int, bool, bool, bool>(&pmp_boolean_mesh_mesh),
+        "Boolean operation on native meshes with one corefinement. Returns (V, F, E, S, VS).",
+        "A"_a,
+        "B"_a,
+        "operation"_a,
+        "return_edges"_a = true,
+        "return_face_source"_a = true,
+        "return_vertex_source"_a = true,
+        nb::call_guard<nb::gil_scoped_release>());
+
+    m.def(
+        "boolean_difference_mesh_meshes",
+        nb::overload_cast<
+            Eigen::Ref<const compas::RowMatrixXd>,
+            Eigen::Ref<const compas::RowMatrixXi>,
+            Eigen::Ref<const compas::RowMatrixXd>,
+            Eigen::Ref<const compas::RowMatrixXi>,
+            const std::vector<int>&,
+            const std::vector<int>&,
+            int>(&pmp_boolean_difference_mesh_meshes),
+        "Subtract many cutters (flat V/F with per-mesh counts) from A. "
+        "Overlapping cutters are unioned first, in parallel. Returns (V, F, path).",
+        "VA"_a,
+        "FA"_a,
+        "vertices"_a,
+        "faces"_a,
+        "mesh_v_counts"_a,
+        "mesh_f_counts"_a,
+        "num_threads"_a = 0,
+        nb::call_guard<nb::gil_scoped_release>());
+
+    m.def(
+        "boolean_difference_mesh_meshes",
+        nb::overload_cast<
+            compas::Mesh,
+            Eigen::Ref<const compas::RowMatrixXd>,
+            Eigen::Ref<const compas::RowMatrixXi>,
+            const std::vector<int>&,
+            const std::vector<int>&,
+            int>(&pmp_boolean_difference_mesh_meshes),
+        "Subtract many cutters from a native mesh A. Returns (V, F, path).",
+        "A"_a,
+        "vertices"_a,
+        "faces"_a,
+        "mesh_v_counts"_a,
+        "mesh_f_counts"_a,
+        "num_threads"_a = 0,
+        nb::call_guard<nb::gil_scoped_release>());
+
+    nb::class_<BooleanAccumulator>(m, "BooleanAccumulator",
+        "Boolean chain that keeps its exact intermediate result in C++ and consumes one mesh at a time.")
+        .def(nb::init<Eigen::Ref<const compas::RowMatrixXd>, Eigen::Ref<const compas::RowMatrixXi>, bool, bool, int, bool>(),
+             "vertices"_a, "faces"_a, "hybrid"_a = false, "track_sources"_a = false,
+             "snap_every"_a = 0, "snap_rollback"_a = true,
+             nb::call_guard<nb::gil_scoped_release>())
+        .def(nb::init<compas::Mesh, bool, bool, int, bool>(),
+             "mesh"_a, "hybrid"_a = false, "track_sources"_a = false,
+             "snap_every"_a = 0, "snap_rollback"_a = true,
+             nb::call_guard<nb::gil_scoped_release>())
+        .def("apply",
+             nb::overload_cast<
+                 int,
+                 Eigen::Ref<const compas::RowMatrixXd>,
+                 Eigen::Ref<const compas::RowMatrixXi>>(&BooleanAccumulator::apply),
+             "Replace the result R by R OP B.",
+             "operation"_a, "vertices"_a, "faces"_a,
+             nb::call_guard<nb::gil_scoped_release>())
+        .def("apply",
+             nb::overload_cast<int, compas::Mesh>(&BooleanAccumulator::apply),
+             "Replace the result R by R OP B, with B a native mesh.",
+             "operation"_a, "mesh"_a,
+             nb::call_guard<nb::gil_scoped_release>())
+        .def("result",
+             &BooleanAccumulator::result,
+             "The current result as (V, F, S). S is empty unless sources are tracked.",
+             nb::call_guard<nb::gil_scoped_release>())
+        .def_prop_ro("num_meshes", &BooleanAccumulator::num_meshes)
+        .def_prop_ro("num_failed_snaps", &BooleanAccumulator::num_failed_snaps);
 }
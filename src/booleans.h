@@ -13,11 +13,16 @@
  * @param faces_a Faces of mesh A as Mx3 matrix of vertex indices in row-major order
  * @param vertices_b Vertices of mesh B as Px3 matrix in row-major order
  * @param faces_b Faces of mesh B as Qx3 matrix of vertex indices in row-major order
+ * If the bounding boxes of A and B are disjoint, or an AABB tree test shows
+ * that their surfaces do not intersect, the result is assembled from the
+ * inputs without corefinement.
+ *
  * @return Tuple containing:
  *         - Resulting vertices as Rx3 matrix
  *         - Resulting faces as Sx3 matrix of vertex indices
+ *         - Path taken: "bbox", "aabb", or "corefinement"
  */
-std::tuple<compas::RowMatrixXd, compas::RowMatrixXi>
+std::tuple<compas::RowMatrixXd, compas::RowMatrixXi, std::string>
 pmp_boolean_union(
     Eigen::Ref<const compas::RowMatrixXd> vertices_a,
     Eigen::Ref<const compas::RowMatrixXi> faces_a,
@@ -31,11 +36,16 @@ pmp_boolean_union(
  * @param faces_a Faces of mesh A as Mx3 matrix of vertex indices in row-major order
  * @param vertices_b Vertices of mesh B as Px3 matrix in row-major order
  * @param faces_b Faces of mesh B as Qx3 matrix of vertex indices in row-major order
+ * If the bounding boxes of A and B are disjoint, or an AABB tree test shows
+ * that their surfaces do not intersect, the result is assembled from the
+ * inputs without corefinement.
+ *
  * @return Tuple containing:
  *         - Resulting vertices as Rx3 matrix
  *         - Resulting faces as Sx3 matrix of vertex indices
+ *         - Path taken: "bbox", "aabb", or "corefinement"
  */
-std::tuple<compas::RowMatrixXd, compas::RowMatrixXi>
+std::tuple<compas::RowMatrixXd, compas::RowMatrixXi, std::string>
 pmp_boolean_difference(
     Eigen::Ref<const compas::RowMatrixXd> vertices_a,
     Eigen::Ref<const compas::RowMatrixXi> faces_a,
@@ -49,11 +59,16 @@ pmp_boolean_difference(
  * @param faces_a Faces of mesh A as Mx3 matrix of vertex indices in row-major order
  * @param vertices_b Vertices of mesh B as Px3 matrix in row-major order
  * @param faces_b Faces of mesh B as Qx3 matrix of vertex indices in row-major order
+ * If the bounding boxes of A and B are disjoint, or an AABB tree test shows
+ * that their surfaces do not intersect, the result is assembled from the
+ * inputs without corefinement.
+ *
  * @return Tuple containing:
  *         - Resulting vertices as Rx3 matrix
  *         - Resulting faces as Sx3 matrix of vertex indices
+ *         - Path taken: "bbox", "aabb", or "corefinement"
  */
-std::tuple<compas::RowMatrixXd, compas::RowMatrixXi>
+std::tuple<compas::RowMatrixXd, compas::RowMatrixXi, std::string>
 pmp_boolean_intersection(
     Eigen::Ref<const compas::RowMatrixXd> vertices_a,
     Eigen::Ref<const compas::RowMatrixXi> faces_a,
@@ -62,7 +77,7 @@ pmp_boolean_intersection(
 
 /**
  * Clip mesh A using mesh B as a clipping volume.
- * Points of mesh A that lie inside mesh B are removed.
+ * The part of mesh A inside the closed mesh B is kept.
  * 
  * @param vertices_a Vertices of mesh A as Nx3 matrix in row-major order
  * @param faces_a Faces of mesh A as Mx3 matrix of vertex indices in row-major order
@@ -172,35 +187,47 @@ pmp_boolean_intersection_with_face_source(
  *     0 = union
  *     1 = difference (result - mesh_{i+1})
  *     2 = intersection
- *     3 = xor (symmetric difference, computed as (A - B) union (B - A))
+ *     3 = xor (symmetric difference: A - B and B - A from one corefinement,
+ *         concatenated; the two parts only touch along the intersection curves)
  *
  * EPECK constructions are lazy-exact: there are no rounding artifacts on
  * cut boundaries, so the chain handles geometrically degenerate input
  * (e.g., three cylinders meeting at the origin) without any geometric
- * workarounds.
+ * workarounds. *
+ * Lazy-exact points keep the history of their construction, which grows
+ * with the length of the chain. With `snap_every = k > 0`, the intermediate
+ * result is rounded to double coordinates after every k-th step (see
+ * exact_chain::snap). Every rounding is checked for self-intersections. With
+ * `snap_rollback`, a rounding that makes the mesh self-intersect is undone;
+ * otherwise it is kept. Returns `(V, F, failed_snaps)`, where `failed_snaps`
+ * counts the roundings that made the mesh self-intersect in either case.
  */
-std::tuple<compas::RowMatrixXd, compas::RowMatrixXi>
+std::tuple<compas::RowMatrixXd, compas::RowMatrixXi, int>
 pmp_boolean_chain(
     Eigen::Ref<const compas::RowMatrixXd> vertices,
     Eigen::Ref<const compas::RowMatrixXi> faces,
     const std::vector<int>& mesh_v_counts,
     const std::vector<int>& mesh_f_counts,
-    const std::vector<int>& operations);
+    const std::vector<int>& operations,
+    int snap_every = 0,
+    bool snap_rollback = true);
 
 /**
  * Like `pmp_boolean_chain` but additionally tracks which input mesh and
  * which input face each output triangle descended from. Returns
- * `(V, F, S)` where `S[i] = [mesh_id, face_id]`. Tracking is done via a
- * CGAL corefinement visitor that propagates per-face tags through subface
- * creation and face copies. `xor` (op code 3) is not supported here.
+ * `(V, F, S, failed_snaps)` where `S[i] = [mesh_id, face_id]`. Tracking is
+ * done via a CGAL corefinement visitor that propagates per-face tags through
+ * subface creation and face copies.
  */
-std::tuple<compas::RowMatrixXd, compas::RowMatrixXi, compas::RowMatrixXi>
+std::tuple<compas::RowMatrixXd, compas::RowMatrixXi, compas::RowMatrixXi, int>
 pmp_boolean_chain_with_face_source(
     Eigen::Ref<const compas::RowMatrixXd> vertices,
     Eigen::Ref<const compas::RowMatrixXi> faces,
     const std::vector<int>& mesh_v_counts,
     const std::vector<int>& mesh_f_counts,
-    const std::vector<int>& operations);
+    const std::vector<int>& operations,
+    int snap_every = 0,
+    bool snap_rollback = true);
 
 /**
  * Hybrid kernel chain: Surface_mesh<Point_3> stored in EPICK, but every
@@ -212,13 +239,15 @@ pmp_boolean_chain_with_face_source(
  * pattern from CGAL's "consecutive boolean operations with exact point
  * maps" example.
  */
-std::tuple<compas::RowMatrixXd, compas::RowMatrixXi>
+std::tuple<compas::RowMatrixXd, compas::RowMatrixXi, int>
 pmp_boolean_chain_hybrid(
     Eigen::Ref<const compas::RowMatrixXd> vertices,
     Eigen::Ref<const compas::RowMatrixXi> faces,
     const std::vector<int>& mesh_v_counts,
     const std::vector<int>& mesh_f_counts,
-    const std::vector<int>& operations);
+    const std::vector<int>& operations,
+    int snap_every = 0,
+    bool snap_rollback = true);
 
 /**
  * Hybrid-kernel variant of pmp_boolean_chain_with_face_source. Same exact
@@ -227,10 +256,280 @@ pmp_boolean_chain_hybrid(
  * variants, because the visitor and the vertex_point_map are independent
  * named parameters.
  */
-std::tuple<compas::RowMatrixXd, compas::RowMatrixXi, compas::RowMatrixXi>
+std::tuple<compas::RowMatrixXd, compas::RowMatrixXi, compas::RowMatrixXi, int>
 pmp_boolean_chain_with_face_source_hybrid(
     Eigen::Ref<const compas::RowMatrixXd> vertices,
     Eigen::Ref<const compas::RowMatrixXi> faces,
     const std::vector<int>& mesh_v_counts,
     const std::vector<int>& mesh_f_counts,
-    const std::vector<int>& operations);
+    const std::vector<int>& operations,
+    int snap_every = 0,
+    bool snap_rollback = true);
+
+/**
+ * Native-mesh overloads of the pairwise boolean operations above.
+ *
+ * The operands are taken by value: corefinement modifies its inputs, so a
+ * `CgalMesh` passed from Python is copied (property arrays only, no rebuild
+ * of the halfedge structure) and the caller's mesh is left untouched. The
+ * `(V, F)` overloads build their meshes and move them into these.
+ */
+std::tuple<compas::RowMatrixXd, compas::RowMatrixXi, std::string>
+pmp_boolean_union(compas::Mesh mesh_a, compas::Mesh mesh_b);
+
+std::tuple<compas::RowMatrixXd, compas::RowMatrixXi, std::string>
+pmp_boolean_difference(compas::Mesh mesh_a, compas::Mesh mesh_b);
+
+std::tuple<compas::RowMatrixXd, compas::RowMatrixXi, std::string>
+pmp_boolean_intersection(compas::Mesh mesh_a, compas::Mesh mesh_b);
+
+std::tuple<compas::RowMatrixXd, compas::RowMatrixXi, compas::RowMatrixXi>
+pmp_boolean_union_with_edges(compas::Mesh mesh_a, compas::Mesh mesh_b);
+
+std::tuple<compas::RowMatrixXd, compas::RowMatrixXi, compas::RowMatrixXi>
+pmp_boolean_difference_with_edges(compas::Mesh mesh_a, compas::Mesh mesh_b);
+
+std::tuple<compas::RowMatrixXd, compas::RowMatrixXi, compas::RowMatrixXi>
+pmp_boolean_intersection_with_edges(compas::Mesh mesh_a, compas::Mesh mesh_b);
+
+std::tuple<compas::RowMatrixXd, compas::RowMatrixXi, compas::RowMatrixXi>
+pmp_boolean_union_with_face_source(compas::Mesh mesh_a, compas::Mesh mesh_b);
+
+std::tuple<compas::RowMatrixXd, compas::RowMatrixXi, compas::RowMatrixXi>
+pmp_boolean_difference_with_face_source(compas::Mesh mesh_a, compas::Mesh mesh_b);
+
+std::tuple<compas::RowMatrixXd, compas::RowMatrixXi, compas::RowMatrixXi>
+pmp_boolean_intersection_with_face_source(compas::Mesh mesh_a, compas::Mesh mesh_b);
+
+/**
+ * Apply one boolean operation between A and each of many meshes B_i.
+ *
+ * A is converted to a Surface_mesh once and copied for every item; the B_i
+ * are passed as flat (V, F) arrays plus per-mesh row counts, like the chain
+ * functions. The items are processed on a pool of native threads
+ * (`compas::parallel_for`), so the binding releases the GIL for the whole
+ * batch. A failing item does not abort the batch: its vertices and faces are
+ * empty and its error message is set.
+ *
+ * @param operation 0 (union), 1 (difference A - B_i), 2 (intersection), 3 (xor)
+ * @param num_threads Number of threads; 0 uses the hardware concurrency
+ * @return Per-item vertices, faces, and error messages (empty on success)
+ */
+std::tuple<std::vector<compas::RowMatrixXd>, std::vector<compas::RowMatrixXi>, std::vector<std::string>>
+pmp_boolean_many(
+    Eigen::Ref<const compas::RowMatrixXd> vertices_a,
+    Eigen::Ref<const compas::RowMatrixXi> faces_a,
+    Eigen::Ref<const compas::RowMatrixXd> vertices,
+    Eigen::Ref<const compas::RowMatrixXi> faces,
+    const std::vector<int>& mesh_v_counts,
+    const std::vector<int>& mesh_f_counts,
+    int operation,
+    int num_threads = 0);
+
+std::tuple<std::vector<compas::RowMatrixXd>, std::vector<compas::RowMatrixXi>, std::vector<std::string>>
+pmp_boolean_many(
+    const compas::Mesh& mesh_a,
+    Eigen::Ref<const compas::RowMatrixXd> vertices,
+    Eigen::Ref<const compas::RowMatrixXi> faces,
+    const std::vector<int>& mesh_v_counts,
+    const std::vector<int>& mesh_f_counts,
+    int operation,
+    int num_threads = 0);
+
+/**
+ * Union of many meshes in a balanced binary tree.
+ *
+ * The meshes are first grouped by (transitive) bounding-box overlap. Each
+ * group is reduced pairwise in a balanced tree, so N meshes need log2(N)
+ * rounds of independent corefinements instead of N - 1 sequential ones on an
+ * ever-growing intermediate; the pairs of a round run on native threads.
+ * The groups are bbox-disjoint and are concatenated without corefinement.
+ *
+ * @param exact If true, use the EPECK kernel (as pmp_boolean_chain);
+ *              otherwise the hybrid EPICK mesh with an EPECK vertex point map
+ *              (as pmp_boolean_chain_hybrid).
+ * @param num_threads Number of threads; 0 uses the hardware concurrency
+ */
+std::tuple<compas::RowMatrixXd, compas::RowMatrixXi>
+pmp_boolean_union_many(
+    Eigen::Ref<const compas::RowMatrixXd> vertices,
+    Eigen::Ref<const compas::RowMatrixXi> faces,
+    const std::vector<int>& mesh_v_counts,
+    const std::vector<int>& mesh_f_counts,
+    bool exact = true,
+    int num_threads = 0);
+
+/**
+ * Boolean union (0), difference (1), or intersection (2) that corefines only
+ * the region of interest of A.
+ *
+ * The faces of A whose bounding boxes overlap the slightly expanded bounding
+ * box of B are extracted into a patch, the patch is corefined with B, and the
+ * kept faces are spliced back into the untouched faces of A. The result has
+ * the same faces as the full operation, but A is neither copied nor corefined
+ * as a whole, which matters for a small B against a very large A.
+ *
+ * If the local classification is not conclusive (B does not cross A, a
+ * component of B does not cross A, coplanar contacts), the full operation is
+ * run instead.
+ *
+ * @return Tuple containing the resulting vertices, faces, and the path taken:
+ *         "localized", or the path of the full operation.
+ */
+std::tuple<compas::RowMatrixXd, compas::RowMatrixXi, std::string>
+pmp_boolean_localized(
+    Eigen::Ref<const compas::RowMatrixXd> vertices_a,
+    Eigen::Ref<const compas::RowMatrixXi> faces_a,
+    Eigen::Ref<const compas::RowMatrixXd> vertices_b,
+    Eigen::Ref<const compas::RowMatrixXi> faces_b,
+    int operation);
+
+std::tuple<compas::RowMatrixXd, compas::RowMatrixXi, std::string>
+pmp_boolean_localized(
+    const compas::Mesh& mesh_a,
+    compas::Mesh mesh_b,
+    int operation);
+
+/**
+ * Native-mesh overload of pmp_clip. Both meshes are copied.
+ */
+std::tuple<compas::RowMatrixXd, compas::RowMatrixXi>
+pmp_clip(compas::Mesh mesh_a, compas::Mesh mesh_b);
+
+/**
+ * Clip a triangle mesh with a plane, keeping the part on its negative side
+ * (opposite to the normal).
+ *
+ * @param point Point on the plane
+ * @param normal Normal of the plane
+ * @param close If true, close the cut with a cap (the mesh must be closed)
+ */
+std::tuple<compas::RowMatrixXd, compas::RowMatrixXi>
+pmp_clip_plane(
+    Eigen::Ref<const compas::RowMatrixXd> vertices,
+    Eigen::Ref<const compas::RowMatrixXi> faces,
+    const std::vector<double>& point,
+    const std::vector<double>& normal,
+    bool close = false);
+
+std::tuple<compas::RowMatrixXd, compas::RowMatrixXi>
+pmp_clip_plane(
+    compas::Mesh mesh,
+    const std::vector<double>& point,
+    const std::vector<double>& normal,
+    bool close = false);
+
+/**
+ * Clip a triangle mesh with an axis-aligned box, keeping the part inside.
+ *
+ * Without `close`, only the faces overlapping the box are copied before
+ * clipping; the rest of the mesh is never touched.
+ *
+ * @param box xmin, ymin, zmin, xmax, ymax, zmax
+ * @param close If true, close the cuts with caps (the mesh must be closed)
+ */
+std::tuple<compas::RowMatrixXd, compas::RowMatrixXi>
+pmp_clip_box(
+    Eigen::Ref<const compas::RowMatrixXd> vertices,
+    Eigen::Ref<const compas::RowMatrixXi> faces,
+    const std::vector<double>& box,
+    bool close = false);
+
+std::tuple<compas::RowMatrixXd, compas::RowMatrixXi>
+pmp_clip_box(
+    const compas::Mesh& mesh,
+    const std::vector<double>& box,
+    bool close = false);
+
+/**
+ * Clip one triangle mesh with many axis-aligned boxes (tiling).
+ *
+ * The mesh is converted once and shared read-only between the items, which
+ * run on native threads (`compas::parallel_for`).
+ *
+ * @param boxes Nx6 matrix of xmin, ymin, zmin, xmax, ymax, zmax
+ * @param num_threads Number of threads; 0 uses the hardware concurrency
+ * @return Per-box vertices and faces
+ */
+std::tuple<std::vector<compas::RowMatrixXd>, std::vector<compas::RowMatrixXi>>
+pmp_clip_boxes(
+    Eigen::Ref<const compas::RowMatrixXd> vertices,
+    Eigen::Ref<const compas::RowMatrixXi> faces,
+    Eigen::Ref<const compas::RowMatrixXd> boxes,
+    bool close = false,
+    int num_threads = 0);
+
+std::tuple<std::vector<compas::RowMatrixXd>, std::vector<compas::RowMatrixXi>>
+pmp_clip_boxes(
+    const compas::Mesh& mesh,
+    Eigen::Ref<const compas::RowMatrixXd> boxes,
+    bool close = false,
+    int num_threads = 0);
+
+/**
+ * Boolean union (0), difference (1), or intersection (2) with a single
+ * corefinement, optionally returning the intersection edges (as the
+ * `_with_edges` variants), the face sources (as the `_with_face_source`
+ * variants), and the vertex sources together.
+ *
+ * @return Tuple containing:
+ *         - Resulting vertices as Rx3 matrix
+ *         - Resulting faces as Sx3 matrix
+ *         - Intersection edges as Ex2 matrix of vertex indices
+ *         - Face sources as Sx2 matrix of (mesh_id, face_id), mesh_id 0 = A, 1 = B
+ *         - Vertex sources as Rx2 matrix of (mesh_id, vertex_id); vertices
+ *           created on the intersection curves are (-1, -1)
+ *         Arrays that are not requested are empty (0x2).
+ */
+std::tuple<compas::RowMatrixXd, compas::RowMatrixXi, compas::RowMatrixXi, compas::RowMatrixXi, compas::RowMatrixXi>
+pmp_boolean_mesh_mesh(
+    Eigen::Ref<const compas::RowMatrixXd> vertices_a,
+    Eigen::Ref<const compas::RowMatrixXi> faces_a,
+    Eigen::Ref<const compas::RowMatrixXd> vertices_b,
+    Eigen::Ref<const compas::RowMatrixXi> faces_b,
+    int operation,
+    bool return_edges = true,
+    bool return_face_source = true,
+    bool return_vertex_source = true);
+
+std::tuple<compas::RowMatrixXd, compas::RowMatrixXi, compas::RowMatrixXi, compas::RowMatrixXi, compas::RowMatrixXi>
+pmp_boolean_mesh_mesh(
+    compas::Mesh mesh_a,
+    compas::Mesh mesh_b,
+    int operation,
+    bool return_edges = true,
+    bool return_face_source = true,
+    bool return_vertex_source = true);
+
+/**
+ * Subtract many closed cutters B_i from A with a single difference.
+ *
+ * Cutters whose bounding boxes overlap are tested with PMP::do_intersect;
+ * clusters of overlapping cutters are unioned in parallel (hybrid kernel,
+ * balanced tree), the clusters are concatenated into one operand, and A is
+ * corefined once with that operand.
+ *
+ * @param mesh_v_counts Number of vertices of every cutter in `vertices`
+ * @param mesh_f_counts Number of faces of every cutter in `faces`
+ * @param num_threads Number of threads; 0 uses the hardware concurrency
+ * @return Tuple containing the resulting vertices, faces, and the path taken
+ *         by the final difference
+ */
+std::tuple<compas::RowMatrixXd, compas::RowMatrixXi, std::string>
+pmp_boolean_difference_mesh_meshes(
+    Eigen::Ref<const compas::RowMatrixXd> vertices_a,
+    Eigen::Ref<const compas::RowMatrixXi> faces_a,
+    Eigen::Ref<const compas::RowMatrixXd> vertices,
+    Eigen::Ref<const compas::RowMatrixXi> faces,
+    const std::vector<int>& mesh_v_counts,
+    const std::vector<int>& mesh_f_counts,
+    int num_threads = 0);
+
+std::tuple<compas::RowMatrixXd, compas::RowMatrixXi, std::string>
+pmp_boolean_difference_mesh_meshes(
+    compas::Mesh mesh_a,
+    Eigen::Ref<const compas::RowMatrixXd> vertices,
+    Eigen::Ref<const compas::RowMatrixXi> faces,
+    const std::vector<int>& mesh_v_counts,
+    const std::vector<int>& mesh_f_counts,
+    int num_threads = 0);
@@ -5,6 +5,12 @@
 // This file is referenced in CMakeLists PCH section.
 
 // STD
+#include <algorithm>
+#include <array>
+#include <atomic>
+#include <exception>
+#include <mutex>
+#include <thread>
 #include <vector>
 
 // Nanobind
@@ -34,6 +40,9 @@ using namespace nb::literals; // enables syntax for annotating function and argu
 #include <CGAL/Polyhedron_3.h>
 #include <CGAL/Polyhedron_incremental_builder_3.h>
 #include <CGAL/Polyhedron_items_with_id_3.h>
+#include <CGAL/AABB_face_graph_triangle_primitive.h>
+#include <CGAL/AABB_traits_3.h>
+#include <CGAL/AABB_tree.h>
 
 namespace compas
 {
@@ -279,4 +288,173 @@ namespace compas
         return std::make_tuple(std::move(V), std::move(F));
     }
 
-} // namespace compas
\ No newline at end of file
+    /**
+     * @brief Run a function for every index in [0, n) on a pool of native threads
+     *
+     * Indices are handed out one at a time through an atomic counter, so uneven
+     * workloads (e.g. booleans of very different sizes) balance themselves.
+     * The function must not touch Python objects: it runs without the GIL.
+     * The first exception thrown by any call is rethrown after all threads joined.
+     *
+     * @param n Number of items
+     * @param fn Callable taking the item index
+     * @param num_threads Number of threads; 0 uses the hardware concurrency
+     */
+    template <typename Function>
+    void parallel_for(std::size_t n, Function fn, std::size_t num_threads = 0)
+    {
+        if (num_threads == 0)
+        {
+            num_threads = std::max(1u, std::thread::hardware_concurrency());
+        }
+        num_threads = std::min(num_threads, n);
+
+        if (num_threads <= 1)
+        {
+            for (std::size_t i = 0; i < n; i++)
+            {
+                fn(i);
+            }
+            return;
+        }
+
+        std::atomic<std::size_t> next(0);
+        std::exception_ptr error;
+        std::mutex error_mutex;
+
+        auto worker = [&]()
+        {
+            for (std::size_t i = next++; i < n; i = next++)
+            {
+                try
+                {
+                    fn(i);
+                }
+                catch (...)
+                {
+                    std::lock_guard<std::mutex> lock(error_mutex);
+                    if (!error)
+                    {
+                        error = std::current_exception();
+                    }
+                }
+            }
+        };
+
+        std::vector<std::thread> threads;
+        threads.reserve(num_threads - 1);
+        for (std::size_t t = 1; t < num_threads; t++)
+        {
+            threads.emplace_back(worker);
+        }
+        worker();
+        for (auto &thread : threads)
+        {
+            thread.join();
+        }
+
+        if (error)
+        {
+            std::rethrow_exception(error);
+        }
+    }
+
+    /**
+     * @brief Run a function for every block of indices in [0, n) on a pool of native threads
+     *
+     * For cheap per-item work (ray casts, closest point queries, ...), handing
+     * out blocks instead of single indices keeps the shared counter of
+     * `parallel_for` off the hot path.
+     *
+     * @param n Number of items
+     * @param block_size Number of items per block
+     * @param fn Callable taking the begin and end index of a block
+     * @param num_threads Number of threads; 0 uses the hardware concurrency
+     */
+    template <typename Function>
+    void parallel_for_blocks(std::size_t n, std::size_t block_size, Function fn, std::size_t num_threads = 0)
+    {
+        const std::size_t num_blocks = (n + block_size - 1) / block_size;
+        parallel_for(num_blocks, [&](std::size_t b)
+        {
+            const std::size_t begin = b * block_size;
+            fn(begin, std::min(begin + block_size, n));
+        }, num_threads);
+    }
+
+    /**
+     * @brief Number of rows per block in `parallel_for_row_blocks`
+     */
+    constexpr std::size_t row_block_size = 1024;
+
+    /**
+     * @brief Run a function for every block of rows of a query array on a pool of native threads
+     *
+     * Wraps `parallel_for_blocks` for the row indices of Eigen arrays and the
+     * `num_threads` argument of the bindings, where values below 1 use the
+     * hardware concurrency. Block `b` starts at row `b * row_block_size`.
+     *
+     * @param n Number of rows
+     * @param num_threads Number of threads as passed from Python
+     * @param fn Callable taking the begin and end row of a block
+     */
+    template <typename Function>
+    void parallel_for_row_blocks(Eigen::Index n, int num_threads, Function fn)
+    {
+        parallel_for_blocks(static_cast<std::size_t>(n), row_block_size, [&](std::size_t begin, std::size_t end)
+        {
+            fn(static_cast<Eigen::Index>(begin), static_cast<Eigen::Index>(end));
+        }, static_cast<std::size_t>(std::max(num_threads, 0)));
+    }
+
+    /**
+     * @brief AABB tree over the triangle faces of a mesh
+     *
+     * CGAL builds the tree, and the search structure for distance queries,
+     * lazily on the first query that needs them, which is not safe when the
+     * first queries come from several threads. Call `build()`, and
+     * `accelerate_distance_queries()` if distances are queried, before a tree
+     * is shared between threads. The mesh must outlive the tree.
+     */
+    using FaceTree = CGAL::AABB_tree<CGAL::AABB_traits_3<Kernel, CGAL::AABB_face_graph_triangle_primitive<Mesh>>>;
+
+    /**
+     * @brief Barycentric coordinates of a point with respect to a triangle face
+     *
+     * The coordinates follow the order of the face vertices in
+     * `mesh_to_vertices_and_faces`, which is the order of the input faces.
+     * The point is assumed to lie in the plane of the face.
+     *
+     * @param mesh The mesh
+     * @param face The face
+     * @param point The point
+     * @return The weights of the three face vertices
+     */
+    inline std::array<double, 3> barycentric_coordinates(const Mesh &mesh, Mesh::Face_index face, const Point &point)
+    {
+        std::array<Point, 3> p;
+        int j = 0;
+        for (Mesh::Vertex_index vd : vertices_around_face(mesh.halfedge(face), mesh))
+        {
+            p[j++] = mesh.point(vd);
+        }
+
+        const Vector e0 = p[1] - p[0];
+        const Vector e1 = p[2] - p[0];
+        const Vector e2 = point - p[0];
+        const double d00 = e0 * e0;
+        const double d01 = e0 * e1;
+        const double d11 = e1 * e1;
+        const double d20 = e2 * e0;
+        const double d21 = e2 * e1;
+        const double denominator = d00 * d11 - d01 * d01;
+        if (denominator == 0.0)
+        {
+            return {1.0, 0.0, 0.0};
+        }
+        const double v = (d11 * d20 - d01 * d21) / denominator;
+        const double w = (d00 * d21 - d01 * d20) / denominator;
+        return {1.0 - v - w, v, w};
+    }
+
+} // namespace compas
@@ -1,36 +1,58 @@
+import warnings
+from collections.abc import Mapping
 from typing import Iterable
 from typing import Literal
+from typing import Optional
+from typing import Union
 
 import numpy as np
+from compas.geometry import Plane
 from compas.plugins import plugin
 
 from compas_cgal import _booleans  # type: ignore
 
-from .types import VerticesFaces
+from .mesh import flatten_meshes
+from .mesh import mesh_arguments
+from .mesh import vertices_and_faces
+from .repair import _validated
+from .types import MeshLike
 from .types import VerticesFacesEdgesNumpy
 from .types import VerticesFacesNumpy
 from .types import VerticesFacesSourceNumpy
 
 
 def _boolean(
-    A: VerticesFaces,
-    B: VerticesFaces,
+    A: MeshLike,
+    B: MeshLike,
     operation: Literal["union", "difference", "intersection"],
-) -> VerticesFacesNumpy:
+    return_path: bool = False,
+    localized: bool = False,
+    validate: Union[bool, Literal["repair"]] = False,
+):
     """Wrapper for all boolean operations.
 
     Parameters
     ----------
     A
-        Mesh A.
+        Mesh A, as vertices and faces or as a native :class:`compas_cgal.mesh.CgalMesh`.
     B
-        Mesh B.
+        Mesh B, as vertices and faces or as a native :class:`compas_cgal.mesh.CgalMesh`.
     operation
         The type of boolean operation.
+    return_path
+        If True, also return the path taken by union, difference, and intersection:
+        ``"bbox"`` or ``"aabb"`` if the result was assembled without corefinement,
+        ``"corefinement"`` otherwise.
+    localized
+        If True, only corefine the faces of A near B (union, difference, and intersection).
+    validate
+        If True, raise an error if A or B self-intersects.
+        If ``"repair"``, remove the self-intersections instead.
 
     Returns
     -------
     VerticesFacesNumpy
+        With the path appended if ``return_path`` is True.
 
     Raises
     ------
@@ -38,44 +60,68 @@ def _boolean(
         If the operation type is not supported.
 
     """
-    VA, FA = A
-    VB, FB = B
-    VA = np.asarray(VA, dtype=np.float64)
-    FA = np.asarray(FA, dtype=np.int32)
-    VB = np.asarray(VB, dtype=np.float64)
-    FB = np.asarray(FB, dtype=np.int32)
+    args = mesh_arguments(*_validated((A, B), validate))
 
-    if operation == "union":
-        result = _booleans.boolean_union(VA, FA, VB, FB)
+    if localized and operation in ("union", "difference", "intersection"):
+        result = _booleans.boolean_localized(*args, _OP_CODES[operation])
+    elif operation == "union":
+        result = _booleans.boolean_union(*args)
     elif operation == "difference":
-        result = _booleans.boolean_difference(VA, FA, VB, FB)
+        result = _booleans.boolean_difference(*args)
     elif operation == "intersection":
-        result = _booleans.boolean_intersection(VA, FA, VB, FB)
+        result = _booleans.boolean_intersection(*args)
     elif operation == "split":
-        result = _booleans.split(VA, FA, VB, FB)
+        return _booleans.split(*args)
     else:
         raise NotImplementedError
 
-    return result
+    V, F, path = result
+    if return_path:
+        return V, F, path
+    return V, F
 
 
 @plugin(category="booleans", pluggable_name="boolean_union_mesh_mesh")
 def boolean_union_mesh_mesh(
-    A: VerticesFaces,
-    B: VerticesFaces,
+    A: MeshLike,
+    B: MeshLike,
+    return_path: bool = False,
+    localized: bool = False,
+    validate: Union[bool, Literal["repair"]] = False,
 ) -> VerticesFacesNumpy:
     """Boolean union of two meshes.
 
     Parameters
     ----------
     A
-        Mesh A.
+        Mesh A, as vertices and faces or as a native :class:`compas_cgal.mesh.CgalMesh`.
+        A native mesh is copied, not modified.
     B
-        Mesh B.
+        Mesh B, as vertices and faces or as a native :class:`compas_cgal.mesh.CgalMesh`.
+        A native mesh is copied, not modified.
+    return_path
+        If True, also return how the result was computed:
+        ``"bbox"`` if the bounding boxes are disjoint,
+        ``"aabb"`` if an AABB tree test shows that the surfaces do not intersect,
+        and ``"corefinement"`` otherwise.
+        Only in the last case are the meshes corefined.
+    localized
+        If True, only the faces of A whose bounding boxes overlap the bounding box of B
+        are corefined with B and spliced back into the rest of A.
+        The result has the same faces as the full operation, at a much lower cost
+        for a small B against a large A.
+        If the local classification is not conclusive, the full operation is used.
+        With ``return_path``, the path is ``"localized"`` if the local operation succeeded.
+    validate
+        If True, check that A and B do not self-intersect before the operation,
+        and raise a ``ValueError`` naming the invalid operand otherwise.
+        If ``"repair"``, remove the self-intersections with :func:`compas_cgal.repair.remove_self_intersections` instead.
+        Corefinement requires operands without self-intersections.
 
     Returns
     -------
     VerticesFacesNumpy
+        If ``return_path`` is True, a tuple of vertices, faces, and the path taken.
 
     Examples
     --------
@@ -92,26 +138,50 @@ def boolean_union_mesh_mesh(
     >>> shape = Polyhedron(*C)
 
     """
-    return _boolean(A, B, "union")
+    return _boolean(A, B, "union", return_path=return_path, localized=localized, validate=validate)
 
 
 @plugin(category="booleans", pluggable_name="boolean_difference_mesh_mesh")
 def boolean_difference_mesh_mesh(
-    A: VerticesFaces,
-    B: VerticesFaces,
+    A: MeshLike,
+    B: MeshLike,
+    return_path: bool = False,
+    localized: bool = False,
+    validate: Union[bool, Literal["repair"]] = False,
 ) -> VerticesFacesNumpy:
     """Boolean difference of two meshes.
 
     Parameters
     ----------
     A
-        Mesh A.
+        Mesh A, as vertices and faces or as a native :class:`compas_cgal.mesh.CgalMesh`.
+        A native mesh is copied, not modified.
     B
-        Mesh B.
+        Mesh B, as vertices and faces or as a native :class:`compas_cgal.mesh.CgalMesh`.
+        A native mesh is copied, not modified.
+    return_path
+        If True, also return how the result was computed:
+        ``"bbox"`` if the bounding boxes are disjoint,
+        ``"aabb"`` if an AABB tree test shows that the surfaces do not intersect,
+        and ``"corefinement"`` otherwise.
+        Only in the last case are the meshes corefined.
+    localized
+        If True, only the faces of A whose bounding boxes overlap the bounding box of B
+        are corefined with B and spliced back into the rest of A.
+        The result has the same faces as the full operation, at a much lower cost
+        for a small B against a large A.
+        If the local classification is not conclusive, the full operation is used.
+        With ``return_path``, the path is ``"localized"`` if the local operation succeeded.
+    validate
+        If True, check that A and B do not self-intersect before the operation,
+        and raise a ``ValueError`` naming the invalid operand otherwise.
+        If ``"repair"``, remove the self-intersections with :func:`compas_cgal.repair.remove_self_intersections` instead.
+        Corefinement requires operands without self-intersections.
 
     Returns
     -------
     VerticesFacesNumpy
+        If ``return_path`` is True, a tuple of vertices, faces, and the path taken.
 
     Examples
     --------
@@ -128,26 +198,50 @@ def boolean_difference_mesh_mesh(
     >>> shape = Polyhedron(*C)
 
     """
-    return _boolean(A, B, "difference")
+    return _boolean(A, B, "difference", return_path=return_path, localized=localized, validate=validate)
 
 
 @plugin(category="booleans", pluggable_name="boolean_intersection_mesh_mesh")
 def boolean_intersection_mesh_mesh(
-    A: VerticesFaces,
-    B: VerticesFaces,
+    A: MeshLike,
+    B: MeshLike,
+    return_path: bool = False,
+    localized: bool = False,
+    validate: Union[bool, Literal["repair"]] = False,
 ) -> VerticesFacesNumpy:
     """Boolean intersection of two meshes.
 
     Parameters
     ----------
     A
-        Mesh A.
+        Mesh A, as vertices and faces or as a native :class:`compas_cgal.mesh.CgalMesh`.
+        A native mesh is copied, not modified.
     B
-        Mesh B.
+        Mesh B, as vertices and faces or as a native :class:`compas_cgal.mesh.CgalMesh`.
+        A native mesh is copied, not modified.
+    return_path
+        If True, also return how the result was computed:
+        ``"bbox"`` if the bounding boxes are disjoint,
+        ``"aabb"`` if an AABB tree test shows that the surfaces do not intersect,
+        and ``"corefinement"`` otherwise.
+        Only in the last case are the meshes corefined.
+    localized
+        If True, only the faces of A whose bounding boxes overlap the bounding box of B
+        are corefined with B and spliced back into the rest of A.
+        The result has the same faces as the full operation, at a much lower cost
+        for a small B against a large A.
+        If the local classification is not conclusive, the full operation is used.
+        With ``return_path``, the path is ``"localized"`` if the local operation succeeded.
+    validate
+        If True, check that A and B do not self-intersect before the operation,
+        and raise a ``ValueError`` naming the invalid operand otherwise.
+        If ``"repair"``, remove the self-intersections with :func:`compas_cgal.repair.remove_self_intersections` instead.
+        Corefinement requires operands without self-intersections.
 
     Returns
     -------
     VerticesFacesNumpy
+        If ``return_path`` is True, a tuple of vertices, faces, and the path taken.
 
     Examples
     --------
@@ -164,22 +258,24 @@ def boolean_intersection_mesh_mesh(
     >>> shape = Polyhedron(*C)
 
     """
-    return _boolean(A, B, "intersection")
+    return _boolean(A, B, "intersection", return_path=return_path, localized=localized, validate=validate)
 
 
 @plugin(category="booleans", pluggable_name="split_mesh_mesh")
 def split_mesh_mesh(
-    A: VerticesFaces,
-    B: VerticesFaces,
+    A: MeshLike,
+    B: MeshLike,
 ) -> VerticesFacesNumpy:
     """Split one mesh with another.
 
     Parameters
     ----------
     A
-        Mesh A.
+        Mesh A, as vertices and faces or as a native :class:`compas_cgal.mesh.CgalMesh`.
+        A native mesh is copied, not modified.
     B
-        Mesh B.
+        Mesh B, as vertices and faces or as a native :class:`compas_cgal.mesh.CgalMesh`.
+        A native mesh is copied, not modified.
 
     Returns
     -------
@@ -207,27 +303,22 @@ split = split_mesh_mesh
 
 
 def _boolean_with_edges(
-    A: VerticesFaces,
-    B: VerticesFaces,
+    A: MeshLike,
+    B: MeshLike,
     operation: Literal["union", "difference", "intersection"],
 ) -> VerticesFacesEdgesNumpy:
-    VA, FA = A
-    VB, FB = B
-    VA = np.asarray(VA, dtype=np.float64)
-    FA = np.asarray(FA, dtype=np.int32)
-    VB = np.asarray(VB, dtype=np.float64)
-    FB = np.asarray(FB, dtype=np.int32)
+    args = mesh_arguments(A, B)
 
     if operation == "union":
-        return _booleans.boolean_union_with_edges(VA, FA, VB, FB)
+        return _booleans.boolean_union_with_edges(*args)
     if operation == "difference":
-        return _booleans.boolean_difference_with_edges(VA, FA, VB, FB)
+        return _booleans.boolean_difference_with_edges(*args)
     if operation == "intersection":
-        return _booleans.boolean_intersection_with_edges(VA, FA, VB, FB)
+        return _booleans.boolean_intersection_with_edges(*args)
     raise NotImplementedError(operation)
 
 
-def boolean_union_mesh_mesh_with_edges(A: VerticesFaces, B: VerticesFaces) -> VerticesFacesEdgesNumpy:
+def boolean_union_mesh_mesh_with_edges(A: MeshLike, B: MeshLike) -> VerticesFacesEdgesNumpy:
     """Boolean union returning (V, F, E) where E lists vertex-index pairs of intersection-curve edges.
 
     The edges are the corefinement intersection curve in the output mesh and can be
@@ -237,53 +328,33 @@ def boolean_union_mesh_mesh_with_edges(A: VerticesFaces, B: VerticesFaces) -> Ve
     return _boolean_with_edges(A, B, "union")
 
 
-def boolean_difference_mesh_mesh_with_edges(A: VerticesFaces, B: VerticesFaces) -> VerticesFacesEdgesNumpy:
+def boolean_difference_mesh_mesh_with_edges(A: MeshLike, B: MeshLike) -> VerticesFacesEdgesNumpy:
     """Boolean difference returning (V, F, E). See `boolean_union_mesh_mesh_with_edges`."""
     return _boolean_with_edges(A, B, "difference")
 
 
-def boolean_intersection_mesh_mesh_with_edges(A: VerticesFaces, B: VerticesFaces) -> VerticesFacesEdgesNumpy:
+def boolean_intersection_mesh_mesh_with_edges(A: MeshLike, B: MeshLike) -> VerticesFacesEdgesNumpy:
     """Boolean intersection returning (V, F, E). See `boolean_union_mesh_mesh_with_edges`."""
     return _boolean_with_edges(A, B, "intersection")
 
 
-def _concat_meshes(meshes: Iterable[VerticesFaces]) -> VerticesFacesNumpy:
-    Vs: list[np.ndarray] = []
-    Fs: list[np.ndarray] = []
-    offset = 0
-    for V, F in meshes:
-        V = np.asarray(V, dtype=np.float64)
-        F = np.asarray(F, dtype=np.int32)
-        Vs.append(V)
-        Fs.append(F + offset)
-        offset += V.shape[0]
-    if not Vs:
-        return np.zeros((0, 3), dtype=np.float64), np.zeros((0, 3), dtype=np.int32)
-    return np.vstack(Vs), np.vstack(Fs)
-
-
 def _boolean_with_face_source(
-    A: VerticesFaces,
-    B: VerticesFaces,
+    A: MeshLike,
+    B: MeshLike,
     operation: Literal["union", "difference", "intersection"],
 ) -> VerticesFacesSourceNumpy:
-    VA, FA = A
-    VB, FB = B
-    VA = np.asarray(VA, dtype=np.float64)
-    FA = np.asarray(FA, dtype=np.int32)
-    VB = np.asarray(VB, dtype=np.float64)
-    FB = np.asarray(FB, dtype=np.int32)
+    args = mesh_arguments(A, B)
 
     if operation == "union":
-        return _booleans.boolean_union_with_face_source(VA, FA, VB, FB)
+        return _booleans.boolean_union_with_face_source(*args)
     if operation == "difference":
-        return _booleans.boolean_difference_with_face_source(VA, FA, VB, FB)
+        return _booleans.boolean_difference_with_face_source(*args)
     if operation == "intersection":
-        return _booleans.boolean_intersection_with_face_source(VA, FA, VB, FB)
+        return _booleans.boolean_intersection_with_face_source(*args)
     raise NotImplementedError(operation)
 
 
-def boolean_union_mesh_mesh_with_face_source(A: VerticesFaces, B: VerticesFaces) -> VerticesFacesSourceNumpy:
+def boolean_union_mesh_mesh_with_face_source(A: MeshLike, B: MeshLike) -> VerticesFacesSourceNumpy:
     """Boolean union returning (V, F, S) where S[i] = [mesh_id, face_id] of the input face that produced output face i.
 
     `mesh_id` is 0 for A and 1 for B; `face_id` is the original face index into FA / FB.
@@ -293,23 +364,113 @@ def boolean_union_mesh_mesh_with_face_source(A: VerticesFaces, B: VerticesFaces)
     return _boolean_with_face_source(A, B, "union")
 
 
-def boolean_difference_mesh_mesh_with_face_source(A: VerticesFaces, B: VerticesFaces) -> VerticesFacesSourceNumpy:
+def boolean_difference_mesh_mesh_with_face_source(A: MeshLike, B: MeshLike) -> VerticesFacesSourceNumpy:
     """Boolean difference returning (V, F, S). See `boolean_union_mesh_mesh_with_face_source`."""
     return _boolean_with_face_source(A, B, "difference")
 
 
-def boolean_intersection_mesh_mesh_with_face_source(A: VerticesFaces, B: VerticesFaces) -> VerticesFacesSourceNumpy:
+def boolean_intersection_mesh_mesh_with_face_source(A: MeshLike, B: MeshLike) -> VerticesFacesSourceNumpy:
     """Boolean intersection returning (V, F, S). See `boolean_union_mesh_mesh_with_face_source`."""
     return _boolean_with_face_source(A, B, "intersection")
 
 
+def boolean_mesh_mesh(
+    A: MeshLike,
+    B: MeshLike,
+    operation: Literal["union", "difference", "intersection"],
+    return_edges: bool = True,
+    return_face_source: bool = True,
+    return_vertex_source: bool = True,
+) -> tuple:
+    """Boolean operation returning intersection edges, face sources, and vertex sources from one corefinement.
+
+    This combines :func:`boolean_union_mesh_mesh_with_edges` and :func:`boolean_union_mesh_mesh_with_face_source`
+    (and their difference and intersection variants), which would otherwise corefine the same operands twice.
+
+    Parameters
+    ----------
+    A
+        Mesh A, as vertices and faces or as a native :class:`compas_cgal.mesh.CgalMesh`.
+        A native mesh is copied, not modified.
+    B
+        Mesh B, as vertices and faces or as a native :class:`compas_cgal.mesh.CgalMesh`.
+        A native mesh is copied, not modified.
+    operation
+        The boolean operation. ``"difference"`` is ``A - B``.
+    return_edges
+        Return the intersection-curve edges as an ``(E, 2)`` array of vertex indices.
+    return_face_source
+        Return ``S`` with ``S[i] = [mesh_id, face_id]`` of the input face that produced output face ``i``.
+        ``mesh_id`` is 0 for A and 1 for B.
+    return_vertex_source
+        Return ``VS`` with ``VS[i] = [mesh_id, vertex_id]`` of the input vertex of output vertex ``i``,
+        or ``[-1, -1]`` for vertices created on the intersection curves.
+
+    Returns
+    -------
+    tuple
+        ``(V, F)`` followed by ``E``, ``S``, and ``VS``, in this order, for every array that was requested.
+
+    Raises
+    ------
+    ValueError
+        If the operation is not supported.
+
+    Examples
+    --------
+    >>> from compas.geometry import Box, Sphere
+    >>> from compas_cgal.booleans import boolean_mesh_mesh
+
+    >>> box = Box(1).to_vertices_and_faces(triangulated=True)
+    >>> sphere = Sphere(0.5, point=[0.5, 0.5, 0.5]).to_vertices_and_faces(u=32, v=32, triangulated=True)
+
+    >>> V, F, E, S, VS = boolean_mesh_mesh(box, sphere, "difference")
+
+    """
+    if operation not in ("union", "difference", "intersection"):
+        raise ValueError(f"unknown operation {operation!r}; must be one of ['difference', 'intersection', 'union']")
+
+    V, F, E, S, VS = _booleans.boolean_mesh_mesh(
+        *mesh_arguments(A, B),
+        _OP_CODES[operation],
+        return_edges,
+        return_face_source,
+        return_vertex_source,
+    )
+    result = [V, F]
+    if return_edges:
+        result.append(E)
+    if return_face_source:
+        result.append(S)
+    if return_vertex_source:
+        result.append(VS)
+    return tuple(result)
+
+
 _OP_CODES = {"union": 0, "difference": 1, "intersection": 2, "xor": 3}
 
 
+def _check_snap_every(snap_every: int) -> None:
+    if snap_every < 0:
+        raise ValueError("snap_every must be zero (no rounding) or positive")
+
+
+def _warn_failed_snaps(failed: int, snap_rollback: bool) -> None:
+    if failed == 0:
+        return
+    if snap_rollback:
+        message = f"{failed} rounding(s) of the intermediate result were undone because they made it self-intersect."
+    else:
+        message = f"{failed} rounding(s) made the intermediate result self-intersect; the result may be invalid."
+    warnings.warn(message, RuntimeWarning, stacklevel=3)
+
+
 def boolean_chain(
-    meshes: Iterable[VerticesFaces],
+    meshes: Iterable[MeshLike],
     operations: Iterable[Literal["union", "difference", "intersection", "xor"]],
     hybrid: bool = False,
+    snap_every: int = 0,
+    snap_rollback: bool = True,
 ) -> VerticesFacesNumpy:
     """Run a chain of boolean operations entirely in C++ without round-tripping intermediates.
 
@@ -320,11 +481,14 @@ def boolean_chain(
 
     Parameters
     ----------
-    meshes : iterable of (V, F)
+    meshes : iterable of (V, F) or :class:`compas_cgal.mesh.CgalMesh`
         Triangle meshes. Length must be ``len(operations) + 1``.
     operations : iterable of {"union", "difference", "intersection", "xor"}
         Per-step operation. ``"difference"`` is ``result - meshes[i+1]``.
-        ``"xor"`` is the symmetric difference.
+        ``"xor"`` is the symmetric difference, computed from a single corefinement as
+        ``result - meshes[i+1]`` and ``meshes[i+1] - result``, which only touch along their intersection curves.
+        Because the two parts touch, the result is not a valid operand for another step,
+        so ``"xor"`` can only be the last operation.
     hybrid : bool, default False
         If ``False``, runs the chain in CGAL's
         ``Exact_predicates_exact_constructions_kernel`` (EPECK). Constructions
@@ -338,23 +502,30 @@ def boolean_chain(
         Storage stays at native double precision while every intersection
         vertex is constructed exactly: same robustness as full EPECK without
         lazy-exact storage cost.
+    snap_every : int, default 0
+        If positive, round the intermediate result to double coordinates after every
+        ``snap_every`` steps. Exact points remember how they were constructed,
+        so without rounding the memory use and the cost of later steps grow with the length of the chain.
+        Rounding forgets that history, at the price of moving the new vertices
+        by at most half a unit in the last place.
+    snap_rollback : bool, default True
+        If True, undo a rounding that makes the intermediate result self-intersect,
+        and continue with the exact coordinates.
+        If False, keep the rounding anyway.
 
     Returns
     -------
     (V, F) : VerticesFacesNumpy
         The final mesh.
+
+    Warns
+    -----
+    RuntimeWarning
+        If a rounding made the intermediate result self-intersect,
+        whether it was undone or kept.
     """
-    Vs: list[np.ndarray] = []
-    Fs: list[np.ndarray] = []
-    v_counts: list[int] = []
-    f_counts: list[int] = []
-    for V, F in meshes:
-        V = np.asarray(V, dtype=np.float64)
-        F = np.asarray(F, dtype=np.int32)
-        Vs.append(V)
-        Fs.append(F)
-        v_counts.append(int(V.shape[0]))
-        f_counts.append(int(F.shape[0]))
+    _check_snap_every(snap_every)
+    V_flat, F_flat, v_counts, f_counts = flatten_meshes(meshes)
 
     op_codes: list[int] = []
     for op in operations:
@@ -362,24 +533,21 @@ def boolean_chain(
             raise ValueError(f"unknown operation {op!r}; must be one of {sorted(_OP_CODES)}")
         op_codes.append(_OP_CODES[op])
 
-    if len(op_codes) + 1 != len(Vs):
+    if len(op_codes) + 1 != len(v_counts):
         raise ValueError("len(operations) must equal len(meshes) - 1")
 
-    # Concatenate all meshes into single V and F arrays. Face indices stay
-    # mesh-local; the per-mesh row counts tell C++ where each mesh starts.
-    # This is the entire Python -> C++ marshalling for the chain.
-    V_flat = np.vstack(Vs) if Vs else np.zeros((0, 3), dtype=np.float64)
-    F_flat = np.vstack(Fs) if Fs else np.zeros((0, 3), dtype=np.int32)
-
-    if hybrid:
-        return _booleans.boolean_chain_hybrid(V_flat, F_flat, v_counts, f_counts, op_codes)
-    return _booleans.boolean_chain(V_flat, F_flat, v_counts, f_counts, op_codes)
+    chain = _booleans.boolean_chain_hybrid if hybrid else _booleans.boolean_chain
+    V, F, failed = chain(V_flat, F_flat, v_counts, f_counts, op_codes, snap_every, snap_rollback)
+    _warn_failed_snaps(failed, snap_rollback)
+    return V, F
 
 
 def boolean_chain_with_face_source(
-    meshes: Iterable[VerticesFaces],
-    operations: Iterable[Literal["union", "difference", "intersection"]],
+    meshes: Iterable[MeshLike],
+    operations: Iterable[Literal["union", "difference", "intersection", "xor"]],
     hybrid: bool = False,
+    snap_every: int = 0,
+    snap_rollback: bool = True,
 ) -> VerticesFacesSourceNumpy:
     """Boolean chain that also tracks, for every output face, which input mesh
     and which input face produced it. Returns ``(V, F, S)`` where ``S[i] =
@@ -390,84 +558,661 @@ def boolean_chain_with_face_source(
     tags through subface creations and face copies — the technique used in
     the Cockroach project for CGAL face-color tracking through booleans.
 
-    See :func:`boolean_chain` for the meaning of the ``hybrid`` flag.
+    See :func:`boolean_chain` for the meaning of ``hybrid``, ``snap_every``, and ``snap_rollback``.
 
-    ``"xor"`` is not supported here.
+    ``"xor"`` is computed from a single corefinement as well:
+    the faces of ``result - mesh`` and ``mesh - result`` keep the tags of the faces they were cut from.
+    As in :func:`boolean_chain`, it can only be the last operation.
     """
-    Vs: list[np.ndarray] = []
-    Fs: list[np.ndarray] = []
-    v_counts: list[int] = []
-    f_counts: list[int] = []
-    for V, F in meshes:
-        V = np.asarray(V, dtype=np.float64)
-        F = np.asarray(F, dtype=np.int32)
-        Vs.append(V)
-        Fs.append(F)
-        v_counts.append(int(V.shape[0]))
-        f_counts.append(int(F.shape[0]))
+    _check_snap_every(snap_every)
+    V_flat, F_flat, v_counts, f_counts = flatten_meshes(meshes)
 
     op_codes: list[int] = []
     for op in operations:
-        if op == "xor":
-            raise ValueError("xor is not supported by boolean_chain_with_face_source")
         if op not in _OP_CODES:
-            raise ValueError(f"unknown operation {op!r}; must be one of union/difference/intersection")
+            raise ValueError(f"unknown operation {op!r}; must be one of {sorted(_OP_CODES)}")
         op_codes.append(_OP_CODES[op])
 
-    if len(op_codes) + 1 != len(Vs):
+    if len(op_codes) + 1 != len(v_counts):
         raise ValueError("len(operations) must equal len(meshes) - 1")
 
-    V_flat = np.vstack(Vs) if Vs else np.zeros((0, 3), dtype=np.float64)
-    F_flat = np.vstack(Fs) if Fs else np.zeros((0, 3), dtype=np.int32)
+    chain = _booleans.boolean_chain_with_face_source_hybrid if hybrid else _booleans.boolean_chain_with_face_source
+    V, F, S, failed = chain(V_flat, F_flat, v_counts, f_counts, op_codes, snap_every, snap_rollback)
+    _warn_failed_snaps(failed, snap_rollback)
+    return V, F, S
+
+
+def boolean_union_many(
+    meshes: Iterable[MeshLike],
+    exact: bool = True,
+    num_threads: int = 0,
+) -> VerticesFacesNumpy:
+    """Union of many meshes, reduced in a balanced binary tree on native threads.
 
-    if hybrid:
-        return _booleans.boolean_chain_with_face_source_hybrid(V_flat, F_flat, v_counts, f_counts, op_codes)
-    return _booleans.boolean_chain_with_face_source(V_flat, F_flat, v_counts, f_counts, op_codes)
+    Folding the meshes left to right, as :func:`boolean_chain` does, costs ``N - 1`` sequential
+    corefinements on an ever-growing intermediate mesh.
+    Here, the meshes are first grouped by bounding-box overlap.
+    Every group is then unioned pairwise in a balanced binary tree,
+    with all pairs of a tree level computed concurrently,
+    and the groups, which do not overlap, are concatenated without any corefinement.
+
+    Parameters
+    ----------
+    meshes
+        Closed triangle meshes, as vertices and faces or as native :class:`compas_cgal.mesh.CgalMesh`.
+    exact
+        If ``True``, the unions are computed with CGAL's
+        ``Exact_predicates_exact_constructions_kernel``, as in :func:`boolean_chain`.
+        If ``False``, they use the hybrid EPICK mesh with an exact vertex point map,
+        as in :func:`boolean_chain` with ``hybrid=True``.
+    num_threads
+        Number of threads. ``0`` uses all available cores.
+
+    Returns
+    -------
+    VerticesFacesNumpy
+
+    Examples
+    --------
+    >>> from compas.geometry import Sphere
+    >>> from compas_cgal.booleans import boolean_union_many
+
+    >>> spheres = [Sphere(0.6, point=[x, 0, 0]).to_vertices_and_faces(u=16, v=16, triangulated=True) for x in range(10)]
+    >>> V, F = boolean_union_many(spheres)
+
+    """
+    V_flat, F_flat, v_counts, f_counts = flatten_meshes(meshes)
+    return _booleans.boolean_union_many(V_flat, F_flat, v_counts, f_counts, exact, num_threads)
+
+
+class SourceSplit(Mapping):
+    """Faces of a face-source-tagged mesh grouped by source, see :func:`split_by_source`.
+
+    The groups are stored once, in CSR layout: the data of group ``i`` is the slice
+    ``offsets[i]:offsets[i + 1]`` of the corresponding flat array.
+    Indexing the split with a source builds the submesh of that source on demand,
+    so only the submeshes that are actually used are materialized.
+
+    Attributes
+    ----------
+    sources : np.ndarray
+        The sources in ascending order.
+        The mesh ids ``(K,)``, or the ``(mesh_id, face_id)`` pairs ``(K, 2)`` if split by face.
+    face_offsets : np.ndarray
+        ``(K + 1,)`` offsets of the groups in ``face_indices`` and ``faces``.
+    face_indices : np.ndarray
+        The rows of the input faces, grouped by source.
+    faces : np.ndarray
+        The faces, grouped by source, with vertex indices local to their group.
+    vertex_offsets : np.ndarray
+        ``(K + 1,)`` offsets of the groups in ``vertex_indices``.
+    vertex_indices : np.ndarray
+        The rows of the input vertices used by each group, grouped by source and sorted within a group.
+
+    """
+
+    def __init__(
+        self,
+        V: np.ndarray,
+        sources: np.ndarray,
+        face_offsets: np.ndarray,
+        face_indices: np.ndarray,
+        faces: np.ndarray,
+        vertex_offsets: np.ndarray,
+        vertex_indices: np.ndarray,
+    ) -> None:
+        self._V = V
+        self.sources = sources
+        self.face_offsets = face_offsets
+        self.face_indices = face_indices
+        self.faces = faces
+        self.vertex_offsets = vertex_offsets
+        self.vertex_indices = vertex_indices
+        self._positions: Optional[dict] = None
+
+    def _keys(self) -> list:
+        if self.sources.ndim == 2:
+            return [tuple(source) for source in self.sources.tolist()]
+        return self.sources.tolist()
+
+    def group(self, i: int) -> VerticesFacesNumpy:
+        """The submesh of the ``i``-th group.
+
+        Parameters
+        ----------
+        i : int
+            Index of the group in :attr:`sources`.
+
+        Returns
+        -------
+        :attr:`compas_cgal.types.VerticesFacesNumpy`
+            The vertices used by the group, and a view of its reindexed faces.
+
+        """
+        vertices = self.vertex_indices[self.vertex_offsets[i] : self.vertex_offsets[i + 1]]
+        return self._V[vertices], self.faces[self.face_offsets[i] : self.face_offsets[i + 1]]
+
+    def __getitem__(self, source) -> VerticesFacesNumpy:
+        if self._positions is None:
+            self._positions = {key: i for i, key in enumerate(self._keys())}
+        return self.group(self._positions[source])
+
+    def __iter__(self):
+        return iter(self._keys())
+
+    def __len__(self) -> int:
+        return len(self.sources)
 
 
 def split_by_source(
     V: np.ndarray,
     F: np.ndarray,
     S: np.ndarray,
-) -> dict[int, tuple[np.ndarray, np.ndarray]]:
+    by_face: bool = False,
+) -> SourceSplit:
     """Split a face-source-tagged boolean result into one mesh per source.
 
     Given ``(V, F, S)`` from :func:`boolean_chain_with_face_source`, returns a
-    dict mapping each ``mesh_id`` present in ``S[:, 0]`` to its own
+    mapping from each ``mesh_id`` present in ``S[:, 0]`` to its own
     ``(V_sub, F_sub)`` pair. ``V_sub`` contains only the vertices referenced
     by that submesh's faces and ``F_sub`` is reindexed accordingly.
 
+    All groups are computed together from one sort of the face sources and one sort
+    of the face corners, so the cost does not depend on the number of sources.
+    The submeshes themselves are only built when they are accessed,
+    see :class:`SourceSplit` for the grouped arrays.
+
     Note: vertices on the boundary between two source regions are duplicated
     across the resulting submeshes (each submesh gets its own copy), so the
     submeshes are no longer connected at cut boundaries. The original ``(V,
     F, S)`` remains the canonical output — use this helper only when a
     per-source mesh layout is convenient (e.g. assigning a single colour or
     material to a viewer scene object).
+
+    Parameters
+    ----------
+    V : np.ndarray
+        The vertices.
+    F : np.ndarray
+        The faces.
+    S : np.ndarray
+        The ``(mesh_id, face_id)`` source of every face.
+    by_face : bool, optional
+        If True, group by ``(mesh_id, face_id)`` instead of by ``mesh_id``,
+        which gives one submesh per input face: the pieces an input face was cut into.
+        The keys of the mapping are then tuples.
+
+    Returns
+    -------
+    :class:`SourceSplit`
+        A mapping from source to ``(V_sub, F_sub)``.
+
     """
     V = np.asarray(V)
     F = np.asarray(F)
     S = np.asarray(S)
 
-    out: dict[int, tuple[np.ndarray, np.ndarray]] = {}
-    for mesh_id in np.unique(S[:, 0]):
-        face_mask = S[:, 0] == mesh_id
-        F_sub = F[face_mask]
-        used = np.unique(F_sub.reshape(-1))
-        remap = np.full(V.shape[0], -1, dtype=np.int64)
-        remap[used] = np.arange(used.shape[0])
-        out[int(mesh_id)] = (V[used], remap[F_sub].astype(F.dtype))
-    return out
+    if by_face:
+        sources, labels = np.unique(S[:, :2], axis=0, return_inverse=True)
+    else:
+        sources, labels = np.unique(S[:, 0], return_inverse=True)
+    labels = labels.reshape(-1)
+    counts = np.bincount(labels, minlength=len(sources))
+    face_offsets = np.concatenate(([0], np.cumsum(counts)))
+    face_indices = np.argsort(labels, kind="stable")
+
+    # Every face corner as one (group, vertex) code. Sorted, the unique codes
+    # are the vertices of the groups in group order, and the inverse is the
+    # position of each corner among them.
+    n = max(V.shape[0], 1)
+    corners = labels[:, None].astype(np.int64) * n + F
+    codes, inverse = np.unique(corners.reshape(-1), return_inverse=True)
+    vertex_counts = np.bincount(codes // n, minlength=len(sources))
+    vertex_offsets = np.concatenate(([0], np.cumsum(vertex_counts)))
+    vertex_indices = codes % n
 
+    local = inverse.reshape(F.shape) - vertex_offsets[labels][:, None]
+    faces = local[face_indices].astype(F.dtype)
 
-def boolean_difference_mesh_meshes(A: VerticesFaces, Bs: Iterable[VerticesFaces]) -> VerticesFacesNumpy:
+    return SourceSplit(V, sources, face_offsets, face_indices, faces, vertex_offsets, vertex_indices)
+
+
+def boolean_difference_mesh_meshes(A: MeshLike, Bs: Iterable[MeshLike], num_threads: int = 0) -> VerticesFacesNumpy:
     """Subtract many meshes from A in a single corefinement.
 
     Sequential `A = A - B_i` chains accumulate subdivision and round-off, which can
     crash CGAL's corefinement on long sequences (see CGAL issue #9282). Merging the
     cutters into one disjoint operand and doing a single difference avoids that.
 
-    The cutters in `Bs` should not overlap each other; if they do, merge them first
-    via `boolean_union_mesh_mesh` and pass the union as a single operand.
+    The cutters may overlap each other. Clusters of overlapping cutters are detected
+    with a bounding-box sweep followed by an exact volume intersection test,
+    and every cluster is unioned in a balanced tree, in parallel on native threads.
+    The clusters are then concatenated into one operand for the single difference.
+
+    Parameters
+    ----------
+    A
+        Mesh A, as vertices and faces or as a native :class:`compas_cgal.mesh.CgalMesh`.
+    Bs
+        The closed cutters.
+    num_threads
+        Number of threads for merging the cutters. ``0`` uses all available cores.
+
+    Returns
+    -------
+    VerticesFacesNumpy
+
+    """
+    V_flat, F_flat, v_counts, f_counts = flatten_meshes(Bs)
+    if not v_counts:
+        return vertices_and_faces(A)
+    V, F, _ = _booleans.boolean_difference_mesh_meshes(*mesh_arguments(A), V_flat, F_flat, v_counts, f_counts, num_threads)
+    return V, F
+
+
+def boolean_many(
+    A: MeshLike,
+    Bs: Iterable[MeshLike],
+    operation: Literal["union", "difference", "intersection", "xor"],
+    num_threads: int = 0,
+) -> tuple[list[Optional[VerticesFacesNumpy]], list[Optional[str]]]:
+    """Apply one boolean operation between A and each of many meshes.
+
+    Computes ``A OP B_i`` for every mesh in ``Bs`` in a single call.
+    A is converted to a CGAL mesh once and copied for every item,
+    and the items are processed in parallel on native threads, without holding the GIL.
+
+    A failing item does not abort the batch.
+    Its result is ``None`` and its error message is reported instead.
+
+    Parameters
+    ----------
+    A
+        Mesh A, as vertices and faces or as a native :class:`compas_cgal.mesh.CgalMesh`.
+    Bs
+        The meshes B_i.
+    operation
+        The boolean operation. ``"difference"`` is ``A - B_i``.
+    num_threads
+        Number of threads. ``0`` uses all available cores.
+
+    Returns
+    -------
+    tuple[list[VerticesFacesNumpy | None], list[str | None]]
+        The result of every item, and the error message of every item (``None`` on success).
+
+    Raises
+    ------
+    ValueError
+        If the operation is not supported.
+
+    Examples
+    --------
+    >>> from compas.geometry import Box, Sphere
+    >>> from compas_cgal.booleans import boolean_many
+
+    >>> box = Box(2).to_vertices_and_faces(triangulated=True)
+    >>> spheres = [Sphere(0.5, point=[x, 0, 1]).to_vertices_and_faces(u=16, v=16, triangulated=True) for x in (-1, 0, 1)]
+
+    >>> results, errors = boolean_many(box, spheres, "difference")
+
+    """
+    if operation not in _OP_CODES:
+        raise ValueError(f"unknown operation {operation!r}; must be one of {sorted(_OP_CODES)}")
+
+    V_flat, F_flat, v_counts, f_counts = flatten_meshes(Bs)
+    Vs, Fs, messages = _booleans.boolean_many(*mesh_arguments(A), V_flat, F_flat, v_counts, f_counts, _OP_CODES[operation], num_threads)
+
+    results: list[Optional[VerticesFacesNumpy]] = []
+    errors: list[Optional[str]] = []
+    for V, F, message in zip(Vs, Fs, messages):
+        results.append(None if message else (V, F))
+        errors.append(message or None)
+    return results, errors
+
+
+class BooleanSolver:
+    """Mesh prepared once for repeated booleans with other meshes.
+
+    Use this class when the same base mesh is combined with many other meshes,
+    for example a moving tool in an interactive design session.
+    The constructor converts A to a CGAL mesh, builds its AABB tree,
+    and computes the exact coordinates used by the corefinement.
+    Every operation then only converts B, uses the cached tree to skip the corefinement
+    if B does not touch A, and otherwise corefines a copy of the prepared mesh with B.
+
+    A solver is not modified by its operations and can be shared between threads.
+
+    Parameters
+    ----------
+    A : :attr:`compas_cgal.types.MeshLike`
+        The base mesh, as vertices and faces or as a native :class:`compas_cgal.mesh.CgalMesh`.
+
+    Examples
+    --------
+    >>> from compas.geometry import Box, Sphere
+    >>> from compas_cgal.booleans import BooleanSolver
+    >>> box = Box(2).to_vertices_and_faces(triangulated=True)
+    >>> solver = BooleanSolver(box)  # preparation happens here
+    >>> for x in (-1.0, 0.0, 1.0):
+    ...     tool = Sphere(0.5, point=[x, 0, 1]).to_vertices_and_faces(u=16, v=16, triangulated=True)
+    ...     V, F = solver.difference(tool)
+
+    """
+
+    def __init__(self, A: MeshLike) -> None:
+        self._solver = _booleans.BooleanSolver(*mesh_arguments(A))
+
+    def _compute(self, B: MeshLike, operation: str, return_path: bool):
+        V, F, path = self._solver.compute(*mesh_arguments(B), _OP_CODES[operation])
+        if return_path:
+            return V, F, path
+        return V, F
+
+    def union(self, B: MeshLike, return_path: bool = False) -> VerticesFacesNumpy:
+        """Boolean union of the base mesh and B.
+
+        Parameters
+        ----------
+        B
+            Mesh B, as vertices and faces or as a native :class:`compas_cgal.mesh.CgalMesh`.
+        return_path
+            If True, also return the path taken (see :func:`boolean_union_mesh_mesh`).
+
+        Returns
+        -------
+        VerticesFacesNumpy
+
+        """
+        return self._compute(B, "union", return_path)
+
+    def difference(self, B: MeshLike, return_path: bool = False) -> VerticesFacesNumpy:
+        """Boolean difference of the base mesh minus B.
+
+        Parameters
+        ----------
+        B
+            Mesh B, as vertices and faces or as a native :class:`compas_cgal.mesh.CgalMesh`.
+        return_path
+            If True, also return the path taken (see :func:`boolean_difference_mesh_mesh`).
+
+        Returns
+        -------
+        VerticesFacesNumpy
+
+        """
+        return self._compute(B, "difference", return_path)
+
+    def intersection(self, B: MeshLike, return_path: bool = False) -> VerticesFacesNumpy:
+        """Boolean intersection of the base mesh and B.
+
+        Parameters
+        ----------
+        B
+            Mesh B, as vertices and faces or as a native :class:`compas_cgal.mesh.CgalMesh`.
+        return_path
+            If True, also return the path taken (see :func:`boolean_intersection_mesh_mesh`).
+
+        Returns
+        -------
+        VerticesFacesNumpy
+
+        """
+        return self._compute(B, "intersection", return_path)
+
+    @property
+    def num_vertices(self) -> int:
+        """Number of vertices of the base mesh."""
+        return self._solver.num_vertices
+
+    @property
+    def num_faces(self) -> int:
+        """Number of faces of the base mesh."""
+        return self._solver.num_faces
+
+
+class BooleanAccumulator:
+    """Boolean chain that consumes its meshes one at a time.
+
+    The accumulator computes the same result as :func:`boolean_chain`,
+    but the meshes do not have to be collected first:
+    each call to :meth:`apply` converts one mesh and combines it with the intermediate result,
+    which stays in C++ in its exact (or hybrid) representation between calls.
+    This makes it possible to stream meshes from a generator,
+    without holding all of them in memory at the same time.
+
+    Parameters
+    ----------
+    mesh : :attr:`compas_cgal.types.MeshLike`
+        The first mesh of the chain.
+    hybrid : bool, optional
+        Keep the intermediate result in the hybrid representation instead of EPECK.
+        See :func:`boolean_chain`.
+    track_sources : bool, optional
+        Track the source of every face, as in :func:`boolean_chain_with_face_source`.
+        The first mesh has index 0, and every applied mesh gets the next index.
+    snap_every : int, optional
+        Round the intermediate result after every ``snap_every`` steps.
+        See :func:`boolean_chain`.
+    snap_rollback : bool, optional
+        Undo a rounding that makes the intermediate result self-intersect.
+        See :func:`boolean_chain`.
+        Roundings that made the result self-intersect are counted in :attr:`num_failed_snaps`,
+        and :meth:`apply` warns about them as :func:`boolean_chain` does.
+
+    Examples
+    --------
+    >>> from compas.geometry import Box, Sphere
+    >>> from compas_cgal.booleans import BooleanAccumulator
+    >>> box = Box(2).to_vertices_and_faces(triangulated=True)
+    >>> tools = (Sphere(0.5, point=[x, 0, 1]).to_vertices_and_faces(u=16, v=16, triangulated=True) for x in (-1.0, 0.0, 1.0))
+    >>> acc = BooleanAccumulator(box)
+    >>> for tool in tools:
+    ...     acc = acc.apply("difference", tool)
+    >>> V, F = acc.result()
+
+    """
+
+    def __init__(
+        self,
+        mesh: MeshLike,
+        hybrid: bool = False,
+        track_sources: bool = False,
+        snap_every: int = 0,
+        snap_rollback: bool = True,
+    ) -> None:
+        _check_snap_every(snap_every)
+        self._track_sources = track_sources
+        self._snap_rollback = snap_rollback
+        self._accumulator = _booleans.BooleanAccumulator(*mesh_arguments(mesh), hybrid, track_sources, snap_every, snap_rollback)
+
+    def apply(
+        self,
+        operation: Literal["union", "difference", "intersection", "xor"],
+        mesh: MeshLike,
+    ) -> "BooleanAccumulator":
+        """Replace the intermediate result R by ``R OP mesh``.
+
+        Parameters
+        ----------
+        operation : {"union", "difference", "intersection", "xor"}
+            The operation. ``"difference"`` is ``R - mesh``.
+            ``"xor"`` ends the chain, see :func:`boolean_chain`.
+        mesh : :attr:`compas_cgal.types.MeshLike`
+            The next mesh of the chain.
+
+        Returns
+        -------
+        :class:`BooleanAccumulator`
+            The accumulator itself.
+
+        Raises
+        ------
+        ValueError
+            If the operation is unknown, or if the previous operation was ``"xor"``.
+        RuntimeError
+            If CGAL could not compute both parts of ``"xor"``.
+
+        Warns
+        -----
+        RuntimeWarning
+            If the rounding after this step made the intermediate result self-intersect.
+
+        """
+        if operation not in _OP_CODES:
+            raise ValueError(f"unknown operation {operation!r}; must be one of {sorted(_OP_CODES)}")
+        failed = self._accumulator.num_failed_snaps
+        self._accumulator.apply(_OP_CODES[operation], *mesh_arguments(mesh))
+        _warn_failed_snaps(self._accumulator.num_failed_snaps - failed, self._snap_rollback)
+        return self
+
+    def result(self):
+        """Convert the intermediate result to vertices and faces.
+
+        The accumulator can still be used afterwards.
+
+        Returns
+        -------
+        :attr:`compas_cgal.types.VerticesFacesNumpy` | :attr:`compas_cgal.types.VerticesFacesSourceNumpy`
+            The vertices and faces, and the ``(mesh index, face index)`` source of every face
+            if ``track_sources`` is True.
+
+        """
+        V, F, S = self._accumulator.result()
+        if self._track_sources:
+            return V, F, S
+        return V, F
+
+    @property
+    def num_meshes(self) -> int:
+        """Number of meshes consumed so far, including the first one."""
+        return self._accumulator.num_meshes
+
+    @property
+    def num_failed_snaps(self) -> int:
+        """Number of roundings so far that made the intermediate result self-intersect."""
+        return self._accumulator.num_failed_snaps
+
+
+def _boxes_array(boxes) -> np.ndarray:
+    """Axis-aligned boxes as a C-contiguous (N, 6) array of min and max corners."""
+    return np.ascontiguousarray(np.asarray(boxes, dtype=np.float64).reshape(-1, 6))
+
+
+def clip_mesh_mesh(A: MeshLike, B: MeshLike) -> VerticesFacesNumpy:
+    """Clip a mesh with the volume bounded by another mesh.
+
+    Parameters
+    ----------
+    A
+        The mesh to clip, as vertices and faces or as a native :class:`compas_cgal.mesh.CgalMesh`.
+    B
+        The clipping mesh. It must be closed.
+
+    Returns
+    -------
+    VerticesFacesNumpy
+        The part of A inside B.
+
+    """
+    return _booleans.clip(*mesh_arguments(A, B))
+
+
+def clip_mesh_plane(mesh: MeshLike, plane: Plane, close: bool = False) -> VerticesFacesNumpy:
+    """Clip a mesh with a plane.
+
+    This is much cheaper than intersecting the mesh with a large box mesh,
+    because the mesh is only split along the plane.
+
+    Parameters
+    ----------
+    mesh
+        The mesh, as vertices and faces or as a native :class:`compas_cgal.mesh.CgalMesh`.
+    plane
+        The clipping plane, or a pair of a point and a normal.
+    close
+        If True, close the cut with a cap. The mesh must be closed.
+
+    Returns
+    -------
+    VerticesFacesNumpy
+        The part of the mesh behind the plane, i.e. on the side opposite to its normal.
+
+    Examples
+    --------
+    >>> from compas.geometry import Plane, Sphere
+    >>> from compas_cgal.booleans import clip_mesh_plane
+
+    >>> sphere = Sphere(1.0).to_vertices_and_faces(u=32, v=32, triangulated=True)
+    >>> V, F = clip_mesh_plane(sphere, Plane([0, 0, 0.5], [0, 0, 1]), close=True)
+
+    """
+    point, normal = plane
+    return _booleans.clip_plane(*mesh_arguments(mesh), [float(x) for x in point], [float(x) for x in normal], close)
+
+
+def clip_mesh_box(mesh: MeshLike, box, close: bool = False) -> VerticesFacesNumpy:
+    """Clip a mesh with an axis-aligned box.
+
+    Parameters
+    ----------
+    mesh
+        The mesh, as vertices and faces or as a native :class:`compas_cgal.mesh.CgalMesh`.
+    box
+        The box, as its min and max corners ``[[xmin, ymin, zmin], [xmax, ymax, zmax]]``.
+    close
+        If True, close the cuts with caps. The mesh must be closed.
+        Otherwise only the faces overlapping the box are copied before clipping.
+
+    Returns
+    -------
+    VerticesFacesNumpy
+        The part of the mesh inside the box.
+
+    Examples
+    --------
+    >>> from compas.geometry import Sphere
+    >>> from compas_cgal.booleans import clip_mesh_box
+
+    >>> sphere = Sphere(1.0).to_vertices_and_faces(u=32, v=32, triangulated=True)
+    >>> V, F = clip_mesh_box(sphere, [[0, 0, 0], [1, 1, 1]])
+
+    """
+    return _booleans.clip_box(*mesh_arguments(mesh), _boxes_array(box)[0].tolist(), close)
+
+
+def clip_mesh_boxes(mesh: MeshLike, boxes, close: bool = False, num_threads: int = 0) -> list[VerticesFacesNumpy]:
+    """Clip one mesh with many axis-aligned boxes, for example to cut it into tiles.
+
+    The mesh is converted once and the boxes are processed in parallel on native threads,
+    without holding the GIL.
+
+    Parameters
+    ----------
+    mesh
+        The mesh, as vertices and faces or as a native :class:`compas_cgal.mesh.CgalMesh`.
+    boxes
+        The boxes, as an array of shape ``(N, 2, 3)`` of min and max corners,
+        or of shape ``(N, 6)`` with ``xmin, ymin, zmin, xmax, ymax, zmax`` per row.
+    close
+        If True, close the cuts with caps. The mesh must be closed.
+    num_threads
+        Number of threads. ``0`` uses all available cores.
+
+    Returns
+    -------
+    list[VerticesFacesNumpy]
+        The part of the mesh inside every box.
+
+    Examples
+    --------
+    >>> from compas.geometry import Sphere
+    >>> from compas_cgal.booleans import clip_mesh_boxes
+
+    >>> sphere = Sphere(1.0).to_vertices_and_faces(u=32, v=32, triangulated=True)
+    >>> boxes = [[[x, -1, -1], [x + 0.5, 1, 1]] for x in (-1.0, -0.5, 0.0, 0.5)]
+    >>> tiles = clip_mesh_boxes(sphere, boxes)
+
     """
-    B = _concat_meshes(Bs)
-    return _boolean(A, B, "difference")
+    Vs, Fs = _booleans.clip_boxes(*mesh_arguments(mesh), _boxes_array(boxes), close, num_threads)
+    return list(zip(Vs, Fs))
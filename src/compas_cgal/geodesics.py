@@ -2,7 +2,6 @@
 
 from typing import List
 
-import numpy as np
 from numpy.typing import NDArray
 
 from compas_cgal import _types_std  # noqa: F401  # Load vector type bindings
@@ -10,14 +9,15 @@ from compas_cgal._geodesics import geodesic_isolines as _geodesic_isolines
 from compas_cgal._geodesics import geodesic_isolines_split as _geodesic_isolines_split
 from compas_cgal._geodesics import heat_geodesic_distances as _heat_geodesic_distances
 from compas_cgal._geodesics import HeatGeodesicSolver as _HeatGeodesicSolver
+from compas_cgal.mesh import mesh_arguments
+from compas_cgal.types import MeshLike
 from compas_cgal.types import PolylinesNumpy
-from compas_cgal.types import VerticesFaces
 from compas_cgal.types import VerticesFacesNumpy
 
 __all__ = ["heat_geodesic_distances", "HeatGeodesicSolver", "geodesic_isolines_split", "geodesic_isolines"]
 
 
-def heat_geodesic_distances(mesh: VerticesFaces, sources: List[int]) -> NDArray:
+def heat_geodesic_distances(mesh: MeshLike, sources: List[int]) -> NDArray:
     """Compute geodesic distances from source vertices using CGAL heat method.
 
     Uses CGAL's Heat_method_3 with intrinsic Delaunay triangulation for
@@ -25,8 +25,8 @@ def heat_geodesic_distances(mesh: VerticesFaces, sources: List[int]) -> NDArray:
 
     Parameters
     ----------
-    mesh : :attr:`compas_cgal.types.VerticesFaces`
-        A triangulated mesh as a tuple of vertices and faces.
+    mesh : :attr:`compas_cgal.types.MeshLike`
+        A triangulated mesh as a tuple of vertices and faces, or a native :class:`compas_cgal.mesh.CgalMesh`.
     sources : List[int]
         Source vertex indices.
 
@@ -45,11 +45,7 @@ def heat_geodesic_distances(mesh: VerticesFaces, sources: List[int]) -> NDArray:
     >>> distances = heat_geodesic_distances(mesh, [0])  # distances from vertex 0
 
     """
-    V, F = mesh
-    V = np.asarray(V, dtype=np.float64, order="C")
-    F = np.asarray(F, dtype=np.int32, order="C")
-
-    result = _heat_geodesic_distances(V, F, sources)
+    result = _heat_geodesic_distances(*mesh_arguments(mesh), sources)
     return result.flatten()
 
 
@@ -61,10 +57,13 @@ class HeatGeodesicSolver:
     is done once in the constructor, and solve() can be called many
     times efficiently.
 
+    A solver can be shared between threads.
+    Concurrent calls to solve() are serialized, because the heat method stores its sources internally.
+
     Parameters
     ----------
-    mesh : :attr:`compas_cgal.types.VerticesFaces`
-        A triangulated mesh as a tuple of vertices and faces.
+    mesh : :attr:`compas_cgal.types.MeshLike`
+        A triangulated mesh as a tuple of vertices and faces, or a native :class:`compas_cgal.mesh.CgalMesh`.
 
     Examples
     --------
@@ -78,11 +77,8 @@ class HeatGeodesicSolver:
 
     """
 
-    def __init__(self, mesh: VerticesFaces) -> None:
-        V, F = mesh
-        V = np.asarray(V, dtype=np.float64, order="C")
-        F = np.asarray(F, dtype=np.int32, order="C")
-        self._solver = _HeatGeodesicSolver(V, F)
+    def __init__(self, mesh: MeshLike) -> None:
+        self._solver = _HeatGeodesicSolver(*mesh_arguments(mesh))
 
     def solve(self, sources: List[int]) -> NDArray:
         """Compute geodesic distances from source vertices.
@@ -109,7 +105,7 @@ class HeatGeodesicSolver:
 
 
 def geodesic_isolines_split(
-    mesh: VerticesFaces,
+    mesh: MeshLike,
     sources: List[int],
     isovalues: List[float],
 ) -> List[VerticesFacesNumpy]:
@@ -120,8 +116,8 @@ def geodesic_isolines_split(
 
     Parameters
     ----------
-    mesh : :attr:`compas_cgal.types.VerticesFaces`
-        A triangulated mesh as a tuple of vertices and faces.
+    mesh : :attr:`compas_cgal.types.MeshLike`
+        A triangulated mesh as a tuple of vertices and faces, or a native :class:`compas_cgal.mesh.CgalMesh`.
     sources : List[int]
         Source vertex indices for geodesic distance computation.
     isovalues : List[float]
@@ -144,16 +140,12 @@ def geodesic_isolines_split(
     >>> len(components)  # Number of mesh strips
 
     """
-    V, F = mesh
-    V = np.asarray(V, dtype=np.float64, order="C")
-    F = np.asarray(F, dtype=np.int32, order="C")
-
-    vertices_list, faces_list = _geodesic_isolines_split(V, F, sources, isovalues)
+    vertices_list, faces_list = _geodesic_isolines_split(*mesh_arguments(mesh), sources, isovalues)
     return list(zip(vertices_list, faces_list))
 
 
 def geodesic_isolines(
-    mesh: VerticesFaces,
+    mesh: MeshLike,
     sources: List[int],
     isovalues: List[float],
 ) -> PolylinesNumpy:
@@ -163,8 +155,8 @@ def geodesic_isolines(
 
     Parameters
     ----------
-    mesh : :attr:`compas_cgal.types.VerticesFaces`
-        A triangulated mesh as a tuple of vertices and faces.
+    mesh : :attr:`compas_cgal.types.MeshLike`
+        A triangulated mesh as a tuple of vertices and faces, or a native :class:`compas_cgal.mesh.CgalMesh`.
     sources : List[int]
         Source vertex indices for geodesic distance computation.
     isovalues : List[float]
@@ -176,8 +168,4 @@ def geodesic_isolines(
         List of polyline segments as Nx3 arrays of points.
 
     """
-    V, F = mesh
-    V = np.asarray(V, dtype=np.float64, order="C")
-    F = np.asarray(F, dtype=np.int32, order="C")
-
-    return list(_geodesic_isolines(V, F, sources, isovalues))
+    return list(_geodesic_isolines(*mesh_arguments(mesh), sources, isovalues))
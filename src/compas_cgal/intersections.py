@@ -1,26 +1,29 @@
-import numpy as np
+from typing import Iterable
+
 from compas.plugins import plugin
 
 from compas_cgal import _intersections  # type: ignore
 from compas_cgal import _types_std  # type: ignore
 
+from .mesh import flatten_meshes
+from .mesh import mesh_arguments
+from .types import MeshLike
 from .types import PolylinesNumpy
-from .types import VerticesFaces
 
 
 @plugin(category="intersections")
 def intersection_mesh_mesh(
-    A: VerticesFaces,
-    B: VerticesFaces,
+    A: MeshLike,
+    B: MeshLike,
 ) -> PolylinesNumpy:
     """Compute the intersection of tow meshes.
 
     Parameters
     ----------
     A
-        Mesh A.
+        Mesh A, as vertices and faces or as a native :class:`compas_cgal.mesh.CgalMesh`.
     B
-        Mesh B.
+        Mesh B, as vertices and faces or as a native :class:`compas_cgal.mesh.CgalMesh`.
 
     Returns
     -------
@@ -42,13 +45,99 @@ def intersection_mesh_mesh(
     >>> polylines = [Polyline(points) for points in result]
 
     """
-    VA, FA = A
-    VB, FB = B
-    VA = np.asarray(VA, dtype=np.float64, order="C")
-    FA = np.asarray(FA, dtype=np.int32, order="C")
-    VB = np.asarray(VB, dtype=np.float64, order="C")
-    FB = np.asarray(FB, dtype=np.int32, order="C")
-
-    pointsets: _types_std.VectorRowMatrixXd = _intersections.intersection_mesh_mesh(VA, FA, VB, FB)
+    pointsets: _types_std.VectorRowMatrixXd = _intersections.intersection_mesh_mesh(*mesh_arguments(A, B))
 
     return pointsets
+
+
+def collision_matrix(
+    meshes: Iterable[MeshLike],
+    solid: bool = False,
+    return_polylines: bool = False,
+    num_threads: int = 0,
+):
+    """Find the pairs of colliding meshes among many meshes.
+
+    All meshes are sent to C++ in a single call.
+    Candidate pairs are found with a box intersection search over the bounding boxes of the meshes,
+    so that only meshes with overlapping bounding boxes are tested.
+    The candidates are then tested in parallel against AABB trees that are built once per mesh.
+
+    Parameters
+    ----------
+    meshes
+        The meshes, as vertices and faces or as native :class:`compas_cgal.mesh.CgalMesh`.
+    solid
+        If True, two closed meshes also collide if one is completely inside the other.
+        Otherwise only meshes whose surfaces intersect or touch collide.
+    return_polylines
+        If True, also compute the intersection polylines of every colliding pair.
+    num_threads
+        Number of threads. ``0`` uses the hardware concurrency.
+
+    Returns
+    -------
+    IntNx2 | tuple[IntNx2, list[PolylinesNumpy]]
+        The indices ``(i, j)`` with ``i < j`` of the colliding meshes, sorted.
+        If ``return_polylines`` is True, also the intersection polylines of every pair.
+
+    Examples
+    --------
+    >>> from compas.geometry import Box
+    >>> from compas_cgal.intersections import collision_matrix
+    >>> boxes = [Box(1).translated([0.8 * i, 0, 0]).to_vertices_and_faces(triangulated=True) for i in range(4)]
+    >>> collision_matrix(boxes).tolist()
+    [[0, 1], [1, 2], [2, 3]]
+
+    """
+    V, F, v_counts, f_counts = flatten_meshes(meshes)
+    pairs, polylines = _intersections.collision_matrix(V, F, v_counts, f_counts, solid, return_polylines, num_threads)
+    if return_polylines:
+        return pairs, [list(lines) for lines in polylines]
+    return pairs
+
+
+def intersection_mesh_meshes(
+    A: MeshLike,
+    Bs: Iterable[MeshLike],
+    num_threads: int = 0,
+):
+    """Intersect one mesh with many meshes.
+
+    The AABB tree of ``A`` is built once and shared by all meshes ``B_i``,
+    which are sent to C++ in a single call and intersected with ``A`` in parallel.
+    Every segment of the resulting polylines is tagged with the face of ``A``
+    and the face of ``B_i`` that it lies on.
+    Coplanar overlaps of faces are not reported.
+
+    Parameters
+    ----------
+    A
+        Mesh A, as vertices and faces or as a native :class:`compas_cgal.mesh.CgalMesh`.
+    Bs
+        The meshes B_i, as vertices and faces or as native :class:`compas_cgal.mesh.CgalMesh`.
+    num_threads
+        Number of threads. ``0`` uses the hardware concurrency.
+
+    Returns
+    -------
+    tuple[list[PolylinesNumpy], list[list[IntNx2]]]
+        Per mesh B_i, the intersection polylines with ``A``, each an array of ``R`` points,
+        and per polyline an ``(R - 1, 2)`` array with the face of ``A`` and the face of ``B_i``
+        of every segment.
+        Closed polylines repeat their first point at the end.
+
+    Examples
+    --------
+    >>> from compas.geometry import Box, Sphere
+    >>> from compas_cgal.intersections import intersection_mesh_meshes
+    >>> A = Box(2).to_vertices_and_faces(triangulated=True)
+    >>> Bs = [Sphere(0.5, point=[x, 0, 0]).to_vertices_and_faces(u=16, v=16, triangulated=True) for x in (0, 1, 3)]
+    >>> polylines, faces = intersection_mesh_meshes(A, Bs)
+    >>> [len(lines) for lines in polylines]
+    [0, 1, 0]
+
+    """
+    V, F, v_counts, f_counts = flatten_meshes(Bs)
+    polylines, faces = _intersections.intersection_mesh_meshes(*mesh_arguments(A), V, F, v_counts, f_counts, num_threads)
+    return [list(lines) for lines in polylines], [list(tags) for tags in faces]
@@ -1,19 +1,19 @@
-import numpy as np
 from compas.plugins import plugin
 
 from compas_cgal import _measure  # type: ignore
 from compas_cgal import _types_std  # type: ignore
 
-from .types import VerticesFaces
+from .mesh import mesh_arguments
+from .types import MeshLike
 
 
-def mesh_area(mesh: VerticesFaces) -> float:
+def mesh_area(mesh: MeshLike) -> float:
     """Compute the area of a triangle mesh.
 
     Parameters
     ----------
     mesh
-        The mesh.
+        The mesh, as vertices and faces or as a native :class:`compas_cgal.mesh.CgalMesh`.
 
     Returns
     -------
@@ -21,20 +21,17 @@ def mesh_area(mesh: VerticesFaces) -> float:
         The area of the mesh.
 
     """
-    V, F = mesh
-    V = np.asarray(V, dtype=np.float64, order="C")
-    F = np.asarray(F, dtype=np.int32, order="C")
-    return _measure.area(V, F)
+    return _measure.area(*mesh_arguments(mesh))
 
 
 @plugin(category="trimesh", pluggable_name="trimesh_volume")
-def mesh_volume(mesh: VerticesFaces) -> float:
+def mesh_volume(mesh: MeshLike) -> float:
     """Compute the volume of a closed triangle mesh.
 
     Parameters
     ----------
     mesh
-        The mesh.
+        The mesh, as vertices and faces or as a native :class:`compas_cgal.mesh.CgalMesh`.
 
     Returns
     -------
@@ -53,19 +50,16 @@ def mesh_volume(mesh: VerticesFaces) -> float:
     1.0
 
     """
-    V, F = mesh
-    V = np.asarray(V, dtype=np.float64, order="C")
-    F = np.asarray(F, dtype=np.int32, order="C")
-    return _measure.volume(V, F)
+    return _measure.volume(*mesh_arguments(mesh))
 
 
-def mesh_centroid(mesh: VerticesFaces) -> list[float]:
+def mesh_centroid(mesh: MeshLike) -> list[float]:
     """Compute the centroid of a the volume of a closed triangle mesh.
 
     Parameters
     ----------
     mesh
-        The mesh.
+        The mesh, as vertices and faces or as a native :class:`compas_cgal.mesh.CgalMesh`.
 
     Returns
     -------
@@ -73,8 +67,5 @@ def mesh_centroid(mesh: VerticesFaces) -> list[float]:
         The centroid of the mesh.
 
     """
-    V, F = mesh
-    V = np.asarray(V, dtype=np.float64, order="C")
-    F = np.asarray(F, dtype=np.int32, order="C")
-    vector_of_double: _types_std.VectorDouble = _measure.centroid(V, F)
+    vector_of_double: _types_std.VectorDouble = _measure.centroid(*mesh_arguments(mesh))
     return list(vector_of_double)
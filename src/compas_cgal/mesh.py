@@ -0,0 +1,167 @@
+"""Persistent native triangle meshes."""
+
+from typing import Iterable
+from typing import List
+from typing import Tuple
+
+import numpy as np
+
+from compas_cgal import _mesh  # type: ignore
+from compas_cgal.types import MeshLike
+from compas_cgal.types import VerticesFaces
+from compas_cgal.types import VerticesFacesNumpy
+
+__all__ = ["CgalMesh"]
+
+
+class CgalMesh:
+    """Triangle mesh converted once to a CGAL ``Surface_mesh`` and kept in C++.
+
+    Every function of this package that accepts a mesh as a tuple of vertices and faces
+    also accepts a :class:`CgalMesh`. Passing the native mesh skips the conversion
+    of the NumPy arrays to a ``Surface_mesh`` on every call,
+    which dominates the run time of cheap queries on large meshes.
+
+    Functions that modify their input internally (booleans, remeshing, subdivision, ...)
+    work on a copy, so a :class:`CgalMesh` is never changed by the functions it is passed to.
+
+    Parameters
+    ----------
+    mesh : :attr:`compas_cgal.types.VerticesFaces`
+        A triangulated mesh as a tuple of vertices and faces.
+
+    Examples
+    --------
+    >>> from compas.geometry import Box
+    >>> from compas_cgal.measure import mesh_area, mesh_volume
+    >>> from compas_cgal.mesh import CgalMesh
+    >>> box = Box(1)
+    >>> mesh = CgalMesh(box.to_vertices_and_faces(triangulated=True))  # conversion happens here
+    >>> mesh_area(mesh)
+    6.0
+    >>> mesh_volume(mesh)
+    1.0
+
+    """
+
+    def __init__(self, mesh: VerticesFaces) -> None:
+        V, F = mesh
+        V = np.asarray(V, dtype=np.float64, order="C")
+        F = np.asarray(F, dtype=np.int32, order="C")
+        self._mesh = _mesh.CgalMesh(V, F)
+
+    @classmethod
+    def from_mesh(cls, mesh) -> "CgalMesh":
+        """Construct a native mesh from a COMPAS mesh.
+
+        Parameters
+        ----------
+        mesh : :class:`compas.datastructures.Mesh`
+            The mesh. Faces are triangulated if necessary.
+
+        Returns
+        -------
+        :class:`CgalMesh`
+
+        """
+        return cls(mesh.to_vertices_and_faces(triangulated=True))
+
+    def to_vertices_and_faces(self) -> VerticesFacesNumpy:
+        """Convert the native mesh back to vertices and faces.
+
+        Returns
+        -------
+        :attr:`compas_cgal.types.VerticesFacesNumpy`
+
+        """
+        return self._mesh.to_vertices_and_faces()
+
+    @property
+    def number_of_vertices(self) -> int:
+        """Number of vertices of the mesh."""
+        return self._mesh.number_of_vertices
+
+    @property
+    def number_of_faces(self) -> int:
+        """Number of faces of the mesh."""
+        return self._mesh.number_of_faces
+
+
+def mesh_arguments(*meshes: MeshLike) -> Tuple:
+    """Convert meshes to the positional arguments of the native bindings.
+
+    If any of the meshes is a :class:`CgalMesh`, all meshes are passed as native meshes,
+    which selects the native overload of the binding.
+    Otherwise, every mesh is passed as a pair of C-contiguous vertex and face arrays.
+
+    Parameters
+    ----------
+    *meshes : :attr:`compas_cgal.types.MeshLike`
+        The meshes.
+
+    Returns
+    -------
+    tuple
+
+    """
+    if any(isinstance(mesh, CgalMesh) for mesh in meshes):
+        return tuple((mesh if isinstance(mesh, CgalMesh) else CgalMesh(mesh))._mesh for mesh in meshes)
+
+    arguments = []
+    for V, F in meshes:
+        arguments.append(np.asarray(V, dtype=np.float64, order="C"))
+        arguments.append(np.asarray(F, dtype=np.int32, order="C"))
+    return tuple(arguments)
+
+
+def vertices_and_faces(mesh: MeshLike) -> VerticesFacesNumpy:
+    """Return the vertex and face arrays of a mesh.
+
+    Parameters
+    ----------
+    mesh : :attr:`compas_cgal.types.MeshLike`
+        The mesh.
+
+    Returns
+    -------
+    :attr:`compas_cgal.types.VerticesFacesNumpy`
+
+    """
+    if isinstance(mesh, CgalMesh):
+        return mesh.to_vertices_and_faces()
+    V, F = mesh
+    return np.asarray(V, dtype=np.float64, order="C"), np.asarray(F, dtype=np.int32, order="C")
+
+
+def flatten_meshes(meshes: Iterable[MeshLike]) -> Tuple[np.ndarray, np.ndarray, List[int], List[int]]:
+    """Concatenate meshes into the flat arrays of the native bindings that take many meshes.
+
+    Face indices stay local to their mesh;
+    the numbers of vertices and faces per mesh tell the bindings where each mesh starts.
+    This is the entire marshalling of a collection of meshes, in a single call.
+
+    Parameters
+    ----------
+    meshes : iterable of :attr:`compas_cgal.types.MeshLike`
+        The meshes.
+
+    Returns
+    -------
+    tuple[np.ndarray, np.ndarray, list[int], list[int]]
+        The stacked vertices and faces, and the numbers of vertices and faces of every mesh.
+
+    """
+    Vs: List[np.ndarray] = []
+    Fs: List[np.ndarray] = []
+    v_counts: List[int] = []
+    f_counts: List[int] = []
+    for mesh in meshes:
+        V, F = vertices_and_faces(mesh)
+        Vs.append(V)
+        Fs.append(F)
+        v_counts.append(int(V.shape[0]))
+        f_counts.append(int(F.shape[0]))
+
+    V_flat = np.vstack(Vs) if Vs else np.zeros((0, 3), dtype=np.float64)
+    F_flat = np.vstack(Fs) if Fs else np.zeros((0, 3), dtype=np.int32)
+    return V_flat, F_flat, v_counts, f_counts
@@ -4,13 +4,14 @@ from compas.plugins import plugin
 from compas_cgal import _meshing  # type: ignore
 from compas_cgal import _types_std  # noqa: F401  # type: ignore
 
-from .types import VerticesFaces
+from .mesh import mesh_arguments
+from .types import MeshLike
 from .types import VerticesFacesNumpy
 
 
 @plugin(category="trimesh", pluggable_name="trimesh_remesh")
 def trimesh_remesh(
-    mesh: VerticesFaces,
+    mesh: MeshLike,
     target_edge_length: float,
     number_of_iterations: int = 10,
     do_project: bool = True,
@@ -49,14 +50,11 @@ def trimesh_remesh(
     >>> shape = Polyhedron(V.tolist(), F.tolist())
 
     """
-    V, F = mesh
-    V = np.asarray(V, dtype=np.float64, order="C")
-    F = np.asarray(F, dtype=np.int32, order="C")
-    return _meshing.pmp_trimesh_remesh(V, F, target_edge_length, number_of_iterations, do_project)
+    return _meshing.pmp_trimesh_remesh(*mesh_arguments(mesh), target_edge_length, number_of_iterations, do_project)
 
 
 def trimesh_dual(
-    mesh: VerticesFaces,
+    mesh: MeshLike,
     length_factor: float = 1.0,
     number_of_iterations: int = 10,
     angle_radians: float = 0.9,
@@ -98,8 +96,5 @@ def trimesh_dual(
     3. Creating proper connections for boundary edges
 
     """
-    V, F = mesh
-    V = np.asarray(V, dtype=np.float64, order="C")
-    F = np.asarray(F, dtype=np.int32, order="C")
     fixed_vertices = np.asarray(fixed_vertices, dtype=np.int32, order="C")  # type: ignore
-    return _meshing.pmp_trimesh_remesh_dual(V, F, fixed_vertices, length_factor, number_of_iterations, angle_radians, scale_factor)
+    return _meshing.pmp_trimesh_remesh_dual(*mesh_arguments(mesh), fixed_vertices, length_factor, number_of_iterations, angle_radians, scale_factor)
@@ -1,12 +1,259 @@
+from typing import Tuple
+from typing import Union
+
 import numpy as np
 from compas.datastructures import Mesh
+from numpy.typing import NDArray
 
 from compas_cgal import _meshing  # type: ignore
 from compas_cgal import _types_std  # noqa: F401  # type: ignore
 
+from .mesh import CgalMesh
+from .mesh import mesh_arguments
+from .types import MeshLike
 from .types import VerticesFaces
 
 
+class ClosestPointQuery:
+    """Closest point queries with a persistent AABB tree over the faces of a triangle mesh.
+
+    The tree and its search structure for distance queries are built once in the constructor,
+    so that repeated projections onto the same mesh, for example in an optimization loop,
+    only pay for the queries themselves.
+    The points of a query are processed in parallel on native threads, without the GIL.
+    A query object can be shared between threads.
+
+    Parameters
+    ----------
+    mesh : :attr:`compas_cgal.types.MeshLike`
+        A triangulated mesh as a tuple of vertices and faces, or a native :class:`compas_cgal.mesh.CgalMesh`.
+
+    Examples
+    --------
+    >>> from compas.geometry import Box
+    >>> from compas_cgal.projection import ClosestPointQuery
+    >>> box = Box(2)
+    >>> query = ClosestPointQuery(box.to_vertices_and_faces(triangulated=True))  # the tree is built here
+    >>> points, faces, barycentrics, distances = query.query([[0, 0, 3], [0, 0, 0.5]], signed=True)
+    >>> distances.tolist()
+    [2.0, -0.5]
+
+    """
+
+    def __init__(self, mesh: MeshLike) -> None:
+        self._query = _meshing.ClosestPointQuery(*mesh_arguments(mesh))
+
+    def query(
+        self,
+        points,
+        signed: bool = False,
+        num_threads: int = 0,
+    ) -> Tuple[NDArray, NDArray, NDArray, NDArray]:
+        """Find the closest points on the mesh.
+
+        Parameters
+        ----------
+        points : array_like
+            The query points, as an array of shape (N, 3).
+        signed : bool, optional
+            If True, distances of points inside the mesh are negative.
+            Only closed meshes have an inside.
+        num_threads : int, optional
+            Number of threads. ``0`` uses the hardware concurrency.
+
+        Returns
+        -------
+        tuple[NDArray, NDArray, NDArray, NDArray]
+            The closest points of shape (N, 3), the faces they lie on of shape (N,),
+            their barycentric coordinates with respect to the vertices of these faces of shape (N, 3),
+            in the order of the vertices of the faces in the input,
+            and the distances of the query points to the mesh of shape (N,).
+
+        Raises
+        ------
+        ValueError
+            If ``signed`` is True and the mesh is not closed, or if the mesh has no faces.
+
+        """
+        points = np.asarray(points, dtype=np.float64, order="C").reshape(-1, 3)
+        closest, faces, barycentrics, distances = self._query.query(points, signed, num_threads)
+        return closest, faces.flatten(), barycentrics, distances.flatten()
+
+    def side(self, points, num_threads: int = 0) -> NDArray:
+        """Classify points as inside, on or outside the mesh.
+
+        Parameters
+        ----------
+        points : array_like
+            The query points, as an array of shape (N, 3).
+        num_threads : int, optional
+            Number of threads. ``0`` uses the hardware concurrency.
+
+        Returns
+        -------
+        NDArray
+            ``1`` for points inside, ``0`` for points on the surface and ``-1`` for points outside the mesh,
+            of shape (N,).
+
+        Raises
+        ------
+        ValueError
+            If the mesh is not closed or has no faces.
+
+        """
+        points = np.asarray(points, dtype=np.float64, order="C").reshape(-1, 3)
+        return self._query.side(points, num_threads).flatten()
+
+    def signed_distance_grid(self, origin, spacing, counts, num_threads: int = 0) -> NDArray:
+        """Sample the signed distance to the mesh at the nodes of a regular grid.
+
+        Parameters
+        ----------
+        origin : array_like
+            The first node of the grid, as an array of shape (3,).
+        spacing : array_like
+            The distance between neighbouring nodes along each axis, as an array of shape (3,).
+        counts : array_like
+            The number of nodes along each axis, as an array of shape (3,).
+        num_threads : int, optional
+            Number of threads. ``0`` uses the hardware concurrency.
+
+        Returns
+        -------
+        NDArray
+            The signed distances of shape ``tuple(counts)``, negative inside the mesh.
+            The node ``(i, j, k)`` is at ``origin + (i, j, k) * spacing``.
+
+        Raises
+        ------
+        ValueError
+            If the mesh is not closed or has no faces, or if a count is negative.
+
+        """
+        origin = np.asarray(origin, dtype=np.float64).reshape(3)
+        spacing = np.asarray(spacing, dtype=np.float64).reshape(3)
+        counts = np.asarray(counts, dtype=np.int64).reshape(3)
+        distances = self._query.signed_distance_grid(origin.tolist(), spacing.tolist(), counts.tolist(), num_threads)
+        return distances.reshape(tuple(counts))
+
+    @property
+    def is_closed(self) -> bool:
+        """Whether the mesh is closed, and signed distances are available."""
+        return self._query.is_closed
+
+    @property
+    def num_faces(self) -> int:
+        """Number of faces of the mesh."""
+        return self._query.num_faces
+
+
+def _closest_point_query(mesh: Union[MeshLike, ClosestPointQuery]) -> ClosestPointQuery:
+    if isinstance(mesh, ClosestPointQuery):
+        return mesh
+    return ClosestPointQuery(mesh)
+
+
+def points_inside_mesh(
+    mesh: Union[MeshLike, ClosestPointQuery],
+    points,
+    boundary: bool = True,
+    num_threads: int = 0,
+) -> NDArray:
+    """Test which points lie inside a closed mesh.
+
+    The test uses CGAL's ``Side_of_triangle_mesh`` on the AABB tree of the mesh,
+    and runs in parallel over blocks of points.
+    Pass a :class:`ClosestPointQuery` to build the tree once and reuse it across calls.
+
+    Parameters
+    ----------
+    mesh : :attr:`compas_cgal.types.MeshLike` | :class:`ClosestPointQuery`
+        A closed triangle mesh.
+    points : array_like
+        The query points, as an array of shape (N, 3).
+    boundary : bool, optional
+        If True, points on the surface of the mesh count as inside.
+    num_threads : int, optional
+        Number of threads. ``0`` uses the hardware concurrency.
+
+    Returns
+    -------
+    NDArray
+        Boolean array of shape (N,).
+
+    Raises
+    ------
+    ValueError
+        If the mesh is not closed.
+
+    Examples
+    --------
+    >>> from compas.geometry import Box
+    >>> from compas_cgal.projection import points_inside_mesh
+    >>> box = Box(2).to_vertices_and_faces(triangulated=True)
+    >>> points_inside_mesh(box, [[0, 0, 0], [0, 0, 1], [0, 0, 2]]).tolist()
+    [True, True, False]
+
+    """
+    sides = _closest_point_query(mesh).side(points, num_threads)
+    return sides >= 0 if boundary else sides > 0
+
+
+def signed_distance_grid(
+    mesh: Union[MeshLike, ClosestPointQuery],
+    bbox,
+    resolution: Union[int, Tuple[int, int, int]],
+    num_threads: int = 0,
+) -> NDArray:
+    """Sample the signed distance to a closed mesh on a regular grid.
+
+    Distances are negative inside the mesh.
+    The nodes of the grid are generated in C++, and sampled in parallel over blocks of nodes.
+    Pass a :class:`ClosestPointQuery` to build the tree once and reuse it across calls.
+
+    Parameters
+    ----------
+    mesh : :attr:`compas_cgal.types.MeshLike` | :class:`ClosestPointQuery`
+        A closed triangle mesh.
+    bbox : array_like
+        The minimum and maximum corner of the grid, as an array of shape (2, 3).
+    resolution : int | tuple[int, int, int]
+        The number of nodes along every axis, or along each of the three axes.
+    num_threads : int, optional
+        Number of threads. ``0`` uses the hardware concurrency.
+
+    Returns
+    -------
+    NDArray
+        The signed distances of shape ``(nx, ny, nz)``.
+        Along each axis, the nodes are ``np.linspace(bbox[0][axis], bbox[1][axis], n)``.
+
+    Raises
+    ------
+    ValueError
+        If the mesh is not closed, or if a resolution is smaller than 1.
+
+    Examples
+    --------
+    >>> from compas.geometry import Box
+    >>> from compas_cgal.projection import signed_distance_grid
+    >>> box = Box(2).to_vertices_and_faces(triangulated=True)
+    >>> grid = signed_distance_grid(box, [[-2, -2, -2], [2, 2, 2]], 5)
+    >>> grid.shape
+    (5, 5, 5)
+    >>> float(grid[2, 2, 2])
+    -1.0
+
+    """
+    lower, upper = np.asarray(bbox, dtype=np.float64).reshape(2, 3)
+    counts = np.broadcast_to(np.asarray(resolution, dtype=np.int64), (3,))
+    if (counts < 1).any():
+        raise ValueError("resolution must be at least 1 along every axis.")
+    spacing = np.where(counts > 1, (upper - lower) / np.maximum(counts - 1, 1), 0.0)
+
+    return _closest_point_query(mesh).signed_distance_grid(lower, spacing, counts, num_threads)
+
+
 def project_mesh_on_mesh(
     mesh_source: VerticesFaces,
     mesh_target: VerticesFaces,
@@ -69,8 +316,9 @@ def project_points_on_mesh(
     ----------
     points : list[list[float]]
         The points to project.
-    mesh : :attr:`compas_cgal.types.VerticesFaces`
+    mesh : :class:`compas.datastructures.Mesh` | :class:`compas_cgal.mesh.CgalMesh` | :class:`ClosestPointQuery`
         Mesh that the points are projected onto.
+        Pass a :class:`ClosestPointQuery` to reuse its tree across calls.
 
     Returns
     -------
@@ -78,11 +326,12 @@ def project_points_on_mesh(
         The projected points (vertices on the mesh surface).
 
     """
-    V_target, F_target = mesh.to_vertices_and_faces(triangulated=True)
+    if isinstance(mesh, ClosestPointQuery):
+        return mesh.query(points)[0]
+    if not isinstance(mesh, CgalMesh):
+        mesh = mesh.to_vertices_and_faces(triangulated=True)
     numpy_V_source = np.asarray(points, dtype=np.float64, order="C")
-    numpy_V_target = np.asarray(V_target, dtype=np.float64, order="C")
-    numpy_F_target = np.asarray(F_target, dtype=np.int32, order="C")
-    _meshing.pmp_project(numpy_V_target, numpy_F_target, numpy_V_source)
+    _meshing.pmp_project(*mesh_arguments(mesh), numpy_V_source)
 
     return numpy_V_source
 
@@ -96,7 +345,7 @@ def pull_points_on_mesh(points: list[list[float]], normals: list[list[float]], m
         The points to pull.
     normals : list[list[float]]
         The normal vectors used for directing the projection.
-    mesh : :attr:`compas_cgal.types.VerticesFaces`
+    mesh : :class:`compas.datastructures.Mesh` | :class:`compas_cgal.mesh.CgalMesh`
         Mesh that the points are pulled onto.
 
     Returns
@@ -106,10 +355,9 @@ def pull_points_on_mesh(points: list[list[float]], normals: list[list[float]], m
 
     """
 
-    V_target, F_target = mesh.to_vertices_and_faces(triangulated=True)
+    if not isinstance(mesh, CgalMesh):
+        mesh = mesh.to_vertices_and_faces(triangulated=True)
     numpy_V_source = np.asarray(points, dtype=np.float64, order="C")
     numpy_N_source = np.asarray(normals, dtype=np.float64, order="C")
-    numpy_V_target = np.asarray(V_target, dtype=np.float64, order="C")
-    numpy_F_target = np.asarray(F_target, dtype=np.int32, order="C")
-    _meshing.pmp_pull(numpy_V_target, numpy_F_target, numpy_V_source, numpy_N_source)
+    _meshing.pmp_pull(*mesh_arguments(mesh), numpy_V_source, numpy_N_source)
     return numpy_V_source
@@ -0,0 +1,131 @@
+"""Ray casting against triangle meshes."""
+
+from typing import Tuple
+
+import numpy as np
+from numpy.typing import NDArray
+
+from compas_cgal._raycast import RayCaster as _RayCaster
+from compas_cgal.mesh import mesh_arguments
+from compas_cgal.types import MeshLike
+
+__all__ = ["RayCaster"]
+
+
+def _rays(origins, directions) -> Tuple[np.ndarray, np.ndarray]:
+    origins = np.asarray(origins, dtype=np.float64, order="C").reshape(-1, 3)
+    directions = np.asarray(directions, dtype=np.float64, order="C").reshape(-1, 3)
+    if directions.shape[0] == 1 and origins.shape[0] != 1:
+        directions = np.ascontiguousarray(np.broadcast_to(directions, origins.shape))
+    return origins, directions
+
+
+class RayCaster:
+    """Ray caster with a persistent AABB tree over the faces of a triangle mesh.
+
+    The tree is built once in the constructor and reused by every query.
+    The rays of a query are cast in parallel on native threads, without the GIL.
+    A ray caster can be shared between threads.
+
+    Parameters
+    ----------
+    mesh : :attr:`compas_cgal.types.MeshLike`
+        A triangulated mesh as a tuple of vertices and faces, or a native :class:`compas_cgal.mesh.CgalMesh`.
+
+    Notes
+    -----
+    Distances are measured from the origin of a ray to the hit point, in the units of the mesh,
+    independently of the length of the direction vector.
+    Rays with a zero direction never hit.
+    The barycentric coordinates of a hit are the weights of the three vertices of the hit face,
+    in the order of the vertices of the face in the input.
+
+    Examples
+    --------
+    >>> from compas.geometry import Box
+    >>> from compas_cgal.raycast import RayCaster
+    >>> box = Box(2)
+    >>> caster = RayCaster(box.to_vertices_and_faces(triangulated=True))  # the tree is built here
+    >>> distances, faces, barycentrics = caster.first_hit([[0, 0, 5], [5, 5, 5]], [0, 0, -1])
+    >>> distances.tolist()
+    [4.0, inf]
+
+    """
+
+    def __init__(self, mesh: MeshLike) -> None:
+        self._caster = _RayCaster(*mesh_arguments(mesh))
+
+    def first_hit(
+        self,
+        origins,
+        directions,
+        tmax: float = float("inf"),
+        num_threads: int = 0,
+    ) -> Tuple[NDArray, NDArray, NDArray]:
+        """Find the first hit of every ray.
+
+        Parameters
+        ----------
+        origins : array_like
+            The origins of the rays, as an array of shape (N, 3).
+        directions : array_like
+            The directions of the rays, as an array of shape (N, 3),
+            or a single direction for all rays.
+        tmax : float, optional
+            Hits further than this distance from the origin are ignored.
+        num_threads : int, optional
+            Number of threads. ``0`` uses the hardware concurrency.
+
+        Returns
+        -------
+        tuple[NDArray, NDArray, NDArray]
+            The distances of shape (N,), with ``inf`` for rays that miss,
+            the hit faces of shape (N,), with ``-1`` for rays that miss,
+            and the barycentric coordinates of the hit points of shape (N, 3).
+
+        """
+        origins, directions = _rays(origins, directions)
+        distances, faces, barycentrics = self._caster.first_hit(origins, directions, tmax, num_threads)
+        return distances.flatten(), faces.flatten(), barycentrics
+
+    def all_hits(
+        self,
+        origins,
+        directions,
+        tmax: float = float("inf"),
+        num_threads: int = 0,
+    ) -> Tuple[NDArray, NDArray, NDArray, NDArray]:
+        """Find all hits of every ray.
+
+        The hits of ray ``i`` are the rows ``offsets[i]:offsets[i + 1]`` of the other arrays,
+        sorted by distance.
+        A ray through an edge or a vertex of the mesh hits every face incident to it.
+
+        Parameters
+        ----------
+        origins : array_like
+            The origins of the rays, as an array of shape (N, 3).
+        directions : array_like
+            The directions of the rays, as an array of shape (N, 3),
+            or a single direction for all rays.
+        tmax : float, optional
+            Hits further than this distance from the origin are ignored.
+        num_threads : int, optional
+            Number of threads. ``0`` uses the hardware concurrency.
+
+        Returns
+        -------
+        tuple[NDArray, NDArray, NDArray, NDArray]
+            The offsets of the hits of every ray of shape (N + 1,),
+            and the distances of shape (K,), faces of shape (K,) and barycentric coordinates of shape (K, 3)
+            of all K hits.
+
+        """
+        origins, directions = _rays(origins, directions)
+        offsets, distances, faces, barycentrics = self._caster.all_hits(origins, directions, tmax, num_threads)
+        return offsets.flatten(), distances.flatten(), faces.flatten(), barycentrics
+
+    @property
+    def num_faces(self) -> int:
+        """Number of faces of the mesh."""
+        return self._caster.num_faces
@@ -0,0 +1,159 @@
+"""Detection and repair of self-intersecting triangle meshes."""
+
+from typing import Literal
+from typing import Union
+
+from compas_cgal import _repair  # type: ignore
+
+from .mesh import CgalMesh
+from .mesh import mesh_arguments
+from .types import IntNx2
+from .types import MeshLike
+from .types import VerticesFacesNumpy
+
+__all__ = ["self_intersections", "does_self_intersect", "autorefine", "remove_self_intersections", "validate_mesh"]
+
+
+def self_intersections(mesh: MeshLike) -> IntNx2:
+    """Find the pairs of faces of a triangle mesh that intersect.
+
+    Faces that share a vertex or an edge are only reported if they intersect
+    beyond the shared vertex or edge.
+    The search runs in parallel if CGAL is built with TBB.
+
+    Parameters
+    ----------
+    mesh
+        The mesh, as vertices and faces or as a native :class:`compas_cgal.mesh.CgalMesh`.
+
+    Returns
+    -------
+    IntNx2
+        The indices of the intersecting faces, one pair per row, with the smaller index first.
+
+    Examples
+    --------
+    >>> from compas.geometry import Box
+    >>> from compas_cgal.repair import self_intersections
+    >>> mesh = Box(1).to_vertices_and_faces(triangulated=True)
+    >>> self_intersections(mesh).shape
+    (0, 2)
+
+    """
+    return _repair.self_intersections(*mesh_arguments(mesh))
+
+
+def does_self_intersect(mesh: MeshLike) -> bool:
+    """Check if a triangle mesh self-intersects.
+
+    The check stops at the first pair of intersecting faces,
+    which makes it faster than :func:`self_intersections` on invalid meshes.
+
+    Parameters
+    ----------
+    mesh
+        The mesh, as vertices and faces or as a native :class:`compas_cgal.mesh.CgalMesh`.
+
+    Returns
+    -------
+    bool
+
+    """
+    return _repair.does_self_intersect(*mesh_arguments(mesh))
+
+
+def autorefine(mesh: MeshLike) -> VerticesFacesNumpy:
+    """Refine a triangle mesh along its self-intersections.
+
+    Intersecting faces are split along their intersections,
+    so that the faces of the result only meet at shared edges and vertices.
+    The result has no self-intersections, but parts that crossed each other stay in place.
+
+    Parameters
+    ----------
+    mesh
+        The mesh, as vertices and faces or as a native :class:`compas_cgal.mesh.CgalMesh`.
+        A native mesh is copied, not modified.
+
+    Returns
+    -------
+    VerticesFacesNumpy
+
+    """
+    return _repair.autorefine(*mesh_arguments(mesh))
+
+
+def remove_self_intersections(mesh: MeshLike) -> VerticesFacesNumpy:
+    """Remove the self-intersections of a triangle mesh.
+
+    The faces around each self-intersection are removed and the holes are filled again,
+    using CGAL's experimental local repair.
+
+    Parameters
+    ----------
+    mesh
+        The mesh, as vertices and faces or as a native :class:`compas_cgal.mesh.CgalMesh`.
+        A native mesh is copied, not modified.
+
+    Returns
+    -------
+    VerticesFacesNumpy
+
+    Raises
+    ------
+    RuntimeError
+        If not all self-intersections could be removed.
+
+    """
+    V, F, success = _repair.remove_self_intersections(*mesh_arguments(mesh))
+    if not success:
+        raise RuntimeError("Not all self-intersections could be removed.")
+    return V, F
+
+
+def validate_mesh(mesh: MeshLike, repair: bool = False, name: str = "mesh") -> CgalMesh:
+    """Check that a mesh can be used as an operand of a boolean operation.
+
+    Corefinement requires operands without self-intersections.
+    Checking them up front fails before any conversion work is done by the boolean itself,
+    and with an error that names the offending operand.
+
+    Parameters
+    ----------
+    mesh
+        The mesh, as vertices and faces or as a native :class:`compas_cgal.mesh.CgalMesh`.
+    repair
+        If True, remove the self-intersections of an invalid mesh with :func:`remove_self_intersections`
+        instead of raising an error.
+    name
+        The name of the mesh in the error message.
+
+    Returns
+    -------
+    :class:`compas_cgal.mesh.CgalMesh`
+        The (repaired) mesh, converted once so that the boolean does not convert it again.
+
+    Raises
+    ------
+    ValueError
+        If the mesh self-intersects and ``repair`` is False.
+    RuntimeError
+        If the mesh could not be repaired.
+
+    """
+    if not isinstance(mesh, CgalMesh):
+        mesh = CgalMesh(mesh)
+    if not does_self_intersect(mesh):
+        return mesh
+    if not repair:
+        pairs = self_intersections(mesh)
+        raise ValueError(f"{name} self-intersects: {len(pairs)} pairs of faces intersect, for example {pairs[:1].tolist()}.")
+    return CgalMesh(remove_self_intersections(mesh))
+
+
+def _validated(meshes: tuple, validate: Union[bool, Literal["repair"]], names: str = "AB") -> tuple:
+    if not validate:
+        return meshes
+    if validate not in (True, "repair"):
+        raise ValueError(f"validate must be False, True, or 'repair', not {validate!r}")
+    return tuple(validate_mesh(mesh, repair=validate == "repair", name=name) for mesh, name in zip(meshes, names))
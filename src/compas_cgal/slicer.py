@@ -1,3 +1,9 @@
+from typing import Iterator
+from typing import List
+from typing import Optional
+from typing import Tuple
+from typing import Union
+
 import numpy as np
 from compas.geometry import Plane
 from compas.plugins import plugin
@@ -5,24 +11,214 @@ from compas.plugins import plugin
 from compas_cgal import _slicer  # type: ignore
 from compas_cgal import _types_std  # noqa: F401  # type: ignore
 
+from .mesh import mesh_arguments
+from .types import MeshLike
 from .types import PolylinesNumpy
-from .types import VerticesFaces
+
+
+def _check_return_faces(flat: bool, return_faces: bool) -> None:
+    if return_faces and not flat:
+        raise ValueError("return_faces requires flat=True.")
+
+
+def _plane_arrays(planes: List[Plane]) -> Tuple[np.ndarray, np.ndarray]:
+    P = np.zeros((0, 3), dtype=np.float64)
+    N = np.zeros((0, 3), dtype=np.float64)
+    if planes:
+        points, normals = zip(*planes)
+        P = np.array(points, dtype=np.float64, order="C")
+        N = np.array(normals, dtype=np.float64, order="C")
+    return P, N
+
+
+class FlatSlices:
+    """Slice polylines of many planes in flat arrays.
+
+    The polylines are stored once, in CSR layout:
+    the points of polyline ``k`` are the rows ``offsets[k]:offsets[k + 1]`` of ``points``.
+    The arrays are handed over from C++ without copies,
+    which avoids one array and one Python object per polyline for large numbers of contours.
+
+    Attributes
+    ----------
+    points : np.ndarray
+        ``(N, 3)`` points of all polylines.
+        Closed polylines repeat their first point.
+    offsets : np.ndarray
+        ``(P + 1,)`` offsets of the polylines in ``points``.
+    planes : np.ndarray
+        ``(P,)`` index of the plane of every polyline.
+    closed : np.ndarray
+        ``(P,)`` whether every polyline is closed.
+    faces : np.ndarray | None
+        ``(N,)`` face of the mesh crossed by the segment from every point to the next,
+        ``-1`` after the last point of a polyline.
+        None if the faces were not requested.
+
+    """
+
+    def __init__(
+        self,
+        points: np.ndarray,
+        offsets: np.ndarray,
+        planes: np.ndarray,
+        closed: np.ndarray,
+        faces: Optional[np.ndarray] = None,
+    ) -> None:
+        self.points = points
+        self.offsets = offsets
+        self.planes = planes
+        self.closed = closed
+        self.faces = faces
+
+    @classmethod
+    def _from_native(cls, result, return_faces: bool) -> "FlatSlices":
+        points, offsets, planes, closed, faces = result
+        return cls(points, offsets.ravel(), planes.ravel(), closed.ravel().astype(bool), faces.ravel() if return_faces else None)
+
+    def __len__(self) -> int:
+        return len(self.planes)
+
+    def polyline(self, k: int) -> np.ndarray:
+        """The points of polyline ``k``, as a view of ``points``."""
+        return self.points[self.offsets[k] : self.offsets[k + 1]]
+
+    def polylines(self) -> PolylinesNumpy:
+        """All polylines, as views of ``points``."""
+        return [self.polyline(k) for k in range(len(self))]
+
+
+class Slicer:
+    """Mesh slicer that keeps the mesh and an AABB tree over its faces alive.
+
+    The tree is built once in the constructor,
+    so that repeated slicing of the same mesh, for example by an interactive section viewer,
+    only pays for the faces that the planes actually cross.
+    A slicer can be shared between threads.
+
+    Parameters
+    ----------
+    mesh : :attr:`compas_cgal.types.MeshLike`
+        A triangulated mesh as a tuple of vertices and faces, or a native :class:`compas_cgal.mesh.CgalMesh`.
+
+    Notes
+    -----
+    Closed polylines repeat their first point.
+    For a closed, outward oriented mesh, outer contours run counterclockwise seen from the plane normal,
+    and holes clockwise.
+
+    Examples
+    --------
+    >>> from compas.geometry import Box, Plane
+    >>> from compas_cgal.slicer import Slicer
+    >>> box = Box(2)
+    >>> slicer = Slicer(box.to_vertices_and_faces(triangulated=True))  # the tree is built here
+    >>> polylines = slicer.slice([Plane([0, 0, 0], [0, 0, 1])])
+    >>> len(polylines)
+    1
+
+    """
+
+    def __init__(self, mesh: MeshLike) -> None:
+        self._slicer = _slicer.Slicer(*mesh_arguments(mesh))
+
+    def slice(
+        self,
+        planes: List[Plane],
+        flat: bool = False,
+        return_faces: bool = False,
+    ) -> Union[PolylinesNumpy, FlatSlices]:
+        """Slice the mesh with a list of planes.
+
+        Parameters
+        ----------
+        planes
+            The slicing planes.
+        flat
+            If True, return the polylines in the flat arrays of a :class:`FlatSlices`.
+        return_faces
+            If True, also return the faces crossed by the polylines. Requires ``flat``.
+
+        Returns
+        -------
+        PolylinesNumpy | :class:`FlatSlices`
+            The slice polylines of all planes, with each polyline an array of points.
+
+        """
+        _check_return_faces(flat, return_faces)
+        P, N = _plane_arrays(planes)
+        if flat:
+            return FlatSlices._from_native(self._slicer.slice_flat(P, N, return_faces, 1), return_faces)
+        return list(self._slicer.slice(P, N))
+
+    def slice_many(
+        self,
+        planes: List[Plane],
+        num_threads: int = 0,
+        flat: bool = False,
+        return_faces: bool = False,
+    ) -> Union[List[PolylinesNumpy], FlatSlices]:
+        """Slice the mesh with a list of planes in parallel.
+
+        The planes are distributed over native threads.
+
+        Parameters
+        ----------
+        planes
+            The slicing planes.
+        num_threads
+            Number of threads. ``0`` uses the hardware concurrency.
+        flat
+            If True, return the polylines of all planes in the flat arrays of a :class:`FlatSlices`.
+        return_faces
+            If True, also return the faces crossed by the polylines. Requires ``flat``.
+
+        Returns
+        -------
+        list[PolylinesNumpy] | :class:`FlatSlices`
+            Per plane, the slice polylines, with each polyline an array of points.
+
+        """
+        _check_return_faces(flat, return_faces)
+        P, N = _plane_arrays(planes)
+        if flat:
+            return FlatSlices._from_native(self._slicer.slice_flat(P, N, return_faces, num_threads), return_faces)
+        return [list(polylines) for polylines in self._slicer.slice_many(P, N, num_threads)]
+
+    @property
+    def num_faces(self) -> int:
+        """Number of faces of the mesh."""
+        return self._slicer.num_faces
 
 
 @plugin(category="trimesh", pluggable_name="trimesh_slice")
-def slice_mesh_planes(mesh: VerticesFaces, planes: list[Plane]) -> PolylinesNumpy:
+def slice_mesh_planes(
+    mesh: MeshLike,
+    planes: list[Plane],
+    flat: bool = False,
+    return_faces: bool = False,
+    num_threads: int = 0,
+) -> Union[PolylinesNumpy, FlatSlices]:
     """Slice a mesh by a list of planes.
 
     Parameters
     ----------
     mesh
-        The mesh to slice.
+        The mesh to slice, as vertices and faces or as a native :class:`compas_cgal.mesh.CgalMesh`.
     planes
         The slicing planes.
+    flat
+        If True, return the polylines in the flat arrays of a :class:`FlatSlices`,
+        with the plane and the closed flag of every polyline.
+        The planes are then sliced in parallel.
+    return_faces
+        If True, also return the faces crossed by the polylines. Requires ``flat``.
+    num_threads
+        Number of threads for ``flat`` slicing. ``0`` uses the hardware concurrency.
 
     Returns
     -------
-    PolylinesNumpy
+    PolylinesNumpy | :class:`FlatSlices`
         A list of slice polylines, with each polyline an array of points.
 
     Examples
@@ -40,15 +236,197 @@ def slice_mesh_planes(mesh: VerticesFaces, planes: list[Plane]) -> PolylinesNump
     >>> polylines = [Polyline(points) for points in result]
 
     """
-    vertices, faces = mesh
-    points, normals = zip(*planes)
-    V = np.asarray(vertices, dtype=np.float64, order="C")
-    F = np.asarray(faces, dtype=np.int32, order="C")
-    P = np.array(points, dtype=np.float64, order="C")
-    N = np.array(normals, dtype=np.float64, order="C")
-
-    pointsets = _slicer.slice_mesh(V, F, P, N)
+    _check_return_faces(flat, return_faces)
+    P, N = _plane_arrays(planes)
+    if flat:
+        return FlatSlices._from_native(_slicer.slice_mesh_flat(*mesh_arguments(mesh), P, N, return_faces, num_threads), return_faces)
+
+    pointsets = _slicer.slice_mesh(*mesh_arguments(mesh), P, N)
     return pointsets
 
 
 slice_mesh = slice_mesh_planes
+
+
+def slice_mesh_layers(
+    mesh: MeshLike,
+    normal,
+    heights,
+    num_threads: int = 0,
+    flat: bool = False,
+    return_faces: bool = False,
+) -> Union[List[PolylinesNumpy], FlatSlices]:
+    """Slice a mesh with many parallel planes in a single sweep.
+
+    The faces of the mesh are sorted by height once,
+    and the layers are swept upwards with every layer only visiting the faces it crosses,
+    instead of searching the faces of every plane separately.
+    The layers are distributed over native threads.
+    This is much faster than :func:`slice_mesh_planes` for large numbers of layers.
+
+    Parameters
+    ----------
+    mesh
+        The mesh to slice, as vertices and faces or as a native :class:`compas_cgal.mesh.CgalMesh`.
+    normal
+        The common normal of the planes.
+    heights
+        The heights of the planes, as signed distances from the origin along the unit normal.
+        The plane at height ``h`` contains the points ``x`` with ``dot(x, normal) / |normal| == h``.
+    num_threads
+        Number of threads. ``0`` uses the hardware concurrency.
+    flat
+        If True, return the polylines of all layers in the flat arrays of a :class:`FlatSlices`,
+        with plane indices referring to ``heights``.
+    return_faces
+        If True, also return the faces crossed by the polylines. Requires ``flat``.
+
+    Returns
+    -------
+    list[PolylinesNumpy] | :class:`FlatSlices`
+        Per height, the slice polylines, with each polyline an array of points.
+        Closed polylines repeat their first point.
+        For a closed, outward oriented mesh, outer contours run counterclockwise seen from the normal,
+        and holes clockwise.
+
+    Notes
+    -----
+    Vertices that lie exactly on a plane count as above it.
+    A plane through the bottom of a mesh therefore returns no contours,
+    and a plane through its top returns the top outline.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from compas.geometry import Sphere
+    >>> from compas_cgal.slicer import slice_mesh_layers
+    >>> sphere = Sphere(1.0, point=[0, 0, 1.0])
+    >>> mesh = sphere.to_vertices_and_faces(u=32, v=32, triangulated=True)
+    >>> layers = slice_mesh_layers(mesh, [0, 0, 1], np.linspace(0.1, 1.9, 19))
+    >>> len(layers)
+    19
+
+    """
+    _check_return_faces(flat, return_faces)
+    normal = [float(x) for x in normal]
+    heights = np.asarray(heights, dtype=np.float64).ravel().tolist()
+    if flat:
+        result = _slicer.slice_mesh_layers_flat(*mesh_arguments(mesh), normal, heights, return_faces, num_threads)
+        return FlatSlices._from_native(result, return_faces)
+
+    layers = _slicer.slice_mesh_layers(*mesh_arguments(mesh), normal, heights, num_threads)
+    return [list(polylines) for polylines in layers]
+
+
+def iter_slices(
+    mesh: MeshLike,
+    planes: List[Plane],
+    chunk: int = 1,
+    return_faces: bool = False,
+    num_threads: int = 0,
+    buffer: int = 2,
+) -> Iterator[FlatSlices]:
+    """Slice a mesh chunk by chunk, while the contours are consumed.
+
+    The planes are sliced in chunks on a background native thread,
+    which runs ahead of the consumer by at most ``buffer`` chunks.
+    The memory in use is therefore bounded by a few chunks, independently of the number of planes,
+    and the contours can be streamed to disk while the next chunks are being computed.
+
+    Parameters
+    ----------
+    mesh
+        The mesh to slice, as vertices and faces or as a native :class:`compas_cgal.mesh.CgalMesh`.
+    planes
+        The slicing planes.
+    chunk
+        The number of planes per chunk.
+    return_faces
+        If True, also return the faces crossed by the polylines.
+    num_threads
+        Number of threads slicing the planes of a chunk. ``0`` uses the hardware concurrency.
+    buffer
+        The maximum number of computed chunks waiting to be consumed.
+
+    Yields
+    ------
+    :class:`FlatSlices`
+        The slices of the next chunk of planes, with plane indices referring to ``planes``.
+
+    Examples
+    --------
+    >>> from compas.geometry import Box, Plane
+    >>> from compas_cgal.slicer import iter_slices
+    >>> box = Box(2).to_vertices_and_faces(triangulated=True)
+    >>> planes = [Plane([0, 0, z], [0, 0, 1]) for z in (-0.5, 0.0, 0.5)]
+    >>> [len(slices) for slices in iter_slices(box, planes, chunk=2)]
+    [2, 1]
+
+    """
+    if chunk < 1:
+        raise ValueError("chunk must be at least 1.")
+    P, N = _plane_arrays(planes)
+    stream = _slicer.SliceStream(*mesh_arguments(mesh), P, N, chunk, return_faces, num_threads, buffer)
+    try:
+        while True:
+            result = stream.next()
+            if result is None:
+                return
+            yield FlatSlices._from_native(result, return_faces)
+    finally:
+        stream.close()
+
+
+def slice_mesh_regions(
+    mesh: MeshLike,
+    planes: List[Plane],
+    num_threads: int = 0,
+) -> List[List[Tuple[np.ndarray, List[np.ndarray]]]]:
+    """Slice a mesh into regions with holes.
+
+    The contours of every plane are chained, oriented and nested by containment in C++,
+    in parallel over the planes.
+    Every region is an outer boundary with the holes directly inside it;
+    islands inside holes are regions of their own.
+
+    Parameters
+    ----------
+    mesh
+        The mesh to slice, as vertices and faces or as a native :class:`compas_cgal.mesh.CgalMesh`.
+    planes
+        The slicing planes.
+    num_threads
+        Number of threads. ``0`` uses the hardware concurrency.
+
+    Returns
+    -------
+    list[list[tuple[np.ndarray, list[np.ndarray]]]]
+        Per plane, the regions as pairs of a boundary and a list of holes, each an array of points.
+        Boundaries run counterclockwise and holes clockwise, seen from the plane normal,
+        and loops do not repeat their first point.
+        For planes with normal ``[0, 0, 1]``, the regions can be passed directly
+        to :func:`compas_cgal.straight_skeleton_2.offset_polygon_with_holes`
+        and :func:`compas_cgal.triangulation.constrained_delaunay_triangulation`.
+        Open contours, of meshes that are not closed, are skipped.
+
+    Examples
+    --------
+    >>> from compas.geometry import Box, Plane
+    >>> from compas_cgal.slicer import slice_mesh_regions
+    >>> box = Box(2).to_vertices_and_faces(triangulated=True)
+    >>> regions = slice_mesh_regions(box, [Plane([0, 0, 0], [0, 0, 1])])
+    >>> boundary, holes = regions[0][0]
+    >>> len(boundary), len(holes)
+    (8, 0)
+
+    """
+    P, N = _plane_arrays(planes)
+    points, loop_offsets, region_offsets, region_planes = _slicer.slice_mesh_regions(*mesh_arguments(mesh), P, N, num_threads)
+    loop_offsets = loop_offsets.ravel()
+    region_offsets = region_offsets.ravel()
+
+    loops = [points[start:end] for start, end in zip(loop_offsets[:-1], loop_offsets[1:])]
+    result: List[List[Tuple[np.ndarray, List[np.ndarray]]]] = [[] for _ in range(len(P))]
+    for plane, start, end in zip(region_planes.ravel(), region_offsets[:-1], region_offsets[1:]):
+        result[plane].append((loops[start], loops[start + 1 : end]))
+    return result
@@ -3,17 +3,19 @@ import numpy as np
 from compas_cgal import _subdivision  # type: ignore
 from compas_cgal import _types_std  # noqa: F401 # type: ignore
 
-from .types import VerticesFaces
+from .mesh import CgalMesh
+from .mesh import mesh_arguments
+from .types import MeshLike
 from .types import VerticesFacesNumpy
 
 
-def mesh_subdivide_catmull_clark(mesh: VerticesFaces, k=1) -> VerticesFacesNumpy:
+def mesh_subdivide_catmull_clark(mesh: MeshLike, k=1) -> VerticesFacesNumpy:
     """Subdivide a mesh with the Catmull Clark scheme.
 
     Parameters
     ----------
     mesh
-        The mesh to remesh.
+        The mesh to subdivide, as vertices and faces or as a native :class:`compas_cgal.mesh.CgalMesh`.
     k
         The number of subdivision steps.
 
@@ -33,19 +35,21 @@ def mesh_subdivide_catmull_clark(mesh: VerticesFaces, k=1) -> VerticesFacesNumpy
     >>> shape = Polyhedron(*result)
 
     """
+    if isinstance(mesh, CgalMesh):
+        return _subdivision.subd_catmullclark(*mesh_arguments(mesh), k)
     V, F = mesh
     V = np.asarray(V, dtype=np.float64, order="C")
     F = np.asarray(F, dtype=np.int32, order="C")
     return _subdivision.subd_catmullclark(V, F, k)
 
 
-def mesh_subdivide_loop(mesh: VerticesFaces, k=1) -> VerticesFacesNumpy:
+def mesh_subdivide_loop(mesh: MeshLike, k=1) -> VerticesFacesNumpy:
     """Subdivide a mesh with the Loop scheme.
 
     Parameters
     ----------
     mesh
-        The mesh to remesh.
+        The mesh to subdivide, as vertices and faces or as a native :class:`compas_cgal.mesh.CgalMesh`.
     k
         The number of subdivision steps.
 
@@ -54,19 +58,16 @@ def mesh_subdivide_loop(mesh: VerticesFaces, k=1) -> VerticesFacesNumpy:
     VerticesFacesNumpy
 
     """
-    V, F = mesh
-    V = np.asarray(V, dtype=np.float64, order="C")
-    F = np.asarray(F, dtype=np.int32, order="C")
-    return _subdivision.subd_loop(V, F, k)
+    return _subdivision.subd_loop(*mesh_arguments(mesh), k)
 
 
-def mesh_subdivide_sqrt3(mesh: VerticesFaces, k=1) -> VerticesFacesNumpy:
+def mesh_subdivide_sqrt3(mesh: MeshLike, k=1) -> VerticesFacesNumpy:
     """Subdivide a mesh with the Sqrt3 scheme.
 
     Parameters
     ----------
     mesh
-        The mesh to remesh.
+        The mesh to subdivide, as vertices and faces or as a native :class:`compas_cgal.mesh.CgalMesh`.
     k
         The number of subdivision steps.
 
@@ -75,7 +76,4 @@ def mesh_subdivide_sqrt3(mesh: VerticesFaces, k=1) -> VerticesFacesNumpy:
     VerticesFacesNumpy
 
     """
-    V, F = mesh
-    V = np.asarray(V, dtype=np.float64, order="C")
-    F = np.asarray(F, dtype=np.int32, order="C")
-    return _subdivision.subd_sqrt3(V, F, k)
+    return _subdivision.subd_sqrt3(*mesh_arguments(mesh), k)
@@ -1,3 +1,4 @@
+from typing import TYPE_CHECKING
 from typing import Annotated
 from typing import List
 from typing import Literal
@@ -10,6 +11,9 @@ from numpy import float64
 from numpy import int64
 from numpy.typing import NDArray
 
+if TYPE_CHECKING:
+    from compas_cgal.mesh import CgalMesh
+
 FloatNx3 = Annotated[NDArray[float64], Literal["N", 3]]
 IntNx3 = Annotated[NDArray[int64], Literal["N", 3]]
 IntNx2 = Annotated[NDArray[int64], Literal["N", 2]]
@@ -30,6 +34,9 @@ Faces = Union[Sequence[Annotated[List[int], 3]], IntNx3]
 VerticesFaces = Tuple[Vertices, Faces]
 """Representation of a mesh as a tuple of vertices and faces."""
 
+MeshLike = Union[VerticesFaces, "CgalMesh"]
+"""A mesh given either as a tuple of vertices and faces, or as a native :class:`compas_cgal.mesh.CgalMesh`."""
+
 VerticesFacesNumpy = Tuple[FloatNx3, IntNx3]
 """Representation of a mesh as a tuple of vertices and faces,
 with the vertices represented a Nx3 array of spatial coordinates,
@@ -6,6 +6,8 @@
 #include <CGAL/Polygon_mesh_processing/triangulate_faces.h>
 #include <CGAL/boost/graph/split_graph_into_polylines.h>
 
+#include <mutex>
+
 // Type definitions for heat method
 using HeatMethod = CGAL::Heat_method_3::Surface_mesh_geodesic_distances_3<compas::Mesh>;
 using vertex_descriptor = boost::graph_traits<compas::Mesh>::vertex_descriptor;
@@ -13,13 +15,9 @@ using vertex_descriptor = boost::graph_traits<compas::Mesh>::vertex_descriptor;
 
 compas::RowMatrixXd
 pmp_heat_geodesic_distances(
-    Eigen::Ref<compas::RowMatrixXd> vertices,
-    Eigen::Ref<compas::RowMatrixXi> faces,
+    compas::Mesh mesh,
     const std::vector<int>& sources)
 {
-    // Convert input to CGAL mesh
-    compas::Mesh mesh = compas::mesh_from_vertices_and_faces(vertices, faces);
-
     int n_vertices = mesh.number_of_vertices();
 
     // Create property map for distances
@@ -49,6 +47,16 @@ pmp_heat_geodesic_distances(
     return result;
 }
 
+compas::RowMatrixXd
+pmp_heat_geodesic_distances(
+    Eigen::Ref<compas::RowMatrixXd> vertices,
+    Eigen::Ref<compas::RowMatrixXi> faces,
+    const std::vector<int>& sources)
+{
+    // Convert input to CGAL mesh
+    return pmp_heat_geodesic_distances(compas::mesh_from_vertices_and_faces(vertices, faces), sources);
+}
+
 
 /**
  * @brief Heat method solver with precomputation for repeated queries.
@@ -61,13 +69,21 @@ public:
     HeatGeodesicSolver(
         Eigen::Ref<compas::RowMatrixXd> vertices,
         Eigen::Ref<compas::RowMatrixXi> faces)
-        : mesh_(compas::mesh_from_vertices_and_faces(vertices, faces)),
+        : HeatGeodesicSolver(compas::mesh_from_vertices_and_faces(vertices, faces))
+    {}
+
+    HeatGeodesicSolver(compas::Mesh mesh)
+        : mesh_(std::move(mesh)),
           n_vertices_(mesh_.number_of_vertices()),
           distance_pmap_(mesh_.add_property_map<vertex_descriptor, double>("v:distance", 0.0).first),
           hm_(mesh_)
     {}
 
     compas::RowMatrixXd solve(const std::vector<int>& sources) {
+        // The heat method keeps its sources and the distance map as state,
+        // so concurrent calls on the same solver are serialized.
+        std::lock_guard<std::mutex> lock(mutex_);
+
         // Clear previous sources
         hm_.clear_sources();
 
@@ -98,21 +114,19 @@ private:
     int n_vertices_;
     compas::Mesh::Property_map<vertex_descriptor, double> distance_pmap_;
     HeatMethod hm_;
+    std::mutex mutex_;
 };
 
 
 std::tuple<std::vector<compas::RowMatrixXd>, std::vector<compas::RowMatrixXi>>
 pmp_geodesic_isolines_split(
-    Eigen::Ref<compas::RowMatrixXd> vertices,
-    Eigen::Ref<compas::RowMatrixXi> faces,
+    compas::Mesh mesh,
     const std::vector<int>& sources,
     const std::vector<double>& isovalues)
 {
     using vertex_descriptor = boost::graph_traits<compas::Mesh>::vertex_descriptor;
     using edge_descriptor = boost::graph_traits<compas::Mesh>::edge_descriptor;
 
-    // Convert input to CGAL mesh
-    compas::Mesh mesh = compas::mesh_from_vertices_and_faces(vertices, faces);
     int n_vertices = mesh.number_of_vertices();
 
     // Create property map for distances
@@ -191,18 +205,27 @@ pmp_geodesic_isolines_split(
     return std::make_tuple(std::move(all_vertices), std::move(all_faces));
 }
 
+std::tuple<std::vector<compas::RowMatrixXd>, std::vector<compas::RowMatrixXi>>
+pmp_geodesic_isolines_split(
+    Eigen::Ref<compas::RowMatrixXd> vertices,
+    Eigen::Ref<compas::RowMatrixXi> faces,
+    const std::vector<int>& sources,
+    const std::vector<double>& isovalues)
+{
+    // Convert input to CGAL mesh
+    return pmp_geodesic_isolines_split(compas::mesh_from_vertices_and_faces(vertices, faces), sources, isovalues);
+}
+
 
 std::vector<compas::RowMatrixXd>
 pmp_geodesic_isolines(
-    Eigen::Ref<compas::RowMatrixXd> vertices,
-    Eigen::Ref<compas::RowMatrixXi> faces,
+    compas::Mesh mesh,
     const std::vector<int>& sources,
     const std::vector<double>& isovalues)
 {
     using vertex_descriptor = boost::graph_traits<compas::Mesh>::vertex_descriptor;
     using edge_descriptor = boost::graph_traits<compas::Mesh>::edge_descriptor;
 
-    compas::Mesh mesh = compas::mesh_from_vertices_and_faces(vertices, faces);
     int n_vertices = mesh.number_of_vertices();
 
     auto distance_pmap = mesh.add_property_map<vertex_descriptor, double>("v:distance", 0.0).first;
@@ -288,30 +311,78 @@ pmp_geodesic_isolines(
     return polylines;
 }
 
+std::vector<compas::RowMatrixXd>
+pmp_geodesic_isolines(
+    Eigen::Ref<compas::RowMatrixXd> vertices,
+    Eigen::Ref<compas::RowMatrixXi> faces,
+    const std::vector<int>& sources,
+    const std::vector<double>& isovalues)
+{
+    return pmp_geodesic_isolines(compas::mesh_from_vertices_and_faces(vertices, faces), sources, isovalues);
+}
+
 
 NB_MODULE(_geodesics, m) {
     m.def(
         "heat_geodesic_distances",
-        &pmp_heat_geodesic_distances,
+        nb::overload_cast<Eigen::Ref<compas::RowMatrixXd>, Eigen::Ref<compas::RowMatrixXi>, const std::vector<int>&>(
+            &pmp_heat_geodesic_distances),
         "Compute geodesic distances using CGAL heat method.",
-        "vertices"_a, "faces"_a, "sources"_a);
+        "vertices"_a, "faces"_a, "sources"_a,
+        nb::call_guard<nb::gil_scoped_release>());
+
+    m.def(
+        "heat_geodesic_distances",
+        nb::overload_cast<compas::Mesh, const std::vector<int>&>(&pmp_heat_geodesic_distances),
+        "Compute geodesic distances on a native mesh using CGAL heat method.",
+        "mesh"_a, "sources"_a,
+        nb::call_guard<nb::gil_scoped_release>());
 
     nanobind::class_<HeatGeodesicSolver>(m, "HeatGeodesicSolver",
         "Precomputed heat method solver for repeated geodesic queries.")
         .def(nanobind::init<Eigen::Ref<compas::RowMatrixXd>, Eigen::Ref<compas::RowMatrixXi>>(),
-             "vertices"_a, "faces"_a)
-        .def("solve", &HeatGeodesicSolver::solve, "sources"_a)
+             "vertices"_a, "faces"_a,
+             nb::call_guard<nb::gil_scoped_release>())
+        .def(nanobind::init<compas::Mesh>(),
+             "mesh"_a,
+             nb::call_guard<nb::gil_scoped_release>())
+        .def("solve", &HeatGeodesicSolver::solve, "sources"_a,
+             nb::call_guard<nb::gil_scoped_release>())
         .def_prop_ro("num_vertices", &HeatGeodesicSolver::num_vertices);
 
     m.def(
         "geodesic_isolines_split",
-        &pmp_geodesic_isolines_split,
+        nb::overload_cast<
+            Eigen::Ref<compas::RowMatrixXd>,
+            Eigen::Ref<compas::RowMatrixXi>,
+            const std::vector<int>&,
+            const std::vector<double>&>(&pmp_geodesic_isolines_split),
         "Split mesh into components along geodesic isolines.",
-        "vertices"_a, "faces"_a, "sources"_a, "isovalues"_a);
+        "vertices"_a, "faces"_a, "sources"_a, "isovalues"_a,
+        nb::call_guard<nb::gil_scoped_release>());
+
+    m.def(
+        "geodesic_isolines_split",
+        nb::overload_cast<compas::Mesh, const std::vector<int>&, const std::vector<double>&>(&pmp_geodesic_isolines_split),
+        "Split a native mesh into components along geodesic isolines.",
+        "mesh"_a, "sources"_a, "isovalues"_a,
+        nb::call_guard<nb::gil_scoped_release>());
 
     m.def(
         "geodesic_isolines",
-        &pmp_geodesic_isolines,
+        nb::overload_cast<
+            Eigen::Ref<compas::RowMatrixXd>,
+            Eigen::Ref<compas::RowMatrixXi>,
+            const std::vector<int>&,
+            const std::vector<double>&>(&pmp_geodesic_isolines),
         "Extract isoline polylines from geodesic distance field.",
-        "vertices"_a, "faces"_a, "sources"_a, "isovalues"_a);
+        "vertices"_a, "faces"_a, "sources"_a, "isovalues"_a,
+        nb::call_guard<nb::gil_scoped_release>());
+
+    m.def(
+        "geodesic_isolines",
+        nb::overload_cast<compas::Mesh, const std::vector<int>&, const std::vector<double>&>(&pmp_geodesic_isolines),
+        "Extract isoline polylines from the geodesic distance field of a native mesh.",
+        "mesh"_a, "sources"_a, "isovalues"_a,
+        nb::call_guard<nb::gil_scoped_release>());
 }
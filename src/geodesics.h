@@ -58,4 +58,25 @@ pmp_geodesic_isolines(
     const std::vector<int>& sources,
     const std::vector<double>& isovalues);
 
+// Overloads operating on a native mesh (see `_mesh.CgalMesh`).
+// The heat method and isoline refinement add properties to the mesh,
+// so the native mesh is copied.
+
+compas::RowMatrixXd
+pmp_heat_geodesic_distances(
+    compas::Mesh mesh,
+    const std::vector<int>& sources);
+
+std::tuple<std::vector<compas::RowMatrixXd>, std::vector<compas::RowMatrixXi>>
+pmp_geodesic_isolines_split(
+    compas::Mesh mesh,
+    const std::vector<int>& sources,
+    const std::vector<double>& isovalues);
+
+std::vector<compas::RowMatrixXd>
+pmp_geodesic_isolines(
+    compas::Mesh mesh,
+    const std::vector<int>& sources,
+    const std::vector<double>& isovalues);
+
 // HeatGeodesicSolver class is defined in geodesics.cpp and exposed via nanobind
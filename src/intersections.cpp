@@ -1,5 +1,23 @@
 #include "intersections.h"
 
+#include <array>
+#include <cmath>
+#include <map>
+#include <memory>
+#include <set>
+
+std::vector<compas::RowMatrixXd>
+pmp_intersection_mesh_mesh(
+    const compas::Mesh& mesh_a,
+    const compas::Mesh& mesh_b)
+{
+    compas::Polylines polylines;
+    CGAL::Polygon_mesh_processing::surface_intersection(mesh_a, mesh_b, std::back_inserter(polylines));
+
+    std::vector<compas::RowMatrixXd> result = compas::polylines_to_lists_of_points(polylines);
+    return result;
+}
+
 std::vector<compas::RowMatrixXd>
 pmp_intersection_mesh_mesh(
     Eigen::Ref<const compas::RowMatrixXd> vertices_a,
@@ -9,12 +27,354 @@ pmp_intersection_mesh_mesh(
 {
     compas::Mesh mesh_a = compas::mesh_from_vertices_and_faces(vertices_a, faces_a);
     compas::Mesh mesh_b = compas::mesh_from_vertices_and_faces(vertices_b, faces_b);
+    return pmp_intersection_mesh_mesh(mesh_a, mesh_b);
+}
 
-    compas::Polylines polylines;
-    CGAL::Polygon_mesh_processing::surface_intersection(mesh_a, mesh_b, std::back_inserter(polylines));
+namespace flat {
 
-    std::vector<compas::RowMatrixXd> result = compas::polylines_to_lists_of_points(polylines);
-    return result;
+// Row offsets of the meshes in flat (V, F) arrays with per-mesh row counts.
+struct Offsets
+{
+    std::vector<Eigen::Index> v, f;
+
+    Offsets(
+        Eigen::Ref<const compas::RowMatrixXd> vertices,
+        Eigen::Ref<const compas::RowMatrixXi> faces,
+        const std::vector<int>& mesh_v_counts,
+        const std::vector<int>& mesh_f_counts)
+        : v(mesh_v_counts.size() + 1, 0), f(mesh_v_counts.size() + 1, 0)
+    {
+        const std::size_t n = mesh_v_counts.size();
+        if (mesh_f_counts.size() != n)
+            throw std::invalid_argument("mesh_v_counts and mesh_f_counts must have the same length");
+        for (std::size_t i = 0; i < n; ++i)
+        {
+            if (mesh_v_counts[i] < 0 || mesh_f_counts[i] < 0)
+                throw std::invalid_argument("mesh counts must be non-negative");
+            v[i + 1] = v[i] + mesh_v_counts[i];
+            f[i + 1] = f[i] + mesh_f_counts[i];
+        }
+        if (v[n] != vertices.rows() || f[n] != faces.rows())
+            throw std::invalid_argument("per-mesh counts do not sum to vertices/faces row counts");
+    }
+
+    compas::Mesh mesh(
+        Eigen::Ref<const compas::RowMatrixXd> vertices,
+        Eigen::Ref<const compas::RowMatrixXi> faces,
+        std::size_t i) const
+    {
+        return compas::mesh_from_vertices_and_faces(
+            vertices.middleRows(v[i], v[i + 1] - v[i]),
+            faces.middleRows(f[i], f[i + 1] - f[i]));
+    }
+};
+
+} // namespace flat
+
+namespace collision {
+
+using Box = CGAL::Box_intersection_d::Box_with_info_d<double, 3, std::size_t>;
+
+// Whether a face of `a` intersects the surface of `b`. Faces of a outside
+// the bounding box of b are skipped before the tree of b is queried.
+bool surfaces_intersect(const compas::Mesh& a, const CGAL::Bbox_3& box_b, const compas::FaceTree& tree_b)
+{
+    for (auto f : a.faces())
+    {
+        auto h = a.halfedge(f);
+        compas::Kernel::Triangle_3 triangle(
+            a.point(a.source(h)), a.point(a.target(h)), a.point(a.target(a.next(h))));
+        if (CGAL::do_overlap(triangle.bbox(), box_b) && tree_b.do_intersect(triangle))
+            return true;
+    }
+    return false;
+}
+
+// Whether `inner` lies inside the closed mesh `outer`, given that their
+// surfaces do not intersect, so that one vertex decides.
+bool inside(const compas::Mesh& inner, const compas::Mesh& outer, const compas::FaceTree& tree_outer)
+{
+    if (inner.is_empty() || !CGAL::is_closed(outer))
+        return false;
+    CGAL::Side_of_triangle_mesh<compas::Mesh, compas::Kernel, CGAL::Default, compas::FaceTree> side(tree_outer);
+    return side(inner.point(*inner.vertices().begin())) != CGAL::ON_UNBOUNDED_SIDE;
+}
+
+} // namespace collision
+
+std::tuple<compas::RowMatrixXi, std::vector<std::vector<compas::RowMatrixXd>>>
+pmp_collision_matrix(
+    Eigen::Ref<const compas::RowMatrixXd> vertices,
+    Eigen::Ref<const compas::RowMatrixXi> faces,
+    const std::vector<int>& mesh_v_counts,
+    const std::vector<int>& mesh_f_counts,
+    bool solid,
+    bool return_polylines,
+    int num_threads)
+{
+    const std::size_t n = mesh_v_counts.size();
+    const flat::Offsets offsets(vertices, faces, mesh_v_counts, mesh_f_counts);
+    const std::size_t threads = static_cast<std::size_t>(std::max(num_threads, 0));
+
+    std::vector<compas::Mesh> meshes(n);
+    std::vector<CGAL::Bbox_3> bboxes(n);
+    compas::parallel_for(n, [&](std::size_t i) {
+        meshes[i] = offsets.mesh(vertices, faces, i);
+        if (!meshes[i].is_empty())
+            bboxes[i] = CGAL::Polygon_mesh_processing::bbox(meshes[i]);
+    }, threads);
+
+    // Broad phase: pairs of overlapping bounding boxes.
+    std::vector<collision::Box> boxes;
+    boxes.reserve(n);
+    for (std::size_t i = 0; i < n; ++i)
+        if (!meshes[i].is_empty()) boxes.emplace_back(bboxes[i], i);
+
+    std::vector<std::pair<std::size_t, std::size_t>> candidates;
+    CGAL::box_self_intersection_d(boxes.begin(), boxes.end(),
+        [&](const collision::Box& a, const collision::Box& b) {
+            candidates.emplace_back(std::min(a.info(), b.info()), std::max(a.info(), b.info()));
+        });
+    std::sort(candidates.begin(), candidates.end());
+
+    // One AABB tree per mesh that takes part in a candidate pair.
+    std::vector<char> needed(n, 0);
+    for (auto [i, j] : candidates) needed[i] = needed[j] = 1;
+    std::vector<std::unique_ptr<compas::FaceTree>> trees(n);
+    compas::parallel_for(n, [&](std::size_t i) {
+        if (!needed[i]) return;
+        trees[i] = std::make_unique<compas::FaceTree>(CGAL::faces(meshes[i]).first, CGAL::faces(meshes[i]).second, meshes[i]);
+        trees[i]->build();
+    }, threads);
+
+    // Narrow phase: the faces of the smaller mesh against the tree of the other.
+    std::vector<char> collides(candidates.size(), 0);
+    compas::parallel_for(candidates.size(), [&](std::size_t k) {
+        auto [i, j] = candidates[k];
+        if (meshes[i].number_of_faces() > meshes[j].number_of_faces()) std::swap(i, j);
+        bool hit = collision::surfaces_intersect(meshes[i], bboxes[j], *trees[j]);
+        if (!hit && solid)
+            hit = collision::inside(meshes[i], meshes[j], *trees[j]) || collision::inside(meshes[j], meshes[i], *trees[i]);
+        collides[k] = hit;
+    }, threads);
+
+    std::vector<std::pair<std::size_t, std::size_t>> pairs;
+    for (std::size_t k = 0; k < candidates.size(); ++k)
+        if (collides[k]) pairs.push_back(candidates[k]);
+
+    compas::RowMatrixXi P(static_cast<Eigen::Index>(pairs.size()), 2);
+    for (std::size_t k = 0; k < pairs.size(); ++k)
+    {
+        P(k, 0) = static_cast<int>(pairs[k].first);
+        P(k, 1) = static_cast<int>(pairs[k].second);
+    }
+
+    std::vector<std::vector<compas::RowMatrixXd>> polylines;
+    if (return_polylines)
+    {
+        polylines.resize(pairs.size());
+        compas::parallel_for(pairs.size(), [&](std::size_t k) {
+            compas::Polylines lines;
+            CGAL::Polygon_mesh_processing::surface_intersection(
+                meshes[pairs[k].first], meshes[pairs[k].second], std::back_inserter(lines));
+            polylines[k] = compas::polylines_to_lists_of_points(lines);
+        }, threads);
+    }
+
+    return std::make_tuple(std::move(P), std::move(polylines));
+}
+
+namespace sections {
+
+// Merges points closer than `tolerance`. The end of a segment on an edge of
+// B is computed once for each of the two faces of the edge, and the two
+// constructions may differ in the last bits.
+class PointMerger
+{
+public:
+    explicit PointMerger(double tolerance) : tolerance_(tolerance) {}
+
+    int insert(const compas::Point& p)
+    {
+        const std::array<long long, 3> key = cell(p);
+        for (long long dx = -1; dx <= 1; ++dx)
+            for (long long dy = -1; dy <= 1; ++dy)
+                for (long long dz = -1; dz <= 1; ++dz)
+                {
+                    auto it = grid_.find({key[0] + dx, key[1] + dy, key[2] + dz});
+                    if (it == grid_.end()) continue;
+                    for (int id : it->second)
+                        if (CGAL::squared_distance(points_[id], p) <= tolerance_ * tolerance_)
+                            return id;
+                }
+        const int id = static_cast<int>(points_.size());
+        points_.push_back(p);
+        grid_[key].push_back(id);
+        return id;
+    }
+
+    const compas::Point& point(int id) const { return points_[id]; }
+
+private:
+    std::array<long long, 3> cell(const compas::Point& p) const
+    {
+        return {static_cast<long long>(std::floor(p.x() / tolerance_)),
+                static_cast<long long>(std::floor(p.y() / tolerance_)),
+                static_cast<long long>(std::floor(p.z() / tolerance_))};
+    }
+
+    double tolerance_;
+    std::vector<compas::Point> points_;
+    std::map<std::array<long long, 3>, std::vector<int>> grid_;
+};
+
+struct Segment
+{
+    int u, v;
+    int face_a, face_b;
+};
+
+// Chain segments into polylines: open chains run between points that do not
+// have exactly two segments, the remaining segments form closed loops.
+void chain(
+    const std::vector<Segment>& segments,
+    const PointMerger& points,
+    std::vector<compas::RowMatrixXd>& polylines,
+    std::vector<compas::RowMatrixXi>& tags)
+{
+    std::map<int, std::vector<int>> incident;
+    for (int k = 0; k < static_cast<int>(segments.size()); ++k)
+    {
+        incident[segments[k].u].push_back(k);
+        incident[segments[k].v].push_back(k);
+    }
+
+    std::vector<char> used(segments.size(), 0);
+    auto walk = [&](int start, int k) {
+        std::vector<int> nodes{start};
+        std::vector<int> path;
+        int node = start;
+        while (k >= 0 && !used[k])
+        {
+            used[k] = 1;
+            path.push_back(k);
+            node = segments[k].u == node ? segments[k].v : segments[k].u;
+            nodes.push_back(node);
+            k = -1;
+            const auto& next = incident[node];
+            if (next.size() == 2)
+                for (int e : next)
+                    if (!used[e]) k = e;
+        }
+
+        compas::RowMatrixXd P(static_cast<Eigen::Index>(nodes.size()), 3);
+        for (std::size_t r = 0; r < nodes.size(); ++r)
+        {
+            const compas::Point& p = points.point(nodes[r]);
+            P(r, 0) = p.x();
+            P(r, 1) = p.y();
+            P(r, 2) = p.z();
+        }
+        compas::RowMatrixXi T(static_cast<Eigen::Index>(path.size()), 2);
+        for (std::size_t r = 0; r < path.size(); ++r)
+        {
+            T(r, 0) = segments[path[r]].face_a;
+            T(r, 1) = segments[path[r]].face_b;
+        }
+        polylines.push_back(std::move(P));
+        tags.push_back(std::move(T));
+    };
+
+    for (const auto& [node, edges] : incident)
+        if (edges.size() != 2)
+            for (int k : edges)
+                if (!used[k]) walk(node, k);
+
+    for (int k = 0; k < static_cast<int>(segments.size()); ++k)
+        if (!used[k]) walk(segments[k].u, k);
+}
+
+} // namespace sections
+
+std::tuple<std::vector<std::vector<compas::RowMatrixXd>>, std::vector<std::vector<compas::RowMatrixXi>>>
+pmp_intersection_mesh_meshes(
+    const compas::Mesh& mesh_a,
+    Eigen::Ref<const compas::RowMatrixXd> vertices,
+    Eigen::Ref<const compas::RowMatrixXi> faces,
+    const std::vector<int>& mesh_v_counts,
+    const std::vector<int>& mesh_f_counts,
+    int num_threads)
+{
+    const std::size_t n = mesh_v_counts.size();
+    const flat::Offsets offsets(vertices, faces, mesh_v_counts, mesh_f_counts);
+
+    std::vector<std::vector<compas::RowMatrixXd>> polylines(n);
+    std::vector<std::vector<compas::RowMatrixXi>> tags(n);
+    if (mesh_a.is_empty())
+        return std::make_tuple(std::move(polylines), std::move(tags));
+
+    const CGAL::Bbox_3 box_a = CGAL::Polygon_mesh_processing::bbox(mesh_a);
+    compas::FaceTree tree(CGAL::faces(mesh_a).first, CGAL::faces(mesh_a).second, mesh_a);
+    tree.build();
+
+    using Triangle = compas::Kernel::Triangle_3;
+    using Result = compas::FaceTree::Intersection_and_primitive_id<Triangle>::Type;
+
+    compas::parallel_for(n, [&](std::size_t i) {
+        compas::Mesh b = offsets.mesh(vertices, faces, i);
+        if (b.is_empty()) return;
+        const CGAL::Bbox_3 box_b = CGAL::Polygon_mesh_processing::bbox(b);
+        if (!CGAL::do_overlap(box_a, box_b)) return;
+
+        const CGAL::Bbox_3 box = box_a + box_b;
+        const double diagonal = std::sqrt(
+            CGAL::square(box.xmax() - box.xmin()) +
+            CGAL::square(box.ymax() - box.ymin()) +
+            CGAL::square(box.zmax() - box.zmin()));
+        sections::PointMerger points(std::max(diagonal, 1.0) * 1e-9);
+
+        std::vector<sections::Segment> segments;
+        std::set<std::pair<int, int>> seen;
+        std::vector<Result> results;
+        for (auto f : b.faces())
+        {
+            auto h = b.halfedge(f);
+            Triangle triangle(b.point(b.source(h)), b.point(b.target(h)), b.point(b.target(b.next(h))));
+            if (!CGAL::do_overlap(triangle.bbox(), box_a)) continue;
+
+            results.clear();
+            tree.all_intersections(triangle, std::back_inserter(results));
+            for (const auto& [object, face_a] : results)
+            {
+                const auto* segment = std::get_if<compas::Kernel::Segment_3>(&object);
+                if (!segment) continue;
+                const int u = points.insert(segment->source());
+                const int v = points.insert(segment->target());
+                // A segment along an edge of A is found from both faces of the edge.
+                if (u == v || !seen.insert({std::min(u, v), std::max(u, v)}).second) continue;
+                segments.push_back({u, v, static_cast<int>(face_a.idx()), static_cast<int>(f.idx())});
+            }
+        }
+
+        sections::chain(segments, points, polylines[i], tags[i]);
+    }, static_cast<std::size_t>(std::max(num_threads, 0)));
+
+    return std::make_tuple(std::move(polylines), std::move(tags));
+}
+
+std::tuple<std::vector<std::vector<compas::RowMatrixXd>>, std::vector<std::vector<compas::RowMatrixXi>>>
+pmp_intersection_mesh_meshes(
+    Eigen::Ref<const compas::RowMatrixXd> vertices_a,
+    Eigen::Ref<const compas::RowMatrixXi> faces_a,
+    Eigen::Ref<const compas::RowMatrixXd> vertices,
+    Eigen::Ref<const compas::RowMatrixXi> faces,
+    const std::vector<int>& mesh_v_counts,
+    const std::vector<int>& mesh_f_counts,
+    int num_threads)
+{
+    return pmp_intersection_mesh_meshes(
+        compas::mesh_from_vertices_and_faces(vertices_a, faces_a),
+        vertices, faces, mesh_v_counts, mesh_f_counts, num_threads);
 }
 
 NB_MODULE(_intersections, m) {
@@ -22,10 +382,77 @@ NB_MODULE(_intersections, m) {
 
     m.def(
         "intersection_mesh_mesh",
-        &pmp_intersection_mesh_mesh,
+        nb::overload_cast<
+            Eigen::Ref<const compas::RowMatrixXd>,
+            Eigen::Ref<const compas::RowMatrixXi>,
+            Eigen::Ref<const compas::RowMatrixXd>,
+            Eigen::Ref<const compas::RowMatrixXi>>(&pmp_intersection_mesh_mesh),
         "Compute intersection polylines between two triangle meshes.",
         "vertices_a"_a,
         "faces_a"_a,
         "vertices_b"_a,
-        "faces_b"_a);
-}
\ No newline at end of file
+        "faces_b"_a,
+        nb::call_guard<nb::gil_scoped_release>());
+
+    m.def(
+        "intersection_mesh_mesh",
+        nb::overload_cast<const compas::Mesh&, const compas::Mesh&>(&pmp_intersection_mesh_mesh),
+        "Compute intersection polylines between two native triangle meshes.",
+        "mesh_a"_a,
+        "mesh_b"_a,
+        nb::call_guard<nb::gil_scoped_release>());
+
+    m.def(
+        "collision_matrix",
+        &pmp_collision_matrix,
+        "Find the pairs of colliding meshes among many meshes, passed as flat (V, F) arrays "
+        "plus per-mesh row counts. Returns the sorted (i, j) pairs with i < j, and the "
+        "intersection polylines of every pair if requested.",
+        "vertices"_a,
+        "faces"_a,
+        "mesh_v_counts"_a,
+        "mesh_f_counts"_a,
+        "solid"_a = false,
+        "return_polylines"_a = false,
+        "num_threads"_a = 0,
+        nb::call_guard<nb::gil_scoped_release>());
+
+    m.def(
+        "intersection_mesh_meshes",
+        nb::overload_cast<
+            Eigen::Ref<const compas::RowMatrixXd>,
+            Eigen::Ref<const compas::RowMatrixXi>,
+            Eigen::Ref<const compas::RowMatrixXd>,
+            Eigen::Ref<const compas::RowMatrixXi>,
+            const std::vector<int>&,
+            const std::vector<int>&,
+            int>(&pmp_intersection_mesh_meshes),
+        "Intersect mesh A with many meshes B_i, passed as flat (V, F) arrays plus per-mesh "
+        "row counts. Returns per B_i the polylines and the (face of A, face of B_i) of every segment.",
+        "vertices_a"_a,
+        "faces_a"_a,
+        "vertices"_a,
+        "faces"_a,
+        "mesh_v_counts"_a,
+        "mesh_f_counts"_a,
+        "num_threads"_a = 0,
+        nb::call_guard<nb::gil_scoped_release>());
+
+    m.def(
+        "intersection_mesh_meshes",
+        nb::overload_cast<
+            const compas::Mesh&,
+            Eigen::Ref<const compas::RowMatrixXd>,
+            Eigen::Ref<const compas::RowMatrixXi>,
+            const std::vector<int>&,
+            const std::vector<int>&,
+            int>(&pmp_intersection_mesh_meshes),
+        "Intersect native mesh A with many meshes B_i.",
+        "mesh_a"_a,
+        "vertices"_a,
+        "faces"_a,
+        "mesh_v_counts"_a,
+        "mesh_f_counts"_a,
+        "num_threads"_a = 0,
+        nb::call_guard<nb::gil_scoped_release>());
+}
@@ -4,6 +4,9 @@
 
 // CGAL intersection
 #include <CGAL/Polygon_mesh_processing/intersection.h>
+#include <CGAL/Polygon_mesh_processing/bbox.h>
+#include <CGAL/Side_of_triangle_mesh.h>
+#include <CGAL/box_intersection_d.h>
 
 /**
  * Compute intersection between two triangle meshes.
@@ -21,4 +24,87 @@ pmp_intersection_mesh_mesh(
     Eigen::Ref<const compas::RowMatrixXd> vertices_a,
     Eigen::Ref<const compas::RowMatrixXi> faces_a,
     Eigen::Ref<const compas::RowMatrixXd> vertices_b,
-    Eigen::Ref<const compas::RowMatrixXi> faces_b);
\ No newline at end of file
+    Eigen::Ref<const compas::RowMatrixXi> faces_b);
+
+/**
+ * Compute intersection between two native triangle meshes.
+ *
+ * @param mesh_a Mesh A
+ * @param mesh_b Mesh B
+ * @return std::vector<RowMatrixXd> containing:
+ *         - List of intersection polylines, each as Rx3 matrix of points (float64)
+ * @note Input meshes must be manifold and closed
+ */
+std::vector<compas::RowMatrixXd>
+pmp_intersection_mesh_mesh(
+    const compas::Mesh& mesh_a,
+    const compas::Mesh& mesh_b);
+
+/**
+ * Find the pairs of meshes that collide among many triangle meshes.
+ *
+ * The meshes are passed as flat arrays: mesh i occupies the next
+ * mesh_v_counts[i] rows of `vertices` and mesh_f_counts[i] rows of `faces`,
+ * with mesh-local face indices. Candidate pairs come from a box
+ * intersection search over the bounding boxes of all meshes. Each candidate
+ * is then tested in parallel: the faces of one mesh against the AABB tree
+ * of the other, with one tree built per mesh and shared by all its pairs.
+ *
+ * @param vertices Vertices of all meshes as Nx3 matrix in row-major order (float64)
+ * @param faces Faces of all meshes as Mx3 matrix in row-major order (int32)
+ * @param mesh_v_counts Number of vertices of every mesh
+ * @param mesh_f_counts Number of faces of every mesh
+ * @param solid If true, closed meshes also collide if one is inside the other
+ * @param return_polylines If true, also compute the intersection polylines of every colliding pair
+ * @param num_threads Number of threads; 0 uses the hardware concurrency
+ * @return std::tuple containing:
+ *         - Kx2 matrix of the indices (i < j) of the colliding meshes, sorted
+ *         - Per pair, the intersection polylines (empty if not requested)
+ */
+std::tuple<compas::RowMatrixXi, std::vector<std::vector<compas::RowMatrixXd>>>
+pmp_collision_matrix(
+    Eigen::Ref<const compas::RowMatrixXd> vertices,
+    Eigen::Ref<const compas::RowMatrixXi> faces,
+    const std::vector<int>& mesh_v_counts,
+    const std::vector<int>& mesh_f_counts,
+    bool solid = false,
+    bool return_polylines = false,
+    int num_threads = 0);
+
+/**
+ * Intersect one triangle mesh with many others.
+ *
+ * The AABB tree of A is built once and shared by all B_i, which are
+ * processed in parallel. Every face of B_i is intersected with the faces of
+ * A found by the tree, and the resulting segments are chained into
+ * polylines. Each segment is tagged with the face of A and the face of B_i
+ * that it lies on. Coplanar overlaps of faces are not reported.
+ *
+ * @param mesh_a Mesh A
+ * @param vertices Vertices of all B_i as Nx3 matrix in row-major order (float64)
+ * @param faces Faces of all B_i as Mx3 matrix in row-major order (int32), with mesh-local indices
+ * @param mesh_v_counts Number of vertices of every B_i
+ * @param mesh_f_counts Number of faces of every B_i
+ * @param num_threads Number of threads; 0 uses the hardware concurrency
+ * @return std::tuple containing, per B_i:
+ *         - The intersection polylines, each as Rx3 matrix of points (float64)
+ *         - Per polyline, an (R-1)x2 matrix of the (face of A, face of B_i) of every segment
+ */
+std::tuple<std::vector<std::vector<compas::RowMatrixXd>>, std::vector<std::vector<compas::RowMatrixXi>>>
+pmp_intersection_mesh_meshes(
+    const compas::Mesh& mesh_a,
+    Eigen::Ref<const compas::RowMatrixXd> vertices,
+    Eigen::Ref<const compas::RowMatrixXi> faces,
+    const std::vector<int>& mesh_v_counts,
+    const std::vector<int>& mesh_f_counts,
+    int num_threads = 0);
+
+std::tuple<std::vector<std::vector<compas::RowMatrixXd>>, std::vector<std::vector<compas::RowMatrixXi>>>
+pmp_intersection_mesh_meshes(
+    Eigen::Ref<const compas::RowMatrixXd> vertices_a,
+    Eigen::Ref<const compas::RowMatrixXi> faces_a,
+    Eigen::Ref<const compas::RowMatrixXd> vertices,
+    Eigen::Ref<const compas::RowMatrixXi> faces,
+    const std::vector<int>& mesh_v_counts,
+    const std::vector<int>& mesh_f_counts,
+    int num_threads = 0);
@@ -171,5 +171,6 @@ NB_MODULE(_isolines, m) {
         "isolines",
         &pmp_isolines,
         "Extract isoline polylines from vertex scalar field.",
-        "vertices"_a, "faces"_a, "scalars"_a, "isovalues"_a, "refine"_a = 0);
+        "vertices"_a, "faces"_a, "scalars"_a, "isovalues"_a, "refine"_a = 0,
+        nb::call_guard<nb::gil_scoped_release>());
 }
@@ -1,13 +1,24 @@
 #include "measure.h"
 
+double
+pmp_area(const compas::Mesh& mesh)
+{
+    return CGAL::Polygon_mesh_processing::area(mesh);
+}
+
 double
 pmp_area(
     Eigen::Ref<const compas::RowMatrixXd> vertices,
     Eigen::Ref<const compas::RowMatrixXi> faces)
 {
     compas::Mesh mesh = compas::mesh_from_vertices_and_faces(vertices, faces);
-    double area = CGAL::Polygon_mesh_processing::area(mesh);
-    return area;
+    return pmp_area(mesh);
+}
+
+double
+pmp_volume(const compas::Mesh& mesh)
+{
+    return CGAL::Polygon_mesh_processing::volume(mesh);
 }
 
 double
@@ -16,9 +27,14 @@ pmp_volume(
     Eigen::Ref<const compas::RowMatrixXi> faces)
 {
     compas::Mesh mesh = compas::mesh_from_vertices_and_faces(vertices, faces);
-    double volume = CGAL::Polygon_mesh_processing::volume(mesh);
-    int a = 0;
-    return volume;
+    return pmp_volume(mesh);
+}
+
+std::vector<double>
+pmp_centroid(const compas::Mesh& mesh)
+{
+    compas::Kernel::Point_3 centroid = CGAL::Polygon_mesh_processing::centroid(mesh);
+    return std::vector<double>{centroid.x(), centroid.y(), centroid.z()};
 }
 
 std::vector<double>
@@ -27,8 +43,7 @@ pmp_centroid(
     Eigen::Ref<const compas::RowMatrixXi> faces)
 {
     compas::Mesh mesh = compas::mesh_from_vertices_and_faces(vertices, faces);
-    compas::Kernel::Point_3 centroid = CGAL::Polygon_mesh_processing::centroid(mesh);
-    return std::vector<double>{centroid.x(), centroid.y(), centroid.z()};
+    return pmp_centroid(mesh);
 }
 
 
@@ -37,22 +52,46 @@ NB_MODULE(_measure, m) {
 
     m.def(
         "area",
-        &pmp_area,
+        nb::overload_cast<Eigen::Ref<const compas::RowMatrixXd>, Eigen::Ref<const compas::RowMatrixXi>>(&pmp_area),
         "Calculate the surface area of a mesh",
         "vertices"_a,
-        "faces"_a);
+        "faces"_a,
+        nb::call_guard<nb::gil_scoped_release>());
+
+    m.def(
+        "area",
+        nb::overload_cast<const compas::Mesh&>(&pmp_area),
+        "Calculate the surface area of a native mesh",
+        "mesh"_a,
+        nb::call_guard<nb::gil_scoped_release>());
 
     m.def(
         "volume",
-        &pmp_volume,
+        nb::overload_cast<Eigen::Ref<const compas::RowMatrixXd>, Eigen::Ref<const compas::RowMatrixXi>>(&pmp_volume),
         "Calculate the volume enclosed by a mesh",
         "vertices"_a,
-        "faces"_a);
+        "faces"_a,
+        nb::call_guard<nb::gil_scoped_release>());
+
+    m.def(
+        "volume",
+        nb::overload_cast<const compas::Mesh&>(&pmp_volume),
+        "Calculate the volume enclosed by a native mesh",
+        "mesh"_a,
+        nb::call_guard<nb::gil_scoped_release>());
 
     m.def(
         "centroid",
-        &pmp_centroid,
+        nb::overload_cast<Eigen::Ref<const compas::RowMatrixXd>, Eigen::Ref<const compas::RowMatrixXi>>(&pmp_centroid),
         "Calculate the centroid of a mesh",
         "vertices"_a,
-        "faces"_a);
-}
\ No newline at end of file
+        "faces"_a,
+        nb::call_guard<nb::gil_scoped_release>());
+
+    m.def(
+        "centroid",
+        nb::overload_cast<const compas::Mesh&>(&pmp_centroid),
+        "Calculate the centroid of a native mesh",
+        "mesh"_a,
+        nb::call_guard<nb::gil_scoped_release>());
+}
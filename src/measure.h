@@ -18,6 +18,15 @@ pmp_area(
     Eigen::Ref<const compas::RowMatrixXd> vertices,
     Eigen::Ref<const compas::RowMatrixXi> faces);
 
+/**
+ * @brief Computes the surface area of a native triangle mesh.
+ *
+ * @param mesh The mesh
+ * @return double The total surface area of the mesh
+ */
+double
+pmp_area(const compas::Mesh& mesh);
+
 /**
  * @brief Computes the volume of a closed triangle mesh.
  * 
@@ -30,6 +39,15 @@ pmp_volume(
     Eigen::Ref<const compas::RowMatrixXd> vertices,
     Eigen::Ref<const compas::RowMatrixXi> faces);
 
+/**
+ * @brief Computes the volume of a closed native triangle mesh.
+ *
+ * @param mesh The mesh
+ * @return double The volume enclosed by the mesh
+ */
+double
+pmp_volume(const compas::Mesh& mesh);
+
 /**
  * @brief Computes the centroid (center of mass) of a triangle mesh.
  * 
@@ -41,3 +59,12 @@ std::vector<double>
 pmp_centroid(
     Eigen::Ref<const compas::RowMatrixXd> vertices,
     Eigen::Ref<const compas::RowMatrixXi> faces);
+
+/**
+ * @brief Computes the centroid (center of mass) of a native triangle mesh.
+ *
+ * @param mesh The mesh
+ * @return std::vector<double> A vector containing the x,y,z coordinates of the mesh centroid
+ */
+std::vector<double>
+pmp_centroid(const compas::Mesh& mesh);
@@ -0,0 +1,42 @@
+#include "compas.h"
+
+// The `CgalMesh` binding wraps `compas::Mesh` (a CGAL Surface_mesh) directly,
+// so that a mesh converted once from (V, F) can be passed to every other
+// module without rebuilding its halfedge structure. Bindings that only read
+// the mesh take it by `const compas::Mesh&`; bindings that modify their input
+// (corefinement, remeshing, subdivision, ...) take it by value, which copies
+// the property arrays instead of rebuilding the connectivity.
+//
+// A `CgalMesh` may be shared between Python threads: the bindings release the
+// GIL and only ever read it, or copy it before modifying.
+//
+// nanobind shares bound types between extension modules, so `_mesh` only has
+// to be imported once before any other binding receives a `compas::Mesh`.
+
+NB_MODULE(_mesh, m) {
+
+    nb::class_<compas::Mesh>(m, "CgalMesh",
+        "Triangle mesh stored as a CGAL Surface_mesh.")
+        .def(
+            "__init__",
+            [](compas::Mesh* self,
+               Eigen::Ref<const compas::RowMatrixXd> vertices,
+               Eigen::Ref<const compas::RowMatrixXi> faces)
+            {
+                new (self) compas::Mesh(compas::mesh_from_vertices_and_faces(vertices, faces));
+            },
+            "vertices"_a,
+            "faces"_a,
+            nb::call_guard<nb::gil_scoped_release>())
+        .def(
+            "to_vertices_and_faces",
+            [](const compas::Mesh& mesh) { return compas::mesh_to_vertices_and_faces(mesh); },
+            "Convert the mesh back to (V, F) arrays.",
+            nb::call_guard<nb::gil_scoped_release>())
+        .def_prop_ro(
+            "number_of_vertices",
+            [](const compas::Mesh& mesh) { return mesh.number_of_vertices(); })
+        .def_prop_ro(
+            "number_of_faces",
+            [](const compas::Mesh& mesh) { return mesh.number_of_faces(); });
+}
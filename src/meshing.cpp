@@ -7,6 +7,7 @@
 #include <CGAL/Polygon_mesh_processing/compute_normal.h>
  
 #include <iostream>
+#include <memory>
 #include <fstream>
  
 #include <boost/graph/filtered_graph.hpp>
@@ -39,16 +40,11 @@ typedef boost::graph_traits<Dual>::edge_descriptor     edge_descriptor;
 
 std::tuple<compas::RowMatrixXd, compas::RowMatrixXi>
 pmp_trimesh_remesh(
-    Eigen::Ref<const compas::RowMatrixXd> vertices_a,
-    Eigen::Ref<const compas::RowMatrixXi> faces_a,
+    compas::Mesh mesh_a,
     double target_edge_length,
     unsigned int number_of_iterations,
     bool do_project)
 {
-    // Convert input matrices to CGAL mesh and keep a copy for projection
-    compas::Mesh original_mesh = compas::mesh_from_vertices_and_faces(vertices_a, faces_a);
-    compas::Mesh mesh_a = compas::mesh_from_vertices_and_faces(vertices_a, faces_a);
-
     // Perform isotropic remeshing
     CGAL::Polygon_mesh_processing::isotropic_remeshing(
         faces(mesh_a),
@@ -65,6 +61,21 @@ pmp_trimesh_remesh(
     return compas::mesh_to_vertices_and_faces(mesh_a);
 }
 
+std::tuple<compas::RowMatrixXd, compas::RowMatrixXi>
+pmp_trimesh_remesh(
+    Eigen::Ref<const compas::RowMatrixXd> vertices_a,
+    Eigen::Ref<const compas::RowMatrixXi> faces_a,
+    double target_edge_length,
+    unsigned int number_of_iterations,
+    bool do_project)
+{
+    return pmp_trimesh_remesh(
+        compas::mesh_from_vertices_and_faces(vertices_a, faces_a),
+        target_edge_length,
+        number_of_iterations,
+        do_project);
+}
+
 
 
 // Calculate face normals for a mesh using CGAL's Polygon Mesh Processing
@@ -137,8 +148,7 @@ compas::RowMatrixXi,
 compas::RowMatrixXd,
 std::vector<std::vector<int>>>
 pmp_trimesh_remesh_dual(
-    Eigen::Ref<const compas::RowMatrixXd> vertices_a,
-    Eigen::Ref<const compas::RowMatrixXi> faces_a,
+    compas::Mesh mesh_a,
     const std::vector<int>& fixed_vertices,
     double length_factor,
     unsigned int number_of_iterations,
@@ -147,9 +157,8 @@ pmp_trimesh_remesh_dual(
 )
 {
 
-    // Convert input matrices to CGAL mesh and keep a copy for projection
-    compas::Mesh original_mesh = compas::mesh_from_vertices_and_faces(vertices_a, faces_a);
-    compas::Mesh mesh_a = compas::mesh_from_vertices_and_faces(vertices_a, faces_a);
+    // Keep a copy of the input mesh for projection
+    compas::Mesh original_mesh = mesh_a;
     
     // Calculate average edge length
     double average_length = 0.0;
@@ -177,13 +186,9 @@ pmp_trimesh_remesh_dual(
     fixed_points.reserve(fixed_vertices.size()); // Pre-allocate for performance
     
     for (const auto& idx : fixed_vertices) {
-        if (idx >= 0 && idx < vertices_a.rows()) {
-            // Get directly from the input Eigen matrix
-            fixed_points.emplace_back(
-                vertices_a(idx, 0), 
-                vertices_a(idx, 1), 
-                vertices_a(idx, 2)
-            );
+        if (idx >= 0 && idx < static_cast<int>(mesh_a.number_of_vertices())) {
+            // Vertex indices match the row order of the input vertices
+            fixed_points.push_back(mesh_a.point(compas::Mesh::Vertex_index(idx)));
         }
     }
 
@@ -692,17 +697,35 @@ pmp_trimesh_remesh_dual(
 
 }
 
-void pmp_pull(
+std::tuple<
+compas::RowMatrixXd,
+compas::RowMatrixXi,
+compas::RowMatrixXd,
+std::vector<std::vector<int>>>
+pmp_trimesh_remesh_dual(
     Eigen::Ref<const compas::RowMatrixXd> vertices_a,
     Eigen::Ref<const compas::RowMatrixXi> faces_a,
+    const std::vector<int>& fixed_vertices,
+    double length_factor,
+    unsigned int number_of_iterations,
+    double angle_radians,
+    double scale_factor
+)
+{
+    return pmp_trimesh_remesh_dual(
+        compas::mesh_from_vertices_and_faces(vertices_a, faces_a),
+        fixed_vertices,
+        length_factor,
+        number_of_iterations,
+        angle_radians,
+        scale_factor);
+}
+
+void pmp_pull(
+    const compas::Mesh& mesh_a,
     Eigen::Ref<compas::RowMatrixXd> vertices_b,
     Eigen::Ref<compas::RowMatrixXd> normals_b)
 {
-    /////////////////////////////////////////////////////////////////////////////////
-    // Mesh Creation
-    /////////////////////////////////////////////////////////////////////////////////
-    compas::Mesh mesh_a = compas::mesh_from_vertices_and_faces(vertices_a, faces_a);
-
     // After scaling, use proper AABB tree for projection
     // Define triangle type
     typedef CGAL::Kernel_traits<CGAL::Point_3<compas::Kernel>>::Kernel K;
@@ -821,17 +844,24 @@ void pmp_pull(
     }
 }
 
-
-void pmp_project(
+void pmp_pull(
     Eigen::Ref<const compas::RowMatrixXd> vertices_a,
     Eigen::Ref<const compas::RowMatrixXi> faces_a,
-    Eigen::Ref<compas::RowMatrixXd> vertices_b)
+    Eigen::Ref<compas::RowMatrixXd> vertices_b,
+    Eigen::Ref<compas::RowMatrixXd> normals_b)
 {
     /////////////////////////////////////////////////////////////////////////////////
     // Mesh Creation
     /////////////////////////////////////////////////////////////////////////////////
     compas::Mesh mesh_a = compas::mesh_from_vertices_and_faces(vertices_a, faces_a);
+    pmp_pull(mesh_a, vertices_b, normals_b);
+}
+
 
+void pmp_project(
+    const compas::Mesh& mesh_a,
+    Eigen::Ref<compas::RowMatrixXd> vertices_b)
+{
     // After scaling, use proper AABB tree for projection
     // Define triangle type
     typedef CGAL::Kernel_traits<CGAL::Point_3<compas::Kernel>>::Kernel K;
@@ -879,21 +909,194 @@ void pmp_project(
     }
 }
 
+void pmp_project(
+    Eigen::Ref<const compas::RowMatrixXd> vertices_a,
+    Eigen::Ref<const compas::RowMatrixXi> faces_a,
+    Eigen::Ref<compas::RowMatrixXd> vertices_b)
+{
+    /////////////////////////////////////////////////////////////////////////////////
+    // Mesh Creation
+    /////////////////////////////////////////////////////////////////////////////////
+    compas::Mesh mesh_a = compas::mesh_from_vertices_and_faces(vertices_a, faces_a);
+    pmp_project(mesh_a, vertices_b);
+}
+
+class ClosestPointQuery {
+public:
+    using Inside = CGAL::Side_of_triangle_mesh<compas::Mesh, compas::Kernel, CGAL::Default, compas::FaceTree>;
+
+    ClosestPointQuery(
+        Eigen::Ref<const compas::RowMatrixXd> vertices,
+        Eigen::Ref<const compas::RowMatrixXi> faces)
+        : ClosestPointQuery(compas::mesh_from_vertices_and_faces(vertices, faces))
+    {}
+
+    ClosestPointQuery(compas::Mesh mesh)
+        : mesh_(std::move(mesh)),
+          tree_(CGAL::faces(mesh_).first, CGAL::faces(mesh_).second, mesh_),
+          is_closed_(CGAL::is_closed(mesh_))
+    {
+        tree_.build();
+        tree_.accelerate_distance_queries();
+        if (is_closed_)
+            inside_ = std::make_unique<Inside>(tree_);
+    }
+
+    std::tuple<compas::RowMatrixXd, compas::RowMatrixXi, compas::RowMatrixXd, compas::RowMatrixXd>
+    query(
+        Eigen::Ref<const compas::RowMatrixXd> points,
+        bool is_signed,
+        int num_threads) const
+    {
+        if (points.cols() != 3)
+            throw std::invalid_argument("points must have 3 columns");
+        if (is_signed && !is_closed_)
+            throw std::invalid_argument("signed distances require a closed mesh");
+        if (mesh_.is_empty())
+            throw std::invalid_argument("the mesh has no faces");
+
+        const Eigen::Index n = points.rows();
+        compas::RowMatrixXd closest(n, 3);
+        compas::RowMatrixXi face_ids(n, 1);
+        compas::RowMatrixXd barycentrics(n, 3);
+        compas::RowMatrixXd distances(n, 1);
+
+        compas::parallel_for_row_blocks(n, num_threads, [&](Eigen::Index begin, Eigen::Index end) {
+            for (Eigen::Index i = begin; i < end; ++i)
+            {
+                const compas::Point point(points(i, 0), points(i, 1), points(i, 2));
+                const auto [p, face] = tree_.closest_point_and_primitive(point);
+                const auto weights = compas::barycentric_coordinates(mesh_, face, p);
+
+                double distance = std::sqrt(CGAL::squared_distance(point, p));
+                if (is_signed && (*inside_)(point) == CGAL::ON_BOUNDED_SIDE)
+                    distance = -distance;
+
+                closest.row(i) << p.x(), p.y(), p.z();
+                face_ids(i, 0) = static_cast<int>(face.idx());
+                barycentrics.row(i) << weights[0], weights[1], weights[2];
+                distances(i, 0) = distance;
+            }
+        });
+
+        return std::make_tuple(std::move(closest), std::move(face_ids), std::move(barycentrics), std::move(distances));
+    }
+
+    // Side of the mesh of every point: 1 inside, 0 on the surface, -1 outside.
+    compas::RowMatrixXi side(
+        Eigen::Ref<const compas::RowMatrixXd> points,
+        int num_threads) const
+    {
+        if (points.cols() != 3)
+            throw std::invalid_argument("points must have 3 columns");
+        if (!is_closed_)
+            throw std::invalid_argument("inside tests require a closed mesh");
+        if (mesh_.is_empty())
+            throw std::invalid_argument("the mesh has no faces");
+
+        const Eigen::Index n = points.rows();
+        compas::RowMatrixXi sides(n, 1);
+        compas::parallel_for_row_blocks(n, num_threads, [&](Eigen::Index begin, Eigen::Index end) {
+            for (Eigen::Index i = begin; i < end; ++i)
+            {
+                switch ((*inside_)(compas::Point(points(i, 0), points(i, 1), points(i, 2))))
+                {
+                case CGAL::ON_BOUNDED_SIDE: sides(i, 0) = 1; break;
+                case CGAL::ON_BOUNDARY: sides(i, 0) = 0; break;
+                default: sides(i, 0) = -1;
+                }
+            }
+        });
+        return sides;
+    }
+
+    // Signed distances at the nodes of a regular grid, without materializing
+    // the nodes. Node (i, j, k) is `origin + (i, j, k) * spacing` and is stored
+    // at row (i * ny + j) * nz + k.
+    compas::RowMatrixXd signed_distance_grid(
+        const std::vector<double>& origin,
+        const std::vector<double>& spacing,
+        const std::vector<int>& counts,
+        int num_threads) const
+    {
+        if (origin.size() != 3 || spacing.size() != 3 || counts.size() != 3)
+            throw std::invalid_argument("origin, spacing and counts must have 3 components");
+        if (counts[0] < 0 || counts[1] < 0 || counts[2] < 0)
+            throw std::invalid_argument("counts must be non-negative");
+        if (!is_closed_)
+            throw std::invalid_argument("signed distances require a closed mesh");
+        if (mesh_.is_empty())
+            throw std::invalid_argument("the mesh has no faces");
+
+        const Eigen::Index ny = counts[1], nz = counts[2];
+        const Eigen::Index n = static_cast<Eigen::Index>(counts[0]) * ny * nz;
+        compas::RowMatrixXd distances(n, 1);
+        compas::parallel_for_row_blocks(n, num_threads, [&](Eigen::Index begin, Eigen::Index end) {
+            for (Eigen::Index r = begin; r < end; ++r)
+            {
+                const Eigen::Index i = r / (ny * nz), j = (r / nz) % ny, k = r % nz;
+                const compas::Point point(
+                    origin[0] + static_cast<double>(i) * spacing[0],
+                    origin[1] + static_cast<double>(j) * spacing[1],
+                    origin[2] + static_cast<double>(k) * spacing[2]);
+                const double distance = std::sqrt(CGAL::squared_distance(point, tree_.closest_point(point)));
+                distances(r, 0) = (*inside_)(point) == CGAL::ON_BOUNDED_SIDE ? -distance : distance;
+            }
+        });
+        return distances;
+    }
+
+    bool is_closed() const { return is_closed_; }
+
+    int num_faces() const { return static_cast<int>(mesh_.number_of_faces()); }
+
+private:
+    compas::Mesh mesh_;
+    compas::FaceTree tree_;
+    bool is_closed_;
+    std::unique_ptr<Inside> inside_;
+};
+
+
 NB_MODULE(_meshing, m) {
     m.def(
         "pmp_trimesh_remesh",
-        &pmp_trimesh_remesh,
+        nb::overload_cast<
+            Eigen::Ref<const compas::RowMatrixXd>,
+            Eigen::Ref<const compas::RowMatrixXi>,
+            double,
+            unsigned int,
+            bool>(&pmp_trimesh_remesh),
         "Remesh a triangle mesh with target edge length",
         "vertices_a"_a,
         "faces_a"_a,
         "target_edge_length"_a,
         "number_of_iterations"_a = 10,
-        "do_project"_a = true
+        "do_project"_a = true,
+        nb::call_guard<nb::gil_scoped_release>()
     );
-    
+
+    m.def(
+        "pmp_trimesh_remesh",
+        nb::overload_cast<compas::Mesh, double, unsigned int, bool>(&pmp_trimesh_remesh),
+        "Remesh a native triangle mesh with target edge length",
+        "mesh_a"_a,
+        "target_edge_length"_a,
+        "number_of_iterations"_a = 10,
+        "do_project"_a = true,
+        nb::call_guard<nb::gil_scoped_release>()
+    );
+
     m.def(
         "pmp_trimesh_remesh_dual",
-        &pmp_trimesh_remesh_dual,
+        nb::overload_cast<
+            Eigen::Ref<const compas::RowMatrixXd>,
+            Eigen::Ref<const compas::RowMatrixXi>,
+            const std::vector<int>&,
+            double,
+            unsigned int,
+            double,
+            double>(&pmp_trimesh_remesh_dual),
         "Remesh a triangle mesh with target edge length",
         "vertices_a"_a,
         "faces_a"_a,
@@ -901,25 +1104,90 @@ NB_MODULE(_meshing, m) {
         "length_factor"_a=1,
         "number_of_iterations"_a = 10,
         "angle_radians"_a = 0.9,
-        "scale_factor"_a = 1.0
+        "scale_factor"_a = 1.0,
+        nb::call_guard<nb::gil_scoped_release>()
+    );
+
+    m.def(
+        "pmp_trimesh_remesh_dual",
+        nb::overload_cast<compas::Mesh, const std::vector<int>&, double, unsigned int, double, double>(&pmp_trimesh_remesh_dual),
+        "Remesh a native triangle mesh with target edge length",
+        "mesh_a"_a,
+        "fixed_vertices"_a,
+        "length_factor"_a=1,
+        "number_of_iterations"_a = 10,
+        "angle_radians"_a = 0.9,
+        "scale_factor"_a = 1.0,
+        nb::call_guard<nb::gil_scoped_release>()
     );
 
     m.def(
         "pmp_pull",
-        &pmp_pull,
+        nb::overload_cast<
+            Eigen::Ref<const compas::RowMatrixXd>,
+            Eigen::Ref<const compas::RowMatrixXi>,
+            Eigen::Ref<compas::RowMatrixXd>,
+            Eigen::Ref<compas::RowMatrixXd>>(&pmp_pull),
         "Pull a set of points to a mesh using vectors by ray-mesh intersection",
         "vertices_a"_a,
         "faces_a"_a,
         "vertices_b"_a,
-        "normals_b"_a
+        "normals_b"_a,
+        nb::call_guard<nb::gil_scoped_release>()
+    );
+
+    m.def(
+        "pmp_pull",
+        nb::overload_cast<const compas::Mesh&, Eigen::Ref<compas::RowMatrixXd>, Eigen::Ref<compas::RowMatrixXd>>(&pmp_pull),
+        "Pull a set of points to a native mesh using vectors by ray-mesh intersection",
+        "mesh_a"_a,
+        "vertices_b"_a,
+        "normals_b"_a,
+        nb::call_guard<nb::gil_scoped_release>()
     );
 
     m.def(
         "pmp_project",
-        &pmp_project,
+        nb::overload_cast<
+            Eigen::Ref<const compas::RowMatrixXd>,
+            Eigen::Ref<const compas::RowMatrixXi>,
+            Eigen::Ref<compas::RowMatrixXd>>(&pmp_project),
         "Project a set of points to the closest point on a mesh",
         "vertices_a"_a,
         "faces_a"_a,
-        "vertices_b"_a
+        "vertices_b"_a,
+        nb::call_guard<nb::gil_scoped_release>()
     );
-}
\ No newline at end of file
+
+    m.def(
+        "pmp_project",
+        nb::overload_cast<const compas::Mesh&, Eigen::Ref<compas::RowMatrixXd>>(&pmp_project),
+        "Project a set of points to the closest point on a native mesh",
+        "mesh_a"_a,
+        "vertices_b"_a,
+        nb::call_guard<nb::gil_scoped_release>()
+    );
+
+    nb::class_<ClosestPointQuery>(m, "ClosestPointQuery",
+        "Closest point queries with a persistent AABB tree over the faces of a triangle mesh.")
+        .def(nb::init<Eigen::Ref<const compas::RowMatrixXd>, Eigen::Ref<const compas::RowMatrixXi>>(),
+             "vertices"_a, "faces"_a,
+             nb::call_guard<nb::gil_scoped_release>())
+        .def(nb::init<compas::Mesh>(),
+             "mesh"_a,
+             nb::call_guard<nb::gil_scoped_release>())
+        .def("query", &ClosestPointQuery::query,
+             "Closest points, faces, barycentric coordinates and distances of a set of points.",
+             "points"_a, "signed"_a = false, "num_threads"_a = 0,
+             nb::call_guard<nb::gil_scoped_release>())
+        .def("side", &ClosestPointQuery::side,
+             "Side of the closed mesh of a set of points: 1 inside, 0 on the surface, -1 outside.",
+             "points"_a, "num_threads"_a = 0,
+             nb::call_guard<nb::gil_scoped_release>())
+        .def("signed_distance_grid", &ClosestPointQuery::signed_distance_grid,
+             "Signed distances to the closed mesh at the nodes of a regular grid.",
+             "origin"_a, "spacing"_a, "counts"_a, "num_threads"_a = 0,
+             nb::call_guard<nb::gil_scoped_release>())
+        .def_prop_ro("is_closed", &ClosestPointQuery::is_closed)
+        .def_prop_ro("num_faces", &ClosestPointQuery::num_faces);
+}
@@ -10,6 +10,7 @@
 #include <CGAL/AABB_tree.h>
 #include <CGAL/AABB_traits_3.h>
 #include <CGAL/AABB_triangle_primitive_3.h>
+#include <CGAL/Side_of_triangle_mesh.h>
 
 namespace compas {
 
@@ -119,3 +120,38 @@ void pmp_project(
     Eigen::Ref<const compas::RowMatrixXd> vertices_a,
     Eigen::Ref<const compas::RowMatrixXi> faces_a,
     Eigen::Ref<compas::RowMatrixXd> vertices_b);
+
+// Overloads operating on a native mesh (see `_mesh.CgalMesh`).
+// Remeshing modifies its input, so the native mesh is copied.
+
+std::tuple<compas::RowMatrixXd, compas::RowMatrixXi>
+pmp_trimesh_remesh(
+    compas::Mesh mesh_a,
+    double target_edge_length,
+    unsigned int number_of_iterations = 10,
+    bool do_project = true);
+
+std::tuple<
+compas::RowMatrixXd,
+compas::RowMatrixXi,
+compas::RowMatrixXd,
+std::vector<std::vector<int>>>
+pmp_trimesh_remesh_dual(
+    compas::Mesh mesh_a,
+    const std::vector<int>& fixed_vertices,
+    double length_factor=1.0,
+    unsigned int number_of_iterations=10,
+    double angle_radians=0.9,
+    double scale_factor=1.0
+);
+
+void pmp_pull(
+    const compas::Mesh& mesh_a,
+    Eigen::Ref<compas::RowMatrixXd> vertices_b,
+    Eigen::Ref<compas::RowMatrixXd> normals_b);
+
+void pmp_project(
+    const compas::Mesh& mesh_a,
+    Eigen::Ref<compas::RowMatrixXd> vertices_b);
+
+// ClosestPointQuery class is defined in meshing.cpp and exposed via nanobind
@@ -214,7 +214,8 @@ NB_MODULE(_polylines, m) {
         "list\n"
         "    List of simplified polylines as matrices",
         "polylines"_a,
-        "threshold"_a);
+        "threshold"_a,
+        nb::call_guard<nb::gil_scoped_release>());
 
     m.def(
         "closest_points_on_polyline",
@@ -232,5 +233,6 @@ NB_MODULE(_polylines, m) {
         "array\n"
         "    Closest points on polyline (same dimensions as input)",
         "query_points"_a,
-        "polyline"_a);
+        "polyline"_a,
+        nb::call_guard<nb::gil_scoped_release>());
 }
@@ -0,0 +1,195 @@
+#include "raycast.h"
+
+#include <cmath>
+#include <limits>
+#include <variant>
+
+using Ray = compas::Kernel::Ray_3;
+
+class RayCaster {
+public:
+    RayCaster(
+        Eigen::Ref<const compas::RowMatrixXd> vertices,
+        Eigen::Ref<const compas::RowMatrixXi> faces)
+        : RayCaster(compas::mesh_from_vertices_and_faces(vertices, faces))
+    {}
+
+    RayCaster(compas::Mesh mesh)
+        : mesh_(std::move(mesh)),
+          tree_(CGAL::faces(mesh_).first, CGAL::faces(mesh_).second, mesh_)
+    {
+        tree_.build();
+    }
+
+    std::tuple<compas::RowMatrixXd, compas::RowMatrixXi, compas::RowMatrixXd>
+    first_hit(
+        Eigen::Ref<const compas::RowMatrixXd> origins,
+        Eigen::Ref<const compas::RowMatrixXd> directions,
+        double tmax,
+        int num_threads) const
+    {
+        check_rays(origins, directions);
+        const Eigen::Index n = origins.rows();
+
+        compas::RowMatrixXd distances = compas::RowMatrixXd::Constant(n, 1, std::numeric_limits<double>::infinity());
+        compas::RowMatrixXi face_ids = compas::RowMatrixXi::Constant(n, 1, -1);
+        compas::RowMatrixXd barycentrics = compas::RowMatrixXd::Zero(n, 3);
+
+        compas::parallel_for_row_blocks(n, num_threads, [&](Eigen::Index begin, Eigen::Index end) {
+            for (Eigen::Index i = begin; i < end; ++i)
+            {
+                Ray ray;
+                if (!make_ray(origins, directions, i, ray)) continue;
+
+                const auto hit = tree_.first_intersection(ray);
+                if (!hit) continue;
+
+                const compas::Point point = nearest_point(ray.source(), hit->first);
+                const double distance = std::sqrt(CGAL::squared_distance(ray.source(), point));
+                if (distance > tmax) continue;
+
+                const auto weights = compas::barycentric_coordinates(mesh_, hit->second, point);
+                distances(i, 0) = distance;
+                face_ids(i, 0) = static_cast<int>(hit->second.idx());
+                barycentrics.row(i) << weights[0], weights[1], weights[2];
+            }
+        });
+
+        return std::make_tuple(std::move(distances), std::move(face_ids), std::move(barycentrics));
+    }
+
+    std::tuple<compas::RowMatrixXi, compas::RowMatrixXd, compas::RowMatrixXi, compas::RowMatrixXd>
+    all_hits(
+        Eigen::Ref<const compas::RowMatrixXd> origins,
+        Eigen::Ref<const compas::RowMatrixXd> directions,
+        double tmax,
+        int num_threads) const
+    {
+        check_rays(origins, directions);
+        const Eigen::Index n = origins.rows();
+
+        struct Hit
+        {
+            double distance;
+            int face;
+            std::array<double, 3> weights;
+        };
+
+        // Hits are collected per block and per ray, and copied into flat
+        // arrays once the number of hits of every ray is known.
+        const std::size_t num_blocks = (static_cast<std::size_t>(n) + compas::row_block_size - 1) / compas::row_block_size;
+        std::vector<std::vector<Hit>> block_hits(num_blocks);
+        compas::RowMatrixXi offsets = compas::RowMatrixXi::Zero(n + 1, 1);
+
+        using Result = compas::FaceTree::Intersection_and_primitive_id<Ray>::Type;
+
+        compas::parallel_for_row_blocks(n, num_threads, [&](Eigen::Index begin, Eigen::Index end) {
+            std::vector<Hit>& hits = block_hits[static_cast<std::size_t>(begin) / compas::row_block_size];
+            std::vector<Result> results;
+            for (Eigen::Index i = begin; i < end; ++i)
+            {
+                Ray ray;
+                if (!make_ray(origins, directions, i, ray)) continue;
+
+                results.clear();
+                tree_.all_intersections(ray, std::back_inserter(results));
+
+                const std::size_t first = hits.size();
+                for (const auto& [object, face] : results)
+                {
+                    const compas::Point point = nearest_point(ray.source(), object);
+                    const double distance = std::sqrt(CGAL::squared_distance(ray.source(), point));
+                    if (distance > tmax) continue;
+                    hits.push_back({distance, static_cast<int>(face.idx()), compas::barycentric_coordinates(mesh_, face, point)});
+                }
+                std::sort(hits.begin() + first, hits.end(), [](const Hit& a, const Hit& b) {
+                    return a.distance < b.distance || (a.distance == b.distance && a.face < b.face);
+                });
+                offsets(i + 1, 0) = static_cast<int>(hits.size() - first);
+            }
+        });
+
+        for (Eigen::Index i = 0; i < n; ++i)
+            offsets(i + 1, 0) += offsets(i, 0);
+
+        const Eigen::Index total = offsets(n, 0);
+        compas::RowMatrixXd distances(total, 1);
+        compas::RowMatrixXi face_ids(total, 1);
+        compas::RowMatrixXd barycentrics(total, 3);
+
+        Eigen::Index row = 0;
+        for (const auto& hits : block_hits)
+            for (const Hit& hit : hits)
+            {
+                distances(row, 0) = hit.distance;
+                face_ids(row, 0) = hit.face;
+                barycentrics.row(row) << hit.weights[0], hit.weights[1], hit.weights[2];
+                ++row;
+            }
+
+        return std::make_tuple(std::move(offsets), std::move(distances), std::move(face_ids), std::move(barycentrics));
+    }
+
+    int num_faces() const { return static_cast<int>(mesh_.number_of_faces()); }
+
+private:
+    static void check_rays(
+        Eigen::Ref<const compas::RowMatrixXd> origins,
+        Eigen::Ref<const compas::RowMatrixXd> directions)
+    {
+        if (origins.cols() != 3 || directions.cols() != 3)
+            throw std::invalid_argument("origins and directions must have 3 columns");
+        if (origins.rows() != directions.rows())
+            throw std::invalid_argument("origins and directions must have the same number of rows");
+    }
+
+    static bool make_ray(
+        Eigen::Ref<const compas::RowMatrixXd> origins,
+        Eigen::Ref<const compas::RowMatrixXd> directions,
+        Eigen::Index i,
+        Ray& ray)
+    {
+        const compas::Vector direction(directions(i, 0), directions(i, 1), directions(i, 2));
+        if (direction == CGAL::NULL_VECTOR) return false;
+        ray = Ray(compas::Point(origins(i, 0), origins(i, 1), origins(i, 2)), direction);
+        return true;
+    }
+
+    // A ray in the plane of a face intersects it in a segment;
+    // the hit is the end of the segment closest to the origin of the ray.
+    template <typename Object>
+    static compas::Point nearest_point(const compas::Point& origin, const Object& object)
+    {
+        if (const auto* point = std::get_if<compas::Point>(&object))
+            return *point;
+        const auto& segment = std::get<compas::Kernel::Segment_3>(object);
+        return CGAL::has_smaller_distance_to_point(origin, segment.source(), segment.target())
+            ? segment.source()
+            : segment.target();
+    }
+
+    compas::Mesh mesh_;
+    compas::FaceTree tree_;
+};
+
+
+NB_MODULE(_raycast, m) {
+
+    nb::class_<RayCaster>(m, "RayCaster",
+        "Ray caster with a persistent AABB tree over the faces of a triangle mesh.")
+        .def(nb::init<Eigen::Ref<const compas::RowMatrixXd>, Eigen::Ref<const compas::RowMatrixXi>>(),
+             "vertices"_a, "faces"_a,
+             nb::call_guard<nb::gil_scoped_release>())
+        .def(nb::init<compas::Mesh>(),
+             "mesh"_a,
+             nb::call_guard<nb::gil_scoped_release>())
+        .def("first_hit", &RayCaster::first_hit,
+             "Distance, face and barycentric coordinates of the first hit of every ray.",
+             "origins"_a, "directions"_a, "tmax"_a, "num_threads"_a = 0,
+             nb::call_guard<nb::gil_scoped_release>())
+        .def("all_hits", &RayCaster::all_hits,
+             "Offsets per ray, and distances, faces and barycentric coordinates of all hits sorted by distance.",
+             "origins"_a, "directions"_a, "tmax"_a, "num_threads"_a = 0,
+             nb::call_guard<nb::gil_scoped_release>())
+        .def_prop_ro("num_faces", &RayCaster::num_faces);
+}
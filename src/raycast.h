@@ -0,0 +1,5 @@
+#pragma once
+
+#include "compas.h"
+
+// RayCaster class is defined in raycast.cpp and exposed via nanobind
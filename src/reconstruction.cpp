@@ -247,7 +247,8 @@ NB_MODULE(_reconstruction, m) {
         "normals"_a,
         "sm_angle"_a = 20.0,
         "sm_radius"_a = 30.0,
-        "sm_distance"_a = 0.375
+        "sm_distance"_a = 0.375,
+        nb::call_guard<nb::gil_scoped_release>()
     );
 
     m.def(
@@ -256,7 +257,8 @@ NB_MODULE(_reconstruction, m) {
         "Remove outliers from a pointcloud",
         "points"_a,
         "num_neighbors"_a,
-        "radius"_a
+        "radius"_a,
+        nb::call_guard<nb::gil_scoped_release>()
     );
 
     m.def(
@@ -264,7 +266,8 @@ NB_MODULE(_reconstruction, m) {
         &pointset_reduction,
         "Reduce number of points using hierarchy simplification",
         "points"_a,
-        "spacing"_a = 2.0
+        "spacing"_a = 2.0,
+        nb::call_guard<nb::gil_scoped_release>()
     );
 
     m.def(
@@ -273,7 +276,8 @@ NB_MODULE(_reconstruction, m) {
         "Smooth a pointcloud using jet smoothing",
         "points"_a,
         "num_neighbors"_a = 8,
-        "num_iterations"_a = 1
+        "num_iterations"_a = 1,
+        nb::call_guard<nb::gil_scoped_release>()
     );
 
     m.def(
@@ -282,6 +286,7 @@ NB_MODULE(_reconstruction, m) {
         "Estimate pointcloud normals and orient them",
         "points"_a,
         "num_neighbors"_a = 8,
-        "erase_unoriented"_a = true
+        "erase_unoriented"_a = true,
+        nb::call_guard<nb::gil_scoped_release>()
     );
 }
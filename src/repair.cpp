@@ -0,0 +1,140 @@
+#include "repair.h"
+
+namespace PMP = CGAL::Polygon_mesh_processing;
+
+compas::RowMatrixXi
+pmp_self_intersections(const compas::Mesh& mesh)
+{
+    using face_descriptor = compas::Mesh::Face_index;
+
+    std::vector<std::pair<face_descriptor, face_descriptor>> pairs;
+    PMP::self_intersections<CGAL::Parallel_if_available_tag>(mesh, std::back_inserter(pairs));
+
+    compas::RowMatrixXi result(static_cast<Eigen::Index>(pairs.size()), 2);
+    for (std::size_t i = 0; i < pairs.size(); i++)
+    {
+        const int a = static_cast<int>(pairs[i].first.idx());
+        const int b = static_cast<int>(pairs[i].second.idx());
+        result(i, 0) = std::min(a, b);
+        result(i, 1) = std::max(a, b);
+    }
+    return result;
+}
+
+compas::RowMatrixXi
+pmp_self_intersections(
+    Eigen::Ref<const compas::RowMatrixXd> vertices,
+    Eigen::Ref<const compas::RowMatrixXi> faces)
+{
+    return pmp_self_intersections(compas::mesh_from_vertices_and_faces(vertices, faces));
+}
+
+bool
+pmp_does_self_intersect(const compas::Mesh& mesh)
+{
+    return PMP::does_self_intersect<CGAL::Parallel_if_available_tag>(mesh);
+}
+
+bool
+pmp_does_self_intersect(
+    Eigen::Ref<const compas::RowMatrixXd> vertices,
+    Eigen::Ref<const compas::RowMatrixXi> faces)
+{
+    return pmp_does_self_intersect(compas::mesh_from_vertices_and_faces(vertices, faces));
+}
+
+std::tuple<compas::RowMatrixXd, compas::RowMatrixXi>
+pmp_autorefine(compas::Mesh mesh)
+{
+    PMP::autorefine(mesh);
+    mesh.collect_garbage();
+    return compas::mesh_to_vertices_and_faces(mesh);
+}
+
+std::tuple<compas::RowMatrixXd, compas::RowMatrixXi>
+pmp_autorefine(
+    Eigen::Ref<const compas::RowMatrixXd> vertices,
+    Eigen::Ref<const compas::RowMatrixXi> faces)
+{
+    return pmp_autorefine(compas::mesh_from_vertices_and_faces(vertices, faces));
+}
+
+std::tuple<compas::RowMatrixXd, compas::RowMatrixXi, bool>
+pmp_remove_self_intersections(compas::Mesh mesh)
+{
+    bool success = PMP::experimental::remove_self_intersections(mesh);
+    mesh.collect_garbage();
+    auto [V, F] = compas::mesh_to_vertices_and_faces(mesh);
+    return std::make_tuple(std::move(V), std::move(F), success);
+}
+
+std::tuple<compas::RowMatrixXd, compas::RowMatrixXi, bool>
+pmp_remove_self_intersections(
+    Eigen::Ref<const compas::RowMatrixXd> vertices,
+    Eigen::Ref<const compas::RowMatrixXi> faces)
+{
+    return pmp_remove_self_intersections(compas::mesh_from_vertices_and_faces(vertices, faces));
+}
+
+NB_MODULE(_repair, m) {
+
+    m.def(
+        "self_intersections",
+        nb::overload_cast<Eigen::Ref<const compas::RowMatrixXd>, Eigen::Ref<const compas::RowMatrixXi>>(&pmp_self_intersections),
+        "Find the pairs of intersecting faces of a mesh",
+        "vertices"_a,
+        "faces"_a,
+        nb::call_guard<nb::gil_scoped_release>());
+
+    m.def(
+        "self_intersections",
+        nb::overload_cast<const compas::Mesh&>(&pmp_self_intersections),
+        "Find the pairs of intersecting faces of a native mesh",
+        "mesh"_a,
+        nb::call_guard<nb::gil_scoped_release>());
+
+    m.def(
+        "does_self_intersect",
+        nb::overload_cast<Eigen::Ref<const compas::RowMatrixXd>, Eigen::Ref<const compas::RowMatrixXi>>(&pmp_does_self_intersect),
+        "Check if a mesh self-intersects",
+        "vertices"_a,
+        "faces"_a,
+        nb::call_guard<nb::gil_scoped_release>());
+
+    m.def(
+        "does_self_intersect",
+        nb::overload_cast<const compas::Mesh&>(&pmp_does_self_intersect),
+        "Check if a native mesh self-intersects",
+        "mesh"_a,
+        nb::call_guard<nb::gil_scoped_release>());
+
+    m.def(
+        "autorefine",
+        nb::overload_cast<Eigen::Ref<const compas::RowMatrixXd>, Eigen::Ref<const compas::RowMatrixXi>>(&pmp_autorefine),
+        "Refine a mesh along its self-intersections",
+        "vertices"_a,
+        "faces"_a,
+        nb::call_guard<nb::gil_scoped_release>());
+
+    m.def(
+        "autorefine",
+        nb::overload_cast<compas::Mesh>(&pmp_autorefine),
+        "Refine a native mesh along its self-intersections",
+        "mesh"_a,
+        nb::call_guard<nb::gil_scoped_release>());
+
+    m.def(
+        "remove_self_intersections",
+        nb::overload_cast<Eigen::Ref<const compas::RowMatrixXd>, Eigen::Ref<const compas::RowMatrixXi>>(&pmp_remove_self_intersections),
+        "Remove the self-intersections of a mesh",
+        "vertices"_a,
+        "faces"_a,
+        nb::call_guard<nb::gil_scoped_release>());
+
+    m.def(
+        "remove_self_intersections",
+        nb::overload_cast<compas::Mesh>(&pmp_remove_self_intersections),
+        "Remove the self-intersections of a native mesh",
+        "mesh"_a,
+        nb::call_guard<nb::gil_scoped_release>());
+}
@@ -0,0 +1,105 @@
+#pragma once
+
+#include "compas.h"
+
+// CGAL self-intersection detection and repair
+#include <CGAL/Polygon_mesh_processing/self_intersections.h>
+#include <CGAL/Polygon_mesh_processing/autorefinement.h>
+#include <CGAL/Polygon_mesh_processing/repair_self_intersections.h>
+
+/**
+ * @brief Find the pairs of faces of a triangle mesh that intersect.
+ *
+ * Faces that share a vertex or an edge only intersect if they overlap
+ * beyond the shared element. Runs in parallel if CGAL is linked with TBB.
+ *
+ * @param mesh The mesh
+ * @return RowMatrixXi Kx2 matrix of face indices, with the smaller index first
+ */
+compas::RowMatrixXi
+pmp_self_intersections(const compas::Mesh& mesh);
+
+/**
+ * @brief Find the pairs of faces of a triangle mesh that intersect.
+ *
+ * @param vertices Matrix of vertex positions as Nx3 matrix in row-major order (float64)
+ * @param faces Matrix of face indices as Mx3 matrix in row-major order (int32)
+ * @return RowMatrixXi Kx2 matrix of face indices, with the smaller index first
+ */
+compas::RowMatrixXi
+pmp_self_intersections(
+    Eigen::Ref<const compas::RowMatrixXd> vertices,
+    Eigen::Ref<const compas::RowMatrixXi> faces);
+
+/**
+ * @brief Check if a triangle mesh self-intersects.
+ *
+ * Stops at the first intersecting pair of faces.
+ *
+ * @param mesh The mesh
+ * @return bool True if two faces of the mesh intersect
+ */
+bool
+pmp_does_self_intersect(const compas::Mesh& mesh);
+
+/**
+ * @brief Check if a triangle mesh self-intersects.
+ *
+ * @param vertices Matrix of vertex positions as Nx3 matrix in row-major order (float64)
+ * @param faces Matrix of face indices as Mx3 matrix in row-major order (int32)
+ * @return bool True if two faces of the mesh intersect
+ */
+bool
+pmp_does_self_intersect(
+    Eigen::Ref<const compas::RowMatrixXd> vertices,
+    Eigen::Ref<const compas::RowMatrixXi> faces);
+
+/**
+ * @brief Refine a triangle mesh along its self-intersections.
+ *
+ * Intersecting faces are split so that they only meet along shared edges
+ * and vertices. The mesh is copied.
+ *
+ * @param mesh The mesh
+ * @return std::tuple<RowMatrixXd, RowMatrixXi> The refined vertices and faces
+ */
+std::tuple<compas::RowMatrixXd, compas::RowMatrixXi>
+pmp_autorefine(compas::Mesh mesh);
+
+/**
+ * @brief Refine a triangle mesh along its self-intersections.
+ *
+ * @param vertices Matrix of vertex positions as Nx3 matrix in row-major order (float64)
+ * @param faces Matrix of face indices as Mx3 matrix in row-major order (int32)
+ * @return std::tuple<RowMatrixXd, RowMatrixXi> The refined vertices and faces
+ */
+std::tuple<compas::RowMatrixXd, compas::RowMatrixXi>
+pmp_autorefine(
+    Eigen::Ref<const compas::RowMatrixXd> vertices,
+    Eigen::Ref<const compas::RowMatrixXi> faces);
+
+/**
+ * @brief Remove the self-intersections of a triangle mesh.
+ *
+ * Uses CGAL's experimental local repair, which removes and refills the
+ * regions around intersecting faces. The mesh is copied.
+ *
+ * @param mesh The mesh
+ * @return std::tuple<RowMatrixXd, RowMatrixXi, bool> The repaired vertices
+ *         and faces, and whether all self-intersections were removed
+ */
+std::tuple<compas::RowMatrixXd, compas::RowMatrixXi, bool>
+pmp_remove_self_intersections(compas::Mesh mesh);
+
+/**
+ * @brief Remove the self-intersections of a triangle mesh.
+ *
+ * @param vertices Matrix of vertex positions as Nx3 matrix in row-major order (float64)
+ * @param faces Matrix of face indices as Mx3 matrix in row-major order (int32)
+ * @return std::tuple<RowMatrixXd, RowMatrixXi, bool> The repaired vertices
+ *         and faces, and whether all self-intersections were removed
+ */
+std::tuple<compas::RowMatrixXd, compas::RowMatrixXi, bool>
+pmp_remove_self_intersections(
+    Eigen::Ref<const compas::RowMatrixXd> vertices,
+    Eigen::Ref<const compas::RowMatrixXi> faces);
@@ -81,6 +81,7 @@ NB_MODULE(_skeletonization, m) {
         &pmp_mesh_skeleton,
         "Create a geometric skeleton from a mesh using mean curvature flow",
         "vertices"_a,
-        "faces"_a
+        "faces"_a,
+        nb::call_guard<nb::gil_scoped_release>()
     );
 }
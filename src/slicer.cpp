@@ -1,14 +1,560 @@
 #include "slicer.h"
 
+#include <condition_variable>
+#include <deque>
+#include <optional>
+#include <thread>
+#include <utility>
+
+#include <nanobind/stl/optional.h>
+
+namespace slicing {
+
+// Flat copy of the connectivity of a triangle mesh, indexed by the indices of
+// the mesh elements. The contours of a plane are chained through the crossed
+// edges, so that both faces of an edge produce exactly the same point.
+struct Topology
+{
+    std::vector<std::array<double, 3>> points;
+    std::vector<int> faces;                       // live faces
+    std::vector<std::array<int, 3>> face_vertices; // in halfedge order
+    std::vector<std::array<int, 3>> face_edges;    // edge k joins face vertices k and k + 1
+    std::vector<std::array<int, 2>> edge_vertices; // smaller vertex index first
+
+    explicit Topology(const compas::Mesh& mesh)
+        : points(mesh.num_vertices()),
+          face_vertices(mesh.num_faces()),
+          face_edges(mesh.num_faces()),
+          edge_vertices(mesh.num_edges())
+    {
+        for (auto v : mesh.vertices())
+        {
+            const compas::Point& p = mesh.point(v);
+            points[v.idx()] = {p.x(), p.y(), p.z()};
+        }
+        for (auto e : mesh.edges())
+        {
+            const int a = static_cast<int>(mesh.vertex(e, 0).idx());
+            const int b = static_cast<int>(mesh.vertex(e, 1).idx());
+            edge_vertices[e.idx()] = {std::min(a, b), std::max(a, b)};
+        }
+        faces.reserve(mesh.number_of_faces());
+        for (auto f : mesh.faces())
+        {
+            auto h = mesh.halfedge(f);
+            for (int k = 0; k < 3; ++k, h = mesh.next(h))
+            {
+                face_vertices[f.idx()][k] = static_cast<int>(mesh.source(h).idx());
+                face_edges[f.idx()][k] = static_cast<int>(mesh.edge(h).idx());
+            }
+            faces.push_back(static_cast<int>(f.idx()));
+        }
+    }
+};
+
+struct Contour
+{
+    std::vector<std::array<double, 3>> points;
+    std::vector<int> faces; // face crossed by every segment
+    bool closed;
+};
+
+// Per-thread buffers indexed by edge, reset after every plane.
+struct Workspace
+{
+    struct Segment
+    {
+        int from, to, face;
+    };
+
+    std::vector<Segment> segments;
+    std::vector<int> start;
+    std::vector<char> incoming;
+    std::vector<char> visited;
+
+    explicit Workspace(std::size_t num_edges) : start(num_edges, -1), incoming(num_edges, 0) {}
+};
+
+// Plane at a height along a common normal, from precomputed vertex heights.
+struct HeightPlane
+{
+    const std::vector<double>& heights;
+    double height;
+
+    bool above(int v) const { return heights[v] >= height; }
+    double distance(int v) const { return heights[v] - height; }
+};
+
+// Arbitrary plane. Vertices are classified with the exact predicate, which
+// the AABB tree also uses to find the faces that the plane intersects.
+struct Plane
+{
+    const Topology& topology;
+    compas::Kernel::Plane_3 plane;
+
+    bool above(int v) const
+    {
+        const auto& p = topology.points[v];
+        return plane.oriented_side(compas::Point(p[0], p[1], p[2])) != CGAL::ON_NEGATIVE_SIDE;
+    }
+
+    double distance(int v) const
+    {
+        const auto& p = topology.points[v];
+        return plane.a() * p[0] + plane.b() * p[1] + plane.c() * p[2] + plane.d();
+    }
+};
+
+// Contours of a plane through the candidate faces. Vertices on the plane count
+// as above it, so that every crossed edge has one end strictly below the plane
+// and no face is cut twice. Segments run from the edge where the boundary of
+// a face goes down through the plane to the edge where it goes up, which
+// makes the outer contours of an outward oriented closed mesh counterclockwise
+// seen from the normal of the plane, and its holes clockwise.
+template <typename Candidates, typename Side>
+void contours(
+    const Topology& topology,
+    const Candidates& candidates,
+    const Side& plane,
+    Workspace& workspace,
+    std::vector<Contour>& out)
+{
+    auto& segments = workspace.segments;
+    segments.clear();
+    for (int f : candidates)
+    {
+        const auto& fv = topology.face_vertices[f];
+        const std::array<bool, 3> above = {plane.above(fv[0]), plane.above(fv[1]), plane.above(fv[2])};
+        if (above[0] == above[1] && above[1] == above[2]) continue;
+
+        int from = -1, to = -1;
+        for (int k = 0; k < 3; ++k)
+        {
+            if (above[k] && !above[(k + 1) % 3]) from = topology.face_edges[f][k];
+            else if (!above[k] && above[(k + 1) % 3]) to = topology.face_edges[f][k];
+        }
+        segments.push_back({from, to, f});
+    }
+    if (segments.empty()) return;
+
+    for (int s = 0; s < static_cast<int>(segments.size()); ++s)
+    {
+        workspace.start[segments[s].from] = s;
+        workspace.incoming[segments[s].to] = 1;
+    }
+    workspace.visited.assign(segments.size(), 0);
+
+    auto point = [&](int e) -> std::array<double, 3> {
+        const auto [a, b] = topology.edge_vertices[e];
+        // The distances are rounded, the classification is not.
+        const double da = plane.distance(a), db = plane.distance(b);
+        const double t = da != db ? std::clamp(da / (da - db), 0.0, 1.0) : 0.5;
+        const auto& pa = topology.points[a];
+        const auto& pb = topology.points[b];
+        return {pa[0] + t * (pb[0] - pa[0]), pa[1] + t * (pb[1] - pa[1]), pa[2] + t * (pb[2] - pa[2])};
+    };
+
+    // Zero-length segments, at vertices on the plane, are dropped.
+    auto walk = [&](int first) {
+        Contour contour{{point(segments[first].from)}, {}, false};
+        for (int s = first;;)
+        {
+            workspace.visited[s] = 1;
+            const auto p = point(segments[s].to);
+            if (p != contour.points.back())
+            {
+                contour.points.push_back(p);
+                contour.faces.push_back(segments[s].face);
+            }
+            const int next = workspace.start[segments[s].to];
+            if (next == first) contour.closed = true;
+            if (next < 0 || workspace.visited[next]) break;
+            s = next;
+        }
+        if (contour.points.size() >= (contour.closed ? 4u : 2u))
+            out.push_back(std::move(contour));
+    };
+
+    for (int s = 0; s < static_cast<int>(segments.size()); ++s)
+        if (!workspace.incoming[segments[s].from]) walk(s);
+    for (int s = 0; s < static_cast<int>(segments.size()); ++s)
+        if (!workspace.visited[s]) walk(s);
+
+    for (const auto& segment : segments)
+    {
+        workspace.start[segment.from] = -1;
+        workspace.incoming[segment.to] = 0;
+    }
+}
+
+// Workspaces are large for large meshes, so they are kept for later calls.
+class WorkspacePool
+{
+public:
+    explicit WorkspacePool(std::size_t num_edges) : num_edges_(num_edges) {}
+
+    std::unique_ptr<Workspace> acquire()
+    {
+        std::lock_guard<std::mutex> lock(mutex_);
+        if (pool_.empty()) return std::make_unique<Workspace>(num_edges_);
+        auto workspace = std::move(pool_.back());
+        pool_.pop_back();
+        return workspace;
+    }
+
+    void release(std::unique_ptr<Workspace> workspace)
+    {
+        std::lock_guard<std::mutex> lock(mutex_);
+        pool_.push_back(std::move(workspace));
+    }
+
+private:
+    std::size_t num_edges_;
+    std::vector<std::unique_ptr<Workspace>> pool_;
+    std::mutex mutex_;
+};
+
+std::size_t thread_count(int num_threads)
+{
+    return num_threads > 0 ? static_cast<std::size_t>(num_threads) : std::max(1u, std::thread::hardware_concurrency());
+}
+
+// Slices a mesh with arbitrary planes, using an AABB tree over its faces to
+// find the faces a plane intersects. The mesh must outlive the slicer.
+class PlaneSlicer
+{
+public:
+    explicit PlaneSlicer(const compas::Mesh& mesh)
+        : topology_(mesh),
+          tree_(CGAL::faces(mesh).first, CGAL::faces(mesh).second, mesh),
+          workspaces_(topology_.edge_vertices.size())
+    {
+        tree_.build();
+    }
+
+    // Contours per plane, with the planes split over the threads.
+    std::vector<std::vector<Contour>> slice(
+        Eigen::Ref<const compas::RowMatrixXd> points,
+        Eigen::Ref<const compas::RowMatrixXd> normals,
+        int num_threads) const
+    {
+        if (points.cols() != 3 || normals.cols() != 3)
+            throw std::invalid_argument("points and normals must have 3 columns");
+        if (points.rows() != normals.rows())
+            throw std::invalid_argument("points and normals must have the same number of rows");
+
+        const std::size_t n = static_cast<std::size_t>(points.rows());
+        std::vector<std::vector<Contour>> result(n);
+
+        // One workspace per run of consecutive planes.
+        const std::size_t runs = std::min(thread_count(num_threads), n);
+        compas::parallel_for(runs, [&](std::size_t r) {
+            auto workspace = workspaces_.acquire();
+            for (std::size_t i = r * n / runs; i < (r + 1) * n / runs; ++i)
+            {
+                const compas::Vector normal(normals(i, 0), normals(i, 1), normals(i, 2));
+                if (normal == CGAL::NULL_VECTOR)
+                    throw std::invalid_argument("plane normals must not be zero");
+                const Plane plane{topology_, compas::Kernel::Plane_3(compas::Point(points(i, 0), points(i, 1), points(i, 2)), normal)};
+
+                std::vector<int> candidates;
+                tree_.all_intersected_primitives(plane.plane, boost::make_function_output_iterator([&](compas::FaceTree::Primitive_id f) {
+                    candidates.push_back(static_cast<int>(f.idx()));
+                }));
+                contours(topology_, candidates, plane, *workspace, result[i]);
+            }
+            workspaces_.release(std::move(workspace));
+        }, runs);
+
+        return result;
+    }
+
+private:
+    Topology topology_;
+    compas::FaceTree tree_;
+    mutable WorkspacePool workspaces_;
+};
+
+compas::RowMatrixXd to_matrix(const Contour& contour)
+{
+    compas::RowMatrixXd points(static_cast<Eigen::Index>(contour.points.size()), 3);
+    for (std::size_t i = 0; i < contour.points.size(); ++i)
+        points.row(i) << contour.points[i][0], contour.points[i][1], contour.points[i][2];
+    return points;
+}
+
+std::vector<std::vector<compas::RowMatrixXd>> to_matrices(const std::vector<std::vector<Contour>>& per_plane)
+{
+    std::vector<std::vector<compas::RowMatrixXd>> result(per_plane.size());
+    for (std::size_t i = 0; i < per_plane.size(); ++i)
+        for (const auto& contour : per_plane[i])
+            result[i].push_back(to_matrix(contour));
+    return result;
+}
+
+// The contours of all planes in flat arrays: the points of polyline k are the
+// rows offsets[k] to offsets[k + 1] of the points, and faces[j] is the face
+// crossed by the segment from point j to point j + 1, or -1 after the last
+// point of a polyline. Plane indices start at `first_plane`.
+FlatContours flatten(const std::vector<std::vector<Contour>>& per_plane, bool with_faces, int first_plane = 0)
+{
+    Eigen::Index num_polylines = 0, num_points = 0;
+    for (const auto& contours : per_plane)
+        for (const auto& contour : contours)
+        {
+            ++num_polylines;
+            num_points += static_cast<Eigen::Index>(contour.points.size());
+        }
+
+    compas::RowMatrixXd points(num_points, 3);
+    compas::RowMatrixXi offsets(num_polylines + 1, 1);
+    compas::RowMatrixXi planes(num_polylines, 1);
+    compas::RowMatrixXi closed(num_polylines, 1);
+    compas::RowMatrixXi faces(with_faces ? num_points : 0, 1);
+
+    Eigen::Index k = 0, j = 0;
+    offsets(0, 0) = 0;
+    for (std::size_t i = 0; i < per_plane.size(); ++i)
+        for (const auto& contour : per_plane[i])
+        {
+            for (std::size_t r = 0; r < contour.points.size(); ++r, ++j)
+            {
+                points.row(j) << contour.points[r][0], contour.points[r][1], contour.points[r][2];
+                if (with_faces) faces(j, 0) = r < contour.faces.size() ? contour.faces[r] : -1;
+            }
+            planes(k, 0) = first_plane + static_cast<int>(i);
+            closed(k, 0) = contour.closed ? 1 : 0;
+            offsets(++k, 0) = static_cast<int>(j);
+        }
+
+    return std::make_tuple(std::move(points), std::move(offsets), std::move(planes), std::move(closed), std::move(faces));
+}
+
+// Closed contours of one plane grouped into regions: an outer boundary,
+// counterclockwise seen from the normal, followed by its holes, clockwise.
+// The closing point of the loops is not repeated. Loops are nested by
+// containment rather than by their orientation, so that meshes with inverted
+// faces still give the right hierarchy.
+using Region = std::vector<std::vector<std::array<double, 3>>>;
+
+std::vector<Region> regions(const std::vector<Contour>& contours, const std::array<double, 3>& normal)
+{
+    // Basis (u, v) of the plane with u x v along the normal.
+    const double length = std::sqrt(normal[0] * normal[0] + normal[1] * normal[1] + normal[2] * normal[2]);
+    const std::array<double, 3> n = {normal[0] / length, normal[1] / length, normal[2] / length};
+    const std::array<double, 3> a = std::abs(n[0]) < 0.9 ? std::array<double, 3>{1, 0, 0} : std::array<double, 3>{0, 1, 0};
+    auto cross = [](const std::array<double, 3>& x, const std::array<double, 3>& y) {
+        return std::array<double, 3>{x[1] * y[2] - x[2] * y[1], x[2] * y[0] - x[0] * y[2], x[0] * y[1] - x[1] * y[0]};
+    };
+    std::array<double, 3> u = cross(n, a);
+    const double u_length = std::sqrt(u[0] * u[0] + u[1] * u[1] + u[2] * u[2]);
+    u = {u[0] / u_length, u[1] / u_length, u[2] / u_length};
+    const std::array<double, 3> v = cross(n, u);
+
+    struct Loop
+    {
+        const Contour* contour;
+        std::vector<std::array<double, 2>> uv;
+        double area;
+        std::array<double, 4> box; // umin, vmin, umax, vmax
+        int parent;
+        int depth;
+    };
+
+    std::vector<Loop> loops;
+    for (const auto& contour : contours)
+    {
+        if (!contour.closed) continue;
+        Loop loop{&contour, {}, 0.0, {INFINITY, INFINITY, -INFINITY, -INFINITY}, -1, 0};
+        const std::size_t m = contour.points.size() - 1;
+        loop.uv.reserve(m);
+        for (std::size_t i = 0; i < m; ++i)
+        {
+            const auto& p = contour.points[i];
+            const double x = p[0] * u[0] + p[1] * u[1] + p[2] * u[2];
+            const double y = p[0] * v[0] + p[1] * v[1] + p[2] * v[2];
+            loop.uv.push_back({x, y});
+            loop.box = {std::min(loop.box[0], x), std::min(loop.box[1], y), std::max(loop.box[2], x), std::max(loop.box[3], y)};
+        }
+        for (std::size_t i = 0; i < m; ++i)
+        {
+            const auto& p = loop.uv[i];
+            const auto& q = loop.uv[(i + 1) % m];
+            loop.area += 0.5 * (p[0] * q[1] - q[0] * p[1]);
+        }
+        if (loop.area != 0.0) loops.push_back(std::move(loop));
+    }
+
+    // A loop can only be contained in a larger one: with the loops sorted by
+    // decreasing area, the parent of a loop is the first loop before it,
+    // going backwards, that contains it.
+    std::sort(loops.begin(), loops.end(), [](const Loop& a, const Loop& b) { return std::abs(a.area) > std::abs(b.area); });
+
+    auto contains = [](const Loop& outer, const std::array<double, 2>& p) {
+        bool inside = false;
+        const std::size_t m = outer.uv.size();
+        for (std::size_t i = 0, j = m - 1; i < m; j = i++)
+        {
+            const auto& a = outer.uv[i];
+            const auto& b = outer.uv[j];
+            if ((a[1] > p[1]) != (b[1] > p[1]) && p[0] < (b[0] - a[0]) * (p[1] - a[1]) / (b[1] - a[1]) + a[0])
+                inside = !inside;
+        }
+        return inside;
+    };
+
+    for (std::size_t i = 0; i < loops.size(); ++i)
+    {
+        const auto& box = loops[i].box;
+        for (std::size_t j = i; j-- > 0;)
+        {
+            const auto& outer = loops[j].box;
+            if (box[0] < outer[0] || box[1] < outer[1] || box[2] > outer[2] || box[3] > outer[3]) continue;
+            if (!contains(loops[j], loops[i].uv[0])) continue;
+            loops[i].parent = static_cast<int>(j);
+            loops[i].depth = loops[j].depth + 1;
+            break;
+        }
+    }
+
+    auto oriented = [](const Loop& loop, bool counterclockwise) {
+        const auto& points = loop.contour->points;
+        std::vector<std::array<double, 3>> result(points.begin(), points.end() - 1);
+        if ((loop.area > 0) != counterclockwise) std::reverse(result.begin(), result.end());
+        return result;
+    };
+
+    std::vector<Region> result;
+    std::vector<int> region_of(loops.size(), -1);
+    for (std::size_t i = 0; i < loops.size(); ++i)
+    {
+        if (loops[i].depth % 2 == 0)
+        {
+            region_of[i] = static_cast<int>(result.size());
+            result.push_back({oriented(loops[i], true)});
+        }
+        else
+        {
+            result[region_of[loops[i].parent]].push_back(oriented(loops[i], false));
+        }
+    }
+    return result;
+}
+
+// The regions of all planes in flat arrays: points (Nx3), the offsets of the
+// loops in the points (L+1), the offsets of the regions in the loops (R+1),
+// with the boundary as first loop of every region, and the plane of every
+// region (R).
+std::tuple<compas::RowMatrixXd, compas::RowMatrixXi, compas::RowMatrixXi, compas::RowMatrixXi>
+flatten(const std::vector<std::vector<Region>>& per_plane)
+{
+    Eigen::Index num_points = 0, num_loops = 0, num_regions = 0;
+    for (const auto& regions : per_plane)
+        for (const auto& region : regions)
+        {
+            ++num_regions;
+            for (const auto& loop : region)
+            {
+                ++num_loops;
+                num_points += static_cast<Eigen::Index>(loop.size());
+            }
+        }
+
+    compas::RowMatrixXd points(num_points, 3);
+    compas::RowMatrixXi loop_offsets(num_loops + 1, 1);
+    compas::RowMatrixXi region_offsets(num_regions + 1, 1);
+    compas::RowMatrixXi planes(num_regions, 1);
+
+    Eigen::Index j = 0, l = 0, r = 0;
+    loop_offsets(0, 0) = 0;
+    region_offsets(0, 0) = 0;
+    for (std::size_t i = 0; i < per_plane.size(); ++i)
+        for (const auto& region : per_plane[i])
+        {
+            for (const auto& loop : region)
+            {
+                for (const auto& p : loop)
+                    points.row(j++) << p[0], p[1], p[2];
+                loop_offsets(++l, 0) = static_cast<int>(j);
+            }
+            planes(r, 0) = static_cast<int>(i);
+            region_offsets(++r, 0) = static_cast<int>(l);
+        }
+
+    return std::make_tuple(std::move(points), std::move(loop_offsets), std::move(region_offsets), std::move(planes));
+}
+
+// Slice with parallel planes at the given heights along a unit normal.
+// Faces are sorted once by the lowest height of their vertices; the sorted
+// heights are split into one contiguous run per thread, and every run sweeps
+// upwards, keeping the faces whose height interval contains the current
+// height. Each layer only touches the faces it crosses.
+std::vector<std::vector<Contour>> layers(
+    const Topology& topology,
+    const std::array<double, 3>& normal,
+    const std::vector<double>& heights,
+    int num_threads)
+{
+    std::vector<double> vertex_heights(topology.points.size());
+    for (std::size_t v = 0; v < topology.points.size(); ++v)
+    {
+        const auto& p = topology.points[v];
+        vertex_heights[v] = p[0] * normal[0] + p[1] * normal[1] + p[2] * normal[2];
+    }
+
+    const std::size_t num_faces = topology.faces.size();
+    std::vector<double> lower(num_faces), upper(num_faces);
+    for (std::size_t i = 0; i < num_faces; ++i)
+    {
+        const auto& fv = topology.face_vertices[topology.faces[i]];
+        lower[i] = std::min({vertex_heights[fv[0]], vertex_heights[fv[1]], vertex_heights[fv[2]]});
+        upper[i] = std::max({vertex_heights[fv[0]], vertex_heights[fv[1]], vertex_heights[fv[2]]});
+    }
+    std::vector<int> by_lower(num_faces);
+    std::iota(by_lower.begin(), by_lower.end(), 0);
+    std::sort(by_lower.begin(), by_lower.end(), [&](int a, int b) { return lower[a] < lower[b]; });
+
+    std::vector<int> by_height(heights.size());
+    std::iota(by_height.begin(), by_height.end(), 0);
+    std::sort(by_height.begin(), by_height.end(), [&](int a, int b) { return heights[a] < heights[b]; });
+
+    std::vector<std::vector<Contour>> result(heights.size());
+    const std::size_t runs = std::min(thread_count(num_threads), heights.size());
+    compas::parallel_for(runs, [&](std::size_t r) {
+        const std::size_t begin = r * heights.size() / runs;
+        const std::size_t end = (r + 1) * heights.size() / runs;
+
+        Workspace workspace(topology.edge_vertices.size());
+        std::vector<int> active;
+        std::size_t next = 0;
+        for (std::size_t l = begin; l < end; ++l)
+        {
+            const double height = heights[by_height[l]];
+            // A face is cut if one of its vertices is below and one is on or above the plane.
+            for (; next < num_faces && lower[by_lower[next]] < height; ++next)
+                if (upper[by_lower[next]] >= height) active.push_back(by_lower[next]);
+            active.erase(
+                std::remove_if(active.begin(), active.end(), [&](int i) { return upper[i] < height; }),
+                active.end());
+
+            std::vector<int> faces(active.size());
+            std::transform(active.begin(), active.end(), faces.begin(), [&](int i) { return topology.faces[i]; });
+            contours(topology, faces, HeightPlane{vertex_heights, height}, workspace, result[by_height[l]]);
+        }
+    }, runs);
+
+    return result;
+}
+
+} // namespace slicing
+
+
 std::vector<compas::RowMatrixXd>
 pmp_slice_mesh(
-    Eigen::Ref<const compas::RowMatrixXd> vertices,
-    Eigen::Ref<const compas::RowMatrixXi> faces,
+    const compas::Mesh& mesh,
     Eigen::Ref<const compas::RowMatrixXd> points,
     Eigen::Ref<const compas::RowMatrixXd> normals)
 {
-    compas::Mesh mesh = compas::mesh_from_vertices_and_faces(vertices, faces);
-
     CGAL::Polygon_mesh_slicer<compas::Mesh, compas::Kernel> slicer(mesh);
     compas::Polylines polylines;
     std::back_insert_iterator<compas::Polylines> slices(polylines);
@@ -28,12 +574,324 @@ pmp_slice_mesh(
     return result;
 };
 
+std::vector<compas::RowMatrixXd>
+pmp_slice_mesh(
+    Eigen::Ref<const compas::RowMatrixXd> vertices,
+    Eigen::Ref<const compas::RowMatrixXi> faces,
+    Eigen::Ref<const compas::RowMatrixXd> points,
+    Eigen::Ref<const compas::RowMatrixXd> normals)
+{
+    compas::Mesh mesh = compas::mesh_from_vertices_and_faces(vertices, faces);
+    return pmp_slice_mesh(mesh, points, normals);
+};
+
+namespace slicing {
+
+// Checks the normal and runs the sweep of `layers`.
+std::vector<std::vector<Contour>>
+slice_layers(
+    const compas::Mesh& mesh,
+    const std::vector<double>& normal,
+    const std::vector<double>& heights,
+    int num_threads)
+{
+    if (normal.size() != 3)
+        throw std::invalid_argument("normal must have 3 components");
+    const double length = std::sqrt(normal[0] * normal[0] + normal[1] * normal[1] + normal[2] * normal[2]);
+    if (!(length > 0))
+        throw std::invalid_argument("normal must not be zero");
+
+    const Topology topology(mesh);
+    return layers(topology, {normal[0] / length, normal[1] / length, normal[2] / length}, heights, num_threads);
+}
+
+} // namespace slicing
+
+std::vector<std::vector<compas::RowMatrixXd>>
+pmp_slice_mesh_layers(
+    const compas::Mesh& mesh,
+    const std::vector<double>& normal,
+    const std::vector<double>& heights,
+    int num_threads)
+{
+    return slicing::to_matrices(slicing::slice_layers(mesh, normal, heights, num_threads));
+}
+
+std::vector<std::vector<compas::RowMatrixXd>>
+pmp_slice_mesh_layers(
+    Eigen::Ref<const compas::RowMatrixXd> vertices,
+    Eigen::Ref<const compas::RowMatrixXi> faces,
+    const std::vector<double>& normal,
+    const std::vector<double>& heights,
+    int num_threads)
+{
+    return pmp_slice_mesh_layers(compas::mesh_from_vertices_and_faces(vertices, faces), normal, heights, num_threads);
+}
+
+slicing::FlatContours
+pmp_slice_mesh_flat(
+    const compas::Mesh& mesh,
+    Eigen::Ref<const compas::RowMatrixXd> points,
+    Eigen::Ref<const compas::RowMatrixXd> normals,
+    bool return_faces,
+    int num_threads)
+{
+    const slicing::PlaneSlicer slicer(mesh);
+    return slicing::flatten(slicer.slice(points, normals, num_threads), return_faces);
+}
+
+slicing::FlatContours
+pmp_slice_mesh_flat(
+    Eigen::Ref<const compas::RowMatrixXd> vertices,
+    Eigen::Ref<const compas::RowMatrixXi> faces,
+    Eigen::Ref<const compas::RowMatrixXd> points,
+    Eigen::Ref<const compas::RowMatrixXd> normals,
+    bool return_faces,
+    int num_threads)
+{
+    return pmp_slice_mesh_flat(compas::mesh_from_vertices_and_faces(vertices, faces), points, normals, return_faces, num_threads);
+}
+
+slicing::FlatContours
+pmp_slice_mesh_layers_flat(
+    const compas::Mesh& mesh,
+    const std::vector<double>& normal,
+    const std::vector<double>& heights,
+    bool return_faces,
+    int num_threads)
+{
+    return slicing::flatten(slicing::slice_layers(mesh, normal, heights, num_threads), return_faces);
+}
+
+slicing::FlatContours
+pmp_slice_mesh_layers_flat(
+    Eigen::Ref<const compas::RowMatrixXd> vertices,
+    Eigen::Ref<const compas::RowMatrixXi> faces,
+    const std::vector<double>& normal,
+    const std::vector<double>& heights,
+    bool return_faces,
+    int num_threads)
+{
+    return pmp_slice_mesh_layers_flat(compas::mesh_from_vertices_and_faces(vertices, faces), normal, heights, return_faces, num_threads);
+}
+
+std::tuple<compas::RowMatrixXd, compas::RowMatrixXi, compas::RowMatrixXi, compas::RowMatrixXi>
+pmp_slice_mesh_regions(
+    const compas::Mesh& mesh,
+    Eigen::Ref<const compas::RowMatrixXd> points,
+    Eigen::Ref<const compas::RowMatrixXd> normals,
+    int num_threads)
+{
+    const slicing::PlaneSlicer slicer(mesh);
+    const auto contours = slicer.slice(points, normals, num_threads);
+
+    std::vector<std::vector<slicing::Region>> regions(contours.size());
+    compas::parallel_for(contours.size(), [&](std::size_t i) {
+        regions[i] = slicing::regions(contours[i], {normals(i, 0), normals(i, 1), normals(i, 2)});
+    }, static_cast<std::size_t>(std::max(num_threads, 0)));
+
+    return slicing::flatten(regions);
+}
+
+std::tuple<compas::RowMatrixXd, compas::RowMatrixXi, compas::RowMatrixXi, compas::RowMatrixXi>
+pmp_slice_mesh_regions(
+    Eigen::Ref<const compas::RowMatrixXd> vertices,
+    Eigen::Ref<const compas::RowMatrixXi> faces,
+    Eigen::Ref<const compas::RowMatrixXd> points,
+    Eigen::Ref<const compas::RowMatrixXd> normals,
+    int num_threads)
+{
+    return pmp_slice_mesh_regions(compas::mesh_from_vertices_and_faces(vertices, faces), points, normals, num_threads);
+}
+
+class Slicer {
+public:
+    Slicer(
+        Eigen::Ref<const compas::RowMatrixXd> vertices,
+        Eigen::Ref<const compas::RowMatrixXi> faces)
+        : Slicer(compas::mesh_from_vertices_and_faces(vertices, faces))
+    {}
+
+    Slicer(compas::Mesh mesh)
+        : mesh_(std::move(mesh)),
+          slicer_(mesh_)
+    {}
+
+    std::vector<compas::RowMatrixXd> slice(
+        Eigen::Ref<const compas::RowMatrixXd> points,
+        Eigen::Ref<const compas::RowMatrixXd> normals) const
+    {
+        std::vector<compas::RowMatrixXd> result;
+        for (const auto& contours : slicer_.slice(points, normals, 1))
+            for (const auto& contour : contours)
+                result.push_back(slicing::to_matrix(contour));
+        return result;
+    }
+
+    std::vector<std::vector<compas::RowMatrixXd>> slice_many(
+        Eigen::Ref<const compas::RowMatrixXd> points,
+        Eigen::Ref<const compas::RowMatrixXd> normals,
+        int num_threads) const
+    {
+        return slicing::to_matrices(slicer_.slice(points, normals, num_threads));
+    }
+
+    slicing::FlatContours slice_flat(
+        Eigen::Ref<const compas::RowMatrixXd> points,
+        Eigen::Ref<const compas::RowMatrixXd> normals,
+        bool return_faces,
+        int num_threads) const
+    {
+        return slicing::flatten(slicer_.slice(points, normals, num_threads), return_faces);
+    }
+
+    int num_faces() const { return static_cast<int>(mesh_.number_of_faces()); }
+
+private:
+    compas::Mesh mesh_;
+    slicing::PlaneSlicer slicer_;
+};
+
+// Slices a mesh chunk by chunk on a background thread, keeping at most
+// `buffer` chunks that have not been consumed yet.
+class SliceStream {
+public:
+    SliceStream(
+        Eigen::Ref<const compas::RowMatrixXd> vertices,
+        Eigen::Ref<const compas::RowMatrixXi> faces,
+        Eigen::Ref<const compas::RowMatrixXd> points,
+        Eigen::Ref<const compas::RowMatrixXd> normals,
+        int chunk,
+        bool return_faces,
+        int num_threads,
+        int buffer)
+        : SliceStream(compas::mesh_from_vertices_and_faces(vertices, faces), points, normals, chunk, return_faces, num_threads, buffer)
+    {}
+
+    SliceStream(
+        compas::Mesh mesh,
+        Eigen::Ref<const compas::RowMatrixXd> points,
+        Eigen::Ref<const compas::RowMatrixXd> normals,
+        int chunk,
+        bool return_faces,
+        int num_threads,
+        int buffer)
+        : mesh_(std::move(mesh)),
+          slicer_(mesh_),
+          points_(points),
+          normals_(normals),
+          chunk_(chunk),
+          return_faces_(return_faces),
+          num_threads_(num_threads),
+          buffer_(static_cast<std::size_t>(std::max(buffer, 1)))
+    {
+        if (chunk < 1)
+            throw std::invalid_argument("chunk must be at least 1");
+        if (points_.cols() != 3 || normals_.cols() != 3 || points_.rows() != normals_.rows())
+            throw std::invalid_argument("points and normals must be matrices with 3 columns and the same number of rows");
+        producer_ = std::thread([this] { produce(); });
+    }
+
+    ~SliceStream() { close(); }
+
+    SliceStream(const SliceStream&) = delete;
+    SliceStream& operator=(const SliceStream&) = delete;
+
+    // The next chunk, or nothing once all planes are sliced or the stream is closed.
+    std::optional<slicing::FlatContours> next()
+    {
+        std::unique_lock<std::mutex> lock(mutex_);
+        ready_.wait(lock, [this] { return !queue_.empty() || done_; });
+        if (!queue_.empty())
+        {
+            slicing::FlatContours result = std::move(queue_.front());
+            queue_.pop_front();
+            space_.notify_one();
+            return result;
+        }
+        if (error_)
+            std::rethrow_exception(std::exchange(error_, nullptr));
+        return std::nullopt;
+    }
+
+    // Stop slicing and wait for the background thread.
+    void close()
+    {
+        {
+            std::lock_guard<std::mutex> lock(mutex_);
+            stop_ = true;
+            queue_.clear();
+        }
+        space_.notify_all();
+        if (producer_.joinable())
+            producer_.join();
+    }
+
+private:
+    void produce()
+    {
+        try
+        {
+            const Eigen::Index n = points_.rows();
+            for (Eigen::Index begin = 0; begin < n; begin += chunk_)
+            {
+                {
+                    std::unique_lock<std::mutex> lock(mutex_);
+                    space_.wait(lock, [this] { return stop_ || queue_.size() < buffer_; });
+                    if (stop_) break;
+                }
+                const Eigen::Index count = std::min<Eigen::Index>(chunk_, n - begin);
+                auto contours = slicer_.slice(points_.middleRows(begin, count), normals_.middleRows(begin, count), num_threads_);
+                auto result = slicing::flatten(contours, return_faces_, static_cast<int>(begin));
+                {
+                    std::lock_guard<std::mutex> lock(mutex_);
+                    if (stop_) break;
+                    queue_.push_back(std::move(result));
+                }
+                ready_.notify_one();
+            }
+        }
+        catch (...)
+        {
+            std::lock_guard<std::mutex> lock(mutex_);
+            error_ = std::current_exception();
+        }
+        {
+            std::lock_guard<std::mutex> lock(mutex_);
+            done_ = true;
+        }
+        ready_.notify_all();
+    }
+
+    compas::Mesh mesh_;
+    slicing::PlaneSlicer slicer_;
+    compas::RowMatrixXd points_;
+    compas::RowMatrixXd normals_;
+    Eigen::Index chunk_;
+    bool return_faces_;
+    int num_threads_;
+    std::size_t buffer_;
+
+    std::mutex mutex_;
+    std::condition_variable ready_;
+    std::condition_variable space_;
+    std::deque<slicing::FlatContours> queue_;
+    std::exception_ptr error_;
+    bool stop_ = false;
+    bool done_ = false;
+    std::thread producer_;
+};
+
 NB_MODULE(_slicer, m) {
 
 
     m.def(
         "slice_mesh",
-        &pmp_slice_mesh,
+        nb::overload_cast<
+            Eigen::Ref<const compas::RowMatrixXd>,
+            Eigen::Ref<const compas::RowMatrixXi>,
+            Eigen::Ref<const compas::RowMatrixXd>,
+            Eigen::Ref<const compas::RowMatrixXd>>(&pmp_slice_mesh),
         "Slice a mesh with a set of planes defined by points and normals.\n\n"
         "Parameters\n"
         "----------\n"
@@ -53,5 +911,195 @@ NB_MODULE(_slicer, m) {
         "vertices"_a,
         "faces"_a,
         "points"_a,
-        "normals"_a);
-}
\ No newline at end of file
+        "normals"_a,
+        nb::call_guard<nb::gil_scoped_release>());
+
+    m.def(
+        "slice_mesh",
+        nb::overload_cast<
+            const compas::Mesh&,
+            Eigen::Ref<const compas::RowMatrixXd>,
+            Eigen::Ref<const compas::RowMatrixXd>>(&pmp_slice_mesh),
+        "Slice a native mesh with a set of planes defined by points and normals.",
+        "mesh"_a,
+        "points"_a,
+        "normals"_a,
+        nb::call_guard<nb::gil_scoped_release>());
+
+    m.def(
+        "slice_mesh_layers",
+        nb::overload_cast<
+            Eigen::Ref<const compas::RowMatrixXd>,
+            Eigen::Ref<const compas::RowMatrixXi>,
+            const std::vector<double>&,
+            const std::vector<double>&,
+            int>(&pmp_slice_mesh_layers),
+        "Slice a mesh with parallel planes at the given heights along a normal, in one sweep.",
+        "vertices"_a,
+        "faces"_a,
+        "normal"_a,
+        "heights"_a,
+        "num_threads"_a = 0,
+        nb::call_guard<nb::gil_scoped_release>());
+
+    m.def(
+        "slice_mesh_layers",
+        nb::overload_cast<
+            const compas::Mesh&,
+            const std::vector<double>&,
+            const std::vector<double>&,
+            int>(&pmp_slice_mesh_layers),
+        "Slice a native mesh with parallel planes at the given heights along a normal, in one sweep.",
+        "mesh"_a,
+        "normal"_a,
+        "heights"_a,
+        "num_threads"_a = 0,
+        nb::call_guard<nb::gil_scoped_release>());
+
+    nb::class_<Slicer>(m, "Slicer",
+        "Mesh slicer with a persistent AABB tree over the faces of a triangle mesh.")
+        .def(nb::init<Eigen::Ref<const compas::RowMatrixXd>, Eigen::Ref<const compas::RowMatrixXi>>(),
+             "vertices"_a, "faces"_a,
+             nb::call_guard<nb::gil_scoped_release>())
+        .def(nb::init<compas::Mesh>(),
+             "mesh"_a,
+             nb::call_guard<nb::gil_scoped_release>())
+        .def("slice", &Slicer::slice,
+             "Slice the mesh with a set of planes defined by points and normals.",
+             "points"_a, "normals"_a,
+             nb::call_guard<nb::gil_scoped_release>())
+        .def("slice_many", &Slicer::slice_many,
+             "Slice the mesh with a set of planes in parallel, with the polylines of every plane separately.",
+             "points"_a, "normals"_a, "num_threads"_a = 0,
+             nb::call_guard<nb::gil_scoped_release>())
+        .def("slice_flat", &Slicer::slice_flat,
+             "Slice the mesh with a set of planes in parallel, with the polylines of all planes in flat arrays.",
+             "points"_a, "normals"_a, "return_faces"_a = false, "num_threads"_a = 0,
+             nb::call_guard<nb::gil_scoped_release>())
+        .def_prop_ro("num_faces", &Slicer::num_faces);
+
+    m.def(
+        "slice_mesh_flat",
+        nb::overload_cast<
+            Eigen::Ref<const compas::RowMatrixXd>,
+            Eigen::Ref<const compas::RowMatrixXi>,
+            Eigen::Ref<const compas::RowMatrixXd>,
+            Eigen::Ref<const compas::RowMatrixXd>,
+            bool,
+            int>(&pmp_slice_mesh_flat),
+        "Slice a mesh with a set of planes, with the polylines of all planes in flat arrays: "
+        "points, offsets, plane indices, closed flags and crossed faces.",
+        "vertices"_a,
+        "faces"_a,
+        "points"_a,
+        "normals"_a,
+        "return_faces"_a = false,
+        "num_threads"_a = 0,
+        nb::call_guard<nb::gil_scoped_release>());
+
+    m.def(
+        "slice_mesh_flat",
+        nb::overload_cast<
+            const compas::Mesh&,
+            Eigen::Ref<const compas::RowMatrixXd>,
+            Eigen::Ref<const compas::RowMatrixXd>,
+            bool,
+            int>(&pmp_slice_mesh_flat),
+        "Slice a native mesh with a set of planes, with the polylines of all planes in flat arrays.",
+        "mesh"_a,
+        "points"_a,
+        "normals"_a,
+        "return_faces"_a = false,
+        "num_threads"_a = 0,
+        nb::call_guard<nb::gil_scoped_release>());
+
+    m.def(
+        "slice_mesh_layers_flat",
+        nb::overload_cast<
+            Eigen::Ref<const compas::RowMatrixXd>,
+            Eigen::Ref<const compas::RowMatrixXi>,
+            const std::vector<double>&,
+            const std::vector<double>&,
+            bool,
+            int>(&pmp_slice_mesh_layers_flat),
+        "Slice a mesh with parallel planes in one sweep, with the polylines of all planes in flat arrays.",
+        "vertices"_a,
+        "faces"_a,
+        "normal"_a,
+        "heights"_a,
+        "return_faces"_a = false,
+        "num_threads"_a = 0,
+        nb::call_guard<nb::gil_scoped_release>());
+
+    m.def(
+        "slice_mesh_layers_flat",
+        nb::overload_cast<
+            const compas::Mesh&,
+            const std::vector<double>&,
+            const std::vector<double>&,
+            bool,
+            int>(&pmp_slice_mesh_layers_flat),
+        "Slice a native mesh with parallel planes in one sweep, with the polylines of all planes in flat arrays.",
+        "mesh"_a,
+        "normal"_a,
+        "heights"_a,
+        "return_faces"_a = false,
+        "num_threads"_a = 0,
+        nb::call_guard<nb::gil_scoped_release>());
+
+    nb::class_<SliceStream>(m, "SliceStream",
+        "Slices a mesh with a set of planes chunk by chunk on a background thread.")
+        .def(nb::init<
+                 Eigen::Ref<const compas::RowMatrixXd>,
+                 Eigen::Ref<const compas::RowMatrixXi>,
+                 Eigen::Ref<const compas::RowMatrixXd>,
+                 Eigen::Ref<const compas::RowMatrixXd>,
+                 int, bool, int, int>(),
+             "vertices"_a, "faces"_a, "points"_a, "normals"_a,
+             "chunk"_a = 1, "return_faces"_a = false, "num_threads"_a = 0, "buffer"_a = 2,
+             nb::call_guard<nb::gil_scoped_release>())
+        .def(nb::init<
+                 compas::Mesh,
+                 Eigen::Ref<const compas::RowMatrixXd>,
+                 Eigen::Ref<const compas::RowMatrixXd>,
+                 int, bool, int, int>(),
+             "mesh"_a, "points"_a, "normals"_a,
+             "chunk"_a = 1, "return_faces"_a = false, "num_threads"_a = 0, "buffer"_a = 2,
+             nb::call_guard<nb::gil_scoped_release>())
+        .def("next", &SliceStream::next,
+             "The flat slices of the next chunk of planes, or None once all planes are sliced.",
+             nb::call_guard<nb::gil_scoped_release>())
+        .def("close", &SliceStream::close,
+             "Stop slicing and wait for the background thread.",
+             nb::call_guard<nb::gil_scoped_release>());
+
+    m.def(
+        "slice_mesh_regions",
+        nb::overload_cast<
+            Eigen::Ref<const compas::RowMatrixXd>,
+            Eigen::Ref<const compas::RowMatrixXi>,
+            Eigen::Ref<const compas::RowMatrixXd>,
+            Eigen::Ref<const compas::RowMatrixXd>,
+            int>(&pmp_slice_mesh_regions),
+        "Slice a mesh with a set of planes into regions: outer boundaries with their holes, in flat arrays.",
+        "vertices"_a,
+        "faces"_a,
+        "points"_a,
+        "normals"_a,
+        "num_threads"_a = 0,
+        nb::call_guard<nb::gil_scoped_release>());
+
+    m.def(
+        "slice_mesh_regions",
+        nb::overload_cast<
+            const compas::Mesh&,
+            Eigen::Ref<const compas::RowMatrixXd>,
+            Eigen::Ref<const compas::RowMatrixXd>,
+            int>(&pmp_slice_mesh_regions),
+        "Slice a native mesh with a set of planes into regions: outer boundaries with their holes, in flat arrays.",
+        "mesh"_a,
+        "points"_a,
+        "normals"_a,
+        "num_threads"_a = 0,
+        nb::call_guard<nb::gil_scoped_release>());
+}
@@ -4,6 +4,13 @@
 
 // CGAL slicer
 #include <CGAL/Polygon_mesh_slicer.h>
+#include <boost/iterator/function_output_iterator.hpp>
+
+#include <array>
+#include <cmath>
+#include <memory>
+#include <mutex>
+#include <numeric>
 
 /**
  * @brief Slice a mesh with a set of planes defined by points and normals.
@@ -20,3 +27,158 @@ pmp_slice_mesh(
     Eigen::Ref<const compas::RowMatrixXi> faces,
     Eigen::Ref<const compas::RowMatrixXd> points,
     Eigen::Ref<const compas::RowMatrixXd> normals);
+
+/**
+ * @brief Slice a native mesh with a set of planes defined by points and normals.
+ *
+ * @param mesh The mesh
+ * @param points Matrix of plane points as Kx3 matrix in row-major order (float64)
+ * @param normals Matrix of plane normals as Kx3 matrix in row-major order (float64)
+ * @return std::vector<compas::RowMatrixXd> Vector of polylines, each represented as a matrix of points (Px3 float64)
+ */
+std::vector<compas::RowMatrixXd>
+pmp_slice_mesh(
+    const compas::Mesh& mesh,
+    Eigen::Ref<const compas::RowMatrixXd> points,
+    Eigen::Ref<const compas::RowMatrixXd> normals);
+
+namespace slicing {
+
+/**
+ * Slice polylines of many planes in flat arrays:
+ *  - the points of all polylines as Nx3 matrix (float64),
+ *  - the offsets of the polylines in the points as (P+1)x1 matrix (int32),
+ *  - the index of the plane of every polyline as Px1 matrix (int32),
+ *  - whether every polyline is closed as Px1 matrix (int32, 0 or 1),
+ *  - the face crossed by the segment from every point to the next as Nx1
+ *    matrix (int32), with -1 after the last point of a polyline, or an
+ *    empty matrix if faces were not requested.
+ */
+using FlatContours = std::tuple<
+    compas::RowMatrixXd,
+    compas::RowMatrixXi,
+    compas::RowMatrixXi,
+    compas::RowMatrixXi,
+    compas::RowMatrixXi>;
+
+} // namespace slicing
+
+/**
+ * @brief Slice a mesh with parallel planes at a set of heights.
+ *
+ * The plane at height h contains the points x with dot(x, n) = h, for the
+ * unit vector n along the normal. The faces are sorted by height once and
+ * swept upwards through the sorted heights, with the layers split over the
+ * threads, so that every layer only visits the faces it crosses.
+ *
+ * Closed polylines repeat their first point. The outer contours of a closed,
+ * outward oriented mesh run counterclockwise seen from the normal, holes
+ * clockwise.
+ *
+ * @param mesh The mesh
+ * @param normal Common normal of the planes
+ * @param heights Heights of the planes along the unit normal
+ * @param num_threads Number of threads; 0 uses the hardware concurrency
+ * @return Per height, the polylines of the slice, each as Px3 matrix of points (float64)
+ */
+std::vector<std::vector<compas::RowMatrixXd>>
+pmp_slice_mesh_layers(
+    const compas::Mesh& mesh,
+    const std::vector<double>& normal,
+    const std::vector<double>& heights,
+    int num_threads = 0);
+
+std::vector<std::vector<compas::RowMatrixXd>>
+pmp_slice_mesh_layers(
+    Eigen::Ref<const compas::RowMatrixXd> vertices,
+    Eigen::Ref<const compas::RowMatrixXi> faces,
+    const std::vector<double>& normal,
+    const std::vector<double>& heights,
+    int num_threads = 0);
+
+/**
+ * @brief Slice a mesh with a set of planes, with the result in flat arrays.
+ *
+ * The planes are split over the threads. Faces intersected by a plane are
+ * found with an AABB tree over the faces of the mesh.
+ *
+ * @param mesh The mesh
+ * @param points Matrix of plane points as Kx3 matrix in row-major order (float64)
+ * @param normals Matrix of plane normals as Kx3 matrix in row-major order (float64)
+ * @param return_faces Whether to return the face crossed by every segment
+ * @param num_threads Number of threads; 0 uses the hardware concurrency
+ * @return slicing::FlatContours
+ */
+slicing::FlatContours
+pmp_slice_mesh_flat(
+    const compas::Mesh& mesh,
+    Eigen::Ref<const compas::RowMatrixXd> points,
+    Eigen::Ref<const compas::RowMatrixXd> normals,
+    bool return_faces = false,
+    int num_threads = 0);
+
+slicing::FlatContours
+pmp_slice_mesh_flat(
+    Eigen::Ref<const compas::RowMatrixXd> vertices,
+    Eigen::Ref<const compas::RowMatrixXi> faces,
+    Eigen::Ref<const compas::RowMatrixXd> points,
+    Eigen::Ref<const compas::RowMatrixXd> normals,
+    bool return_faces = false,
+    int num_threads = 0);
+
+/**
+ * @brief Slice a mesh with parallel planes at a set of heights, with the result in flat arrays.
+ *
+ * See `pmp_slice_mesh_layers`. Plane indices refer to the input order of the heights.
+ */
+slicing::FlatContours
+pmp_slice_mesh_layers_flat(
+    const compas::Mesh& mesh,
+    const std::vector<double>& normal,
+    const std::vector<double>& heights,
+    bool return_faces = false,
+    int num_threads = 0);
+
+slicing::FlatContours
+pmp_slice_mesh_layers_flat(
+    Eigen::Ref<const compas::RowMatrixXd> vertices,
+    Eigen::Ref<const compas::RowMatrixXi> faces,
+    const std::vector<double>& normal,
+    const std::vector<double>& heights,
+    bool return_faces = false,
+    int num_threads = 0);
+
+/**
+ * @brief Slice a mesh with a set of planes into regions with holes.
+ *
+ * The closed contours of every plane are nested by containment, in parallel
+ * over the planes. Every region is an outer boundary, counterclockwise seen
+ * from the plane normal, followed by its holes, clockwise. Loops do not
+ * repeat their first point. Open contours are skipped.
+ *
+ * @param mesh The mesh
+ * @param points Matrix of plane points as Kx3 matrix in row-major order (float64)
+ * @param normals Matrix of plane normals as Kx3 matrix in row-major order (float64)
+ * @param num_threads Number of threads; 0 uses the hardware concurrency
+ * @return std::tuple containing:
+ *         - The points of all loops as Nx3 matrix (float64)
+ *         - The offsets of the loops in the points as (L+1)x1 matrix (int32)
+ *         - The offsets of the regions in the loops as (R+1)x1 matrix (int32)
+ *         - The index of the plane of every region as Rx1 matrix (int32)
+ */
+std::tuple<compas::RowMatrixXd, compas::RowMatrixXi, compas::RowMatrixXi, compas::RowMatrixXi>
+pmp_slice_mesh_regions(
+    const compas::Mesh& mesh,
+    Eigen::Ref<const compas::RowMatrixXd> points,
+    Eigen::Ref<const compas::RowMatrixXd> normals,
+    int num_threads = 0);
+
+std::tuple<compas::RowMatrixXd, compas::RowMatrixXi, compas::RowMatrixXi, compas::RowMatrixXi>
+pmp_slice_mesh_regions(
+    Eigen::Ref<const compas::RowMatrixXd> vertices,
+    Eigen::Ref<const compas::RowMatrixXi> faces,
+    Eigen::Ref<const compas::RowMatrixXd> points,
+    Eigen::Ref<const compas::RowMatrixXd> normals,
+    int num_threads = 0);
+
+// Slicer and SliceStream classes are defined in slicer.cpp and exposed via nanobind
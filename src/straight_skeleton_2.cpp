@@ -321,7 +321,8 @@ NB_MODULE(_straight_skeleton_2, m) {
         "    - Vector of source vertex indices\n"
         "    - Matrix of skeleton edges (Kx2, int32)\n"
         "    - Vector of source edge indices",
-        "vertices"_a);
+        "vertices"_a,
+        nb::call_guard<nb::gil_scoped_release>());
 
     m.def(
         "create_interior_straight_skeleton_with_holes",
@@ -342,7 +343,8 @@ NB_MODULE(_straight_skeleton_2, m) {
         "    - Matrix of skeleton edges (Qx2, int32)\n"
         "    - Vector of source edge indices",
         "boundary_vertices"_a,
-        "hole_vertices"_a);
+        "hole_vertices"_a,
+        nb::call_guard<nb::gil_scoped_release>());
 
     m.def(
         "create_offset_polygons_2_inner",
@@ -360,7 +362,8 @@ NB_MODULE(_straight_skeleton_2, m) {
         "list\n"
         "    List of offset polygon matrices (each Mx2, float64)",
         "vertices"_a,
-        "offset_distance"_a);
+        "offset_distance"_a,
+        nb::call_guard<nb::gil_scoped_release>());
 
     m.def(
         "create_offset_polygons_2_inner_with_holes",
@@ -381,7 +384,8 @@ NB_MODULE(_straight_skeleton_2, m) {
         "    List of tuples (outer polygon, list of hole polygons)",
         "boundary_vertices"_a,
         "hole_vertices"_a,
-        "offset_distance"_a);
+        "offset_distance"_a,
+        nb::call_guard<nb::gil_scoped_release>());
 
     m.def(
         "create_offset_polygons_2_outer",
@@ -399,7 +403,8 @@ NB_MODULE(_straight_skeleton_2, m) {
         "list\n"
         "    List of offset polygon matrices (each Mx2, float64)",
         "vertices"_a,
-        "offset_distance"_a);
+        "offset_distance"_a,
+        nb::call_guard<nb::gil_scoped_release>());
 
     m.def(
         "create_offset_polygons_2_outer_with_holes",
@@ -420,7 +425,8 @@ NB_MODULE(_straight_skeleton_2, m) {
         "    List of tuples (outer polygon, list of hole polygons)",
         "boundary_vertices"_a,
         "hole_vertices"_a,
-        "offset_distance"_a);
+        "offset_distance"_a,
+        nb::call_guard<nb::gil_scoped_release>());
 
     m.def(
         "create_weighted_offset_polygons_2_inner",
@@ -441,7 +447,8 @@ NB_MODULE(_straight_skeleton_2, m) {
         "    List of offset polygon matrices (each Mx2, float64)",
         "vertices"_a,
         "offset_distance"_a,
-        "edge_weights"_a);
+        "edge_weights"_a,
+        nb::call_guard<nb::gil_scoped_release>());
 
     m.def(
         "create_weighted_offset_polygons_2_outer",
@@ -462,5 +469,6 @@ NB_MODULE(_straight_skeleton_2, m) {
         "    List of offset polygon matrices (each Mx2, float64)",
         "vertices"_a,
         "offset_distance"_a,
-        "edge_weights"_a);
+        "edge_weights"_a,
+        nb::call_guard<nb::gil_scoped_release>());
 }
\ No newline at end of file
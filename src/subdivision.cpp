@@ -1,5 +1,35 @@
 #include "subdivision.h"
 
+std::tuple<compas::RowMatrixXd, compas::RowMatrixXi>
+subd_catmullclark(
+    compas::Mesh mesh,
+    unsigned int num_iterations)
+{
+    CGAL::Subdivision_method_3::CatmullClark_subdivision(mesh, CGAL::parameters::number_of_iterations(num_iterations));
+    mesh.collect_garbage();
+    return compas::quadmesh_to_vertices_and_faces(mesh);
+}
+
+std::tuple<compas::RowMatrixXd, compas::RowMatrixXi>
+subd_loop(
+    compas::Mesh mesh,
+    unsigned int num_iterations)
+{
+    CGAL::Subdivision_method_3::Loop_subdivision(mesh, CGAL::parameters::number_of_iterations(num_iterations));
+    mesh.collect_garbage();
+    return compas::mesh_to_vertices_and_faces(mesh);
+}
+
+std::tuple<compas::RowMatrixXd, compas::RowMatrixXi>
+subd_sqrt3(
+    compas::Mesh mesh,
+    unsigned int num_iterations)
+{
+    CGAL::Subdivision_method_3::Sqrt3_subdivision(mesh, CGAL::parameters::number_of_iterations(num_iterations));
+    mesh.collect_garbage();
+    return compas::mesh_to_vertices_and_faces(mesh);
+}
+
 std::tuple<compas::RowMatrixXd, compas::RowMatrixXi>
 subd_catmullclark(
     Eigen::Ref<const compas::RowMatrixXd> vertices,
@@ -40,7 +70,7 @@ NB_MODULE(_subdivision, m) {
 
     m.def(
         "subd_catmullclark",
-        &subd_catmullclark,
+        nb::overload_cast<Eigen::Ref<const compas::RowMatrixXd>, const std::vector<std::vector<int>>&, unsigned int>(&subd_catmullclark),
         "Catmull-Clark subdivision of a polygonal mesh.\n\n"
         "Parameters\n"
         "----------\n"
@@ -58,11 +88,12 @@ NB_MODULE(_subdivision, m) {
         "    - Matrix of subdivided face vertex indices (Px4, int32)",
         "vertices"_a,
         "faces"_a,
-        "num_iterations"_a);
+        "num_iterations"_a,
+        nb::call_guard<nb::gil_scoped_release>());
 
     m.def(
         "subd_loop",
-        &subd_loop,
+        nb::overload_cast<Eigen::Ref<const compas::RowMatrixXd>, Eigen::Ref<const compas::RowMatrixXi>, unsigned int>(&subd_loop),
         "Loop subdivision of a triangular mesh.\n\n"
         "Parameters\n"
         "----------\n"
@@ -80,11 +111,12 @@ NB_MODULE(_subdivision, m) {
         "    - Matrix of subdivided face vertex indices (Qx3, int32)",
         "vertices"_a,
         "faces"_a,
-        "num_iterations"_a);
+        "num_iterations"_a,
+        nb::call_guard<nb::gil_scoped_release>());
 
     m.def(
         "subd_sqrt3",
-        &subd_sqrt3,
+        nb::overload_cast<Eigen::Ref<const compas::RowMatrixXd>, Eigen::Ref<const compas::RowMatrixXi>, unsigned int>(&subd_sqrt3),
         "Sqrt3 subdivision of a triangular mesh.\n\n"
         "Parameters\n"
         "----------\n"
@@ -102,5 +134,30 @@ NB_MODULE(_subdivision, m) {
         "    - Matrix of subdivided face vertex indices (Qx3, int32)",
         "vertices"_a,
         "faces"_a,
-        "num_iterations"_a);
+        "num_iterations"_a,
+        nb::call_guard<nb::gil_scoped_release>());
+
+    m.def(
+        "subd_catmullclark",
+        nb::overload_cast<compas::Mesh, unsigned int>(&subd_catmullclark),
+        "Catmull-Clark subdivision of a native triangle mesh.",
+        "mesh"_a,
+        "num_iterations"_a,
+        nb::call_guard<nb::gil_scoped_release>());
+
+    m.def(
+        "subd_loop",
+        nb::overload_cast<compas::Mesh, unsigned int>(&subd_loop),
+        "Loop subdivision of a native triangle mesh.",
+        "mesh"_a,
+        "num_iterations"_a,
+        nb::call_guard<nb::gil_scoped_release>());
+
+    m.def(
+        "subd_sqrt3",
+        nb::overload_cast<compas::Mesh, unsigned int>(&subd_sqrt3),
+        "Sqrt3 subdivision of a native triangle mesh.",
+        "mesh"_a,
+        "num_iterations"_a,
+        nb::call_guard<nb::gil_scoped_release>());
 }
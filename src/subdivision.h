@@ -54,4 +54,22 @@ std::tuple<compas::RowMatrixXd, compas::RowMatrixXi>
 subd_sqrt3(
     Eigen::Ref<const compas::RowMatrixXd> vertices,
     Eigen::Ref<const compas::RowMatrixXi> faces,
-    unsigned int num_iterations);
\ No newline at end of file
+    unsigned int num_iterations);
+
+// Overloads operating on a native mesh (see `_mesh.CgalMesh`).
+// Subdivision modifies its input, so the native mesh is copied.
+
+std::tuple<compas::RowMatrixXd, compas::RowMatrixXi>
+subd_catmullclark(
+    compas::Mesh mesh,
+    unsigned int num_iterations);
+
+std::tuple<compas::RowMatrixXd, compas::RowMatrixXi>
+subd_loop(
+    compas::Mesh mesh,
+    unsigned int num_iterations);
+
+std::tuple<compas::RowMatrixXd, compas::RowMatrixXi>
+subd_sqrt3(
+    compas::Mesh mesh,
+    unsigned int num_iterations);
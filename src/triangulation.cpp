@@ -401,7 +401,8 @@ NB_MODULE(_triangulation, m) {
         "delaunay_triangulation",
         &pmp_delaunay_triangulation,
         "Create a Delaunay triangulation from a set of points.",
-        "vertices"_a);
+        "vertices"_a,
+        nb::call_guard<nb::gil_scoped_release>());
 
     m.def(
         "constrained_delaunay_triangulation",
@@ -411,7 +412,8 @@ NB_MODULE(_triangulation, m) {
         "internal_vertices"_a,
         "holes"_a,
         "curves"_a,
-        "is_conforming"_a = false);
+        "is_conforming"_a = false,
+        nb::call_guard<nb::gil_scoped_release>());
 
     m.def(
         "refined_delaunay_mesh",
@@ -423,5 +425,6 @@ NB_MODULE(_triangulation, m) {
         "curves"_a,
         "min_angle"_a = 0.0,
         "max_length"_a = 0.0,
-        "is_optimized"_a = true);
+        "is_optimized"_a = true,
+        nb::call_guard<nb::gil_scoped_release>());
 }
\ No newline at end of file
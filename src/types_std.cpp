@@ -8,5 +8,6 @@ NB_MODULE(_types_std, m) {
     nb::bind_vector<std::vector<compas::RowMatrixXd>>(m, "VectorRowMatrixXd");
     nb::bind_vector<std::vector<compas::RowMatrixXi>>(m, "VectorRowMatrixXi");
     nb::bind_vector<std::vector<std::vector<compas::RowMatrixXd>>>(m, "VectorVectorRowMatrixXd");
+    nb::bind_vector<std::vector<std::vector<compas::RowMatrixXi>>>(m, "VectorVectorRowMatrixXi");
 
 }
\ No newline at end of file
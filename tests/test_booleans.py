@@ -1,10 +1,15 @@
+import warnings
+from concurrent.futures import ThreadPoolExecutor
+
 import pytest
 import numpy as np
 
-from compas.geometry import Box, Sphere
+from compas.geometry import Box, Plane, Sphere
 from compas.datastructures import Mesh
 
 from compas_cgal.booleans import (
+    BooleanAccumulator,
+    BooleanSolver,
     boolean_chain,
     boolean_chain_with_face_source,
     boolean_difference_mesh_mesh,
@@ -14,11 +19,20 @@ from compas_cgal.booleans import (
     boolean_intersection_mesh_mesh,
     boolean_intersection_mesh_mesh_with_edges,
     boolean_intersection_mesh_mesh_with_face_source,
+    boolean_many,
+    boolean_mesh_mesh,
+    boolean_union_many,
     boolean_union_mesh_mesh,
     boolean_union_mesh_mesh_with_edges,
     boolean_union_mesh_mesh_with_face_source,
+    clip_mesh_box,
+    clip_mesh_boxes,
+    clip_mesh_mesh,
+    clip_mesh_plane,
+    split_by_source,
     split_mesh_mesh,
 )
+from compas_cgal.measure import mesh_volume
 
 
 @pytest.fixture
@@ -146,6 +160,42 @@ def test_boolean_difference_mesh_meshes(box_sphere_meshes):
     assert len(V_two) > len(V_single)
 
 
+def test_boolean_difference_mesh_meshes_overlapping_cutters():
+    """Overlapping cutters are merged automatically before the single difference."""
+    box = Box.from_width_height_depth(4.0, 1.0, 1.0).to_vertices_and_faces(triangulated=True)
+    cutters = [Sphere(0.4, point=[x, 0, 0.5]).to_vertices_and_faces(u=16, v=16, triangulated=True) for x in (-1.5, -1.0, -0.5, 1.0)]
+
+    V, F = boolean_difference_mesh_meshes(box, cutters)
+    mesh = Mesh.from_vertices_and_faces(V, F)
+    assert mesh.is_valid()
+    assert mesh.euler() == 2
+
+    V_ref, F_ref = boolean_chain([box] + cutters, ["difference"] * len(cutters))
+    assert len(F) == pytest.approx(len(F_ref), rel=0.1)
+
+
+def test_boolean_difference_mesh_meshes_nested_cutters():
+    """A cutter fully inside another is grouped with it and adds no cuts."""
+    box = Box.from_width_height_depth(4.0, 1.0, 1.0).to_vertices_and_faces(triangulated=True)
+    outer = Sphere(0.4, point=[0, 0, 0.5]).to_vertices_and_faces(u=16, v=16, triangulated=True)
+    inner = Sphere(0.15, point=[0, 0, 0.5]).to_vertices_and_faces(u=16, v=16, triangulated=True)
+
+    V, F = boolean_difference_mesh_meshes(box, [outer, inner])
+    mesh = Mesh.from_vertices_and_faces(V, F)
+    assert mesh.is_valid()
+    assert mesh.euler() == 2
+
+    V_ref, F_ref = boolean_difference_mesh_mesh(box, outer)
+    assert len(F) == len(F_ref)
+    assert mesh_volume((V, F)) == pytest.approx(mesh_volume((V_ref, F_ref)))
+
+
+def test_boolean_difference_mesh_meshes_no_cutters(box_sphere_meshes):
+    box, _ = box_sphere_meshes
+    V, F = boolean_difference_mesh_meshes(box, [])
+    assert len(F) == len(box[1])
+
+
 @pytest.mark.parametrize(
     "fn",
     [
@@ -202,6 +252,8 @@ def test_boolean_chain_validation(box_sphere_meshes):
         boolean_chain([A, B], ["nope"])  # unknown op
     with pytest.raises(ValueError):
         boolean_chain([A, B, A], ["difference"])  # mismatched lengths
+    with pytest.raises(ValueError):
+        boolean_chain([A, B, A], ["xor", "union"])  # xor before the last step
 
 
 def test_boolean_chain_with_face_source():
@@ -226,10 +278,18 @@ def test_boolean_chain_with_face_source():
     assert (mids == 2).any()
 
 
-def test_boolean_chain_with_face_source_xor_rejected(box_sphere_meshes):
+@pytest.mark.parametrize("hybrid", [False, True])
+def test_boolean_chain_with_face_source_xor(box_sphere_meshes, hybrid):
     A, B = box_sphere_meshes
-    with pytest.raises(ValueError):
-        boolean_chain_with_face_source([A, B], ["xor"])
+    V, F, S = boolean_chain_with_face_source([A, B], ["xor"], hybrid=hybrid)
+    V_ref, F_ref = boolean_chain([A, B], ["xor"], hybrid=hybrid)
+
+    assert len(F) == len(F_ref)
+    assert S.shape == (len(F), 2)
+    assert set(S[:, 0].tolist()) == {0, 1}
+
+    V_inter, F_inter = boolean_intersection_mesh_mesh(A, B)
+    assert mesh_volume((V, F)) == pytest.approx(mesh_volume(A) + mesh_volume(B) - 2 * mesh_volume((V_inter, F_inter)), rel=1e-3)
 
 
 def test_boolean_chain_drilled_rounded_cube():
@@ -268,3 +328,366 @@ def test_boolean_with_face_source_disjoint(box_sphere_meshes):
     assert (S[:, 0] == 0).all()
     # face_ids should be a permutation of [0, n_a) since no faces were cut.
     assert sorted(S[:, 1].tolist()) == list(range(len(box[1])))
+
+
+def test_boolean_concurrent_threads(box_sphere_meshes):
+    """Booleans release the GIL, so they can run from several Python threads at once."""
+    box, sphere = box_sphere_meshes
+    expected_V, expected_F = boolean_union_mesh_mesh(box, sphere)
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        results = list(executor.map(lambda _: boolean_union_mesh_mesh(box, sphere), range(8)))
+
+    for V, F in results:
+        assert V.shape == expected_V.shape
+        assert F.shape == expected_F.shape
+
+
+def test_boolean_many(box_sphere_meshes):
+    """Each item of the batch equals the corresponding pairwise boolean."""
+    box, sphere = box_sphere_meshes
+    V_s, F_s = np.asarray(sphere[0]), np.asarray(sphere[1])
+    spheres = [(V_s + np.array([dx, 0.0, 0.0]), F_s) for dx in (0.0, -0.5, -1.0)]
+
+    results, errors = boolean_many(box, spheres, "difference")
+
+    assert len(results) == len(spheres)
+    assert errors == [None, None, None]
+    for (V, F), B in zip(results, spheres):
+        V_ref, F_ref = boolean_difference_mesh_mesh(box, B)
+        assert V.shape == V_ref.shape
+        assert F.shape == F_ref.shape
+
+
+def test_boolean_many_reports_failures(box_sphere_meshes):
+    """A self-intersecting operand fails on its own without aborting the batch."""
+    box, sphere = box_sphere_meshes
+    V_b, F_b = np.asarray(box[0], dtype=np.float64), np.asarray(box[1], dtype=np.int32)
+    overlapping = (np.vstack([V_b, V_b + 0.5]), np.vstack([F_b, F_b + len(V_b)]))
+
+    results, errors = boolean_many(box, [sphere, overlapping], "union")
+
+    assert results[0] is not None
+    assert errors[0] is None
+    assert results[1] is None
+    assert isinstance(errors[1], str)
+
+
+def test_boolean_many_validation(box_sphere_meshes):
+    box, sphere = box_sphere_meshes
+    with pytest.raises(ValueError):
+        boolean_many(box, [sphere], "split")
+
+
+@pytest.mark.parametrize("exact", [True, False])
+def test_boolean_union_many(exact):
+    """A row of overlapping spheres next to a far away one: one corefined group plus one concatenated group."""
+    spheres = [Sphere(0.6, point=[x, 0, 0]).to_vertices_and_faces(u=16, v=16, triangulated=True) for x in range(5)]
+    far = Sphere(0.6, point=[100, 0, 0]).to_vertices_and_faces(u=16, v=16, triangulated=True)
+
+    V, F = boolean_union_many(spheres + [far], exact=exact)
+
+    mesh = Mesh.from_vertices_and_faces(V, F)
+    assert mesh.is_valid()
+    # two closed components: the merged row and the far sphere
+    assert mesh.euler() == 4
+
+    V_chain, F_chain = boolean_chain(spheres, ["union"] * 4)
+    assert len(F) == pytest.approx(len(F_chain) + len(far[1]), rel=0.1)
+
+
+def test_boolean_union_many_empty():
+    V, F = boolean_union_many([])
+    assert V.shape == (0, 3)
+    assert F.shape == (0, 3)
+
+
+def test_boolean_broad_phase_disjoint(box_sphere_meshes):
+    """Operands with disjoint bounding boxes are combined without corefinement."""
+    box, _ = box_sphere_meshes
+    far = Sphere(0.5, point=[10, 0, 0]).to_vertices_and_faces(u=16, v=16, triangulated=True)
+
+    V, F, path = boolean_union_mesh_mesh(box, far, return_path=True)
+    assert path == "bbox"
+    assert len(F) == len(box[1]) + len(far[1])
+
+    V, F, path = boolean_difference_mesh_mesh(box, far, return_path=True)
+    assert path == "bbox"
+    assert len(F) == len(box[1])
+
+    V, F, path = boolean_intersection_mesh_mesh(box, far, return_path=True)
+    assert path == "bbox"
+    assert len(F) == 0
+
+
+def test_boolean_broad_phase_nested():
+    """A sphere strictly inside a box is resolved by the AABB tree test."""
+    box = Box.from_width_height_depth(4.0, 4.0, 4.0).to_vertices_and_faces(triangulated=True)
+    sphere = Sphere(0.5).to_vertices_and_faces(u=16, v=16, triangulated=True)
+
+    V, F, path = boolean_union_mesh_mesh(box, sphere, return_path=True)
+    assert path == "aabb"
+    assert len(F) == len(box[1])
+
+    V, F, path = boolean_intersection_mesh_mesh(box, sphere, return_path=True)
+    assert path == "aabb"
+    assert len(F) == len(sphere[1])
+
+    V, F, path = boolean_difference_mesh_mesh(sphere, box, return_path=True)
+    assert path == "aabb"
+    assert len(F) == 0
+
+
+def test_boolean_broad_phase_overlap(box_sphere_meshes):
+    box, sphere = box_sphere_meshes
+    _, _, path = boolean_union_mesh_mesh(box, sphere, return_path=True)
+    assert path == "corefinement"
+
+
+@pytest.mark.parametrize(
+    "fn",
+    [boolean_union_mesh_mesh, boolean_difference_mesh_mesh, boolean_intersection_mesh_mesh],
+)
+def test_boolean_localized(fn):
+    """A small cutter on a finely tessellated sphere gives the same faces as the full operation."""
+    A = Sphere(5.0).to_vertices_and_faces(u=64, v=64, triangulated=True)
+    B = Box.from_width_height_depth(1.0, 1.0, 1.0).to_vertices_and_faces(triangulated=True)
+    B = (np.asarray(B[0]) + [5.0, 0.2, 0.3], B[1])
+
+    V, F, path = fn(A, B, return_path=True, localized=True)
+    V_full, F_full = fn(A, B)
+
+    assert path == "localized"
+    assert len(F) == len(F_full)
+    assert len(V) == len(V_full)
+    mesh = Mesh.from_vertices_and_faces(V, F)
+    assert mesh.is_valid()
+    assert mesh.is_closed()
+    assert mesh.euler() == Mesh.from_vertices_and_faces(V_full, F_full).euler()
+    assert mesh_volume((V, F)) == pytest.approx(mesh_volume((V_full, F_full)))
+
+
+def test_boolean_localized_fallback(box_sphere_meshes):
+    """Disjoint operands fall back to the full operation."""
+    box, _ = box_sphere_meshes
+    far = Sphere(0.5, point=[10, 0, 0]).to_vertices_and_faces(u=16, v=16, triangulated=True)
+    V, F, path = boolean_difference_mesh_mesh(box, far, return_path=True, localized=True)
+    assert path == "bbox"
+    assert len(F) == len(box[1])
+
+
+def _assert_valid_clip(V, F):
+    assert len(F) > 0
+    assert F.min() >= 0
+    assert F.max() < len(V)
+    assert Mesh.from_vertices_and_faces(V, F).is_valid()
+
+
+def test_clip_mesh_plane():
+    sphere = Sphere(1.0).to_vertices_and_faces(u=32, v=32, triangulated=True)
+
+    V, F = clip_mesh_plane(sphere, Plane([0, 0, 0], [0, 0, 1]))
+    _assert_valid_clip(V, F)
+    assert V[:, 2].max() <= 1e-9
+
+    V, F = clip_mesh_plane(sphere, Plane([0, 0, 0], [0, 0, 1]), close=True)
+    _assert_valid_clip(V, F)
+    mesh = Mesh.from_vertices_and_faces(V, F)
+    assert mesh.is_closed()
+
+
+def test_clip_mesh_box():
+    sphere = Sphere(1.0).to_vertices_and_faces(u=32, v=32, triangulated=True)
+    V, F = clip_mesh_box(sphere, [[0, 0, 0], [2, 2, 2]])
+    _assert_valid_clip(V, F)
+    assert V.min() >= -1e-9
+
+    V, F = clip_mesh_box(sphere, [[0, 0, 0], [2, 2, 2]], close=True)
+    _assert_valid_clip(V, F)
+    assert V.min() >= -1e-9
+
+
+def test_clip_mesh_boxes():
+    """Tiles of a sphere match clipping with every box separately."""
+    sphere = Sphere(1.0).to_vertices_and_faces(u=32, v=32, triangulated=True)
+    boxes = [[[x, -2, -2], [x + 0.5, 2, 2]] for x in (-1.0, -0.5, 0.0, 0.5)]
+
+    tiles = clip_mesh_boxes(sphere, boxes)
+    assert len(tiles) == len(boxes)
+    for box, (V, F) in zip(boxes, tiles):
+        _assert_valid_clip(V, F)
+        V_single, F_single = clip_mesh_box(sphere, box)
+        assert len(F) == len(F_single)
+
+    assert clip_mesh_boxes(sphere, np.zeros((0, 6))) == []
+
+
+def test_clip_mesh_mesh(box_sphere_meshes):
+    box, sphere = box_sphere_meshes
+    V, F = clip_mesh_mesh(box, sphere)
+    _assert_valid_clip(V, F)
+
+
+def test_boolean_solver(box_sphere_meshes):
+    """Repeated operations on a prepared mesh match the one-shot functions."""
+    box, sphere = box_sphere_meshes
+    solver = BooleanSolver(box)
+    assert solver.num_faces == len(box[1])
+
+    for fn, method in [
+        (boolean_union_mesh_mesh, solver.union),
+        (boolean_difference_mesh_mesh, solver.difference),
+        (boolean_intersection_mesh_mesh, solver.intersection),
+    ]:
+        V, F, path = method(sphere, return_path=True)
+        V_ref, F_ref = fn(box, sphere)
+        assert path == "corefinement"
+        assert len(F) == len(F_ref)
+        assert Mesh.from_vertices_and_faces(V, F).euler() == 2
+
+
+def test_boolean_solver_moving_tool():
+    box = Box.from_width_height_depth(4.0, 4.0, 4.0).to_vertices_and_faces(triangulated=True)
+    solver = BooleanSolver(box)
+
+    inside = Sphere(0.5).to_vertices_and_faces(u=16, v=16, triangulated=True)
+    V, F, path = solver.difference(inside, return_path=True)
+    assert path == "aabb"
+    assert len(F) == len(box[1]) + len(inside[1])
+
+    far = Sphere(0.5, point=[10, 0, 0]).to_vertices_and_faces(u=16, v=16, triangulated=True)
+    V, F, path = solver.difference(far, return_path=True)
+    assert path == "bbox"
+    assert len(F) == len(box[1])
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        tools = [Sphere(0.5, point=[x, 0, 2]).to_vertices_and_faces(u=16, v=16, triangulated=True) for x in (-1.0, 0.0, 1.0)]
+        results = list(pool.map(solver.difference, tools))
+    for V, F in results:
+        assert Mesh.from_vertices_and_faces(V, F).euler() == 2
+
+
+@pytest.mark.parametrize("operation", ["union", "difference", "intersection"])
+def test_boolean_mesh_mesh(box_sphere_meshes, operation):
+    """One corefinement gives the same edges and face sources as the separate variants."""
+    box, sphere = box_sphere_meshes
+    V, F, E, S, VS = boolean_mesh_mesh(box, sphere, operation)
+
+    _, F_edges, E_ref = globals()[f"boolean_{operation}_mesh_mesh_with_edges"](box, sphere)
+    _, F_source, S_ref = globals()[f"boolean_{operation}_mesh_mesh_with_face_source"](box, sphere)
+    assert len(F) == len(F_edges) == len(F_source)
+    assert len(E) == len(E_ref)
+    assert S.shape == S_ref.shape
+    assert sorted(map(tuple, S.tolist())) == sorted(map(tuple, S_ref.tolist()))
+
+    assert VS.shape == (len(V), 2)
+    # the vertices of the intersection curves are (almost all) new
+    assert (VS[np.unique(E), 0] == -1).mean() > 0.9
+    for mesh_id, mesh in enumerate((box, sphere)):
+        rows = VS[:, 0] == mesh_id
+        assert np.allclose(V[rows], np.asarray(mesh[0])[VS[rows, 1]])
+
+
+def test_boolean_mesh_mesh_selection(box_sphere_meshes):
+    box, sphere = box_sphere_meshes
+    assert len(boolean_mesh_mesh(box, sphere, "union", False, False, False)) == 2
+    V, F, S = boolean_mesh_mesh(box, sphere, "union", return_edges=False, return_vertex_source=False)
+    assert S.shape == (len(F), 2)
+    with pytest.raises(ValueError):
+        boolean_mesh_mesh(box, sphere, "xor")
+
+
+@pytest.mark.parametrize("hybrid", [False, True])
+def test_boolean_accumulator(hybrid):
+    cube = Box(2).to_vertices_and_faces(triangulated=True)
+
+    def tools():
+        for x in (-1.0, 0.0, 1.0):
+            yield Sphere(0.5, point=[x, 0, 1]).to_vertices_and_faces(u=16, v=16, triangulated=True)
+
+    V_ref, F_ref = boolean_chain([cube, *tools()], ["difference"] * 3, hybrid=hybrid)
+
+    acc = BooleanAccumulator(cube, hybrid=hybrid)
+    for tool in tools():
+        acc.apply("difference", tool)
+    V, F = acc.result()
+
+    assert acc.num_meshes == 4
+    assert V.shape == V_ref.shape
+    assert F.shape == F_ref.shape
+
+
+def test_boolean_accumulator_sources():
+    cube = Box(2).to_vertices_and_faces(triangulated=True)
+    sphere = Sphere(0.8, point=[1, 1, 1]).to_vertices_and_faces(u=32, v=32, triangulated=True)
+
+    acc = BooleanAccumulator(cube, track_sources=True).apply("difference", sphere)
+    V, F, S = acc.result()
+    _, F_ref, S_ref = boolean_chain_with_face_source([cube, sphere], ["difference"])
+
+    assert S.shape == (len(F), 2)
+    assert sorted(map(tuple, S.tolist())) == sorted(map(tuple, S_ref.tolist()))
+
+    with pytest.raises(ValueError):
+        acc.apply("nope", sphere)
+    assert acc.num_meshes == 2
+
+    V, F, S = acc.apply("xor", sphere).result()
+    assert S.shape == (len(F), 2)
+    assert acc.num_meshes == 3
+
+    with pytest.raises(ValueError):
+        acc.apply("union", sphere)
+    assert acc.num_meshes == 3
+
+
+@pytest.mark.parametrize("hybrid", [False, True])
+def test_boolean_chain_snap_every(hybrid):
+    cube = Box(2).to_vertices_and_faces(triangulated=True)
+    spheres = [Sphere(0.4, point=[x, 0.2 * x, 1]).to_vertices_and_faces(u=16, v=16, triangulated=True) for x in (-0.9, -0.5, -0.1, 0.3, 0.7)]
+    meshes = [cube] + spheres
+    operations = ["difference"] * len(spheres)
+
+    V_ref, F_ref = boolean_chain(meshes, operations, hybrid=hybrid)
+    with warnings.catch_warnings():
+        # Every rounding is checked; none of these may break the intermediate result.
+        warnings.simplefilter("error", RuntimeWarning)
+        for snap_every in (1, 2):
+            V, F = boolean_chain(meshes, operations, hybrid=hybrid, snap_every=snap_every)
+            assert len(F) == len(F_ref)
+            assert mesh_volume((V, F)) == pytest.approx(mesh_volume((V_ref, F_ref)))
+
+        V, F, S = boolean_chain_with_face_source(meshes, operations, hybrid=hybrid, snap_every=1, snap_rollback=False)
+        assert S.shape == (len(F), 2)
+        assert len(F) == len(F_ref)
+
+        acc = BooleanAccumulator(cube, hybrid=hybrid, snap_every=2)
+        for sphere in spheres:
+            acc.apply("difference", sphere)
+        V, F = acc.result()
+        assert len(F) == len(F_ref)
+        assert acc.num_failed_snaps == 0
+
+    with pytest.raises(ValueError):
+        boolean_chain(meshes, operations, snap_every=-1)
+
+
+def test_split_by_source():
+    cube = Box(2).to_vertices_and_faces(triangulated=True)
+    spheres = [Sphere(0.5, point=[x, 0, 1]).to_vertices_and_faces(u=16, v=16, triangulated=True) for x in (-1.0, 0.0, 1.0)]
+    V, F, S = boolean_chain_with_face_source([cube] + spheres, ["difference"] * 3)
+
+    split = split_by_source(V, F, S)
+    assert list(split) == sorted(set(S[:, 0].tolist()))
+    assert split.face_offsets[-1] == len(F)
+    for mesh_id, (V_sub, F_sub) in split.items():
+        F_ref = F[S[:, 0] == mesh_id]
+        used = np.unique(F_ref)
+        assert np.allclose(V_sub, V[used])
+        assert np.array_equal(used[F_sub], F_ref)
+
+    split = split_by_source(V, F, S, by_face=True)
+    assert len(split) == len(np.unique(S, axis=0))
+    V_sub, F_sub = split[tuple(S[0].tolist())]
+    assert len(F_sub) == np.all(S == S[0], axis=1).sum()
+    assert F_sub.max() < len(V_sub)
@@ -1,3 +1,5 @@
+from concurrent.futures import ThreadPoolExecutor
+
 import pytest
 import numpy as np
 
@@ -175,3 +177,18 @@ def test_geodesic_isolines_empty(sphere_mesh):
     # Should return empty list
     assert isinstance(isolines, list)
     assert len(isolines) == 0
+
+
+def test_heat_solver_shared_between_threads(sphere_mesh):
+    """Test that a solver shared by several threads gives the same distances as serial calls."""
+    V, F = sphere_mesh
+    solver = HeatGeodesicSolver((V, F))
+    sources = [[0], [1], [2], [3], [0, 5]]
+
+    expected = [solver.solve(s) for s in sources]
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        results = list(executor.map(solver.solve, sources))
+
+    for result, reference in zip(results, expected):
+        assert np.allclose(result, reference)
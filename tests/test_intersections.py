@@ -2,7 +2,9 @@ import pytest
 import numpy as np
 
 from compas.geometry import Box, Sphere
+from compas_cgal.intersections import collision_matrix
 from compas_cgal.intersections import intersection_mesh_mesh
+from compas_cgal.intersections import intersection_mesh_meshes
 
 
 @pytest.fixture
@@ -32,3 +34,42 @@ def test_intersection_mesh_mesh(box_sphere_meshes):
         assert isinstance(points, np.ndarray), "Each pointset should be a numpy array"
         assert points.shape[1] == 3, "Points should be 3D"
         assert len(points) > 1, "Each intersection curve should have multiple points"
+
+
+def test_collision_matrix():
+    boxes = [Box(1).translated([0.8 * i, 0, 0]).to_vertices_and_faces(triangulated=True) for i in range(4)]
+    inner = Box(0.2).translated([3, 3, 3]).to_vertices_and_faces(triangulated=True)
+    outer = Box(1).translated([3, 3, 3]).to_vertices_and_faces(triangulated=True)
+    meshes = boxes + [inner, outer]
+
+    pairs = collision_matrix(meshes)
+    assert pairs.tolist() == [[0, 1], [1, 2], [2, 3]]
+
+    pairs = collision_matrix(meshes, solid=True, num_threads=2)
+    assert pairs.tolist() == [[0, 1], [1, 2], [2, 3], [4, 5]]
+
+    pairs, polylines = collision_matrix(meshes, return_polylines=True)
+    assert len(polylines) == len(pairs)
+    for lines in polylines:
+        assert len(lines) > 0
+        assert all(points.shape[1] == 3 for points in lines)
+
+    assert collision_matrix([]).shape == (0, 2)
+
+
+def test_intersection_mesh_meshes():
+    A = Box(2).to_vertices_and_faces(triangulated=True)
+    Bs = [Sphere(0.5, point=[x, 0.1, 0.2]).to_vertices_and_faces(u=16, v=16, triangulated=True) for x in (0, 1, 3, -1)]
+
+    polylines, faces = intersection_mesh_meshes(A, Bs, num_threads=2)
+    assert [len(lines) for lines in polylines] == [0, 1, 0, 1]
+    assert len(faces) == len(Bs)
+
+    for B, lines, tags in zip(Bs, polylines, faces):
+        for points, pairs in zip(lines, tags):
+            assert points.shape[1] == 3
+            assert pairs.shape == (len(points) - 1, 2)
+            assert np.all((pairs[:, 0] >= 0) & (pairs[:, 0] < len(A[1])))
+            assert np.all((pairs[:, 1] >= 0) & (pairs[:, 1] < len(B[1])))
+        for points in lines:
+            assert np.allclose(points[0], points[-1])
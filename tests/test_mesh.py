@@ -0,0 +1,84 @@
+"""Tests for the native CgalMesh handle."""
+
+import numpy as np
+import pytest
+from compas.geometry import Box, Plane, Sphere
+
+from compas_cgal.booleans import boolean_union_mesh_mesh
+from compas_cgal.geodesics import HeatGeodesicSolver, heat_geodesic_distances
+from compas_cgal.intersections import intersection_mesh_mesh
+from compas_cgal.measure import mesh_area, mesh_volume
+from compas_cgal.mesh import CgalMesh
+from compas_cgal.slicer import slice_mesh
+
+
+@pytest.fixture
+def box_sphere_meshes():
+    box = Box.from_width_height_depth(2.0, 2.0, 2.0)
+    sphere = Sphere(1.0, point=[1, 1, 1])
+    return box.to_vertices_and_faces(triangulated=True), sphere.to_vertices_and_faces(u=32, v=32, triangulated=True)
+
+
+def test_round_trip(box_sphere_meshes):
+    V, F = box_sphere_meshes[0]
+    mesh = CgalMesh((V, F))
+
+    assert mesh.number_of_vertices == len(V)
+    assert mesh.number_of_faces == len(F)
+
+    V2, F2 = mesh.to_vertices_and_faces()
+    assert np.allclose(V2, np.asarray(V, dtype=np.float64))
+    assert np.array_equal(F2, np.asarray(F, dtype=np.int32))
+
+
+def test_measure_native():
+    box = Box.from_width_height_depth(1, 1, 1)
+    mesh = CgalMesh(box.to_vertices_and_faces(triangulated=True))
+
+    assert pytest.approx(mesh_area(mesh)) == 6.0
+    assert pytest.approx(mesh_volume(mesh)) == 1.0
+
+
+def test_boolean_native_matches_arrays(box_sphere_meshes):
+    A, B = box_sphere_meshes
+    native_a = CgalMesh(A)
+    native_b = CgalMesh(B)
+
+    V1, F1 = boolean_union_mesh_mesh(A, B)
+    V2, F2 = boolean_union_mesh_mesh(native_a, native_b)
+
+    assert V1.shape == V2.shape
+    assert F1.shape == F2.shape
+
+    # the native inputs are copied, not corefined in place
+    assert native_a.number_of_faces == len(A[1])
+    assert native_b.number_of_faces == len(B[1])
+
+
+def test_boolean_mixed_arguments(box_sphere_meshes):
+    A, B = box_sphere_meshes
+    V, F = boolean_union_mesh_mesh(CgalMesh(A), B)
+    assert len(V) > 0
+    assert len(F) > 0
+
+
+def test_slice_and_intersect_native(box_sphere_meshes):
+    A, B = box_sphere_meshes
+    native_a = CgalMesh(A)
+
+    polylines = slice_mesh(native_a, [Plane([0, 0, 0], [0, 0, 1])])
+    assert len(polylines) > 0
+
+    polylines = intersection_mesh_mesh(native_a, CgalMesh(B))
+    assert len(polylines) > 0
+
+
+def test_geodesics_native():
+    sphere = Sphere(1.0)
+    VF = sphere.to_vertices_and_faces(u=16, v=16, triangulated=True)
+    mesh = CgalMesh(VF)
+
+    assert np.allclose(heat_geodesic_distances(mesh, [0]), heat_geodesic_distances(VF, [0]))
+
+    solver = HeatGeodesicSolver(mesh)
+    assert solver.num_vertices == mesh.number_of_vertices
@@ -1,5 +1,7 @@
 """Tests for COMPAS CGAL meshing functionality."""
 
+from concurrent.futures import ThreadPoolExecutor
+
 import pytest
 import numpy as np
 from compas.datastructures import Mesh
@@ -59,6 +61,20 @@ def test_remesh(sample_mesh):
     assert remeshed_mesh.is_valid()
 
 
+def test_remesh_concurrent_threads(sample_mesh):
+    """Test remeshing several meshes from a thread pool."""
+    V, F = sample_mesh.to_vertices_and_faces()
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        results = list(executor.map(lambda length: trimesh_remesh((V, F), length, 5), [0.5, 0.4, 0.3, 0.2]))
+
+    assert len(results) == 4
+    for V_new, F_new in results:
+        assert V_new.shape[1] == 3
+        assert F_new.shape[1] == 3
+        assert Mesh.from_vertices_and_faces(V_new, F_new).is_valid()
+
+
 def test_dual(sample_mesh):
     """Test the dual functionality."""
     # Get mesh data
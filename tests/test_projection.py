@@ -1,6 +1,14 @@
 from pathlib import Path
+
+import numpy as np
+import pytest
 from compas.datastructures import Mesh
-from compas_cgal.projection import project_mesh_on_mesh, pull_mesh_on_mesh
+from compas.geometry import Box
+from compas_cgal.mesh import CgalMesh
+from compas_cgal.projection import ClosestPointQuery
+from compas_cgal.projection import points_inside_mesh
+from compas_cgal.projection import signed_distance_grid
+from compas_cgal.projection import project_mesh_on_mesh, project_points_on_mesh, pull_mesh_on_mesh
 
 
 def mesh_projection():
@@ -17,3 +25,59 @@ def mesh_projection():
 
     mesh_result = pull_mesh_on_mesh(mesh_0, mesh_1)
     assert mesh_result.number_of_vertices() == mesh_0.number_of_vertices()
+
+
+def test_closest_point_query():
+    V, F = Box(2).to_vertices_and_faces(triangulated=True)
+    V, F = np.asarray(V), np.asarray(F)
+    query = ClosestPointQuery((V, F))
+    assert query.is_closed
+    assert query.num_faces == len(F)
+
+    points = [[0.3, 0.2, 3], [0.3, 0.2, 0.5], [5, 0.2, 0.1]]
+    closest, faces, barycentrics, distances = query.query(points, num_threads=2)
+    assert np.allclose(closest, [[0.3, 0.2, 1], [0.3, 0.2, 1], [1, 0.2, 0.1]])
+    assert np.allclose(distances, [2, 0.5, 4])
+    assert np.allclose(np.einsum("ij,ijk->ik", barycentrics, V[F[faces]]), closest)
+
+    _, _, _, distances = query.query(points, signed=True)
+    assert np.allclose(distances, [2, -0.5, 4])
+
+    assert np.allclose(project_points_on_mesh(points, query), closest)
+
+    open_box = ClosestPointQuery((V, F[2:]))
+    assert not open_box.is_closed
+    with pytest.raises(ValueError):
+        open_box.query(points, signed=True)
+
+
+def test_points_inside_mesh():
+    box = Box(2).to_vertices_and_faces(triangulated=True)
+    points = [[0, 0, 0], [0.3, 0.2, 1], [0, 0, 2]]
+
+    assert points_inside_mesh(box, points, num_threads=2).tolist() == [True, True, False]
+    assert points_inside_mesh(box, points, boundary=False).tolist() == [True, False, False]
+
+    mesh = CgalMesh(box)
+    assert points_inside_mesh(mesh, points).tolist() == [True, True, False]
+    assert points_inside_mesh(ClosestPointQuery(mesh), points).tolist() == [True, True, False]
+
+
+def test_signed_distance_grid():
+    mesh = CgalMesh(Box(2).to_vertices_and_faces(triangulated=True))
+    grid = signed_distance_grid(mesh, [[-2, -2, -2], [2, 2, 2]], 5, num_threads=2)
+    assert grid.shape == (5, 5, 5)
+    assert np.isclose(grid[2, 2, 2], -1)
+    assert np.isclose(grid[0, 2, 2], 1)
+    assert np.isclose(grid[1, 2, 2], 0)
+    assert np.isclose(grid[0, 0, 0], np.sqrt(3))
+
+    grid = signed_distance_grid(mesh, [[-2, 0, 0], [2, 0, 0]], (3, 1, 1))
+    assert np.allclose(grid.ravel(), [1, -1, 1])
+
+    query = ClosestPointQuery(mesh)
+    assert np.allclose(signed_distance_grid(query, [[-2, 0, 0], [2, 0, 0]], (3, 1, 1)).ravel(), [1, -1, 1])
+    assert query.signed_distance_grid([-2, 0, 0], [2, 1, 1], [3, 1, 1]).shape == (3, 1, 1)
+
+    with pytest.raises(ValueError):
+        signed_distance_grid(mesh, [[-2, -2, -2], [2, 2, 2]], 0)
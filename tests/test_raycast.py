@@ -0,0 +1,40 @@
+import numpy as np
+from compas.geometry import Box
+
+from compas_cgal.mesh import CgalMesh
+from compas_cgal.raycast import RayCaster
+
+
+def test_first_hit():
+    V, F = Box(2).to_vertices_and_faces(triangulated=True)
+    V, F = np.asarray(V), np.asarray(F)
+    caster = RayCaster((V, F))
+    assert caster.num_faces == len(F)
+
+    origins = [[0.3, 0.2, 5], [5, 5, 5], [0.3, 0.2, 5]]
+    directions = [[0, 0, -2], [0, 0, -1], [0, 0, 0]]
+    distances, faces, barycentrics = caster.first_hit(origins, directions, num_threads=2)
+
+    assert np.allclose(distances[0], 4.0)
+    assert np.isinf(distances[1:]).all()
+    assert faces.tolist()[1:] == [-1, -1]
+    assert np.allclose(barycentrics[0].sum(), 1.0)
+    assert np.allclose(barycentrics[0] @ V[F[faces[0]]], [0.3, 0.2, 1])
+
+    distances, faces, _ = caster.first_hit(origins[:1], [0, 0, -1], tmax=3.0)
+    assert faces.tolist() == [-1]
+
+
+def test_all_hits():
+    mesh = CgalMesh(Box(2).to_vertices_and_faces(triangulated=True))
+    caster = RayCaster(mesh)
+
+    origins = [[0.3, 0.2, 5], [5, 5, 5], [0.3, 0.2, 0]]
+    offsets, distances, faces, barycentrics = caster.all_hits(origins, [0, 0, -1])
+
+    assert offsets.tolist() == [0, 2, 2, 3]
+    assert np.allclose(distances, [4, 6, 1])
+    assert len(faces) == len(barycentrics) == 3
+
+    offsets, distances, _, _ = caster.all_hits(origins, [0, 0, -1], tmax=5.0)
+    assert offsets.tolist() == [0, 1, 1, 2]
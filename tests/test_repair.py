@@ -0,0 +1,52 @@
+import numpy as np
+import pytest
+from compas.geometry import Box
+
+from compas_cgal.booleans import boolean_union_mesh_mesh
+from compas_cgal.mesh import CgalMesh
+from compas_cgal.repair import autorefine
+from compas_cgal.repair import does_self_intersect
+from compas_cgal.repair import self_intersections
+from compas_cgal.repair import validate_mesh
+
+
+@pytest.fixture
+def crossing_boxes():
+    """Two overlapping boxes stored as one self-intersecting mesh."""
+    V1, F1 = Box(2).to_vertices_and_faces(triangulated=True)
+    V2, F2 = Box(2).translated([1, 1, 1]).to_vertices_and_faces(triangulated=True)
+    V = np.vstack([V1, V2])
+    F = np.vstack([F1, np.asarray(F2) + len(V1)])
+    return V, F
+
+
+def test_self_intersections(crossing_boxes):
+    box = Box(1).to_vertices_and_faces(triangulated=True)
+    assert self_intersections(box).shape == (0, 2)
+    assert not does_self_intersect(box)
+
+    pairs = self_intersections(crossing_boxes)
+    assert pairs.shape[1] == 2 and len(pairs) > 0
+    assert (pairs[:, 0] < pairs[:, 1]).all()
+    # every pair has one face of each box
+    assert ((pairs[:, 0] < 12) & (pairs[:, 1] >= 12)).all()
+    assert does_self_intersect(CgalMesh(crossing_boxes))
+
+
+def test_autorefine(crossing_boxes):
+    V, F = autorefine(crossing_boxes)
+    assert len(F) > len(crossing_boxes[1])
+    assert not does_self_intersect((V, F))
+
+
+def test_validate(crossing_boxes):
+    box = Box(1).to_vertices_and_faces(triangulated=True)
+    assert isinstance(validate_mesh(box), CgalMesh)
+
+    with pytest.raises(ValueError, match="A self-intersects"):
+        boolean_union_mesh_mesh(crossing_boxes, box, validate=True)
+    with pytest.raises(ValueError):
+        boolean_union_mesh_mesh(box, box, validate="yes")
+
+    V, F = boolean_union_mesh_mesh(box, Box(1).translated([0.5, 0.5, 0.5]).to_vertices_and_faces(triangulated=True), validate=True)
+    assert len(F) > 0
@@ -1,5 +1,12 @@
+import numpy as np
+import pytest
 from compas.geometry import Box, Plane, Point, Vector, Polyline
+from compas_cgal.mesh import CgalMesh
+from compas_cgal.slicer import Slicer
+from compas_cgal.slicer import iter_slices
+from compas_cgal.slicer import slice_mesh_regions
 from compas_cgal.slicer import slice_mesh
+from compas_cgal.slicer import slice_mesh_layers
 
 
 def test_mesh_slice():
@@ -29,3 +36,114 @@ def test_mesh_slice():
     assert len(polylines) > 0  # Box intersected by middle plane should give edges
     assert len(polylines[0]) == 9
     assert len(polylines[0][0]) == 3  # 3D points
+
+
+def test_slice_mesh_layers():
+    mesh = Box.from_width_height_depth(2.0, 2.0, 2.0).to_vertices_and_faces(triangulated=True)
+    heights = [0.5, -0.5, 5.0, 0.0]
+
+    layers = slice_mesh_layers(mesh, [0, 0, 2], heights, num_threads=2)
+    assert [len(polylines) for polylines in layers] == [1, 1, 0, 1]
+
+    for height, polylines in zip(heights, layers):
+        for points in polylines:
+            assert np.allclose(points[0], points[-1])
+            assert np.allclose(points[:, 2], height)
+            x, y = points[:, 0], points[:, 1]
+            area = 0.5 * np.sum(x[:-1] * y[1:] - x[1:] * y[:-1])
+            assert np.isclose(area, 4.0)
+
+    reference = slice_mesh(mesh, [Plane([0, 0, 0.5], [0, 0, 1])])
+    assert len(layers[0][0]) == len(reference[0])
+
+
+def test_slicer():
+    mesh = Box.from_width_height_depth(2.0, 2.0, 2.0).to_vertices_and_faces(triangulated=True)
+    slicer = Slicer(CgalMesh(mesh))
+    planes = [Plane([0, 0, 0.5], [0, 0, 1]), Plane([5, 0, 0], [1, 0, 0]), Plane([0, 0, 0], [1, 1, 1])]
+
+    polylines = slicer.slice(planes)
+    assert len(polylines) == 2
+    assert all(np.allclose(points[0], points[-1]) for points in polylines)
+
+    layers = slicer.slice_many(planes, num_threads=2)
+    assert [len(lines) for lines in layers] == [1, 0, 1]
+    assert len(layers[0][0]) == len(slice_mesh(mesh, planes[:1])[0])
+    assert np.allclose(layers[2][0] @ [1, 1, 1], 0)
+
+    assert slicer.slice([]) == []
+
+
+def test_slice_flat():
+    V, F = Box.from_width_height_depth(2.0, 2.0, 2.0).to_vertices_and_faces(triangulated=True)
+    V, F = np.asarray(V), np.asarray(F)
+    planes = [Plane([0, 0, 0.5], [0, 0, 1]), Plane([5, 0, 0], [1, 0, 0]), Plane([0, 0, 0], [1, 1, 1])]
+
+    result = slice_mesh((V, F), planes, flat=True, return_faces=True, num_threads=2)
+    assert len(result) == 2
+    assert result.planes.tolist() == [0, 2]
+    assert result.closed.tolist() == [True, True]
+    assert result.offsets[-1] == len(result.points) == len(result.faces)
+
+    for k, points in enumerate(result.polylines()):
+        faces = result.faces[result.offsets[k] : result.offsets[k + 1]]
+        assert faces[-1] == -1
+        for a, b, face in zip(points[:-1], points[1:], faces[:-1]):
+            normal = np.cross(V[F[face][1]] - V[F[face][0]], V[F[face][2]] - V[F[face][0]])
+            assert np.isclose(np.dot(a - V[F[face][0]], normal), 0)
+            assert np.isclose(np.dot(b - V[F[face][0]], normal), 0)
+
+    layers = slice_mesh_layers((V, F), [0, 0, 1], [5.0, 0.5, -0.5], flat=True)
+    assert layers.planes.tolist() == [1, 2]
+    assert layers.faces is None
+
+    assert len(Slicer((V, F)).slice_many(planes, flat=True)) == 2
+
+    with pytest.raises(ValueError):
+        slice_mesh((V, F), planes, return_faces=True)
+
+
+def test_iter_slices():
+    mesh = Box.from_width_height_depth(2.0, 2.0, 2.0).to_vertices_and_faces(triangulated=True)
+    planes = [Plane([0, 0, z], [0, 0, 1]) for z in np.linspace(-0.9, 0.9, 7)] + [Plane([0, 0, 5], [0, 0, 1])]
+
+    chunks = list(iter_slices(mesh, planes, chunk=3, return_faces=True, num_threads=2))
+    assert [len(chunk) for chunk in chunks] == [3, 3, 1]
+    assert np.concatenate([chunk.planes for chunk in chunks]).tolist() == list(range(7))
+    assert all(len(chunk.faces) == len(chunk.points) for chunk in chunks)
+
+    stream = iter_slices(mesh, planes, buffer=1)
+    assert next(stream).planes.tolist() == [0]
+    stream.close()
+
+    with pytest.raises(ValueError):
+        next(iter_slices(mesh, planes, chunk=0))
+
+
+def test_slice_mesh_regions():
+    from compas_cgal.booleans import boolean_difference_mesh_mesh
+    from compas_cgal.triangulation import constrained_delaunay_triangulation
+
+    outer = Box(4).to_vertices_and_faces(triangulated=True)
+    inner = Box(2, 2, 6).to_vertices_and_faces(triangulated=True)
+    tube = boolean_difference_mesh_mesh(outer, inner)
+    island = Box(0.5).to_vertices_and_faces(triangulated=True)
+    V = np.vstack([tube[0], island[0]])
+    F = np.vstack([tube[1], np.asarray(island[1]) + len(tube[0])])
+
+    planes = [Plane([0, 0, 0], [0, 0, 1]), Plane([0, 0, 1.5], [0, 0, 1]), Plane([0, 0, 5], [0, 0, 1])]
+    regions = slice_mesh_regions((V, F), planes, num_threads=2)
+    assert [len(r) for r in regions] == [2, 1, 0]
+
+    def area(points):
+        x, y = points[:, 0], points[:, 1]
+        return 0.5 * np.sum(x * np.roll(y, -1) - np.roll(x, -1) * y)
+
+    (boundary, holes), (island_boundary, island_holes) = regions[0]
+    assert np.isclose(area(boundary), 16)
+    assert len(holes) == 1 and np.isclose(area(holes[0]), -4)
+    assert np.isclose(area(island_boundary), 0.25) and island_holes == []
+    assert not np.allclose(boundary[0], boundary[-1])
+
+    V2, F2 = constrained_delaunay_triangulation(boundary, holes=holes)
+    assert len(F2) > 0